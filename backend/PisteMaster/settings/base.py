@@ -39,6 +39,7 @@ MIDDLEWARE = [
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     # Cluster middleware - handles write proxying and ACK waiting
+    "backend.apps.cluster.middleware.gzip.ClusterGzipMiddleware",
     "backend.apps.cluster.middleware.api_router.ApiRouterMiddleware",
     "backend.apps.cluster.middleware.write_sync.SyncWriteMiddleware",
 ]
@@ -129,10 +130,12 @@ SESSION_COOKIE_SAMESITE = "Lax"
 CLUSTER_CONFIG = {
     "mode": os.environ.get("CLUSTER_MODE", "single"),
     "udp_port": int(os.environ.get("CLUSTER_UDP_PORT", 9000)),
+    "udp_wire_format": os.environ.get("CLUSTER_UDP_WIRE_FORMAT", "binary"),  # "binary" frames or "json" datagrams
     "api_port": int(os.environ.get("CLUSTER_API_PORT", 8000)),
     "node_id": os.environ.get("NODE_ID"),
-    "heartbeat_interval": float(os.environ.get("CLUSTER_HEARTBEAT_INTERVAL", "5.0")),
-    "heartbeat_timeout": float(os.environ.get("CLUSTER_HEARTBEAT_TIMEOUT", "15.0")),
+    "heartbeat_interval": float(os.environ.get("CLUSTER_HEARTBEAT_INTERVAL", "1.0")),
+    "heartbeat_timeout": float(os.environ.get("CLUSTER_HEARTBEAT_TIMEOUT", "15.0")),  # upper bound; see heartbeat_phi_threshold
+    "heartbeat_phi_threshold": float(os.environ.get("CLUSTER_HEARTBEAT_PHI_THRESHOLD", "8.0")),
     "election_timeout": float(os.environ.get("CLUSTER_ELECTION_TIMEOUT", "10.0")),
     "node_expiry_timeout": float(os.environ.get("CLUSTER_NODE_EXPIRY_TIMEOUT", "30.0")),
     "replica_ack_required": int(os.environ.get("CLUSTER_REPLICA_ACK", "1")),
@@ -142,6 +145,26 @@ CLUSTER_CONFIG = {
     "master_ip": None,
     "proxy_writes": True,  # Always proxy writes (even to self in single mode)
     "proxy_timeout": int(os.environ.get("PROXY_TIMEOUT", "10")),
+    "config_cache_ttl": float(os.environ.get("CLUSTER_CONFIG_CACHE_TTL", "5.0")),
+    "sync_delta_enabled": os.environ.get("CLUSTER_SYNC_DELTA", "True").lower() == "true",
+    "sync_long_poll_timeout": float(os.environ.get("CLUSTER_SYNC_LONG_POLL_TIMEOUT", "25.0")),
+    # How often a parked long-poll re-reads MAX(id) from sync_log for writes made by other worker processes
+    "sync_long_poll_recheck_interval": float(os.environ.get("CLUSTER_SYNC_LONG_POLL_RECHECK_INTERVAL", "1.0")),
+    "sync_push_notify": os.environ.get("CLUSTER_SYNC_PUSH_NOTIFY", "False").lower() == "true",
+    "http_pool_connections": int(os.environ.get("CLUSTER_HTTP_POOL_CONNECTIONS", "4")),
+    "http_pool_maxsize": int(os.environ.get("CLUSTER_HTTP_POOL_MAXSIZE", "10")),
+    "http_gzip": os.environ.get("CLUSTER_HTTP_GZIP", "False").lower() == "true",
+    "http_gzip_min_bytes": int(os.environ.get("CLUSTER_HTTP_GZIP_MIN_BYTES", "1024")),
+    "sync_log_compaction": os.environ.get("CLUSTER_SYNC_LOG_COMPACTION", "True").lower() == "true",
+    "sync_log_retention_hours": float(os.environ.get("CLUSTER_SYNC_LOG_RETENTION_HOURS", "2.0")),
+    "sync_log_compact_interval": float(os.environ.get("CLUSTER_SYNC_LOG_COMPACT_INTERVAL", "600.0")),
+    "sync_log_follower_timeout": float(os.environ.get("CLUSTER_SYNC_LOG_FOLLOWER_TIMEOUT", "3600.0")),
+    # Tables whose repeated UPDATEs of one record are merged: {table_name: window_ms}, 0 = within one transaction
+    # e.g. {"event": 500, "pool": 500} for live rankings and live score entry
+    "sync_coalesce_tables": {},
+    # Followers on PostgreSQL apply tables of a page that share no foreign key concurrently
+    "sync_parallel_apply": os.environ.get("CLUSTER_SYNC_PARALLEL_APPLY", "True").lower() == "true",
+    "sync_apply_workers": int(os.environ.get("CLUSTER_SYNC_APPLY_WORKERS", "4")),
 }
 
 # Proxy retry settings
@@ -84,11 +84,18 @@ class ClusterConfig(AppConfig):
 
             logging.getLogger(__name__).warning(f"Could not register models for sync: {e}")
 
-        # Register signal to restart SyncWorker when cluster config changes
+        # Register signals to refresh the config cache and restart SyncWorker when cluster config changes
         from django.db.models.signals import post_save  # noqa: E402
         from django.dispatch import receiver  # noqa: E402
         from backend.apps.cluster.models.cluster_config import DjangoClusterConfig  # noqa: E402
 
+        @receiver(post_save, sender=DjangoClusterConfig, dispatch_uid="cluster_config_cache")
+        def on_cluster_config_cached(sender, instance, **kwargs):
+            """Refresh the process-wide config cache with the saved instance."""
+            from backend.apps.cluster.services.config_cache import cluster_config_cache  # noqa: E402
+
+            cluster_config_cache.update(instance)
+
         @receiver(post_save, sender=DjangoClusterConfig, dispatch_uid="cluster_config_sync_worker")
         def on_cluster_config_saved(sender, instance, **kwargs):
             """Restart SyncWorker when cluster configuration changes."""
@@ -1,16 +1,30 @@
 import logging
 from datetime import date, datetime
 from decimal import Decimal
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from uuid import UUID
 
+from django.conf import settings
 from django.db import transaction
 
+from backend.apps.cluster.services.delta import compute_delta, delta_enabled, is_delta, json_fields_of
 from backend.apps.cluster.services.sync_manager import sync_manager
 
 logger = logging.getLogger(__name__)
 
 
+def coalesce_window_ms(table_name: str) -> Optional[float]:
+    """
+    Coalescing window for UPDATEs of ``table_name``, or None if the table is not opted in.
+
+    Tables are opted in with CLUSTER_CONFIG["sync_coalesce_tables"], a mapping
+    of table name to window in milliseconds. With a window of 0 only UPDATEs
+    within one SyncTransaction are merged.
+    """
+    window = getattr(settings, "CLUSTER_CONFIG", {}).get("sync_coalesce_tables", {}).get(table_name)
+    return None if window is None else float(window)
+
+
 class SyncTransaction:
     """
     Context manager for sync-aware database transactions.
@@ -26,6 +40,13 @@ class SyncTransaction:
                 operation="INSERT",
                 data={"name": tournament.name, ...}
             )
+
+    For tables opted in to coalescing (see coalesce_window_ms), repeated
+    UPDATEs of one record collapse into a single entry with the final state,
+    recorded at the position of the last UPDATE. With a non-zero window, the
+    UPDATE entries committed for the record within that window are removed
+    as well and the entry carries the full row, so followers that never saw
+    them still end up with the same state.
     """
 
     @staticmethod
@@ -51,6 +72,9 @@ class SyncTransaction:
         self._records: list = []
         self._atomic = None
         self.last_sync_id: Optional[int] = None
+        self.sync_log_ids: List[int] = []
+        # (table_name, record_id) -> index in _records and the snapshot before the first UPDATE
+        self._coalesced: Dict[Tuple[str, str], Tuple[int, Optional[Dict[str, Any]]]] = {}
 
     def __enter__(self) -> "SyncTransaction":
         self._atomic = transaction.atomic(using=self.using)
@@ -58,29 +82,58 @@ class SyncTransaction:
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
-        if exc_type is None:
-            for record in self._records:
-                try:
-                    sync_log = sync_manager.record_change(
-                        table_name=record["table_name"],
-                        record_id=record["record_id"],
-                        operation=record["operation"],
-                        data=record["data"],
-                        version=record.get("version", 1),
-                    )
-                    self.last_sync_id = sync_log.id
-
-                    logger.debug(
-                        f"Sync recorded: {record['operation']} on "
-                        f"{record['table_name']}/{record['record_id']}, "
-                        f"sync_log_id={sync_log.id}"
-                    )
-                except Exception as e:
-                    logger.error(f"Failed to record sync: {e}")
+        records = [record for record in self._records if record is not None]
+        if exc_type is None and records:
+            try:
+                for (table_name, record_id), (_, base) in self._coalesced.items():
+                    window = coalesce_window_ms(table_name)
+                    # Only a full row can stand in for earlier UPDATEs a follower may not have seen
+                    if window and base is not None:
+                        sync_manager.drop_recent_updates(table_name, record_id, window / 1000.0)
+                sync_logs = self._flush(records)
+                if sync_logs:
+                    self.sync_log_ids = [sync_log.id for sync_log in sync_logs]
+                    self.last_sync_id = self.sync_log_ids[-1]
+                    logger.debug(f"Sync recorded: {len(sync_logs)} change(s), sync_log_ids={self.sync_log_ids[0]}..{self.last_sync_id}")
+            except Exception as e:
+                logger.error(f"Failed to record sync: {e}")
 
         self._atomic.__exit__(exc_type, exc_val, exc_tb)
         return False
 
+    def _flush(self, records: List[Dict[str, Any]]) -> list:
+        """
+        Write the queued records to sync_log; a record that fails is logged and skipped.
+
+        Records are validated one by one and the valid ones bulk-inserted in a
+        savepoint. If that INSERT still fails, each record is retried in its
+        own savepoint, so one bad record never costs the others their entry.
+        """
+        valid = []
+        for record in records:
+            try:
+                sync_manager.validate_record(record)
+                valid.append(record)
+            except ValueError as e:
+                logger.error(f"Failed to record sync: {e}")
+        if not valid:
+            return []
+
+        try:
+            with transaction.atomic(using=self.using):
+                return sync_manager.record_changes(valid)
+        except Exception as e:
+            logger.error(f"Failed to record sync batch, recording changes one by one: {e}")
+
+        sync_logs = []
+        for record in valid:
+            try:
+                with transaction.atomic(using=self.using):
+                    sync_logs.append(sync_manager.record_change(**record))
+            except Exception as e:
+                logger.error(f"Failed to record sync of {record['table_name']}.{record['record_id']}: {e}")
+        return sync_logs
+
     def record(
         self,
         table_name: str,
@@ -100,6 +153,7 @@ class SyncTransaction:
             version: Version number for conflict resolution
         """
         serialized_data = self._make_json_serializable(data)
+        self._coalesced.pop((table_name, str(record_id)), None)
         self._records.append(
             {
                 "table_name": table_name,
@@ -132,10 +186,30 @@ class SyncTransaction:
         table_name: str,
         instance: any,
         data: Optional[Dict[str, Any]] = None,
+        previous: Optional[Dict[str, Any]] = None,
     ) -> None:
-        """Shorthand for recording an UPDATE operation."""
+        """
+        Shorthand for recording an UPDATE operation.
+
+        When ``previous`` (the full-row snapshot taken before the write) is
+        given and delta mode is enabled, only the changed columns are recorded,
+        with JSON columns stored as patches. See services/delta.py.
+        """
         record_id = str(getattr(instance, "id", instance))
         version = getattr(instance, "version", 1)
+        window = coalesce_window_ms(table_name)
+        if window is not None:
+            data, previous = self._coalesce_update(table_name, record_id, data, previous)
+        # With a window the UPDATEs this entry replaces may never reach a follower, so it cannot be a delta against them
+        if previous is not None and data and delta_enabled() and not window:
+            delta = compute_delta(
+                self._make_json_serializable(previous),
+                self._make_json_serializable(data),
+                json_fields=json_fields_of(instance),
+                base_version=previous.get("version"),
+            )
+            if delta is not None:
+                data = delta
         self.record(
             table_name=table_name,
             record_id=record_id,
@@ -143,6 +217,38 @@ class SyncTransaction:
             data=data or {},
             version=version,
         )
+        if window is not None:
+            self._coalesced[(table_name, record_id)] = (len(self._records) - 1, previous)
+
+    def _coalesce_update(
+        self,
+        table_name: str,
+        record_id: str,
+        data: Optional[Dict[str, Any]],
+        previous: Optional[Dict[str, Any]],
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        Drop the pending UPDATE of the same record if the new one can replace it.
+
+        Returns the data and base snapshot to record: full rows are diffed
+        against the snapshot taken before the first UPDATE, and plain partial
+        rows are merged. Anything else is recorded as a separate entry.
+        """
+        pending = self._coalesced.get((table_name, record_id))
+        if pending is None:
+            return data, previous
+
+        index, base = pending
+        earlier = self._records[index]
+        if base is not None and previous is not None:
+            previous = base
+        elif base is None and previous is None and not is_delta(earlier["data"]):
+            data = {**earlier["data"], **(data or {})}
+        else:
+            return data, previous
+
+        self._records[index] = None
+        return data, previous
 
     def record_delete(
         self,
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from backend.apps.cluster.services.config_cache import get_cluster_config
+from backend.apps.cluster.services.sync_log_compactor import sync_log_compactor
+
+
+class Command(BaseCommand):
+    help = "Delete superseded sync_log entries that every live follower has applied"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--retention-hours", type=float, default=None, help="Keep entries younger than this (default: CLUSTER_CONFIG)")
+
+    def handle(self, *args, **options):
+        config = get_cluster_config()
+        if config.mode == "cluster" and not config.is_master:
+            self.stderr.write(self.style.ERROR("Only the master compacts its sync_log"))
+            return
+
+        result = sync_log_compactor.compact(retention_hours=options["retention_hours"])
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Deleted {result["deleted"]} sync_log entries up to sync_id={result["horizon"]} '
+                f'(compacted_id={result["compacted_id"]})'
+            )
+        )
@@ -4,7 +4,7 @@ from typing import Optional
 from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.utils.deprecation import MiddlewareMixin
 
-from backend.apps.cluster.models.cluster_config import DjangoClusterConfig
+from backend.apps.cluster.services.config_cache import get_cluster_config
 from backend.apps.cluster.services.proxy import get_master_proxy
 
 logger = logging.getLogger(__name__)
@@ -47,12 +47,12 @@ class ApiRouterMiddleware(MiddlewareMixin):
     WRITE_METHODS = ["POST", "PUT", "DELETE", "PATCH"]
 
     def __init__(self, get_response):
-        self.get_response = get_response
+        super().__init__(get_response)
         self._load_config()
 
     def _load_config(self) -> None:
         try:
-            config = DjangoClusterConfig.get_config()
+            config = get_cluster_config()
             self.mode = config.mode
             self.is_master = config.is_master
             self.master_url = config.master_url
@@ -130,12 +130,12 @@ class NodeRoleMiddleware(MiddlewareMixin):
     """Simplified middleware that only sets node role context on the request."""
 
     def __init__(self, get_response):
-        self.get_response = get_response
+        super().__init__(get_response)
         self._load_config()
 
     def _load_config(self) -> None:
         try:
-            config = DjangoClusterConfig.get_config()
+            config = get_cluster_config()
             self.mode = config.mode
             self.is_master = config.is_master
         except Exception:
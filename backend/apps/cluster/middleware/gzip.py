@@ -0,0 +1,49 @@
+import gzip
+import io
+import logging
+from typing import Optional
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.middleware.gzip import GZipMiddleware
+
+logger = logging.getLogger(__name__)
+
+
+class ClusterGzipMiddleware(GZipMiddleware):
+    """
+    Gzip support for node-to-node traffic.
+
+    Request bodies sent with ``Content-Encoding: gzip`` to cluster endpoints
+    are inflated before the view reads them (see ClusterHttpClient). When
+    CLUSTER_CONFIG["http_gzip"] is on, cluster responses are compressed for
+    clients that accept gzip. Other paths are not touched.
+    """
+
+    CLUSTER_PATHS = ["/api/cluster/"]
+
+    def process_request(self, request: HttpRequest) -> Optional[HttpResponse]:
+        if not self._is_cluster_path(request.path):
+            return None
+        if request.META.get("HTTP_CONTENT_ENCODING", "").lower() != "gzip":
+            return None
+
+        try:
+            body = gzip.decompress(request.body)
+        except (OSError, EOFError) as e:
+            logger.warning(f"Rejected malformed gzip body for {request.path}: {e}")
+            return JsonResponse({"detail": "Malformed gzip request body"}, status=400)
+
+        request._body = body
+        request._stream = io.BytesIO(body)
+        request.META["CONTENT_LENGTH"] = str(len(body))
+        del request.META["HTTP_CONTENT_ENCODING"]
+        return None
+
+    def process_response(self, request: HttpRequest, response: HttpResponse) -> HttpResponse:
+        if not self._is_cluster_path(request.path) or not getattr(settings, "CLUSTER_CONFIG", {}).get("http_gzip", False):
+            return response
+        return super().process_response(request, response)
+
+    def _is_cluster_path(self, path: str) -> bool:
+        return any(path.startswith(prefix) for prefix in self.CLUSTER_PATHS)
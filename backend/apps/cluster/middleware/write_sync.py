@@ -1,11 +1,12 @@
 import logging
-import threading
 from typing import Callable, Optional
 
+from asgiref.sync import sync_to_async
 from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.utils.deprecation import MiddlewareMixin
 
-from backend.apps.cluster.models.cluster_config import DjangoClusterConfig
+from backend.apps.cluster.services.config_cache import get_cluster_config
+from backend.apps.cluster.services.proxy import get_master_proxy
 from backend.apps.cluster.services.sync_manager import sync_manager
 
 logger = logging.getLogger(__name__)
@@ -18,6 +19,7 @@ class SyncWriteMiddleware(MiddlewareMixin):
     When running as master node:
     1. Intercepts write requests (POST, PUT, DELETE)
     2. After the view completes, waits for ACKs from followers
+       (followers long-poll /sync/changes/ and pull the write as soon as it commits)
     3. Returns response only after confirmation (or timeout)
 
     When running as follower node:
@@ -43,14 +45,38 @@ class SyncWriteMiddleware(MiddlewareMixin):
 
     WRITE_METHODS = ["POST", "PUT", "DELETE", "PATCH"]
 
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response: Callable):
-        self.get_response = get_response
+        super().__init__(get_response)
         self._load_config()
 
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        """
+        ASGI entry point.
+
+        Same steps as the WSGI path, but the wait for follower ACKs awaits a
+        future instead of blocking a worker thread, so the server keeps
+        serving other requests while writes wait for replication.
+        """
+        response = await sync_to_async(self.process_request, thread_sensitive=True)(request)
+        if response is None:
+            response = await self.get_response(request)
+
+        sync_log_id = await sync_to_async(self._sync_log_id_to_confirm, thread_sensitive=True)(request, response)
+        if sync_log_id is None:
+            return response
+
+        confirmed = await sync_manager.ack_queue.wait_async(sync_log_id, self.ack_timeout_ms / 1000.0, self.replica_ack_required)
+        if not confirmed:
+            self._log_ack_timeout(sync_log_id)
+        return self._confirmation_response(sync_log_id, confirmed, response)
+
     def _load_config(self) -> None:
         """Load cluster configuration from database."""
         try:
-            config = DjangoClusterConfig.get_config()
+            config = get_cluster_config()
             self.mode = config.mode
             self.is_master = config.is_master
             self.master_url = config.master_url
@@ -82,31 +108,35 @@ class SyncWriteMiddleware(MiddlewareMixin):
 
     def process_response(self, request: HttpRequest, response: HttpResponse) -> HttpResponse:
         """Post-process response after view execution."""
+        sync_log_id = self._sync_log_id_to_confirm(request, response)
+        if sync_log_id is None:
+            return response
+
+        confirmed = self._wait_for_acks(sync_log_id)
+        return self._confirmation_response(sync_log_id, confirmed, response)
+
+    def _sync_log_id_to_confirm(self, request: HttpRequest, response: HttpResponse) -> Optional[int]:
+        """The sync_log id whose replication this response has to wait for, if any."""
         self._load_config()
 
         if self.mode == "single":
-            return response
+            return None
 
         if not self.is_master:
-            return response
+            return None
 
         if request.method not in self.WRITE_METHODS:
-            return response
+            return None
 
         if self._is_exempt_path(request.path):
-            return response
+            return None
 
         if response.status_code >= 400:
-            return response
-
-        sync_log_id = getattr(request, "_sync_log_id", None)
-        if sync_log_id is None:
-            return response
-
-        self._notify_followers(sync_log_id)
+            return None
 
-        confirmed = self._wait_for_acks(sync_log_id)
+        return getattr(request, "_sync_log_id", None)
 
+    def _confirmation_response(self, sync_log_id: int, confirmed: bool, response: HttpResponse) -> HttpResponse:
         if confirmed:
             logger.debug(f"Write confirmed: sync_log_id={sync_log_id}")
             return response
@@ -139,50 +169,14 @@ class SyncWriteMiddleware(MiddlewareMixin):
         )
 
     def _proxy_to_master(self, request: HttpRequest) -> HttpResponse:
-        """Proxy write request to master node."""
-        import requests
-
+        """Proxy write request to master node over the shared cluster HTTP client."""
         if not self.master_url:
             return JsonResponse(
                 {"detail": "Master URL not configured"},
                 status=503,
             )
 
-        try:
-            url = f"{self.master_url.rstrip('/')}{request.path}"
-
-            headers = {}
-            for key, value in request.META.items():
-                if key.startswith("HTTP_") and key != "HTTP_HOST":
-                    headers[key[5:].replace("_", "-")] = value
-
-            user = getattr(request, "user", None)
-            if user and user.is_authenticated:
-                headers["X-Cluster-User"] = user.username
-
-            body = request.body
-
-            response = requests.request(
-                method=request.method,
-                url=url,
-                headers=headers,
-                data=body,
-                timeout=10,
-                allow_redirects=False,
-            )
-
-            return HttpResponse(
-                content=response.content,
-                status=response.status_code,
-                content_type=response.headers.get("Content-Type", "application/json"),
-            )
-
-        except requests.RequestException as e:
-            logger.error(f"Failed to proxy request to master: {e}")
-            return JsonResponse(
-                {"detail": "Failed to communicate with master node"},
-                status=503,
-            )
+        return get_master_proxy().forward_request(request)
 
     def _wait_for_acks(self, sync_log_id: int) -> bool:
         """Wait for ACKs from followers using threading.Event."""
@@ -196,39 +190,15 @@ class SyncWriteMiddleware(MiddlewareMixin):
         if sync_manager.ack_queue.is_confirmed(sync_log_id):
             return True
 
+        self._log_ack_timeout(sync_log_id)
+        return False
+
+    def _log_ack_timeout(self, sync_log_id: int) -> None:
         logger.warning(
             f"ACK timeout for sync_log_id={sync_log_id}, "
             f"confirmed={len(sync_manager.ack_queue.get_confirmed_nodes(sync_log_id))}, "
             f"required={self.replica_ack_required}"
         )
-        return False
-
-    def _notify_followers(self, sync_log_id: int) -> None:
-        """Notify followers of a new sync_log entry via HTTP POST (fire-and-forget)."""
-        from backend.apps.cluster.models.sync_log import DjangoSyncLog
-        from backend.apps.cluster.models.sync_state import DjangoSyncState
-        from backend.apps.cluster.services.proxy import get_follower_proxy
-
-        try:
-            sync_log = DjangoSyncLog.objects.get(id=sync_log_id)
-        except DjangoSyncLog.DoesNotExist:
-            logger.warning(f"SyncLog {sync_log_id} not found, skipping follower notification")
-            return
-
-        follower_states = DjangoSyncState.objects.exclude(url__isnull=True).exclude(url="")
-        follower_urls = [state.url for state in follower_states]
-
-        if not follower_urls:
-            logger.debug("No follower URLs registered, skipping notification")
-            return
-
-        proxy = get_follower_proxy()
-
-        def _send():
-            proxy.broadcast_sync(follower_urls, sync_log_id, sync_log.table_name, sync_log.record_id)
-
-        thread = threading.Thread(target=_send, daemon=True, name="notify-followers")
-        thread.start()
 
 
 class ClusterModeMiddleware(MiddlewareMixin):
@@ -242,12 +212,12 @@ class ClusterModeMiddleware(MiddlewareMixin):
     """
 
     def __init__(self, get_response: Callable):
-        self.get_response = get_response
+        super().__init__(get_response)
         self._load_config()
 
     def _load_config(self) -> None:
         try:
-            config = DjangoClusterConfig.get_config()
+            config = get_cluster_config()
             self.mode = config.mode
             self.is_master = config.is_master
         except Exception:
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cluster", "0006_add_master_port"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="djangoclusterconfig",
+            name="sync_log_compacted_id",
+            field=models.BigIntegerField(default=0, verbose_name="Highest sync_log ID removed by compaction"),
+        ),
+    ]
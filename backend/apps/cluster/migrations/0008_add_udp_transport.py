@@ -0,0 +1,26 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cluster", "0007_add_sync_log_compacted_id"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="djangoclusterconfig",
+            name="udp_transport",
+            field=models.CharField(
+                choices=[("broadcast", "Broadcast"), ("multicast", "Multicast"), ("unicast", "Unicast to known peers")],
+                default="broadcast",
+                max_length=20,
+                verbose_name="UDP Transport",
+            ),
+        ),
+        migrations.AddField(
+            model_name="djangoclusterconfig",
+            name="udp_multicast_group",
+            field=models.CharField(default="239.255.42.99", max_length=50, verbose_name="UDP Multicast Group"),
+        ),
+    ]
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cluster", "0008_add_udp_transport"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="djangosynclog",
+            index=models.Index(fields=["table_name", "record_id", "created_at"], name="idx_sync_log_record_recent"),
+        ),
+    ]
@@ -0,0 +1,23 @@
+from django.db import migrations, models
+
+
+def use_new_default(apps, schema_editor):
+    # Rows still at the old default report what the heartbeat monitor actually uses
+    DjangoClusterConfig = apps.get_model("cluster", "DjangoClusterConfig")
+    DjangoClusterConfig.objects.filter(heartbeat_interval=5.0).update(heartbeat_interval=1.0)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cluster", "0009_add_sync_log_record_recent_index"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="djangoclusterconfig",
+            name="heartbeat_interval",
+            field=models.FloatField(default=1.0, verbose_name="Heartbeat Interval"),
+        ),
+        migrations.RunPython(use_new_default, migrations.RunPython.noop),
+    ]
@@ -15,8 +15,15 @@ class DjangoClusterConfig(models.Model):
     )
     node_id = models.CharField(max_length=100, blank=True, null=True, verbose_name="Node ID")
     udp_port = models.IntegerField(default=9000, verbose_name="UDP Port")
+    udp_transport = models.CharField(
+        max_length=20,
+        choices=[("broadcast", "Broadcast"), ("multicast", "Multicast"), ("unicast", "Unicast to known peers")],
+        default="broadcast",
+        verbose_name="UDP Transport",
+    )
+    udp_multicast_group = models.CharField(max_length=50, default="239.255.42.99", verbose_name="UDP Multicast Group")
     api_port = models.IntegerField(default=8000, verbose_name="API Port")
-    heartbeat_interval = models.FloatField(default=5.0, verbose_name="Heartbeat Interval")
+    heartbeat_interval = models.FloatField(default=1.0, verbose_name="Heartbeat Interval")
     heartbeat_timeout = models.FloatField(default=15.0, verbose_name="Heartbeat Timeout")
     sync_interval = models.FloatField(default=3.0, verbose_name="Sync Interval")
     replica_ack_required = models.IntegerField(default=1, verbose_name="Replica ACK Required")
@@ -25,6 +32,7 @@ class DjangoClusterConfig(models.Model):
     master_port = models.IntegerField(default=8000, null=True, blank=True, verbose_name="Master Port")
     is_master = models.BooleanField(default=False, verbose_name="Is Master")
     master_url = models.CharField(max_length=200, blank=True, null=True, verbose_name="Master URL")
+    sync_log_compacted_id = models.BigIntegerField(default=0, verbose_name="Highest sync_log ID removed by compaction")
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -26,6 +26,8 @@ class DjangoSyncLog(models.Model):
             models.Index(fields=["record_id"], name="idx_sync_log_record"),
             models.Index(fields=["created_at"], name="idx_sync_log_created"),
             models.Index(fields=["table_name", "record_id"], name="idx_sync_log_table_record"),
+            # Recent entries of one record, see SyncManager.drop_recent_updates
+            models.Index(fields=["table_name", "record_id", "created_at"], name="idx_sync_log_record_recent"),
         ]
 
     def __str__(self):
@@ -7,8 +7,10 @@ from backend.apps.cluster.schemas.messages import (
     GoodbyeMessage,
     SyncRequestMessage,
     AckMessage,
+    ElectionMessage,
     parse_message,
 )
+from backend.apps.cluster.schemas.frames import encode_frames, decode_frame, parse_datagram
 
 __all__ = [
     "MessageType",
@@ -19,5 +21,9 @@ __all__ = [
     "GoodbyeMessage",
     "SyncRequestMessage",
     "AckMessage",
+    "ElectionMessage",
     "parse_message",
+    "encode_frames",
+    "decode_frame",
+    "parse_datagram",
 ]
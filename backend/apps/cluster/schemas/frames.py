@@ -0,0 +1,161 @@
+"""
+Binary frame format for UDP cluster messages.
+
+A datagram carries one frame holding one or more messages:
+
+    frame header   !2sBB    magic b"PM", frame version, message count
+    message header !BBIIqH  type, message version, node id hash, seq_num, timestamp, payload length
+    payload                 node_id, then the type's fields (see FIELDS)
+
+The node id hash (CRC32 of the node id) and seq_num sit in the fixed
+header, so a receiver can drop its own broadcasts and duplicates without
+decoding the payload. Strings are length-prefixed UTF-8. Datagrams that do
+not start with the magic are parsed as the JSON messages older nodes send.
+"""
+
+import struct
+import zlib
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from backend.apps.cluster.schemas.messages import MESSAGE_CLASSES, BaseMessage, MessageType, parse_message
+
+MAGIC = b"PM"
+FRAME_VERSION = 1
+FRAME_HEADER = struct.Struct("!2sBB")
+MESSAGE_HEADER = struct.Struct("!BBIIqH")
+# Stays below a typical 1500 byte MTU so frames are never fragmented
+MAX_FRAME_BYTES = 1400
+MAX_MESSAGES_PER_FRAME = 255
+
+TYPE_CODES: Dict[MessageType, int] = {
+    MessageType.ANNOUNCE: 1,
+    MessageType.HEARTBEAT: 2,
+    MessageType.MASTER_ANNOUNCE: 3,
+    MessageType.GOODBYE: 4,
+    MessageType.SYNC_REQUEST: 5,
+    MessageType.ACK: 6,
+    MessageType.ELECTION: 7,
+}
+TYPES_BY_CODE = {code: message_type for message_type, code in TYPE_CODES.items()}
+
+# Payload fields after node_id: "s" is a length-prefixed string, anything else a struct code
+FIELDS: Dict[MessageType, Tuple[Tuple[str, str], ...]] = {
+    MessageType.ANNOUNCE: (("ip", "s"), ("port", "H"), ("is_master", "?")),
+    MessageType.HEARTBEAT: (("last_sync_id", "Q"),),
+    MessageType.MASTER_ANNOUNCE: (("ip", "s"), ("port", "H")),
+    MessageType.GOODBYE: (("reason", "s"),),
+    MessageType.SYNC_REQUEST: (("last_sync_id", "Q"), ("limit", "I")),
+    MessageType.ACK: (("sync_id", "Q"),),
+    MessageType.ELECTION: (("last_sync_id", "Q"), ("port", "H")),
+}
+
+# Called with (message type, node id hash, seq_num); returning True skips the message undecoded
+SkipFilter = Callable[[MessageType, int, int], bool]
+
+
+def node_hash(node_id: str) -> int:
+    return zlib.crc32(node_id.encode("utf-8"))
+
+
+def _pack_str(value: str) -> bytes:
+    encoded = value.encode("utf-8")[:255]
+    return struct.pack("!B", len(encoded)) + encoded
+
+
+def _unpack_str(payload: bytes, offset: int) -> Tuple[str, int]:
+    (length,) = struct.unpack_from("!B", payload, offset)
+    start = offset + 1
+    return payload[start : start + length].decode("utf-8"), start + length
+
+
+def encode_message(message: BaseMessage) -> bytes:
+    """Message header plus payload for one message."""
+    payload = [_pack_str(message.node_id)]
+    for name, code in FIELDS[message.type]:
+        value = getattr(message, name)
+        payload.append(_pack_str(value or "") if code == "s" else struct.pack(f"!{code}", value))
+    body = b"".join(payload)
+    header = MESSAGE_HEADER.pack(
+        TYPE_CODES[message.type],
+        message.version,
+        node_hash(message.node_id),
+        message.seq_num & 0xFFFFFFFF,
+        int(message.timestamp),
+        len(body),
+    )
+    return header + body
+
+
+def encode_frames(messages: Iterable[BaseMessage], max_bytes: int = MAX_FRAME_BYTES) -> List[bytes]:
+    """Pack messages into as few frames as fit in ``max_bytes`` each."""
+    frames: List[bytes] = []
+    batch: List[bytes] = []
+    size = FRAME_HEADER.size
+
+    def close() -> None:
+        if batch:
+            frames.append(FRAME_HEADER.pack(MAGIC, FRAME_VERSION, len(batch)) + b"".join(batch))
+
+    for message in messages:
+        encoded = encode_message(message)
+        if batch and (size + len(encoded) > max_bytes or len(batch) == MAX_MESSAGES_PER_FRAME):
+            close()
+            batch, size = [], FRAME_HEADER.size
+        batch.append(encoded)
+        size += len(encoded)
+    close()
+    return frames
+
+
+def decode_payload(message_type: MessageType, version: int, seq_num: int, timestamp: int, payload: bytes) -> BaseMessage:
+    node_id, offset = _unpack_str(payload, 0)
+    values = {}
+    for name, code in FIELDS[message_type]:
+        if code == "s":
+            values[name], offset = _unpack_str(payload, offset)
+        else:
+            (values[name],) = struct.unpack_from(f"!{code}", payload, offset)
+            offset += struct.calcsize(f"!{code}")
+    return MESSAGE_CLASSES[message_type](node_id=node_id, timestamp=timestamp, seq_num=seq_num, version=version, **values)
+
+
+def decode_frame(data: bytes, skip: Optional[SkipFilter] = None) -> List[BaseMessage]:
+    """Decode every message of a binary frame, except those ``skip`` rejects by header."""
+    magic, frame_version, count = FRAME_HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError("not a binary cluster frame")
+    if frame_version != FRAME_VERSION:
+        raise ValueError(f"unsupported frame version {frame_version}")
+
+    messages = []
+    offset = FRAME_HEADER.size
+    for _ in range(count):
+        type_code, version, hashed, seq_num, timestamp, length = MESSAGE_HEADER.unpack_from(data, offset)
+        offset += MESSAGE_HEADER.size
+        payload = data[offset : offset + length]
+        offset += length
+        if len(payload) != length:
+            raise ValueError("truncated frame")
+
+        message_type = TYPES_BY_CODE.get(type_code)
+        if message_type is None:
+            # A newer node's message type; the length lets us step over it
+            continue
+        if skip is not None and skip(message_type, hashed, seq_num):
+            continue
+        messages.append(decode_payload(message_type, version, seq_num, timestamp, payload))
+    return messages
+
+
+def is_frame(data: bytes) -> bool:
+    return data[:2] == MAGIC
+
+
+def parse_datagram(data: bytes, skip: Optional[SkipFilter] = None) -> List[BaseMessage]:
+    """Messages in a datagram, binary or JSON."""
+    if is_frame(data):
+        return decode_frame(data, skip)
+    message = parse_message(data)
+    if skip is not None and skip(message.type, node_hash(message.node_id), message.seq_num):
+        return []
+    return [message]
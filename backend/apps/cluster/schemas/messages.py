@@ -11,6 +11,7 @@ class MessageType(Enum):
     GOODBYE = "goodbye"
     SYNC_REQUEST = "sync_request"
     ACK = "ack"
+    ELECTION = "election"
 
 
 @dataclass
@@ -156,27 +157,45 @@ class AckMessage(BaseMessage):
         )
 
 
+@dataclass
+class ElectionMessage(BaseMessage):
+    """Candidacy in a master election, ranked by (last_sync_id, node_id)."""
+
+    last_sync_id: int = 0
+    port: int = 8000
+
+    def __post_init__(self):
+        self.type = MessageType.ELECTION
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ElectionMessage":
+        return cls(
+            type=MessageType.ELECTION,
+            node_id=data["node_id"],
+            timestamp=data["timestamp"],
+            seq_num=data.get("seq_num", 1),
+            version=data.get("version", 1),
+            last_sync_id=data.get("last_sync_id", 0),
+            port=data.get("port", 8000),
+        )
+
+
+MESSAGE_CLASSES = {
+    MessageType.ANNOUNCE: AnnounceMessage,
+    MessageType.HEARTBEAT: HeartbeatMessage,
+    MessageType.MASTER_ANNOUNCE: MasterAnnounceMessage,
+    MessageType.GOODBYE: GoodbyeMessage,
+    MessageType.SYNC_REQUEST: SyncRequestMessage,
+    MessageType.ACK: AckMessage,
+    MessageType.ELECTION: ElectionMessage,
+}
+
+
 def parse_message(data: bytes) -> BaseMessage:
+    """Parse a JSON-encoded message."""
     parsed = json.loads(data.decode("utf-8"))
-    msg_type = parsed.get("type")
-
-    message_classes = {
-        MessageType.ANNOUNCE: AnnounceMessage,
-        MessageType.HEARTBEAT: HeartbeatMessage,
-        MessageType.MASTER_ANNOUNCE: MasterAnnounceMessage,
-        MessageType.GOODBYE: GoodbyeMessage,
-        MessageType.SYNC_REQUEST: SyncRequestMessage,
-        MessageType.ACK: AckMessage,
-    }
-
-    for key, value in parsed.items():
-        if key == "type":
-            continue
-        if key in message_classes:
-            msg_type = MessageType(value)
-            break
-
-    if msg_type in message_classes:
-        return message_classes[msg_type].from_dict(parsed)
-
-    raise ValueError(f"Unknown message type: {msg_type}")
+    try:
+        msg_type = MessageType(parsed.get("type"))
+    except ValueError:
+        raise ValueError(f"Unknown message type: {parsed.get('type')}")
+    return MESSAGE_CLASSES[msg_type].from_dict(parsed)
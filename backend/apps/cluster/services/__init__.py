@@ -6,6 +6,11 @@ from backend.apps.cluster.services.ack_queue import AckQueue, PendingAck
 from backend.apps.cluster.services.sync_manager import SyncManager, sync_manager, SyncChange, SyncResult
 from backend.apps.cluster.services.proxy import MasterProxy, FollowerProxy, get_master_proxy, get_follower_proxy
 from backend.apps.cluster.services.sync_worker import SyncWorker, sync_worker
+from backend.apps.cluster.services.config_cache import ClusterConfigCache, cluster_config_cache, get_cluster_config
+from backend.apps.cluster.services.change_feed import ChangeFeed, change_feed
+from backend.apps.cluster.services.notify_dispatcher import NotificationDispatcher, notification_dispatcher
+from backend.apps.cluster.services.http_client import ClusterHttpClient, cluster_http
+from backend.apps.cluster.services.sync_log_compactor import SyncLogCompactor, sync_log_compactor
 
 __all__ = [
     "UDPBroadcastService",
@@ -27,4 +32,15 @@ __all__ = [
     "get_follower_proxy",
     "SyncWorker",
     "sync_worker",
+    "ClusterConfigCache",
+    "cluster_config_cache",
+    "get_cluster_config",
+    "ChangeFeed",
+    "change_feed",
+    "NotificationDispatcher",
+    "notification_dispatcher",
+    "ClusterHttpClient",
+    "cluster_http",
+    "SyncLogCompactor",
+    "sync_log_compactor",
 ]
@@ -1,13 +1,20 @@
+import asyncio
 import logging
 import threading
 import time
+from bisect import bisect_left, bisect_right, insort
 from dataclasses import dataclass, field
-from typing import Dict, Set, List
+from typing import Dict, Set, List, Tuple
 from threading import Lock
 
 logger = logging.getLogger(__name__)
 
 
+def _set_future_confirmed(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(True)
+
+
 @dataclass
 class PendingAck:
     """Represents a pending ACK for a sync log entry."""
@@ -16,6 +23,16 @@ class PendingAck:
     created_at: float = field(default_factory=time.time)
     confirmed_nodes: Set[str] = field(default_factory=set)
     event: threading.Event = field(default_factory=threading.Event)
+    # Async waiters: the loop each future belongs to, since ACKs arrive on other threads
+    futures: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = field(default_factory=list)
+
+    def resolve(self) -> None:
+        """Release every waiter, sync and async."""
+        self.event.set()
+        for loop, future in self.futures:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(_set_future_confirmed, future)
+        self.futures.clear()
 
     def to_dict(self) -> dict:
         return {
@@ -26,7 +43,16 @@ class PendingAck:
 
 
 class AckQueue:
-    """Tracks pending ACKs from followers for synchronous write confirmation."""
+    """
+    Tracks pending ACKs from followers for synchronous write confirmation.
+
+    Followers ACK the last sync log id they applied, which covers every
+    earlier id as well. Each node's highest ACK is kept as its watermark, and
+    an id is confirmed once ``nodes_required`` watermarks reach it. Pending
+    ids are kept sorted, so an ACK releases every writer at or below the new
+    group watermark at once (a binary search plus one slice) instead of each
+    of them waiting for an ACK of its own id.
+    """
 
     DEFAULT_TIMEOUT_MS = 5000
     CLEANUP_INTERVAL_S = 60
@@ -34,6 +60,8 @@ class AckQueue:
 
     def __init__(self):
         self._pending: Dict[int, PendingAck] = {}
+        self._pending_ids: List[int] = []
+        self._watermarks: Dict[str, int] = {}
         self._lock = Lock()
         self._nodes_required = 1
         self._last_cleanup = time.time()
@@ -42,8 +70,13 @@ class AckQueue:
         """Set the minimum number of node confirmations required."""
         if count < 1:
             raise ValueError("nodes_required must be at least 1")
-        self._nodes_required = count
-        logger.info(f"ACK queue configured: {count} node(s) required for confirmation")
+        with self._lock:
+            changed = count != self._nodes_required
+            self._nodes_required = count
+            if changed:
+                self._release_confirmed()
+        if changed:
+            logger.info(f"ACK queue configured: {count} node(s) required for confirmation")
 
     def register(self, sync_log_id: int, replicas_required: int = 1) -> "threading.Event":
         """
@@ -55,53 +88,74 @@ class AckQueue:
                 logger.warning(f"Sync log {sync_log_id} already registered")
                 return self._pending[sync_log_id].event
 
-            pending_ack = PendingAck(sync_log_id=sync_log_id)
-            self._pending[sync_log_id] = pending_ack
-
-            self._cleanup_old_entries()
+            pending_ack = self._add_pending(sync_log_id)
 
             logger.debug(f"Registered pending ACK for sync_log_id={sync_log_id}")
             return pending_ack.event
 
+    def register_async(self, sync_log_id: int, replicas_required: int = 1) -> asyncio.Future:
+        """
+        Register a pending ACK and return a future of the running event loop.
+
+        The future resolves to True once the required ACKs are received; it
+        can be awaited without holding a thread.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._lock:
+            pending_ack = self._pending.get(sync_log_id) or self._add_pending(sync_log_id)
+            if pending_ack.event.is_set():
+                future.set_result(True)
+            else:
+                pending_ack.futures.append((loop, future))
+
+        logger.debug(f"Registered async pending ACK for sync_log_id={sync_log_id}")
+        return future
+
+    async def wait_async(self, sync_log_id: int, timeout: float, replicas_required: int = 1) -> bool:
+        """Wait for the ACKs of a sync log entry without blocking a thread; returns False on timeout."""
+        future = self.register_async(sync_log_id, replicas_required)
+        try:
+            return await asyncio.wait_for(future, timeout=timeout)
+        except asyncio.TimeoutError:
+            with self._lock:
+                pending_ack = self._pending.get(sync_log_id)
+                if pending_ack is not None:
+                    pending_ack.futures = [(loop, f) for loop, f in pending_ack.futures if f is not future]
+            return self.is_confirmed(sync_log_id)
+
     def acknowledge(self, sync_log_id: int, node_id: str) -> bool:
         """
-        Record an ACK from a follower node.
-        Returns True if the ACK was processed, False if not found.
+        Record an ACK from a follower node for ``sync_log_id`` and every id before it.
+        Returns True if the ACK covered a pending entry, False otherwise.
         """
         with self._lock:
-            if sync_log_id not in self._pending:
+            if sync_log_id > self._watermarks.get(node_id, 0):
+                self._watermarks[node_id] = sync_log_id
+
+            covered = bisect_right(self._pending_ids, sync_log_id)
+            if not covered:
                 logger.debug(f"Received ACK for unknown sync_log_id={sync_log_id} from node={node_id}")
                 return False
 
-            pending_ack = self._pending[sync_log_id]
-            pending_ack.confirmed_nodes.add(node_id)
-
-            confirmed_count = len(pending_ack.confirmed_nodes)
-            required = self._nodes_required
+            released = self._release_confirmed()
 
-            logger.debug(f"ACK received for sync_log_id={sync_log_id} from node={node_id} " f"({confirmed_count}/{required})")
-
-            if confirmed_count >= required:
-                pending_ack.event.set()
-                logger.info(f"Sync log {sync_log_id} confirmed by {confirmed_count} node(s)")
-                del self._pending[sync_log_id]
-
-            return True
+        logger.debug(f"ACK received up to sync_log_id={sync_log_id} from node={node_id}, released {released} pending write(s)")
+        return True
 
     def is_confirmed(self, sync_log_id: int) -> bool:
         """Check if a sync log entry has been confirmed."""
         with self._lock:
             if sync_log_id not in self._pending:
                 return True
-            pending_ack = self._pending[sync_log_id]
-            return len(pending_ack.confirmed_nodes) >= self._nodes_required
+            return sync_log_id <= self._group_watermark()
 
     def get_confirmed_nodes(self, sync_log_id: int) -> List[str]:
         """Get the list of nodes that have confirmed a sync log entry."""
         with self._lock:
             if sync_log_id not in self._pending:
                 return []
-            return list(self._pending[sync_log_id].confirmed_nodes)
+            return self._confirmed_nodes(sync_log_id)
 
     def get_pending_count(self) -> int:
         """Get the number of pending ACKs."""
@@ -116,26 +170,35 @@ class AckQueue:
         If pending ACKs exist, returns min(pending_ids) - 1 (last confirmed ID).
         """
         with self._lock:
-            if not self._pending:
+            if not self._pending_ids:
                 return 0
-            min_pending = min(self._pending.keys())
-            return max(0, min_pending - 1)
+            return max(0, self._pending_ids[0] - 1)
 
     def get_pending_ids(self) -> List[int]:
         """Get all pending sync log IDs."""
         with self._lock:
-            return list(self._pending.keys())
+            return list(self._pending_ids)
 
     def get_pending_details(self) -> List[dict]:
         """Get details of all pending ACKs."""
         with self._lock:
-            return [ack.to_dict() for ack in self._pending.values()]
+            details = []
+            for sync_log_id in self._pending_ids:
+                pending_ack = self._pending[sync_log_id]
+                pending_ack.confirmed_nodes = set(self._confirmed_nodes(sync_log_id))
+                details.append(pending_ack.to_dict())
+            return details
+
+    def get_watermarks(self) -> Dict[str, int]:
+        """Highest sync log id ACKed by each node."""
+        with self._lock:
+            return dict(self._watermarks)
 
     def remove(self, sync_log_id: int) -> bool:
         """Remove a pending ACK entry."""
         with self._lock:
             if sync_log_id in self._pending:
-                del self._pending[sync_log_id]
+                self._drop(sync_log_id)
                 logger.debug(f"Removed pending ACK for sync_log_id={sync_log_id}")
                 return True
             return False
@@ -145,9 +208,50 @@ class AckQueue:
         with self._lock:
             count = len(self._pending)
             self._pending.clear()
+            self._pending_ids.clear()
             logger.info(f"Cleared {count} pending ACKs")
             return count
 
+    def _add_pending(self, sync_log_id: int) -> PendingAck:
+        pending_ack = PendingAck(sync_log_id=sync_log_id)
+        if sync_log_id <= self._group_watermark():
+            # The followers were faster than the writer: already confirmed
+            pending_ack.resolve()
+            return pending_ack
+
+        self._pending[sync_log_id] = pending_ack
+        insort(self._pending_ids, sync_log_id)
+        self._cleanup_old_entries()
+        return pending_ack
+
+    def _group_watermark(self) -> int:
+        """Highest id ACKed by at least ``nodes_required`` nodes."""
+        if len(self._watermarks) < self._nodes_required:
+            return 0
+        return sorted(self._watermarks.values(), reverse=True)[self._nodes_required - 1]
+
+    def _confirmed_nodes(self, sync_log_id: int) -> List[str]:
+        return [node_id for node_id, watermark in self._watermarks.items() if watermark >= sync_log_id]
+
+    def _release_confirmed(self) -> int:
+        """Resolve and drop every pending id at or below the group watermark."""
+        end = bisect_right(self._pending_ids, self._group_watermark())
+        if not end:
+            return 0
+
+        released = self._pending_ids[:end]
+        del self._pending_ids[:end]
+        for sync_log_id in released:
+            self._pending.pop(sync_log_id).resolve()
+
+        logger.info(f"Sync logs {released[0]}..{released[-1]} confirmed ({len(released)} write(s))")
+        return len(released)
+
+    def _drop(self, sync_log_id: int) -> None:
+        del self._pending[sync_log_id]
+        position = bisect_left(self._pending_ids, sync_log_id)
+        del self._pending_ids[position]
+
     def _cleanup_old_entries(self) -> None:
         """Remove entries older than MAX_AGE_S."""
         now = time.time()
@@ -157,7 +261,7 @@ class AckQueue:
         expired = [sync_id for sync_id, ack in self._pending.items() if now - ack.created_at > self.MAX_AGE_S]
 
         for sync_id in expired:
-            del self._pending[sync_id]
+            self._drop(sync_id)
             logger.warning(f"Removed expired pending ACK for sync_log_id={sync_id}")
 
         if expired:
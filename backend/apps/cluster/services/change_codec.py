@@ -0,0 +1,112 @@
+"""
+Compact wire format for GET /sync/changes/.
+
+A follower that sends ``Accept: application/x-ndjson`` gets the page as
+JSON lines instead of one DRF-rendered document:
+
+    {"format": "changes/1", "fields": ["id", "table_name", ...]}
+    [41, "tournament", "5f0c...", "UPDATE", {"status": "open"}, 3, "2025-01-01T10:00:00.123456+00:00"]
+    [42, ...]
+    {"last_id": 42, "has_more": false}
+
+Rows are positional arrays, so field names are not repeated per change, and
+``data`` is copied from the database as stored JSON text rather than being
+decoded and re-encoded. The master gzips the stream when the follower
+accepts it, flushing every ``FLUSH_ROWS`` rows, and the follower decodes it
+line by line as it arrives. A stream without the trailer line is truncated.
+Followers that do not ask for it (or masters that do not offer it) keep
+using the JSON document.
+"""
+
+import json
+import zlib
+from typing import Any, Dict, Iterable, Iterator, List, Sequence
+
+from backend.apps.cluster.services.sync_manager import SyncChange
+
+CONTENT_TYPE = "application/x-ndjson"
+# JSON stays acceptable so that masters without the compact format still answer
+ACCEPT = f"{CONTENT_TYPE}, application/json;q=0.9"
+FORMAT = "changes/1"
+FIELDS = ("id", "table_name", "record_id", "operation", "data", "version", "created_at")
+FLUSH_ROWS = 100
+
+
+def is_compact(content_type: Any) -> bool:
+    return isinstance(content_type, str) and content_type.split(";")[0].strip().lower() == CONTENT_TYPE
+
+
+def encode_changes(rows: Iterable[Sequence[Any]], limit: int, since_id: int) -> Iterator[str]:
+    """
+    Encode rows from SyncManager.iter_change_rows as JSON lines.
+
+    ``rows`` may hold one row more than ``limit``; it is not sent and only
+    sets ``has_more``.
+    """
+    yield json.dumps({"format": FORMAT, "fields": FIELDS}) + "\n"
+
+    last_id = since_id
+    has_more = False
+    for count, (sync_id, table_name, record_id, operation, data_json, version, created_at) in enumerate(rows):
+        if count == limit:
+            has_more = True
+            break
+        last_id = sync_id
+        created = json.dumps(created_at.isoformat() if created_at else None)
+        yield f"[{sync_id},{json.dumps(table_name)},{json.dumps(record_id)},{json.dumps(operation)},{data_json},{version},{created}]\n"
+
+    yield json.dumps({"last_id": last_id, "has_more": has_more}) + "\n"
+
+
+def gzip_lines(lines: Iterable[str], flush_rows: int = FLUSH_ROWS) -> Iterator[bytes]:
+    """Gzip a line stream, flushing every ``flush_rows`` lines so the reader can start early."""
+    compressor = zlib.compressobj(wbits=31)
+    for count, line in enumerate(lines, start=1):
+        chunk = compressor.compress(line.encode())
+        if count % flush_rows == 0:
+            chunk += compressor.flush(zlib.Z_SYNC_FLUSH)
+        if chunk:
+            yield chunk
+    yield compressor.flush()
+
+
+def decode_changes(lines: Iterable[bytes]) -> Dict[str, Any]:
+    """
+    Decode a compact page into ``{"changes": [SyncChange, ...], "last_id", "has_more"}``.
+
+    Raises ValueError if the stream is not in this format or is truncated.
+    """
+    lines = iter(line for line in lines if line)
+    try:
+        header = json.loads(next(lines))
+    except StopIteration:
+        raise ValueError("empty changes stream")
+    if not isinstance(header, dict) or header.get("format") != FORMAT:
+        raise ValueError(f"unsupported changes format: {header!r}")
+    positions = _field_positions(header.get("fields", []))
+
+    changes: List[SyncChange] = []
+    for line in lines:
+        item = json.loads(line)
+        if isinstance(item, dict):
+            return {"changes": changes, "last_id": item["last_id"], "has_more": item["has_more"]}
+        changes.append(
+            SyncChange(
+                id=item[positions["id"]],
+                table_name=item[positions["table_name"]],
+                record_id=item[positions["record_id"]],
+                operation=item[positions["operation"]],
+                data=item[positions["data"]],
+                version=item[positions["version"]],
+                created_at=item[positions["created_at"]],
+            )
+        )
+    raise ValueError(f"changes stream truncated after {len(changes)} change(s)")
+
+
+def _field_positions(fields: List[str]) -> Dict[str, int]:
+    positions = {name: index for index, name in enumerate(fields)}
+    missing = [name for name in FIELDS if name not in positions]
+    if missing:
+        raise ValueError(f"changes stream is missing fields: {', '.join(missing)}")
+    return positions
@@ -0,0 +1,100 @@
+"""
+Change feed for long-polling followers.
+
+The master publishes the id of the newest sync_log entry once the transaction
+that wrote it commits. A follower's GET /sync/changes/?wait=N parks on
+wait_for() until an entry newer than the one it has appears, or until the wait
+expires, so replication starts as soon as a write commits instead of on the
+follower's next poll.
+
+Writes committed by another process (several workers sharing one database)
+never reach this process's feed, so waiters also re-read the newest id from
+the database every ``recheck_interval`` seconds
+(CLUSTER_CONFIG["sync_long_poll_recheck_interval"]).
+
+A parked follower holds its server thread for the whole wait, so the master
+must run threaded workers (gunicorn ``--worker-class gthread``) with more
+threads than followers; see docs/deployment/cluster-setup.md.
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Optional
+
+from django.conf import settings
+from django.db.models import Max
+
+from backend.apps.cluster.models import DjangoSyncLog
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RECHECK_INTERVAL = 1.0
+MAX_WAIT_SECONDS = 30.0
+
+
+def _latest_sync_id_in_db() -> int:
+    return DjangoSyncLog.objects.aggregate(max_id=Max("id"))["max_id"] or 0
+
+
+class ChangeFeed:
+    """Wakes long-poll waiters when new sync_log entries commit."""
+
+    def __init__(self, recheck_interval: Optional[float] = None, latest_id_loader: Optional[Callable[[], int]] = None):
+        self._recheck_interval = recheck_interval
+        self._load_latest_id = latest_id_loader or _latest_sync_id_in_db
+        self._condition = threading.Condition()
+        self._latest_id = 0
+
+    @property
+    def recheck_interval(self) -> float:
+        if self._recheck_interval is not None:
+            return self._recheck_interval
+        return float(getattr(settings, "CLUSTER_CONFIG", {}).get("sync_long_poll_recheck_interval", DEFAULT_RECHECK_INTERVAL))
+
+    @property
+    def latest_id(self) -> int:
+        return self._latest_id
+
+    def publish(self, sync_id: int) -> None:
+        """Announce that sync_log entries up to ``sync_id`` are committed."""
+        with self._condition:
+            if sync_id <= self._latest_id:
+                return
+            self._latest_id = sync_id
+            self._condition.notify_all()
+        logger.debug(f"Change feed: published sync_id={sync_id}")
+
+    def reset(self) -> None:
+        """Forget the published id; the next wait re-reads it from the database."""
+        with self._condition:
+            self._latest_id = 0
+
+    def wait_for(self, since_id: int, timeout: float) -> bool:
+        """
+        Block until a sync_log entry newer than ``since_id`` exists or ``timeout`` seconds pass.
+
+        Returns True if newer entries exist.
+
+        While parked, every waiter runs ``SELECT MAX(id)`` on sync_log once per
+        ``recheck_interval`` to catch writes from other processes; with N
+        followers that is N cheap index lookups per interval on the master.
+        """
+        deadline = time.monotonic() + max(0.0, min(timeout, MAX_WAIT_SECONDS))
+        while True:
+            if self._latest_id > since_id:
+                return True
+            latest = self._load_latest_id()
+            if latest > since_id:
+                self.publish(latest)
+                return True
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            with self._condition:
+                if self._latest_id <= since_id:
+                    self._condition.wait(timeout=min(remaining, self.recheck_interval))
+
+
+change_feed = ChangeFeed()
@@ -0,0 +1,81 @@
+"""
+Process-wide cache of the DjangoClusterConfig singleton.
+
+Middleware, the sync worker and the status views read the cluster config on
+every request/cycle. The cache serves those reads from memory; it is refreshed
+from the model's post_save signal (see ClusterConfig.ready()) and re-read from
+the database once the TTL expires, as a safety net for writes that bypass
+signals (queryset.update(), other processes sharing the database).
+
+The cached instance is shared between threads and must be treated as
+read-only. Code that modifies the config should load its own copy with
+DjangoClusterConfig.get_config() and save() it.
+"""
+
+import copy
+import logging
+import threading
+import time
+from typing import Optional
+
+from django.conf import settings
+
+from backend.apps.cluster.models.cluster_config import DjangoClusterConfig
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONFIG_CACHE_TTL = 5.0
+
+
+class ClusterConfigCache:
+    """Thread-safe TTL cache holding the current cluster config."""
+
+    def __init__(self, ttl: Optional[float] = None):
+        self._ttl = ttl
+        # Re-entrant: get_config() may create the row, firing post_save -> update() under the lock
+        self._lock = threading.RLock()
+        self._config: Optional[DjangoClusterConfig] = None
+        self._loaded_at = 0.0
+
+    @property
+    def ttl(self) -> float:
+        if self._ttl is not None:
+            return self._ttl
+        return getattr(settings, "CLUSTER_CONFIG", {}).get("config_cache_ttl", DEFAULT_CONFIG_CACHE_TTL)
+
+    def get(self) -> DjangoClusterConfig:
+        """Return the cached config, loading it from the database when missing or expired."""
+        config = self._config
+        if config is not None and time.monotonic() - self._loaded_at < self.ttl:
+            return config
+
+        with self._lock:
+            if self._config is not None and time.monotonic() - self._loaded_at < self.ttl:
+                return self._config
+            config = DjangoClusterConfig.get_config()
+            self._store(config)
+            return config
+
+    def update(self, instance: DjangoClusterConfig) -> None:
+        """Replace the cached config with a freshly saved instance."""
+        with self._lock:
+            self._store(copy.copy(instance))
+        logger.debug(f"Cluster config cache refreshed (mode={instance.mode}, is_master={instance.is_master})")
+
+    def invalidate(self) -> None:
+        """Drop the cached config so the next read goes to the database."""
+        with self._lock:
+            self._config = None
+            self._loaded_at = 0.0
+
+    def _store(self, config: DjangoClusterConfig) -> None:
+        self._config = config
+        self._loaded_at = time.monotonic()
+
+
+cluster_config_cache = ClusterConfigCache()
+
+
+def get_cluster_config() -> DjangoClusterConfig:
+    """Read-only cluster config served from the process-wide cache."""
+    return cluster_config_cache.get()
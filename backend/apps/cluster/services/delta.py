@@ -0,0 +1,215 @@
+"""
+Field-level delta payloads for sync_log UPDATE entries.
+
+Instead of storing a full ``model_to_dict`` snapshot for every UPDATE, the
+master records only the columns that changed. JSONField columns (``de_trees``,
+``live_ranking``, pool ``results``...) are stored as JSON-patch style operation
+lists against the previous value, together with a fingerprint of that previous
+value. A follower applies the patch only when its local value matches the
+fingerprint; otherwise it falls back to a full snapshot fetched from master.
+
+Delta payload layout (stored in ``DjangoSyncLog.data``)::
+
+    {
+        "__delta__": 1,
+        "base_version": 3,
+        "base": "9f2c...",              # fingerprint of the patched columns
+        "fields": {"status": "ONGOING"},
+        "patches": {"de_trees": [{"op": "replace", "path": "/1/3/score", "value": 15}]},
+    }
+"""
+
+import copy
+import hashlib
+import json
+import logging
+from typing import Any, Dict, Iterable, List, Optional
+
+from django.conf import settings
+from django.forms.models import model_to_dict
+
+logger = logging.getLogger(__name__)
+
+DELTA_KEY = "__delta__"
+DELTA_FORMAT_VERSION = 1
+
+
+def delta_enabled() -> bool:
+    """Whether UPDATE sync_log entries should be recorded as deltas."""
+    return getattr(settings, "CLUSTER_CONFIG", {}).get("sync_delta_enabled", True)
+
+
+def snapshot_instance(instance) -> Dict[str, Any]:
+    """Full-row snapshot of a model instance as recorded in sync_log."""
+    data = model_to_dict(instance)
+    if hasattr(instance, "created_at") and instance.created_at:
+        data["created_at"] = instance.created_at
+    return data
+
+
+def json_fields_of(instance) -> set:
+    """Names of the JSONField columns of a model instance (empty for non-models)."""
+    meta = getattr(instance, "_meta", None)
+    if meta is None:
+        return set()
+    return {f.name for f in meta.concrete_fields if f.get_internal_type() == "JSONField"}
+
+
+def is_delta(data: Any) -> bool:
+    """Check whether a sync_log payload is a delta rather than a full snapshot."""
+    return isinstance(data, dict) and DELTA_KEY in data
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def fingerprint(values: Dict[str, Any]) -> str:
+    """Stable short hash of a mapping of column values."""
+    return hashlib.sha1(_dumps(values).encode("utf-8")).hexdigest()[:16]
+
+
+def _escape(token: Any) -> str:
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def json_diff(old: Any, new: Any, path: str = "") -> List[Dict[str, Any]]:
+    """
+    Compute JSON-patch style operations (add/remove/replace) turning ``old`` into ``new``.
+
+    Dicts are diffed per key and lists element-wise with tail add/remove, which
+    keeps a single bracket-cell or pool-cell edit down to one operation.
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops: List[Dict[str, Any]] = []
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in new.items():
+            child = f"{path}/{_escape(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": child, "value": value})
+            else:
+                ops.extend(json_diff(old[key], value, child))
+        return ops
+
+    if isinstance(old, list) and isinstance(new, list):
+        ops = []
+        common = min(len(old), len(new))
+        for i in range(common):
+            ops.extend(json_diff(old[i], new[i], f"{path}/{i}"))
+        for i in range(common, len(new)):
+            ops.append({"op": "add", "path": f"{path}/{i}", "value": new[i]})
+        for i in range(len(old) - 1, common - 1, -1):
+            ops.append({"op": "remove", "path": f"{path}/{i}"})
+        return ops
+
+    if type(old) is type(new) and old == new:
+        return []
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+def json_patch(document: Any, ops: Iterable[Dict[str, Any]]) -> Any:
+    """Apply operations produced by :func:`json_diff` to a copy of ``document``."""
+    document = copy.deepcopy(document)
+
+    for op in ops:
+        path = op["path"]
+        if path == "":
+            document = copy.deepcopy(op.get("value"))
+            continue
+
+        tokens = [_unescape(t) for t in path.split("/")[1:]]
+        parent = document
+        for token in tokens[:-1]:
+            parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+
+        last = tokens[-1]
+        kind = op["op"]
+        if isinstance(parent, list):
+            index = len(parent) if last == "-" else int(last)
+            if kind == "add":
+                parent.insert(index, copy.deepcopy(op["value"]))
+            elif kind == "remove":
+                del parent[index]
+            else:
+                parent[index] = copy.deepcopy(op["value"])
+        else:
+            if kind == "remove":
+                del parent[last]
+            else:
+                parent[last] = copy.deepcopy(op["value"])
+
+    return document
+
+
+def compute_delta(
+    previous: Dict[str, Any],
+    current: Dict[str, Any],
+    json_fields: Iterable[str] = (),
+    base_version: Optional[int] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Build a delta payload from two full-row snapshots.
+
+    Returns None when the delta would not be smaller than the full snapshot,
+    in which case the caller should record ``current`` as-is.
+    """
+    json_fields = set(json_fields)
+    fields: Dict[str, Any] = {}
+    patches: Dict[str, List[Dict[str, Any]]] = {}
+    base_values: Dict[str, Any] = {}
+
+    for key, value in current.items():
+        if key in previous and type(previous[key]) is type(value) and previous[key] == value:
+            continue
+
+        old = previous.get(key)
+        if key in json_fields and isinstance(old, (dict, list)) and isinstance(value, (dict, list)):
+            ops = json_diff(old, value)
+            if len(_dumps(ops)) < len(_dumps(value)):
+                patches[key] = ops
+                base_values[key] = old
+                continue
+
+        fields[key] = value
+
+    delta = {
+        DELTA_KEY: DELTA_FORMAT_VERSION,
+        "base_version": base_version,
+        "base": fingerprint(base_values),
+        "fields": fields,
+        "patches": patches,
+    }
+
+    if len(_dumps(delta)) >= len(_dumps(current)):
+        return None
+    return delta
+
+
+def resolve_delta(delta: Dict[str, Any], record) -> Optional[Dict[str, Any]]:
+    """
+    Turn a delta into a partial data dict against the local ``record``.
+
+    Returns None when the record's patched columns do not match the base the
+    delta was computed against; the caller must then use a full snapshot.
+    """
+    patches = delta.get("patches") or {}
+    current = {key: getattr(record, key, None) for key in patches}
+
+    if fingerprint(current) != delta.get("base"):
+        logger.info(f"Delta base mismatch for {getattr(record, 'pk', None)} (base_version={delta.get('base_version')})")
+        return None
+
+    resolved = dict(delta.get("fields") or {})
+    for key, ops in patches.items():
+        try:
+            resolved[key] = json_patch(current[key], ops)
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to apply JSON patch to {key}: {e}")
+            return None
+    return resolved
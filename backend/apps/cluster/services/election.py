@@ -2,10 +2,10 @@ import asyncio
 import logging
 import time
 from enum import Enum
-from typing import Optional, Callable
+from typing import Any, Dict, Optional, Callable, Tuple
 
-from backend.apps.cluster.schemas.messages import MasterAnnounceMessage
-from backend.apps.cluster.services.node_discovery import NodeDiscovery
+from backend.apps.cluster.schemas.messages import ElectionMessage, HeartbeatMessage, MasterAnnounceMessage
+from backend.apps.cluster.services.node_discovery import NodeDiscovery, NodeInfo
 from backend.apps.cluster.services.heartbeat import HeartbeatMonitor
 from backend.apps.cluster.services.udp_broadcast import UDPBroadcastService
 
@@ -20,7 +20,23 @@ class ElectionState(Enum):
 
 
 class BullyElection:
+    """
+    Bully election ranked by data: the live node with the highest
+    (last applied sync id, node_id) becomes master, so the most up-to-date
+    node wins and nobody has to re-copy its data from a fresher follower.
+
+    A candidate broadcasts its last applied sync id in an ElectionMessage and
+    listens CANDIDACY_WAIT seconds for its peers' candidacies; a node that
+    outranks a candidate answers with its own candidacy, and a master
+    re-announces itself. When the heartbeat monitor suspects the master, the
+    failed master no longer counts as a candidate, so a node with no live
+    higher-ranked peer takes over at once. Nodes that do have one wait up to
+    ELECTION_TIMEOUT for it to announce itself.
+    """
+
     ELECTION_TIMEOUT = 10.0
+    ELECTION_POLL_INTERVAL = 0.1
+    CANDIDACY_WAIT = 0.3
     MASTER_ANNOUNCE_WAIT = 2.0
 
     def __init__(
@@ -30,26 +46,53 @@ class BullyElection:
         udp_service: UDPBroadcastService,
         on_become_master: Optional[Callable[[], None]] = None,
         on_become_follower: Optional[Callable[[str, str, int], None]] = None,
+        get_last_sync_id: Optional[Callable[[], int]] = None,
     ):
         self.node_discovery = node_discovery
         self.heartbeat_monitor = heartbeat_monitor
         self.udp_service = udp_service
         self.on_become_master = on_become_master
         self.on_become_follower = on_become_follower
+        # Highest sync_log id this node has applied (see SyncManager.get_applied_sync_id)
+        self.get_last_sync_id = get_last_sync_id or (lambda: 0)
 
         self.state = ElectionState.FOLLOWER
         self.election_start_time: Optional[float] = None
         self.election_in_progress = False
+        self.last_failover_seconds: Optional[float] = None
 
         self._election_task: Optional[asyncio.Task] = None
+        self._failed_master_id: Optional[str] = None
+        self._failure_detected_at: Optional[float] = None
 
     async def start(self) -> None:
+        self.node_discovery.on_master_heartbeat = self.heartbeat_monitor.record_heartbeat
+        self.node_discovery.on_election = self._on_candidacy
         await self.node_discovery.start_discovery()
         await self._determine_initial_role()
 
-        self.heartbeat_monitor.on_timeout = self.trigger_election
+        self.heartbeat_monitor.on_timeout = self._on_master_failure
         await self.heartbeat_monitor.start()
 
+    async def _on_master_failure(self) -> None:
+        self._failed_master_id = self.heartbeat_monitor.master_id
+        self._failure_detected_at = time.time()
+        await self.trigger_election()
+
+    def _rank(self, node_id: str, last_sync_id: int) -> Tuple[int, str]:
+        return (last_sync_id, node_id)
+
+    def _own_rank(self) -> Tuple[int, str]:
+        return self._rank(self.node_discovery.get_node_id(), self.get_last_sync_id())
+
+    def _on_candidacy(self, message: ElectionMessage) -> None:
+        """A peer is running an election: a master re-asserts itself, a better-ranked node joins in."""
+        if self.state == ElectionState.MASTER:
+            asyncio.ensure_future(self._announce_master())
+        elif not self.election_in_progress and self._own_rank() > self._rank(message.node_id, message.last_sync_id):
+            logger.info(f"Outranking candidate {message.node_id} (last_sync_id={message.last_sync_id}), joining election")
+            asyncio.ensure_future(self.trigger_election())
+
     async def _determine_initial_role(self) -> None:
         existing_master = self.node_discovery.get_master()
 
@@ -82,21 +125,36 @@ class BullyElection:
     async def _run_election(self) -> None:
         try:
             my_id = self.node_discovery.get_node_id()
-            peers = self.node_discovery.get_peers()
+            my_rank = self._own_rank()
+            failed = self._failed_master_id
+            deadline = time.monotonic() + self.ELECTION_TIMEOUT
 
-            higher_id_nodes = [peer.node_id for peer in peers if peer.node_id > my_id]
-
-            if not higher_id_nodes:
-                logger.info(f"No nodes with higher ID than {my_id}, becoming master")
+            if any(peer.node_id != failed for peer in self.node_discovery.get_peers()):
+                await self.udp_service.broadcast_async(
+                    ElectionMessage(node_id=my_id, timestamp=int(time.time()), last_sync_id=my_rank[0], port=self.node_discovery.api_port)
+                )
+                # Peers answer with their own candidacy; a live master re-announces itself
+                current_master = await self._wait_for_master(exclude=failed, timeout=min(self.CANDIDACY_WAIT, self.ELECTION_TIMEOUT))
+                if current_master:
+                    logger.info(f"Master announced during candidacy: {current_master.node_id}, becoming follower")
+                    self._become_follower(current_master.node_id, current_master.ip, current_master.port)
+                    return
+
+            higher_ranked = [
+                peer.node_id
+                for peer in self.node_discovery.get_peers()
+                if peer.node_id != failed and self._rank(peer.node_id, peer.last_sync_id) > my_rank
+            ]
+
+            if not higher_ranked:
+                logger.info(f"No node ranks above {my_id} (last_sync_id={my_rank[0]}), becoming master")
                 await self._become_master()
                 return
 
-            logger.info(f"Nodes with higher ID exist: {higher_id_nodes}, " "waiting for election timeout")
-
-            await asyncio.sleep(self.ELECTION_TIMEOUT)
+            logger.info(f"Higher-ranked nodes exist: {higher_ranked}, " "waiting for election timeout")
 
-            current_master = self.node_discovery.get_master()
-            if current_master and current_master.is_master:
+            current_master = await self._wait_for_master(exclude=failed, timeout=deadline - time.monotonic())
+            if current_master:
                 logger.info(f"Master announced during wait: {current_master.node_id}, " "becoming follower")
                 self._become_follower(current_master.node_id, current_master.ip, current_master.port)
                 return
@@ -110,30 +168,62 @@ class BullyElection:
             self.state = ElectionState.FOLLOWER
         finally:
             self.election_in_progress = False
+            self._record_failover()
+
+    async def _wait_for_master(self, exclude: Optional[str] = None, timeout: Optional[float] = None) -> Optional[NodeInfo]:
+        """Wait up to ``timeout`` (default ELECTION_TIMEOUT) for a master, other than a silent ``exclude``, to announce itself."""
+        deadline = time.monotonic() + (self.ELECTION_TIMEOUT if timeout is None else timeout)
+        while True:
+            current_master = self.node_discovery.get_master()
+            if current_master and current_master.is_master and not self._silent_since_failure(current_master, exclude):
+                return current_master
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            await asyncio.sleep(min(self.ELECTION_POLL_INTERVAL, remaining))
+
+    def _silent_since_failure(self, node: NodeInfo, failed: Optional[str]) -> bool:
+        # A suspected master that announces itself again was only slow, and is followed again
+        return node.node_id == failed and node.last_seen <= (self._failure_detected_at or 0)
+
+    def _record_failover(self) -> None:
+        if self._failure_detected_at is None:
+            return
+        if self.state in (ElectionState.MASTER, ElectionState.FOLLOWER):
+            self.last_failover_seconds = time.time() - self._failure_detected_at
+            logger.info(
+                f"Failover from {self._failed_master_id} settled in {self.last_failover_seconds:.2f}s "
+                f"after detection ({self.state.value})"
+            )
+        self._failed_master_id = None
+        self._failure_detected_at = None
 
     async def _become_master(self) -> None:
         self.state = ElectionState.MASTER
         self.node_discovery.set_as_master()
 
-        local_ip = self.udp_service.get_local_ip()
-        api_port = self.node_discovery.api_port
-
-        msg = MasterAnnounceMessage(
-            node_id=self.node_discovery.get_node_id(),
-            timestamp=int(time.time()),
-            ip=local_ip,
-            port=api_port,
-        )
-
-        await self.udp_service.broadcast_async(msg)
+        await self._announce_master()
 
         self.heartbeat_monitor.set_master(True)
 
-        logger.info(f"Node {self.node_discovery.get_node_id()} is now MASTER " f"at {local_ip}:{api_port}")
+        logger.info(
+            f"Node {self.node_discovery.get_node_id()} is now MASTER "
+            f"at {self.udp_service.get_local_ip()}:{self.node_discovery.api_port}"
+        )
 
         if self.on_become_master:
             self.on_become_master()
 
+    async def _announce_master(self) -> None:
+        """Announce this node as master together with a heartbeat, in one datagram."""
+        node_id = self.node_discovery.get_node_id()
+        now = int(time.time())
+        announce = MasterAnnounceMessage(
+            node_id=node_id, timestamp=now, ip=self.udp_service.get_local_ip(), port=self.node_discovery.api_port
+        )
+        heartbeat = HeartbeatMessage(node_id=node_id, timestamp=now, last_sync_id=self.get_last_sync_id())
+        await self.udp_service.broadcast_many_async([announce, heartbeat])
+
     def _become_follower(self, master_id: str, master_ip: str, master_port: int) -> None:
         self.state = ElectionState.FOLLOWER
         self.heartbeat_monitor.set_master(False, master_id)
@@ -160,6 +250,14 @@ class BullyElection:
     def get_state(self) -> ElectionState:
         return self.state
 
+    def stats(self) -> Dict[str, Any]:
+        """Election state and failover timing: detection latency (heartbeat monitor) plus election time."""
+        return {
+            "state": self.state.value,
+            "last_failover_seconds": self.last_failover_seconds,
+            "heartbeat": self.heartbeat_monitor.stats(),
+        }
+
     def is_master(self) -> bool:
         return self.state == ElectionState.MASTER
 
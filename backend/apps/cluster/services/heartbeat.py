@@ -1,16 +1,34 @@
 import asyncio
 import logging
 import time
-from typing import Optional, Callable
+from typing import Any, Dict, Optional, Callable
+
+from django.conf import settings
+
+from backend.apps.cluster.schemas.messages import HeartbeatMessage
+from backend.apps.cluster.services.failure_detector import DEFAULT_THRESHOLD, PhiAccrualFailureDetector
 
 logger = logging.getLogger(__name__)
 
 
 class HeartbeatMonitor:
-    HEARTBEAT_INTERVAL = 5.0
+    """
+    Master heartbeats: the master sends them, followers watch for them.
+
+    Followers feed each heartbeat from the master into a phi-accrual failure
+    detector and suspect the master once phi reaches the threshold, which
+    adapts to the jitter actually seen on the network. HEARTBEAT_TIMEOUT
+    stays as an upper bound. Settings (CLUSTER_CONFIG): "heartbeat_interval",
+    "heartbeat_timeout" and "heartbeat_phi_threshold".
+
+    The master sends one heartbeat per interval. A lost one is not
+    retransmitted; the detector's spread absorbs single losses, and a copy
+    sent right after the original would be dropped as a duplicate anyway.
+    """
+
+    HEARTBEAT_INTERVAL = 1.0
     HEARTBEAT_TIMEOUT = 15.0
-    RETRANSMIT_COUNT = 2
-    RETRANSMIT_DELAY_MS = 500
+    MONITOR_INTERVAL = 0.1
 
     def __init__(
         self,
@@ -24,27 +42,55 @@ class HeartbeatMonitor:
         self.on_timeout = on_timeout
         self.get_last_sync_id = get_last_sync_id or (lambda: 0)
 
+        config = getattr(settings, "CLUSTER_CONFIG", {})
+        self.heartbeat_interval = config.get("heartbeat_interval", self.HEARTBEAT_INTERVAL)
+        self.heartbeat_timeout = config.get("heartbeat_timeout", self.HEARTBEAT_TIMEOUT)
+        self.detector = PhiAccrualFailureDetector(
+            expected_interval=self.heartbeat_interval,
+            threshold=config.get("heartbeat_phi_threshold", DEFAULT_THRESHOLD),
+        )
+        self.detections = 0
+        self.last_detection_latency: Optional[float] = None
+        self._suspected = False
+        self._timeout_handled = False
+
         self.last_heartbeat_time: float = 0
         self.master_id: Optional[str] = None
         self.running = False
         self.is_master = False
 
         self._heartbeat_task: Optional[asyncio.Task] = None
+        self._next_send = 0.0
         self._monitor_task: Optional[asyncio.Task] = None
 
     def set_master(self, is_master: bool, master_id: Optional[str] = None) -> None:
         self.is_master = is_master
+        if master_id and master_id != self.master_id:
+            self.detector.reset()
         if master_id:
             self.master_id = master_id
+        self._suspected = False
+        self._timeout_handled = False
 
         if is_master:
+            # The election announces a new master together with its first heartbeat
+            self._next_send = time.monotonic() + self.heartbeat_interval
+
+        if is_master or master_id:
+            # A newly known master gets a full grace period before it can be suspected
             self.last_heartbeat_time = time.time()
+            self.detector.heartbeat()
         else:
             self.last_heartbeat_time = 0
 
     def record_heartbeat(self, master_id: str) -> None:
+        if master_id != self.master_id:
+            self.detector.reset()
         self.master_id = master_id
         self.last_heartbeat_time = time.time()
+        self.detector.heartbeat()
+        self._suspected = False
+        self._timeout_handled = False
         logger.debug(f"Heartbeat received from master: {master_id}")
 
     def check_timeout(self) -> bool:
@@ -52,18 +98,36 @@ class HeartbeatMonitor:
             return False
 
         elapsed = time.time() - self.last_heartbeat_time
-        if elapsed > self.HEARTBEAT_TIMEOUT:
-            logger.warning(f"Heartbeat timeout: {elapsed:.1f}s since last heartbeat " f"from master {self.master_id}")
+        phi = self.detector.phi()
+        if elapsed > self.heartbeat_timeout or phi >= self.detector.threshold:
+            if not self._suspected:
+                self._suspected = True
+                self.detections += 1
+                self.last_detection_latency = elapsed
+                logger.warning(
+                    f"Master {self.master_id} suspected: {elapsed:.2f}s since last heartbeat "
+                    f"(phi={phi:.1f}, mean interval={self.detector.mean_and_std()[0]:.2f}s)"
+                )
             return True
         return False
 
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "master_id": self.master_id,
+            "is_master": self.is_master,
+            "time_since_last_heartbeat": round(self.get_time_since_last_heartbeat(), 3),
+            "detector": self.detector.stats(),
+            "detections": self.detections,
+            "last_detection_latency": self.last_detection_latency,
+        }
+
     async def start(self) -> None:
         self.running = True
 
-        if self.is_master:
-            self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
-        else:
-            self._monitor_task = asyncio.create_task(self._monitor_loop())
+        # Both loops run for the monitor's lifetime and act on the current role,
+        # so a follower that wins an election starts sending heartbeats at once
+        self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+        self._monitor_task = asyncio.create_task(self._monitor_loop())
 
     def stop(self) -> None:
         self.running = False
@@ -75,26 +139,27 @@ class HeartbeatMonitor:
             self._monitor_task = None
 
     async def _heartbeat_loop(self) -> None:
-        from backend.apps.cluster.schemas.messages import HeartbeatMessage
-
         while self.running:
             try:
-                last_sync_id = self.get_last_sync_id()
+                if not self.is_master:
+                    await asyncio.sleep(self.MONITOR_INTERVAL)
+                    continue
 
-                msg = HeartbeatMessage(
-                    node_id=self.node_id,
-                    timestamp=int(time.time()),
-                    last_sync_id=last_sync_id,
-                )
-
-                for attempt in range(self.RETRANSMIT_COUNT):
-                    await self.udp_service.broadcast_async(msg)
-                    if attempt < self.RETRANSMIT_COUNT - 1:
-                        await asyncio.sleep(self.RETRANSMIT_DELAY_MS / 1000.0)
+                now = time.monotonic()
+                if now < self._next_send:
+                    await asyncio.sleep(self._next_send - now)
+                    continue
 
-                logger.debug(f"Heartbeat sent (seq={msg.seq_num}, " f"last_sync_id={last_sync_id})")
+                last_sync_id = self.get_last_sync_id()
+                msg = HeartbeatMessage(node_id=self.node_id, timestamp=int(time.time()), last_sync_id=last_sync_id)
+                await self.udp_service.broadcast_async(msg)
+                logger.debug(f"Heartbeat sent (seq={msg.seq_num}, last_sync_id={last_sync_id})")
 
-                await asyncio.sleep(self.HEARTBEAT_INTERVAL)
+                # Paced against the schedule, so the time spent sending does not stretch the interval
+                if self._next_send + self.heartbeat_interval <= now:
+                    self._next_send = now + self.heartbeat_interval
+                else:
+                    self._next_send += self.heartbeat_interval
 
             except asyncio.CancelledError:
                 break
@@ -105,12 +170,15 @@ class HeartbeatMonitor:
     async def _monitor_loop(self) -> None:
         while self.running:
             try:
-                if self.master_id and self.check_timeout():
+                if self.master_id and self.check_timeout() and not self._timeout_handled:
+                    self._timeout_handled = True
                     if self.on_timeout:
                         logger.info(f"Triggering election due to heartbeat timeout " f"(master={self.master_id})")
-                        self.on_timeout()
+                        result = self.on_timeout()
+                        if asyncio.iscoroutine(result):
+                            await result
 
-                await asyncio.sleep(1.0)
+                await asyncio.sleep(self.MONITOR_INTERVAL)
 
             except asyncio.CancelledError:
                 break
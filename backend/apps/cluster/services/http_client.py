@@ -0,0 +1,150 @@
+"""
+Shared HTTP client for traffic between cluster nodes.
+
+Every node-to-node request (sync pulls, ACKs, announcements, snapshots,
+proxied writes, follower notifications) goes through one requests.Session,
+so connections to the other node are kept alive and reused instead of being
+opened per request. The pool size, per-endpoint timeouts and gzip of
+request bodies come from CLUSTER_CONFIG:
+
+    "http_pool_connections": 4,     # hosts with a connection pool
+    "http_pool_maxsize": 10,        # kept-alive connections per host
+    "http_gzip": False,             # gzip request bodies (the receiver must run ClusterGzipMiddleware)
+    "http_gzip_min_bytes": 1024,    # smaller bodies are sent as is
+    "http_timeouts": {"ack": 5, ...},
+
+Responses are always requested with ``Accept-Encoding: gzip``; cluster
+endpoints compress them when ``http_gzip`` is on (see ClusterGzipMiddleware).
+"""
+
+import gzip
+import json
+import logging
+import threading
+from typing import Any, Dict, Optional
+
+import requests
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_CONNECTIONS = 4
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_GZIP_MIN_BYTES = 1024
+DEFAULT_TIMEOUT = 10
+
+DEFAULT_TIMEOUTS = {
+    "changes": 10,
+    "snapshot": 10,
+    "full": 30,
+    "ack": 5,
+    "announce": 5,
+    "notify": 5,
+    "health": 5,
+    "proxy": 10,
+}
+
+
+class ClusterHttpClient:
+    """Connection-pooled session shared by all cluster HTTP calls of this process."""
+
+    def __init__(
+        self,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        gzip_requests: Optional[bool] = None,
+        gzip_min_bytes: Optional[int] = None,
+        timeouts: Optional[Dict[str, float]] = None,
+    ):
+        config = getattr(settings, "CLUSTER_CONFIG", {})
+        self.pool_connections = pool_connections or config.get("http_pool_connections", DEFAULT_POOL_CONNECTIONS)
+        self.pool_maxsize = pool_maxsize or config.get("http_pool_maxsize", DEFAULT_POOL_MAXSIZE)
+        self.gzip_requests = config.get("http_gzip", False) if gzip_requests is None else gzip_requests
+        self.gzip_min_bytes = config.get("http_gzip_min_bytes", DEFAULT_GZIP_MIN_BYTES) if gzip_min_bytes is None else gzip_min_bytes
+        self.timeouts = {**DEFAULT_TIMEOUTS, **config.get("http_timeouts", {}), **(timeouts or {})}
+        self._lock = threading.Lock()
+        self._session: Optional[requests.Session] = None
+        self._adapter: Optional[HTTPAdapter] = None
+
+    @property
+    def session(self) -> requests.Session:
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._adapter = HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize)
+                    session = requests.Session()
+                    session.mount("http://", self._adapter)
+                    session.mount("https://", self._adapter)
+                    session.headers.update({"Connection": "keep-alive", "Accept-Encoding": "gzip"})
+                    self._session = session
+        return self._session
+
+    def timeout(self, endpoint: str) -> float:
+        """Timeout in seconds for a named endpoint."""
+        return self.timeouts.get(endpoint, DEFAULT_TIMEOUT)
+
+    def request(self, method: str, url: str, endpoint: Optional[str] = None, **kwargs: Any) -> requests.Response:
+        """
+        Send a request through the shared session.
+
+        ``endpoint`` picks the timeout when none is given. A ``json`` body is
+        gzipped when gzip is enabled and the body is large enough.
+        """
+        if "timeout" not in kwargs:
+            kwargs["timeout"] = self.timeout(endpoint) if endpoint else DEFAULT_TIMEOUT
+        if self.gzip_requests and "json" in kwargs:
+            self._gzip_json(kwargs)
+        return self.session.request(method, url, **kwargs)
+
+    def get(self, url: str, endpoint: Optional[str] = None, **kwargs: Any) -> requests.Response:
+        return self.request("GET", url, endpoint=endpoint, **kwargs)
+
+    def post(self, url: str, endpoint: Optional[str] = None, **kwargs: Any) -> requests.Response:
+        return self.request("POST", url, endpoint=endpoint, **kwargs)
+
+    def stats(self) -> Dict[str, Any]:
+        """Requests sent and connections opened, per host and in total."""
+        hosts = []
+        if self._adapter is not None:
+            for pool in list(self._adapter.poolmanager.pools.values()):
+                hosts.append(
+                    {
+                        "host": f"{pool.scheme}://{pool.host}:{pool.port}",
+                        "requests": pool.num_requests,
+                        "connections_opened": pool.num_connections,
+                        "idle_connections": pool.pool.qsize() if pool.pool is not None else 0,
+                    }
+                )
+        total_requests = sum(h["requests"] for h in hosts)
+        total_connections = sum(h["connections_opened"] for h in hosts)
+        return {
+            "pool_maxsize": self.pool_maxsize,
+            "gzip_requests": self.gzip_requests,
+            "requests": total_requests,
+            "connections_opened": total_connections,
+            "connections_reused": max(0, total_requests - total_connections),
+            "hosts": hosts,
+        }
+
+    def close(self) -> None:
+        """Close all pooled connections; the next request opens a new pool."""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+            self._session = None
+            self._adapter = None
+
+    def _gzip_json(self, kwargs: Dict[str, Any]) -> None:
+        body = json.dumps(kwargs["json"], cls=DjangoJSONEncoder).encode()
+        if len(body) < self.gzip_min_bytes:
+            return
+        kwargs.pop("json")
+        kwargs["data"] = gzip.compress(body)
+        headers = dict(kwargs.get("headers") or {})
+        headers.update({"Content-Type": "application/json", "Content-Encoding": "gzip"})
+        kwargs["headers"] = headers
+
+
+cluster_http = ClusterHttpClient()
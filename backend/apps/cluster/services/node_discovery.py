@@ -10,6 +10,7 @@ from typing import Dict, Optional, Callable, List
 
 from backend.apps.cluster.schemas.messages import (
     AnnounceMessage,
+    ElectionMessage,
     MasterAnnounceMessage,
     GoodbyeMessage,
     BaseMessage,
@@ -27,6 +28,8 @@ class NodeInfo:
     port: int
     last_seen: float
     is_master: bool = False
+    # Highest sync_log id the node has applied, as last reported in a heartbeat or candidacy
+    last_sync_id: int = 0
 
     def is_expired(self, timeout: float = 30.0) -> bool:
         return time.time() - self.last_seen > timeout
@@ -57,22 +60,33 @@ class NodeDiscovery:
         on_master_change: Optional[Callable[[str, str, int], None]] = None,
         on_node_join: Optional[Callable[[NodeInfo], None]] = None,
         on_node_leave: Optional[Callable[[str], None]] = None,
+        on_master_heartbeat: Optional[Callable[[str], None]] = None,
+        on_election: Optional[Callable[[ElectionMessage], None]] = None,
     ):
         self.udp_service = udp_service
         self.api_port = api_port
         self.on_master_change = on_master_change
         self.on_node_join = on_node_join
         self.on_node_leave = on_node_leave
+        self.on_master_heartbeat = on_master_heartbeat
+        self.on_election = on_election
 
         self.state = ClusterState()
         self.state.node_id = self._generate_node_id()
 
         self.udp_service.node_id = self.state.node_id
         self.udp_service.on_message = self._handle_message
+        self.udp_service.peer_hosts = self._peer_hosts
 
         self._discovery_task: Optional[asyncio.Task] = None
         self._cleanup_task: Optional[asyncio.Task] = None
 
+    def _peer_hosts(self) -> List[str]:
+        """Peer addresses for unicast transport; empty (so broadcast) until discovery is complete."""
+        if not self.state.discovery_complete:
+            return []
+        return sorted({node.ip for node in self.state.peers.values()})
+
     def _generate_node_id(self) -> str:
         hostname = platform.node() or "node"
         suffix = "".join(random.choices(string.ascii_lowercase + string.digits, k=8))
@@ -90,6 +104,8 @@ class NodeDiscovery:
             self._handle_goodbye(message, sender_ip)
         elif message.type == MessageType.HEARTBEAT:
             self._handle_heartbeat(message, sender_ip)
+        elif message.type == MessageType.ELECTION:
+            self._handle_election(message, sender_ip)
 
     def _handle_announce(self, message: AnnounceMessage, sender_ip: str) -> None:
         is_new_node = message.node_id not in self.state.peers
@@ -138,9 +154,27 @@ class NodeDiscovery:
     def _handle_heartbeat(self, message: BaseMessage, sender_ip: str) -> None:
         if message.node_id in self.state.peers:
             self.state.peers[message.node_id].last_seen = time.time()
+            self.state.peers[message.node_id].last_sync_id = message.last_sync_id
 
         if message.node_id == self.state.master_id:
             self.state.master_ip = sender_ip
+            if self.on_master_heartbeat:
+                self.on_master_heartbeat(message.node_id)
+
+    def _handle_election(self, message: ElectionMessage, sender_ip: str) -> None:
+        node = self.state.peers.get(message.node_id)
+        if node is None:
+            node = NodeInfo(node_id=message.node_id, ip=sender_ip, port=message.port, last_seen=time.time())
+            self.state.peers[message.node_id] = node
+            if self.on_node_join:
+                self.on_node_join(node)
+        node.last_seen = time.time()
+        node.last_sync_id = message.last_sync_id
+
+        logger.info(f"Candidacy from {message.node_id} (last_sync_id={message.last_sync_id})")
+
+        if self.on_election:
+            self.on_election(message)
 
     def _update_master(self, master_id: str, master_ip: str, master_port: int) -> None:
         old_master = self.state.master_id
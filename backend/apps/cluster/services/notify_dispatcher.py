@@ -0,0 +1,177 @@
+"""
+Push notifications from the master to its followers.
+
+Committed sync_log ids are handed to one long-lived dispatcher thread through
+a bounded queue. The thread collects every id that arrives within
+``debounce_ms`` of the first one and sends each follower a single
+notification for the newest id: the follower pulls everything up to it in one
+request anyway. Notifications go out through the pooled FollowerProxy
+session; the follower URL list is cached for ``url_ttl`` seconds and dropped
+whenever a node announces itself or leaves.
+
+Followers long-poll /sync/changes/ (see change_feed), so pushing is only
+needed for followers that poll on an interval; it is enabled with
+CLUSTER_CONFIG["sync_push_notify"].
+"""
+
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from django.conf import settings
+
+from backend.apps.cluster.models import DjangoSyncState
+from backend.apps.cluster.services.config_cache import get_cluster_config
+from backend.apps.cluster.services.proxy import FollowerProxy, get_follower_proxy
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DEBOUNCE_MS = 20
+DEFAULT_MAX_QUEUE = 1000
+DEFAULT_URL_TTL = 5.0
+
+
+def _follower_urls_from_db() -> List[str]:
+    return list(DjangoSyncState.objects.exclude(url__isnull=True).exclude(url="").values_list("url", flat=True))
+
+
+class NotificationDispatcher:
+    """Coalesces committed sync_log ids into one notification per follower per debounce window."""
+
+    def __init__(
+        self,
+        debounce_ms: int = DEFAULT_DEBOUNCE_MS,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        url_ttl: float = DEFAULT_URL_TTL,
+        proxy_factory: Callable[[], FollowerProxy] = get_follower_proxy,
+        url_loader: Callable[[], List[str]] = _follower_urls_from_db,
+    ):
+        self.debounce_ms = debounce_ms
+        self.url_ttl = url_ttl
+        self._proxy_factory = proxy_factory
+        self._load_urls = url_loader
+        self._queue: "queue.Queue[int]" = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._urls: Optional[List[str]] = None
+        self._urls_loaded_at = 0.0
+        self._counters = {"submitted": 0, "dropped": 0, "batches": 0, "sent": 0, "failed": 0}
+
+    @property
+    def enabled(self) -> bool:
+        if not getattr(settings, "CLUSTER_CONFIG", {}).get("sync_push_notify", False):
+            return False
+        try:
+            config = get_cluster_config()
+        except Exception:
+            return False
+        return config.mode == "cluster" and config.is_master
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self._counters, "queue_depth": self.queue_depth}
+
+    def submit(self, sync_log_id: int) -> bool:
+        """Queue a committed sync_log id without blocking; returns False if it was dropped."""
+        if not self.enabled:
+            return False
+
+        self._ensure_thread()
+        try:
+            self._queue.put_nowait(sync_log_id)
+        except queue.Full:
+            # Anything already queued triggers a pull that covers this id too, unless it is the newest
+            self._count("dropped")
+            logger.warning(f"Notification queue full, dropped sync_log_id={sync_log_id}")
+            return False
+        self._count("submitted")
+        return True
+
+    def invalidate_urls(self) -> None:
+        """Forget the cached follower URLs; they are re-read before the next notification."""
+        with self._lock:
+            self._urls = None
+
+    def drain(self, timeout: float = 0) -> Optional[int]:
+        """
+        Take the next batch off the queue and return its newest id.
+
+        Waits up to ``timeout`` seconds for the first id, then collects ids
+        for ``debounce_ms``. Returns None if nothing arrived.
+        """
+        try:
+            latest = self._queue.get(timeout=timeout) if timeout else self._queue.get_nowait()
+        except queue.Empty:
+            return None
+
+        deadline = time.monotonic() + self.debounce_ms / 1000.0
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                latest = max(latest, self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        # Ids that arrived while the batch was closing belong to it as well
+        while True:
+            try:
+                latest = max(latest, self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return latest
+
+    def dispatch(self, sync_log_id: int) -> Dict[str, Any]:
+        """Notify every known follower of ``sync_log_id``."""
+        urls = self._follower_urls()
+        self._count("batches")
+        if not urls:
+            return {"sync_log_id": sync_log_id, "total_followers": 0, "successful": [], "failed": []}
+
+        results = self._proxy_factory().broadcast_sync(urls, sync_log_id, None, None)
+        with self._lock:
+            self._counters["sent"] += len(results["successful"])
+            self._counters["failed"] += len(results["failed"])
+        logger.debug(f"Notified {len(results['successful'])}/{len(urls)} follower(s) of sync_log_id={sync_log_id}")
+        return results
+
+    def _run(self) -> None:
+        while True:
+            latest = self.drain(timeout=60)
+            if latest is None:
+                continue
+            try:
+                self.dispatch(latest)
+            except Exception as e:
+                logger.error(f"Follower notification failed: {e}")
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, daemon=True, name="notify-dispatcher")
+                self._thread.start()
+
+    def _follower_urls(self) -> List[str]:
+        with self._lock:
+            if self._urls is not None and time.monotonic() - self._urls_loaded_at < self.url_ttl:
+                return self._urls
+        urls = self._load_urls()
+        with self._lock:
+            self._urls = urls
+            self._urls_loaded_at = time.monotonic()
+        return urls
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+
+notification_dispatcher = NotificationDispatcher()
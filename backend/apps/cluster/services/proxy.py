@@ -1,4 +1,5 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
@@ -6,6 +7,8 @@ import requests
 from django.conf import settings
 from django.http import HttpRequest, HttpResponse, JsonResponse
 
+from backend.apps.cluster.services.http_client import cluster_http
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,17 +45,13 @@ class MasterProxy:
 
     WRITE_METHODS = {"POST", "PUT", "DELETE", "PATCH"}
 
-    def __init__(self, master_url: Optional[str] = None, timeout: int = 10):
+    def __init__(self, master_url: Optional[str] = None, timeout: Optional[int] = None):
         self.master_url = master_url
-        self.timeout = timeout
-        self._session: Optional[requests.Session] = None
+        self.timeout = timeout or cluster_http.timeout("proxy")
 
     @property
     def session(self) -> requests.Session:
-        if self._session is None:
-            self._session = requests.Session()
-            self._session.headers.update({"X-Cluster-Proxy": "follower"})
-        return self._session
+        return cluster_http.session
 
     def forward_request(self, request: HttpRequest) -> HttpResponse:
         if not self.master_url:
@@ -149,6 +148,7 @@ class MasterProxy:
             if key.startswith("HTTP_") and key not in self.EXCLUDED_HEADERS:
                 header_name = key[5:].replace("_", "-")
                 headers[header_name] = value
+        headers["X-Cluster-Proxy"] = "follower"
 
         if request.META.get("CONTENT_TYPE"):
             headers["Content-Type"] = request.META["CONTENT_TYPE"]
@@ -202,20 +202,27 @@ class FollowerProxy:
     3. Managing follower health status
     """
 
-    def __init__(self, timeout: int = 5):
-        self.timeout = timeout
-        self._session: Optional[requests.Session] = None
+    MAX_BROADCAST_WORKERS = 10
+
+    HEADERS = {"X-Cluster-Source": "master"}
+
+    def __init__(self, timeout: Optional[int] = None):
+        self.timeout = timeout or cluster_http.timeout("notify")
+        self._executor: Optional[ThreadPoolExecutor] = None
 
     @property
     def session(self) -> requests.Session:
-        if self._session is None:
-            self._session = requests.Session()
-            self._session.headers.update({"X-Cluster-Source": "master"})
-        return self._session
-
-    def broadcast_sync(self, follower_urls: list, sync_log_id: int, table_name: str, record_id: str) -> Dict[str, Any]:
-        from concurrent.futures import ThreadPoolExecutor, as_completed
+        return cluster_http.session
 
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.MAX_BROADCAST_WORKERS, thread_name_prefix="follower-proxy")
+        return self._executor
+
+    def broadcast_sync(
+        self, follower_urls: list, sync_log_id: int, table_name: Optional[str] = None, record_id: Optional[str] = None
+    ) -> Dict[str, Any]:
         results = {
             "sync_log_id": sync_log_id,
             "total_followers": len(follower_urls),
@@ -223,25 +230,26 @@ class FollowerProxy:
             "failed": [],
         }
 
-        with ThreadPoolExecutor(max_workers=min(len(follower_urls), 10)) as executor:
-            future_to_url = {
-                executor.submit(self._send_sync_notification, url, sync_log_id, table_name, record_id): url for url in follower_urls
-            }
+        future_to_url = {
+            self.executor.submit(self._send_sync_notification, url, sync_log_id, table_name, record_id): url for url in follower_urls
+        }
 
-            for future in as_completed(future_to_url):
-                url = future_to_url[future]
-                try:
-                    success = future.result()
-                    if success:
-                        results["successful"].append(url)
-                    else:
-                        results["failed"].append({"url": url, "reason": "sync_failed"})
-                except Exception as e:
-                    results["failed"].append({"url": url, "reason": str(e)})
+        for future in as_completed(future_to_url):
+            url = future_to_url[future]
+            try:
+                success = future.result()
+                if success:
+                    results["successful"].append(url)
+                else:
+                    results["failed"].append({"url": url, "reason": "sync_failed"})
+            except Exception as e:
+                results["failed"].append({"url": url, "reason": str(e)})
 
         return results
 
-    def _send_sync_notification(self, follower_url: str, sync_log_id: int, table_name: str, record_id: str) -> bool:
+    def _send_sync_notification(
+        self, follower_url: str, sync_log_id: int, table_name: Optional[str] = None, record_id: Optional[str] = None
+    ) -> bool:
         url = f"{follower_url.rstrip('/')}/api/cluster/sync/notify/"
 
         payload = {
@@ -251,7 +259,7 @@ class FollowerProxy:
         }
 
         try:
-            response = self.session.post(url, json=payload, timeout=self.timeout)
+            response = self.session.post(url, json=payload, headers=self.HEADERS, timeout=self.timeout)
             return response.status_code == 200
 
         except requests.RequestException as e:
@@ -262,7 +270,7 @@ class FollowerProxy:
         url = f"{follower_url.rstrip('/')}/api/cluster/health"
 
         try:
-            response = self.session.get(url, timeout=self.timeout)
+            response = self.session.get(url, headers=self.HEADERS, timeout=self.timeout)
             if response.status_code == 200:
                 data = response.json()
                 return {
@@ -291,10 +299,10 @@ follower_proxy: Optional[FollowerProxy] = None
 
 def get_master_proxy() -> MasterProxy:
     global master_proxy
-    from backend.apps.cluster.models.cluster_config import DjangoClusterConfig
+    from backend.apps.cluster.services.config_cache import get_cluster_config
 
     try:
-        config = DjangoClusterConfig.get_config()
+        config = get_cluster_config()
         master_url = config.master_url
     except Exception:
         master_url = None
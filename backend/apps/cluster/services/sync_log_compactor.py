@@ -0,0 +1,156 @@
+"""
+Compaction of the master's sync_log.
+
+Every replicated write appends a full-row (or delta) entry, so during a long
+event the log fills up with entries that later entries for the same record
+supersede. Once every follower has applied an entry, only the newest entry
+per (table_name, record_id) matters to anyone pulling from the log; the
+older ones are deleted.
+
+The compaction horizon is the lowest ``last_synced_id`` ACKed by a follower
+seen within ``sync_log_follower_timeout`` seconds. Followers that have not
+been seen for longer do not hold compaction back. Entries younger than
+``sync_log_retention_hours`` are never removed. The highest removed id is
+stored on the cluster config; /sync/changes/ answers 410 Gone to a follower
+asking for changes below it, and the follower re-bootstraps from a full
+snapshot. Settings (CLUSTER_CONFIG):
+
+    "sync_log_compaction": True,          # run compaction on the master
+    "sync_log_retention_hours": 2.0,      # entries younger than this are kept
+    "sync_log_compact_interval": 600.0,   # seconds between automatic runs
+    "sync_log_follower_timeout": 3600.0,  # silent followers stop holding compaction back
+"""
+
+import logging
+import threading
+import time
+from datetime import timedelta
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from django.db.models import Exists, Max, Min, OuterRef
+from django.utils import timezone
+
+from backend.apps.cluster.models import DjangoClusterConfig, DjangoSyncLog, DjangoSyncState
+from backend.apps.cluster.services.config_cache import get_cluster_config
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RETENTION_HOURS = 2.0
+DEFAULT_COMPACT_INTERVAL = 600.0
+DEFAULT_FOLLOWER_TIMEOUT = 3600.0
+DELETE_BATCH_SIZE = 2000
+
+
+class SyncLogCompactor:
+    """Deletes superseded sync_log entries that every live follower has applied."""
+
+    def __init__(self, batch_size: int = DELETE_BATCH_SIZE):
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._running = False
+        self._last_run: Optional[float] = None
+        self._last_result: Optional[Dict[str, Any]] = None
+
+    @property
+    def _config(self) -> Dict[str, Any]:
+        return getattr(settings, "CLUSTER_CONFIG", {})
+
+    @property
+    def enabled(self) -> bool:
+        if not self._config.get("sync_log_compaction", True):
+            return False
+        try:
+            config = get_cluster_config()
+        except Exception:
+            return False
+        return config.mode == "single" or config.is_master
+
+    @property
+    def compacted_id(self) -> int:
+        """Highest sync_log id removed so far; followers behind it must re-bootstrap."""
+        return DjangoClusterConfig.objects.filter(singleton_id=1).values_list("sync_log_compacted_id", flat=True).first() or 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {"compacted_id": self.compacted_id, "last_run": self._last_result}
+
+    def horizon(self) -> int:
+        """Highest sync_log id every live follower has applied."""
+        latest = DjangoSyncLog.objects.aggregate(max_id=Max("id"))["max_id"] or 0
+        seen_after = timezone.now() - timedelta(seconds=self._config.get("sync_log_follower_timeout", DEFAULT_FOLLOWER_TIMEOUT))
+
+        followers = DjangoSyncState.objects.filter(last_sync_time__gte=seen_after)
+        own_node_id = DjangoClusterConfig.objects.filter(singleton_id=1).values_list("node_id", flat=True).first()
+        if own_node_id:
+            followers = followers.exclude(node_id=own_node_id)
+
+        lowest = followers.aggregate(min_id=Min("last_synced_id"))["min_id"]
+        return latest if lowest is None else min(lowest, latest)
+
+    def compact(self, retention_hours: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Delete every entry at or below the horizon that is older than the
+        retention window and superseded by a later entry for the same record
+        that is also at or below the horizon.
+        """
+        if retention_hours is None:
+            retention_hours = self._config.get("sync_log_retention_hours", DEFAULT_RETENTION_HOURS)
+        horizon = self.horizon()
+        cutoff = timezone.now() - timedelta(hours=retention_hours)
+
+        superseded = (
+            DjangoSyncLog.objects.filter(id__lte=horizon, created_at__lt=cutoff)
+            .filter(
+                Exists(
+                    DjangoSyncLog.objects.filter(
+                        table_name=OuterRef("table_name"),
+                        record_id=OuterRef("record_id"),
+                        id__gt=OuterRef("id"),
+                        id__lte=horizon,
+                    )
+                )
+            )
+            .order_by("id")
+        )
+
+        deleted = 0
+        max_deleted_id = 0
+        while True:
+            ids = list(superseded.values_list("id", flat=True)[: self.batch_size])
+            if not ids:
+                break
+            deleted += DjangoSyncLog.objects.filter(id__in=ids).delete()[0]
+            max_deleted_id = max(max_deleted_id, ids[-1])
+
+        if max_deleted_id > self.compacted_id:
+            DjangoClusterConfig.objects.filter(singleton_id=1).update(sync_log_compacted_id=max_deleted_id)
+
+        result = {"horizon": horizon, "deleted": deleted, "compacted_id": max(max_deleted_id, self.compacted_id)}
+        logger.info(f"Sync log compaction: deleted {deleted} superseded entries up to sync_id={horizon}")
+        return result
+
+    def maybe_compact(self) -> bool:
+        """Start a compaction run in the background if one is due; returns True if one was started."""
+        interval = self._config.get("sync_log_compact_interval", DEFAULT_COMPACT_INTERVAL)
+        with self._lock:
+            if self._running or (self._last_run is not None and time.monotonic() - self._last_run < interval):
+                return False
+            if not self.enabled:
+                return False
+            self._running = True
+            self._last_run = time.monotonic()
+
+        threading.Thread(target=self._run, daemon=True, name="sync-log-compactor").start()
+        return True
+
+    def _run(self) -> None:
+        try:
+            self._last_result = self.compact()
+        except Exception as e:
+            logger.error(f"Sync log compaction failed: {e}")
+        finally:
+            with self._lock:
+                self._running = False
+
+
+sync_log_compactor = SyncLogCompactor()
@@ -1,19 +1,39 @@
+import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 from decimal import Decimal
 from enum import Enum
-from typing import Dict, List, Any, Optional, Type
+from typing import Callable, Dict, Iterator, List, Any, Optional, Tuple, Type
 from uuid import UUID
 
-from django.db import transaction
-from django.db.models import Model, Max, ForeignKey, ManyToManyField
+from django.conf import settings
+from django.db import close_old_connections, connection, connections, router, transaction
+from django.db.models import Model, Max, ForeignKey, ManyToManyField, TextField
+from django.db.models.functions import Cast
+from django.utils import timezone
 
 from backend.apps.cluster.models import DjangoSyncLog, DjangoSyncState
 from backend.apps.cluster.services.ack_queue import AckQueue
+from backend.apps.cluster.services.change_feed import change_feed
+from backend.apps.cluster.services.config_cache import get_cluster_config
+from backend.apps.cluster.services.delta import is_delta, resolve_delta, snapshot_instance
+from backend.apps.cluster.services.notify_dispatcher import notification_dispatcher
+from backend.apps.cluster.signals import sync_changes_applied
 
 logger = logging.getLogger(__name__)
 
+# (table_name, record_id) -> full-row snapshot from master, or None if unavailable
+SnapshotFetcher = Callable[[str, str], Optional[Dict[str, Any]]]
+
+# Returned for snapshots the bulk apply has not fetched yet
+_SNAPSHOT_PENDING: Any = object()
+
+
+class _SnapshotsPending(Exception):
+    """Rolls back a bulk replay that needs snapshots which are fetched outside the transaction."""
+
 
 class SyncOperation(str, Enum):
     INSERT = "INSERT"
@@ -76,11 +96,16 @@ class SyncManager:
 
     DEFAULT_BATCH_SIZE = 100
     MAX_BATCH_SIZE = 500
+    DEFAULT_SNAPSHOT_CHUNK_SIZE = 500
+    DEFAULT_APPLY_WORKERS = 4
+    MAX_SNAPSHOT_CHUNK_SIZE = 5000
+    SNAPSHOT_TIMESTAMP_FIELDS = ("created_at", "updated_at", "last_modified_at")
 
     def __init__(self):
         self._ack_queue = AckQueue()
         self._model_registry: Dict[str, ModelRegistryEntry] = {}
         self._initialized = False
+        self._apply_pool: Optional[ThreadPoolExecutor] = None
 
     def register_model(
         self,
@@ -125,8 +150,7 @@ class SyncManager:
         Record a change in the sync log.
         Should be called within a transaction.
         """
-        if operation not in [SyncOperation.INSERT.value, SyncOperation.UPDATE.value, SyncOperation.DELETE.value]:
-            raise ValueError(f"Invalid operation: {operation}")
+        self.validate_record({"table_name": table_name, "record_id": record_id, "operation": operation, "data": data})
 
         sync_log = DjangoSyncLog.objects.create(
             table_name=table_name,
@@ -137,9 +161,112 @@ class SyncManager:
         )
 
         logger.debug(f"Recorded sync log: id={sync_log.id}, table={table_name}, " f"record_id={record_id}, operation={operation}")
+        self._publish_on_commit(sync_log.id)
 
         return sync_log
 
+    @staticmethod
+    def validate_record(record: Dict[str, Any]) -> None:
+        """Raise ValueError if a record cannot be written to the sync log."""
+        operation = record.get("operation")
+        if operation not in [SyncOperation.INSERT.value, SyncOperation.UPDATE.value, SyncOperation.DELETE.value]:
+            raise ValueError(f"Invalid operation: {operation}")
+        for field in ("table_name", "record_id"):
+            value = str(record.get(field) or "")
+            max_length = DjangoSyncLog._meta.get_field(field).max_length
+            if not value or len(value) > max_length:
+                raise ValueError(f"Invalid {field}: {value!r}")
+        try:
+            json.dumps(record.get("data"))
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Data of {record.get('table_name')}.{record.get('record_id')} is not JSON serializable: {e}")
+
+    def record_changes(self, records: List[Dict[str, Any]]) -> List[DjangoSyncLog]:
+        """
+        Record several changes in the sync log with a single bulk INSERT.
+        Should be called within a transaction.
+
+        Each record is a dict with table_name, record_id, operation, data and
+        optional version. Every record is validated before anything is
+        written; an invalid one raises ValueError. Returned entries have their
+        ids populated, in order. Backends that cannot return ids from a bulk
+        INSERT (no ``RETURNING``) get one INSERT per row instead, since ids
+        read back afterwards could belong to a concurrent transaction.
+        """
+        for record in records:
+            self.validate_record(record)
+
+        sync_logs = [
+            DjangoSyncLog(
+                table_name=record["table_name"],
+                record_id=str(record["record_id"]),
+                operation=record["operation"],
+                data=record["data"],
+                version=record.get("version", 1),
+            )
+            for record in records
+        ]
+
+        if not sync_logs:
+            return sync_logs
+
+        if connections[router.db_for_write(DjangoSyncLog)].features.can_return_rows_from_bulk_insert:
+            DjangoSyncLog.objects.bulk_create(sync_logs)
+        else:
+            for sync_log in sync_logs:
+                sync_log.save(force_insert=True)
+
+        logger.debug(f"Recorded {len(sync_logs)} sync logs: ids={sync_logs[0].id}..{sync_logs[-1].id}")
+        self._publish_on_commit(sync_logs[-1].id)
+
+        return sync_logs
+
+    def drop_recent_updates(self, table_name: str, record_id: str, window_seconds: float) -> int:
+        """
+        Delete the UPDATE entries of one record written within the last ``window_seconds``.
+
+        Only the newest uninterrupted run of UPDATEs is removed; an INSERT or
+        DELETE of the record ends it. Used by SyncTransaction when a full-row
+        UPDATE about to be recorded supersedes them. Should be called within
+        the transaction that records it. The lookup is served by the
+        (table_name, record_id, created_at) index.
+
+        The deleted ids leave gaps in sync_log that followers must tolerate:
+        only ids above ``since`` matter, never their continuity. Entries from
+        an earlier, already committed transaction may also have been served
+        to a long-polling follower and counted towards an ACK wait before
+        they are dropped here. That is harmless, because the superseding
+        UPDATE carries the full row and gets a higher id.
+        """
+        since = timezone.now() - timedelta(seconds=window_seconds)
+        recent = (
+            DjangoSyncLog.objects.filter(table_name=table_name, record_id=str(record_id), created_at__gte=since)
+            .order_by("-id")
+            .values_list("id", "operation")
+        )
+
+        ids = []
+        for sync_log_id, operation in recent:
+            if operation != SyncOperation.UPDATE.value:
+                break
+            ids.append(sync_log_id)
+        if not ids:
+            return 0
+
+        deleted, _ = DjangoSyncLog.objects.filter(id__in=ids).delete()
+        logger.debug(f"Coalesced {deleted} recent UPDATE(s) of {table_name}.{record_id}")
+        return deleted
+
+    @staticmethod
+    def _publish_on_commit(sync_id: int) -> None:
+        """Wake long-polling followers (and queue push notifications) once the entries up to ``sync_id`` are committed."""
+
+        def publish():
+            change_feed.publish(sync_id)
+            notification_dispatcher.submit(sync_id)
+
+        transaction.on_commit(publish)
+
     @transaction.atomic
     def record_write(
         self,
@@ -219,11 +346,37 @@ class SyncManager:
 
         return SyncResult(last_id=last_id, has_more=has_more, changes=changes)
 
+    def iter_change_rows(self, since_id: int, limit: int = DEFAULT_BATCH_SIZE, tables: Optional[List[str]] = None) -> Iterator[Tuple]:
+        """
+        Stream the rows behind get_changes_since as plain tuples.
+
+        Yields ``(id, table_name, record_id, operation, data, version,
+        created_at)`` with ``data`` as the stored JSON text, for up to
+        ``limit + 1`` rows; the extra row only tells the caller there is more.
+        """
+        limit = min(limit, self.MAX_BATCH_SIZE)
+
+        queryset = DjangoSyncLog.objects.filter(id__gt=since_id)
+        if tables:
+            queryset = queryset.filter(table_name__in=tables)
+        queryset = queryset.annotate(data_json=Cast("data", output_field=TextField())).order_by("id")
+        yield from queryset.values_list("id", "table_name", "record_id", "operation", "data_json", "version", "created_at")[
+            : limit + 1
+        ].iterator()
+
     def get_latest_sync_id(self) -> int:
         """Get the latest sync log ID."""
         result = DjangoSyncLog.objects.aggregate(max_id=Max("id"))
         return result["max_id"] or 0
 
+    def get_applied_sync_id(self) -> int:
+        """Highest sync log ID this node holds: its own log on the master, the last applied change on a follower."""
+        config = get_cluster_config()
+        if config.mode == "single" or config.is_master:
+            return self.get_latest_sync_id()
+        sync_state = self.get_sync_state(config.node_id) if config.node_id else None
+        return sync_state.last_synced_id if sync_state else 0
+
     def get_sync_state(self, node_id: str) -> Optional[DjangoSyncState]:
         """Get the sync state for a follower node."""
         try:
@@ -246,6 +399,8 @@ class SyncManager:
             defaults["master_latest_sync_id"] = master_latest_sync_id
 
         sync_state, created = DjangoSyncState.objects.update_or_create(node_id=node_id, defaults=defaults)
+        if created or url is not None:
+            notification_dispatcher.invalidate_urls()
 
         if created:
             logger.info(f"Created sync state for node={node_id}")
@@ -254,7 +409,51 @@ class SyncManager:
 
         return sync_state
 
-    def apply_change(self, change: SyncChange) -> bool:
+    def get_record_snapshot(self, table_name: str, record_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the current full-row snapshot of a record.
+        Served to followers whose local row does not match a delta's base.
+        """
+        if table_name not in self._model_registry:
+            return None
+
+        model_class = self._model_registry[table_name].model_class
+        record = model_class.objects.filter(id=record_id).first()
+        if record is None:
+            return None
+        return snapshot_instance(record)
+
+    def _materialize_data(
+        self,
+        change: SyncChange,
+        record: Optional[Model],
+        fetch_snapshot: Optional[SnapshotFetcher] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Return the data dict to apply for ``change``.
+
+        Full snapshots are returned unchanged. Deltas are resolved against the
+        local ``record``; if the record is missing or its base does not match,
+        a full snapshot is requested through ``fetch_snapshot``.
+        """
+        if not is_delta(change.data):
+            return change.data
+
+        if record is not None:
+            resolved = resolve_delta(change.data, record)
+            if resolved is not None:
+                return resolved
+
+        if fetch_snapshot is None:
+            logger.warning(f"Cannot apply delta for {change.table_name}/{change.record_id}: no snapshot source")
+            return None
+
+        snapshot = fetch_snapshot(change.table_name, change.record_id)
+        if snapshot is None:
+            logger.warning(f"Snapshot unavailable for {change.table_name}/{change.record_id}")
+        return snapshot
+
+    def apply_change(self, change: SyncChange, fetch_snapshot: Optional[SnapshotFetcher] = None) -> bool:
         """
         Apply a sync change to the local database.
         Used by followers to apply changes from master.
@@ -275,7 +474,7 @@ class SyncManager:
                 if change.operation == SyncOperation.INSERT.value:
                     return self._apply_insert(model_class, change, registry_entry)
                 elif change.operation == SyncOperation.UPDATE.value:
-                    return self._apply_update(model_class, change, registry_entry)
+                    return self._apply_update(model_class, change, registry_entry, fetch_snapshot)
                 elif change.operation == SyncOperation.DELETE.value:
                     return self._apply_delete(model_class, change)
                 else:
@@ -402,6 +601,7 @@ class SyncManager:
         model_class: Type[Model],
         change: SyncChange,
         registry_entry: ModelRegistryEntry,
+        fetch_snapshot: Optional[SnapshotFetcher] = None,
     ) -> bool:
         """Apply an UPDATE operation with conflict resolution."""
         try:
@@ -409,27 +609,21 @@ class SyncManager:
 
             if not record:
                 logger.warning(f"Record not found for UPDATE: {change.record_id}, creating instead")
-                clean_data = self._clean_data(change.data, model_class)
+                data = self._materialize_data(change, None, fetch_snapshot)
+                if data is None:
+                    return False
+                clean_data = self._clean_data(data, model_class)
                 model_class.objects.create(id=change.record_id, **clean_data)
                 return True
 
-            existing_version = getattr(record, registry_entry.version_field, 1)
-            if existing_version > change.version:
-                logger.info(
-                    f"Skipping UPDATE - existingversion {existing_version} > " f"incoming version {change.version} for {change.record_id}"
-                )
+            if self._is_stale(record, change, registry_entry):
                 return True
 
-            if existing_version == change.version:
-                existing_modified = getattr(record, registry_entry.last_modified_field, None)
-                incoming_modified = self._parse_datetime(change.created_at)
-
-                if existing_modified and incoming_modified:
-                    if existing_modified >= incoming_modified:
-                        logger.info(f"Skipping UPDATE - existing is newer for {change.record_id}")
-                        return True
+            data = self._materialize_data(change, record, fetch_snapshot)
+            if data is None:
+                return False
 
-            clean_data = self._clean_data(change.data, model_class)
+            clean_data = self._clean_data(data, model_class)
             update_fields = list(clean_data.keys()) + [registry_entry.version_field]
 
             for key, value in clean_data.items():
@@ -447,6 +641,30 @@ class SyncManager:
             logger.error(f"UPDATE failed for {change.table_name}/{change.record_id}: {e}")
             return False
 
+    def _is_stale(self, record: Model, change: SyncChange, registry_entry: ModelRegistryEntry) -> bool:
+        """Return True if ``record`` is newer than ``change`` and the UPDATE must be skipped.
+
+        A higher local version always wins; on equal versions the later of the
+        record's last-modified timestamp and the change's creation time wins.
+        """
+        existing_version = getattr(record, registry_entry.version_field, 1)
+        if existing_version > change.version:
+            logger.info(
+                f"Skipping UPDATE - existingversion {existing_version} > " f"incoming version {change.version} for {change.record_id}"
+            )
+            return True
+
+        if existing_version == change.version:
+            existing_modified = getattr(record, registry_entry.last_modified_field, None)
+            incoming_modified = self._parse_datetime(change.created_at)
+
+            if existing_modified and incoming_modified:
+                if existing_modified >= incoming_modified:
+                    logger.info(f"Skipping UPDATE - existing is newer for {change.record_id}")
+                    return True
+
+        return False
+
     def _apply_delete(self, model_class: Type[Model], change: SyncChange) -> bool:
         """Apply a DELETE operation."""
         try:
@@ -462,26 +680,66 @@ class SyncManager:
             logger.error(f"DELETE failed for {change.table_name}/{change.record_id}: {e}")
             return False
 
-    def apply_changes_batch(self, changes: List[SyncChange]) -> Dict[str, Any]:
+    def apply_changes_batch(
+        self,
+        changes: List[SyncChange],
+        bulk: bool = True,
+        fetch_snapshot: Optional[SnapshotFetcher] = None,
+    ) -> Dict[str, Any]:
         """
         Apply a batch of changes.
         Returns summary with per-change status and the last successfully applied ID.
+
+        With ``bulk=True`` (default) the whole page is applied in a single
+        transaction using one prefetch query per table and bulk_create /
+        bulk_update / bulk delete. If the bulk path fails for any reason the
+        batch is rolled back and re-applied change by change. On PostgreSQL
+        a page whose tables fall into groups without foreign keys between
+        them is applied one group per thread instead, see
+        :meth:`_apply_changes_parallel`.
+
+        ``fetch_snapshot`` is used to obtain a full row from master when a
+        delta UPDATE cannot be applied against the local row.
+
+        Sends ``sync_changes_applied`` with the applied changes afterwards.
         """
         success_ids: List[int] = []
         failed_count = 0
         skipped_count = 0
 
-        for change in changes:
-            result = self.apply_change(change)
-            if result is True:
-                success_ids.append(change.id)
-            elif result is False:
-                failed_count += 1
-            else:
-                skipped_count += 1
+        bulk_applied = False
+        tables = [t for t in dict.fromkeys(c.table_name for c in changes) if t in self._model_registry]
+        groups = self.table_groups(tables) if bulk else []
+        if len(groups) > 1 and self.parallel_apply_enabled():
+            success_ids, failed_count, skipped_count = self._apply_changes_parallel(changes, groups, fetch_snapshot)
+            bulk_applied = True
+        elif bulk and changes:
+            try:
+                success_ids, failed_count = self._apply_changes_bulk(changes, fetch_snapshot)
+                bulk_applied = True
+            except Exception as e:
+                logger.warning(f"Bulk apply failed, falling back to per-change apply: {e}")
+                success_ids, failed_count = [], 0
+
+        if not bulk_applied:
+            for change in changes:
+                result = self.apply_change(change, fetch_snapshot)
+                if result is True:
+                    success_ids.append(change.id)
+                elif result is False:
+                    failed_count += 1
+                else:
+                    skipped_count += 1
 
         last_success_id = max(success_ids) if success_ids else 0
 
+        if success_ids:
+            applied_ids = set(success_ids)
+            applied = [change for change in changes if change.id in applied_ids]
+            for receiver, response in sync_changes_applied.send_robust(sender=self.__class__, changes=applied):
+                if isinstance(response, Exception):
+                    logger.warning(f"sync_changes_applied receiver {receiver} failed: {response}")
+
         logger.info(
             f"Batch apply complete: {len(success_ids)} success, "
             f"{failed_count} failed, {skipped_count} skipped, "
@@ -495,6 +753,264 @@ class SyncManager:
             "last_success_id": last_success_id,
         }
 
+    def parallel_apply_enabled(self) -> bool:
+        """Tables are applied concurrently only on PostgreSQL; SQLite allows a single writer."""
+        if not getattr(settings, "CLUSTER_CONFIG", {}).get("sync_parallel_apply", True):
+            return False
+        return connection.vendor == "postgresql"
+
+    def _apply_changes_parallel(
+        self, changes: List[SyncChange], groups: List[List[str]], fetch_snapshot: Optional[SnapshotFetcher] = None
+    ) -> tuple:
+        """
+        Apply a page with one transaction per group of related tables, running the groups concurrently.
+
+        ``groups`` come from :meth:`table_groups`: no foreign key links two
+        groups, so inserts, cascading deletes and updates of one group can
+        never depend on another. Inside a group the changes are replayed in
+        id order in a single transaction, exactly as on the sequential path.
+        A group whose bulk apply fails is re-applied change by change on its
+        own.
+
+        Returns a tuple ``(success_ids, failed_count, skipped_count)``.
+        """
+        group_of = {table_name: i for i, group in enumerate(groups) for table_name in group}
+        by_group: List[List[SyncChange]] = [[] for _ in groups]
+        failed_count = 0
+        for change in changes:
+            if change.table_name in group_of:
+                by_group[group_of[change.table_name]].append(change)
+            else:
+                logger.warning(f"Unknown table: {change.table_name}")
+                failed_count += 1
+
+        futures = [self._apply_executor.submit(self._apply_group_changes, group_changes, fetch_snapshot) for group_changes in by_group]
+
+        success_ids: List[int] = []
+        skipped_count = 0
+        for future in futures:
+            group_success, group_failed, group_skipped = future.result()
+            success_ids.extend(group_success)
+            failed_count += group_failed
+            skipped_count += group_skipped
+
+        return sorted(success_ids), failed_count, skipped_count
+
+    def _apply_group_changes(self, changes: List[SyncChange], fetch_snapshot: Optional[SnapshotFetcher] = None) -> tuple:
+        """Apply one table group's share of a page on an apply thread; returns ``(success_ids, failed, skipped)``."""
+        try:
+            try:
+                success_ids, failed_count = self._apply_changes_bulk(changes, fetch_snapshot)
+                return success_ids, failed_count, 0
+            except Exception as e:
+                tables = sorted({c.table_name for c in changes})
+                logger.warning(f"Bulk apply of {', '.join(tables)} failed, falling back to per-change apply: {e}")
+
+            success_ids, failed_count, skipped_count = [], 0, 0
+            for change in changes:
+                result = self.apply_change(change, fetch_snapshot)
+                if result is True:
+                    success_ids.append(change.id)
+                elif result is False:
+                    failed_count += 1
+                else:
+                    skipped_count += 1
+            return success_ids, failed_count, skipped_count
+        finally:
+            close_old_connections()
+
+    @property
+    def _apply_executor(self) -> ThreadPoolExecutor:
+        if self._apply_pool is None:
+            workers = getattr(settings, "CLUSTER_CONFIG", {}).get("sync_apply_workers", self.DEFAULT_APPLY_WORKERS)
+            self._apply_pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sync-apply")
+        return self._apply_pool
+
+    def _apply_changes_bulk(self, changes: List[SyncChange], fetch_snapshot: Optional[SnapshotFetcher] = None) -> tuple:
+        """
+        Apply a page of changes with set-based queries inside one transaction.
+
+        The page is replayed in id order against an in-memory view of the
+        affected rows (prefetched with one ``id__in`` query per table), using
+        the same INSERT/UPDATE/DELETE and version/last-modified conflict rules
+        as :meth:`apply_change`. The net result is then written per table:
+        deletes first, then inserts (with ``created_at`` restored), then
+        updates.
+
+        Deltas that cannot be resolved locally need a snapshot from the master.
+        The first replay only notes which ones; it is rolled back before
+        anything is written, the snapshots are fetched with no transaction
+        open, and the page is replayed again with them.
+
+        Returns a tuple ``(success_ids, failed_count)``. Raises on database
+        errors so the caller can fall back to the per-change path.
+        """
+        if fetch_snapshot is None:
+            return self._replay_changes_bulk(changes)
+
+        snapshots: Dict[Tuple[str, str], Optional[Dict[str, Any]]] = {}
+        pending: List[Tuple[str, str]] = []
+
+        def prefetched(table_name: str, record_id: str) -> Optional[Dict[str, Any]]:
+            key = (table_name, str(record_id))
+            if key in snapshots:
+                return snapshots[key]
+            pending.append(key)
+            return _SNAPSHOT_PENDING
+
+        try:
+            return self._replay_changes_bulk(changes, prefetched)
+        except _SnapshotsPending:
+            pass
+
+        for key in dict.fromkeys(pending):
+            snapshots[key] = fetch_snapshot(*key)
+        return self._replay_changes_bulk(changes, lambda table_name, record_id: snapshots.get((table_name, str(record_id))))
+
+    def _replay_changes_bulk(self, changes: List[SyncChange], fetch_snapshot: Optional[SnapshotFetcher] = None) -> tuple:
+        """One transactional pass of :meth:`_apply_changes_bulk`; raises ``_SnapshotsPending`` before writing if one is missing."""
+        success_ids: List[int] = []
+        failed_count = 0
+
+        # Group record ids per table, preserving first-appearance order
+        table_ids: Dict[str, set] = {}
+        for change in changes:
+            if change.table_name in self._model_registry:
+                table_ids.setdefault(change.table_name, set()).add(str(change.record_id))
+
+        with transaction.atomic():
+            # Per-table state: record_id -> instance (None when absent)
+            state: Dict[str, Dict[str, Optional[Model]]] = {}
+            original_ids: Dict[str, set] = {}
+            for table_name, record_ids in table_ids.items():
+                model_class = self._model_registry[table_name].model_class
+                existing = {str(obj.pk): obj for obj in model_class.objects.filter(id__in=record_ids)}
+                original_ids[table_name] = set(existing.keys())
+                state[table_name] = existing
+
+            deleted: Dict[str, set] = {t: set() for t in table_ids}
+            dirty: Dict[str, set] = {t: set() for t in table_ids}
+            update_fields: Dict[str, set] = {t: set() for t in table_ids}
+            created_at_values: Dict[str, Dict[str, Any]] = {t: {} for t in table_ids}
+            snapshots_pending = False
+
+            for change in changes:
+                table_name = change.table_name
+                if table_name not in self._model_registry:
+                    logger.warning(f"Unknown table: {table_name}")
+                    failed_count += 1
+                    continue
+
+                registry_entry = self._model_registry[table_name]
+                model_class = registry_entry.model_class
+                record_id = str(change.record_id)
+                records = state[table_name]
+
+                try:
+                    if change.operation == SyncOperation.DELETE.value:
+                        if records.get(record_id) is not None and record_id in original_ids[table_name]:
+                            deleted[table_name].add(record_id)
+                        records[record_id] = None
+                        dirty[table_name].discard(record_id)
+                    elif change.operation in (SyncOperation.INSERT.value, SyncOperation.UPDATE.value):
+                        record = records.get(record_id)
+                        if record is not None and self._is_stale(record, change, registry_entry):
+                            success_ids.append(change.id)
+                            continue
+
+                        data = self._materialize_data(change, record, fetch_snapshot)
+                        if data is _SNAPSHOT_PENDING:
+                            snapshots_pending = True
+                            continue
+                        if data is None:
+                            failed_count += 1
+                            continue
+
+                        clean_data = self._clean_data(data, model_class)
+                        if record is None:
+                            created_at = clean_data.pop("created_at", None)
+                            records[record_id] = model_class(id=change.record_id, **clean_data)
+                            if created_at:
+                                created_at_values[table_name][record_id] = created_at
+                            dirty[table_name].add(record_id)
+                        else:
+                            # INSERT on an existing row is treated as UPDATE, as in _apply_insert
+                            for key, value in clean_data.items():
+                                setattr(record, key, value)
+                            if hasattr(record, registry_entry.version_field):
+                                setattr(record, registry_entry.version_field, change.version)
+                            update_fields[table_name].update(clean_data.keys())
+                            update_fields[table_name].add(registry_entry.version_field)
+                            dirty[table_name].add(record_id)
+                    else:
+                        logger.error(f"Unknown operation: {change.operation}")
+                        failed_count += 1
+                        continue
+                except Exception as e:
+                    logger.error(f"Failed to apply change {change.id}: {e}")
+                    failed_count += 1
+                    continue
+
+                success_ids.append(change.id)
+
+            if snapshots_pending:
+                raise _SnapshotsPending()
+
+            # Deletes (Django's collector still handles ON DELETE CASCADE)
+            for table_name, record_ids in deleted.items():
+                if record_ids:
+                    self._model_registry[table_name].model_class.objects.filter(id__in=record_ids).delete()
+
+            for table_name in table_ids:
+                registry_entry = self._model_registry[table_name]
+                model_class = registry_entry.model_class
+                records = state[table_name]
+
+                to_insert = []
+                to_update = []
+                for record_id in dirty[table_name]:
+                    record = records.get(record_id)
+                    if record is None:
+                        continue
+                    if record_id in original_ids[table_name] and record_id not in deleted[table_name]:
+                        to_update.append(record)
+                    else:
+                        to_insert.append(record)
+
+                # A cascade from a delete above may have removed rows we planned to update
+                if to_update and any(deleted.values()):
+                    remaining = model_class.objects.filter(id__in=[r.pk for r in to_update]).values_list("pk", flat=True)
+                    still_there = {str(pk) for pk in remaining}
+                    to_insert.extend(r for r in to_update if str(r.pk) not in still_there)
+                    to_update = [r for r in to_update if str(r.pk) in still_there]
+
+                if to_insert:
+                    model_class.objects.bulk_create(to_insert)
+                    # auto_now_add overrides created_at during insert; bulk_update does not
+                    restored = []
+                    for record in to_insert:
+                        created_at = created_at_values[table_name].get(str(record.pk))
+                        if created_at:
+                            record.created_at = created_at
+                            restored.append(record)
+                    if restored:
+                        model_class.objects.bulk_update(restored, ["created_at"])
+
+                fields = [
+                    name
+                    for name in update_fields[table_name]
+                    if name != "id" and any(f.attname == name and not f.primary_key for f in model_class._meta.concrete_fields)
+                ]
+                if to_update and fields:
+                    model_class.objects.bulk_update(to_update, fields)
+
+                logger.debug(
+                    f"Bulk applied {table_name}: {len(deleted[table_name])} deleted, "
+                    f"{len(to_insert)} inserted, {len(to_update)} updated"
+                )
+
+        return success_ids, failed_count
+
     def export_full_data(
         self,
         tables: Optional[List[str]] = None,
@@ -519,7 +1035,7 @@ class SyncManager:
             model_class = registry_entry.model_class
             serializer_class = registry_entry.serializer_class
 
-            queryset = model_class.objects.all()
+            queryset = model_class.objects.order_by("pk")
             offset = (page - 1) * page_size
             records = queryset[offset : offset + page_size]
 
@@ -538,6 +1054,232 @@ class SyncManager:
             "data": exported_data,
         }
 
+    def iter_full_snapshot(
+        self, tables: Optional[List[str]] = None, chunk_size: int = DEFAULT_SNAPSHOT_CHUNK_SIZE
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream a snapshot of all or the given tables.
+
+        Yields a ``header`` message carrying the pinned ``latest_sync_id``,
+        then ``chunk`` messages of at most ``chunk_size`` rows per table
+        (parents before children, rows in primary key order, paged by
+        keyset), then an ``end`` message.
+
+        On PostgreSQL everything is read in one REPEATABLE READ transaction,
+        which does not block writers, so the rows match the pinned sync id.
+        SQLite has no such snapshot and an open read transaction would hold
+        back the master's writes while a slow follower downloads, so each
+        chunk is its own short query there. Writes that commit during the
+        stream then may or may not be in it, and a child row can point to a
+        parent inserted after the parent's table was read. They all have sync
+        ids above the pinned one, which is read first: the follower defers
+        such rows (see :meth:`import_snapshot_chunk`) and replays those writes
+        incrementally afterwards.
+        """
+        if tables is None:
+            tables = list(self._model_registry.keys())
+        tables = self.table_dependency_order([t for t in tables if t in self._model_registry])
+        chunk_size = max(1, min(chunk_size, self.MAX_SNAPSHOT_CHUNK_SIZE))
+
+        if connection.vendor != "postgresql":
+            yield from self._snapshot_messages(tables, chunk_size)
+            return
+
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ")
+            yield from self._snapshot_messages(tables, chunk_size)
+
+    def _snapshot_messages(self, tables: List[str], chunk_size: int) -> Iterator[Dict[str, Any]]:
+        latest_sync_id = self.get_latest_sync_id()
+        yield {"type": "header", "latest_sync_id": latest_sync_id, "tables": tables}
+
+        total_records = 0
+        for table_name in tables:
+            model_class = self._model_registry[table_name].model_class
+            last_pk = None
+            while True:
+                queryset = model_class.objects.order_by("pk")
+                if last_pk is not None:
+                    queryset = queryset.filter(pk__gt=last_pk)
+                rows = list(queryset[:chunk_size])
+                if not rows:
+                    break
+
+                records = [{**snapshot_instance(r), **self._snapshot_timestamps(r), "id": r.pk} for r in rows]
+                yield {"type": "chunk", "table": table_name, "records": records}
+                total_records += len(rows)
+                last_pk = rows[-1].pk
+                if len(rows) < chunk_size:
+                    break
+
+        yield {"type": "end", "latest_sync_id": latest_sync_id, "total_records": total_records}
+
+    def import_snapshot_chunk(self, table_name: str, records: List[Dict[str, Any]]) -> int:
+        """
+        Upsert one chunk of a full snapshot with bulk queries.
+
+        The master's rows are authoritative here: existing rows are
+        overwritten without the version checks used for incremental changes,
+        and their timestamps are kept so later incremental changes compare
+        against the master's values.
+
+        Rows whose foreign key points to a parent that does not exist
+        locally are deferred. Chunks arrive parents first, so such a parent
+        was inserted on the master after its table was streamed; the writes
+        involved are above the snapshot's pinned sync id and the incremental
+        replay that follows the full sync brings both rows in. Returns the
+        number of rows written.
+        """
+        if table_name not in self._model_registry or not records:
+            return 0
+
+        model_class = self._model_registry[table_name].model_class
+        deferred = self._rows_with_missing_parents(model_class, records)
+        if deferred:
+            logger.info(f"Full sync: deferring {len(deferred)} {table_name} row(s) whose parent is not in the snapshot")
+            records = [record for i, record in enumerate(records) if i not in deferred]
+            if not records:
+                return 0
+        pk_field = model_class._meta.pk
+        timestamp_fields = [f for f in model_class._meta.concrete_fields if f.name in self.SNAPSHOT_TIMESTAMP_FIELDS]
+
+        with transaction.atomic():
+            ids = [self._coerce_value(r["id"], pk_field) for r in records]
+            existing = {str(pk) for pk in model_class.objects.filter(pk__in=ids).values_list("pk", flat=True)}
+
+            to_insert, to_update = [], []
+            update_fields = set()
+            for pk, record in zip(ids, records):
+                clean_data = self._clean_data(record, model_class)
+                clean_data.pop("created_at", None)
+                instance = model_class(pk=pk, **clean_data)
+                if str(pk) in existing:
+                    to_update.append((instance, record))
+                    update_fields.update(clean_data.keys())
+                else:
+                    to_insert.append((instance, record))
+
+            if to_insert:
+                model_class.objects.bulk_create([instance for instance, _ in to_insert])
+            if to_update and update_fields:
+                model_class.objects.bulk_update([instance for instance, _ in to_update], list(update_fields))
+
+            # auto_now / auto_now_add stamped the local time; bulk_update writes the master's values back
+            if timestamp_fields:
+                now = timezone.now()
+                for instance, record in to_insert + to_update:
+                    for field in timestamp_fields:
+                        value = self._coerce_value(record.get(field.name), field) or getattr(instance, field.attname) or now
+                        setattr(instance, field.attname, value)
+                model_class.objects.bulk_update([instance for instance, _ in to_insert + to_update], [f.name for f in timestamp_fields])
+
+        return len(records)
+
+    @staticmethod
+    def _rows_with_missing_parents(model_class: Type[Model], records: List[Dict[str, Any]]) -> set:
+        """Indexes of the snapshot records that reference a parent row missing locally."""
+        missing = set()
+        for field in model_class._meta.concrete_fields:
+            # A self-reference may point to a row later in the same snapshot
+            if not isinstance(field, ForeignKey) or field.related_model is model_class:
+                continue
+            target = field.target_field
+            values = {i: target.to_python(r[field.name]) for i, r in enumerate(records) if r.get(field.name) is not None}
+            if not values:
+                continue
+            existing = set(
+                field.related_model._base_manager.filter(**{f"{target.name}__in": set(values.values())}).values_list(target.name, flat=True)
+            )
+            missing.update(i for i, value in values.items() if value not in existing)
+        return missing
+
+    def prune_snapshot_table(self, table_name: str, snapshot_ids: List[Any]) -> int:
+        """
+        Delete the local rows of a table whose primary keys are not among ``snapshot_ids``.
+
+        Completes a full snapshot import: rows the master deleted never
+        appear in a snapshot, and their DELETE entries may be behind the
+        follower's new sync state. Returns the number of rows deleted,
+        cascades included.
+        """
+        model_class = self._model_registry[table_name].model_class
+        pk_field = model_class._meta.pk
+        keep = {pk_field.to_python(pk) for pk in snapshot_ids}
+        stale = [pk for pk in model_class.objects.values_list("pk", flat=True).iterator() if pk not in keep]
+
+        deleted = 0
+        with transaction.atomic():
+            for start in range(0, len(stale), self.MAX_BATCH_SIZE):
+                deleted += model_class.objects.filter(pk__in=stale[start : start + self.MAX_BATCH_SIZE]).delete()[0]
+        if deleted:
+            logger.info(f"Full sync: deleted {deleted} local row(s) of {table_name} missing from the snapshot")
+        return deleted
+
+    def _snapshot_timestamps(self, instance: Model) -> Dict[str, Any]:
+        """Auto-managed timestamps of a row; model_to_dict leaves them out because they are not editable."""
+        return {name: getattr(instance, name) for name in self.SNAPSHOT_TIMESTAMP_FIELDS if getattr(instance, name, None)}
+
+    def table_dependencies(self, tables: List[str]) -> Dict[str, set]:
+        """Map each registered table to the tables among ``tables`` its foreign keys point to."""
+        by_model = {self._model_registry[t].model_class: t for t in tables}
+        dependencies = {}
+        for table_name in tables:
+            model_class = self._model_registry[table_name].model_class
+            dependencies[table_name] = {
+                by_model[field.related_model]
+                for field in model_class._meta.concrete_fields
+                if isinstance(field, ForeignKey) and by_model.get(field.related_model) not in (None, table_name)
+            }
+        return dependencies
+
+    def table_groups(self, tables: List[str]) -> List[List[str]]:
+        """
+        Split registered tables into groups with no foreign key between two groups.
+
+        Tables linked by a foreign key in either direction, directly or
+        through other tables in ``tables``, share a group, so cycles simply
+        end up in one group. Groups keep the order of ``tables``.
+        """
+        group_of = {table_name: table_name for table_name in tables}
+
+        def find(table_name: str) -> str:
+            while group_of[table_name] != table_name:
+                group_of[table_name] = group_of[group_of[table_name]]
+                table_name = group_of[table_name]
+            return table_name
+
+        for table_name, parents in self.table_dependencies(tables).items():
+            for parent in parents:
+                group_of[find(table_name)] = find(parent)
+
+        groups: Dict[str, List[str]] = {}
+        for table_name in tables:
+            groups.setdefault(find(table_name), []).append(table_name)
+        return list(groups.values())
+
+    def table_dependency_order(self, tables: List[str]) -> List[str]:
+        """Order registered tables so that every table comes after the tables its foreign keys point to."""
+        by_model = {self._model_registry[t].model_class: t for t in tables}
+        ordered: List[str] = []
+        visiting = set()
+
+        def visit(table_name: str) -> None:
+            if table_name in ordered or table_name in visiting:
+                return
+            visiting.add(table_name)
+            model_class = self._model_registry[table_name].model_class
+            for field in model_class._meta.concrete_fields:
+                parent = by_model.get(field.related_model) if isinstance(field, ForeignKey) else None
+                if parent and parent != table_name:
+                    visit(parent)
+            visiting.discard(table_name)
+            ordered.append(table_name)
+
+        for table_name in tables:
+            visit(table_name)
+        return ordered
+
     def needs_manual_review(self, table_name: str) -> bool:
         """
         Check if a table requires manual review for conflicts.
@@ -1,15 +1,33 @@
+import json
 import logging
 import socket
 import threading
-from typing import Optional
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
+from django.conf import settings
 
 from backend.apps.cluster.models.cluster_config import DjangoClusterConfig
-from backend.apps.cluster.services.sync_manager import sync_manager, SyncChange
+from backend.apps.cluster.services import change_codec
+from backend.apps.cluster.services.config_cache import get_cluster_config
+from backend.apps.cluster.services.http_client import cluster_http
+from backend.apps.cluster.services.sync_manager import sync_manager, SyncChange, SyncManager
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_LONG_POLL_TIMEOUT = 25.0
+
+
+class SyncLogCompactedError(Exception):
+    """The master compacted sync_log entries this follower has not applied yet."""
+
+    def __init__(self, since_id: int, compacted_id: int):
+        super().__init__(f"master compacted its sync_log up to {compacted_id}, past last_synced_id={since_id}")
+        self.since_id = since_id
+        self.compacted_id = compacted_id
+
 
 def _get_own_url() -> str:
     """Derive this node's own HTTP URL from api_port and local IP."""
@@ -40,12 +58,29 @@ class SyncWorker:
     is in cluster mode and is NOT the master.
     """
 
+    MIN_LONG_POLL_SECONDS = 1.0
+    MIN_PAGE_SIZE = 20
+    MAX_PAGE_SIZE = SyncManager.MAX_BATCH_SIZE
+    TARGET_APPLY_SECONDS = 0.5
+
     def __init__(self):
         self._thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
         self._sync_event = threading.Event()
         self._sync_interval = 3.0
         self._running = False
+        self._page_size = SyncManager.DEFAULT_BATCH_SIZE
+        self._prefetch_pool: Optional[ThreadPoolExecutor] = None
+        self._ack_pool: Optional[ThreadPoolExecutor] = None
+        self._ack_lock = threading.Lock()
+        self._pending_ack: Optional[Tuple[str, str, int]] = None
+        # Set after a completed full sync, so a master with an empty log
+        # (pinned sync id 0) is not snapshotted again on every cycle
+        self._bootstrapped = False
+
+    @property
+    def _long_poll_timeout(self) -> float:
+        return float(getattr(settings, "CLUSTER_CONFIG", {}).get("sync_long_poll_timeout", DEFAULT_LONG_POLL_TIMEOUT))
 
     @property
     def is_running(self) -> bool:
@@ -102,6 +137,12 @@ class SyncWorker:
         self._sync_event.set()
         if self._thread:
             self._thread.join(timeout=10)
+        # A queued ACK is still sent; an outstanding prefetch is simply dropped
+        for pool in (self._prefetch_pool, self._ack_pool):
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=pool is self._prefetch_pool)
+        self._prefetch_pool = None
+        self._ack_pool = None
         self._running = False
         self._thread = None
         logger.info("SyncWorker: stopped")
@@ -116,30 +157,33 @@ class SyncWorker:
 
         while not self._stop_event.is_set():
             try:
-                self._do_sync_cycle()
+                poll_again = self._do_sync_cycle()
             except Exception as e:
                 logger.error("SyncWorker: sync cycle error: %s", e)
+                poll_again = False
 
-            self._sync_event.wait(timeout=self._sync_interval)
+            # After a long poll the next request can go out at once: the master holds it until there is something to pull
+            if not poll_again:
+                self._sync_event.wait(timeout=self._sync_interval)
             self._sync_event.clear()
 
         logger.info("SyncWorker: exiting sync loop")
 
-    def _do_sync_cycle(self) -> None:
-        """One iteration of the sync loop."""
+    def _do_sync_cycle(self) -> bool:
+        """One iteration of the sync loop; returns True if the next cycle can start immediately."""
         logger.warning("SyncWorker: starting sync cycle")
         try:
-            config = DjangoClusterConfig.get_config()
+            config = get_cluster_config()
         except Exception:
             logger.warning("SyncWorker: failed to get config")
-            return
+            return False
 
         if config.mode != "cluster" or config.is_master or not config.master_url:
             if config.is_master and self._running:
                 logger.info("SyncWorker: node promoted to master, stopping worker")
                 self._running = False
                 self._stop_event.set()
-            return
+            return False
 
         master_url = config.master_url
         node_id = config.node_id
@@ -148,35 +192,141 @@ class SyncWorker:
         sync_state = sync_manager.get_sync_state(node_id)
         last_synced_id = sync_state.last_synced_id if sync_state else 0
 
-        self._do_incremental_sync(master_url, node_id, last_synced_id)
+        if last_synced_id == 0 and not self._bootstrapped:
+            # A fresh follower loads the snapshot instead of replaying the whole log
+            return self._do_full_sync(master_url, node_id)
+
+        return self._do_incremental_sync(master_url, node_id, last_synced_id)
 
-    def _do_incremental_sync(self, master_url: str, node_id: str, last_synced_id: int) -> None:
-        """Pull and apply incremental changes from master."""
+    def _do_incremental_sync(self, master_url: str, node_id: str, last_synced_id: int) -> bool:
+        """Pull and apply incremental changes from master.
+
+        The first request long-polls: the master answers as soon as a change
+        newer than ``last_synced_id`` commits, or after ``long_poll_timeout``
+        seconds with an empty page. While the master reports more pages, the
+        next page is fetched in the background while the current one is
+        applied, and ACKs are sent off the apply path, so catching up is
+        bound by the local write rate rather than by round trips. Returns
+        True if the next pull can be sent right away.
+        """
         logger.warning(f"SyncWorker: incremental sync called, last_synced_id={last_synced_id}, master_url={master_url}")
+        wait = self._long_poll_timeout
+        started = time.monotonic()
         try:
-            response = requests.get(
-                f"{master_url.rstrip('/')}/api/cluster/sync/changes/",
-                params={"since": last_synced_id, "limit": 100},
-                timeout=10,
+            page = self._fetch_changes(master_url, last_synced_id, self._page_size, wait)
+        except SyncLogCompactedError as e:
+            logger.warning("SyncWorker: %s; re-bootstrapping from a full snapshot", e)
+            self._do_full_sync(master_url, node_id)
+            return False
+        if page is None:
+            return False
+
+        if not page.get("changes"):
+            master_latest_id = page.get("last_id", 0)
+            if master_latest_id > 0:
+                sync_manager.update_sync_state(node_id, last_synced_id, master_latest_sync_id=master_latest_id)
+            # An empty page that came back early means the master did not hold the request; fall back to polling
+            return wait > 0 and time.monotonic() - started >= min(wait, self.MIN_LONG_POLL_SECONDS)
+
+        applied = False
+        while page is not None:
+            sync_changes = page.get("changes", [])
+            has_more = page.get("has_more", False)
+            master_latest_id = page.get("last_id", 0)
+            if not sync_changes:
+                break
+
+            prefetch: Optional[Future] = None
+            if has_more and not self._stop_event.is_set():
+                page_end = max(c.id for c in sync_changes)
+                prefetch = self._prefetch_executor.submit(self._fetch_changes, master_url, page_end, self._page_size, 0)
+
+            apply_started = time.monotonic()
+            results = sync_manager.apply_changes_batch(
+                sync_changes,
+                fetch_snapshot=lambda table_name, record_id: self._fetch_snapshot(master_url, table_name, record_id),
             )
-        except requests.RequestException as e:
-            logger.error("SyncWorker: incremental sync request failed: %s", e)
-            return
+            self._adapt_page_size(len(sync_changes), time.monotonic() - apply_started)
+
+            last_success_id = results.get("last_success_id", 0)
+
+            if last_success_id > 0:
+                sync_manager.update_sync_state(node_id, last_success_id, master_latest_sync_id=master_latest_id)
+                self._queue_ack(master_url, node_id, last_success_id)
+                applied = True
+            else:
+                logger.warning(
+                    "SyncWorker: no changes applied successfully out of %d, " "not advancing sync state",
+                    len(sync_changes),
+                )
 
-        if response.status_code != 200:
-            logger.error("SyncWorker: incremental sync failed: HTTP %d", response.status_code)
-            return
+            logger.info(
+                "SyncWorker: incremental sync applied %d/%d changes (last_success_id=%d, page_size=%d)",
+                results["success"],
+                len(sync_changes),
+                last_success_id,
+                self._page_size,
+            )
 
-        data = response.json()
-        changes = data.get("changes", [])
-        has_more = data.get("has_more", False)
-        master_latest_id = data.get("last_id", 0)
+            if prefetch is None:
+                break
+            if results.get("failed") or last_success_id == 0:
+                # The prefetched page starts after changes that did not apply; pull again from the sync state
+                prefetch.cancel()
+                self._sync_event.set()
+                break
 
-        if not changes:
-            if master_latest_id > 0:
-                sync_manager.update_sync_state(node_id, last_synced_id, master_latest_sync_id=master_latest_id)
-            return
+            try:
+                page = prefetch.result()
+            except SyncLogCompactedError:
+                page = None
+            if page is None:
+                self._sync_event.set()
+
+        return wait > 0 and applied
 
+    def _fetch_changes(self, master_url: str, since_id: int, limit: int, wait: float) -> Optional[dict]:
+        """
+        One page of /sync/changes/ with its changes parsed, or None if the request failed.
+
+        Raises SyncLogCompactedError if the master no longer has every change after ``since_id``.
+
+        The compact format is requested and decoded line by line as it
+        arrives; a master that answers with the JSON document is handled too.
+        """
+        try:
+            response = cluster_http.get(
+                f"{master_url.rstrip('/')}/api/cluster/sync/changes/",
+                params={"since": since_id, "limit": limit, "wait": wait},
+                headers={"Accept": change_codec.ACCEPT},
+                timeout=cluster_http.timeout("changes") + wait,
+                stream=True,
+            )
+        except requests.RequestException as e:
+            logger.error("SyncWorker: incremental sync request failed: %s", e)
+            return None
+
+        try:
+            if response.status_code == 410:
+                raise SyncLogCompactedError(since_id, response.json().get("compacted_id", 0))
+            if response.status_code != 200:
+                logger.error("SyncWorker: incremental sync failed: HTTP %d", response.status_code)
+                return None
+
+            if change_codec.is_compact(response.headers.get("Content-Type")):
+                return change_codec.decode_changes(response.iter_lines())
+
+            page = response.json()
+            page["changes"] = self._parse_changes(page.get("changes", []))
+            return page
+        except (requests.RequestException, ValueError) as e:
+            logger.error("SyncWorker: failed to read changes page: %s", e)
+            return None
+        finally:
+            response.close()
+
+    @staticmethod
+    def _parse_changes(changes: List[dict]) -> List[SyncChange]:
         sync_changes = []
         for c in changes:
             try:
@@ -193,81 +343,159 @@ class SyncWorker:
                 )
             except (KeyError, TypeError) as e:
                 logger.warning("SyncWorker: skipping malformed change: %s", e)
+        return sync_changes
 
-        if not sync_changes:
+    def _adapt_page_size(self, applied: int, seconds: float) -> None:
+        """Size the next page so that applying it takes about TARGET_APPLY_SECONDS."""
+        if applied < self._page_size or seconds <= 0:
+            # A short page says nothing about throughput
             return
+        target = applied / seconds * self.TARGET_APPLY_SECONDS
+        size = int((self._page_size + target) / 2)
+        self._page_size = max(self.MIN_PAGE_SIZE, min(size, self.MAX_PAGE_SIZE))
+
+    def _queue_ack(self, master_url: str, node_id: str, sync_id: int) -> None:
+        """ACK in the background; an ACK covers every earlier id, so only the newest pending one is sent."""
+        with self._ack_lock:
+            self._pending_ack = (master_url, node_id, max(sync_id, self._pending_ack[2] if self._pending_ack else 0))
+        self._ack_executor.submit(self._flush_ack)
+
+    def _flush_ack(self) -> None:
+        with self._ack_lock:
+            pending, self._pending_ack = self._pending_ack, None
+        if pending is not None:
+            self._send_ack(*pending)
 
-        results = sync_manager.apply_changes_batch(sync_changes)
+    @property
+    def _prefetch_executor(self) -> ThreadPoolExecutor:
+        if self._prefetch_pool is None:
+            self._prefetch_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sync-prefetch")
+        return self._prefetch_pool
 
-        last_success_id = results.get("last_success_id", 0)
+    @property
+    def _ack_executor(self) -> ThreadPoolExecutor:
+        if self._ack_pool is None:
+            self._ack_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sync-ack")
+        return self._ack_pool
 
-        if last_success_id > 0:
-            sync_manager.update_sync_state(node_id, last_success_id, master_latest_sync_id=master_latest_id)
-            self._send_ack(master_url, node_id, last_success_id)
-        else:
-            logger.warning(
-                "SyncWorker: no changes applied successfully out of %d, " "not advancing sync state",
-                len(sync_changes),
+    def _fetch_snapshot(self, master_url: str, table_name: str, record_id: str) -> Optional[dict]:
+        """Fetch a full-row snapshot from master when a delta cannot be applied locally."""
+        try:
+            response = cluster_http.get(
+                f"{master_url.rstrip('/')}/api/cluster/sync/snapshot/",
+                params={"table_name": table_name, "record_id": record_id},
+                endpoint="snapshot",
             )
+        except requests.RequestException as e:
+            logger.warning("SyncWorker: snapshot request failed for %s/%s: %s", table_name, record_id, e)
+            return None
 
-        logger.info(
-            "SyncWorker: incremental sync applied %d/%d changes (last_success_id=%d)",
-            results["success"],
-            len(sync_changes),
-            last_success_id,
-        )
-
-        if has_more:
-            self._sync_event.set()
-
-    def _do_full_sync(self, master_url: str, node_id: str) -> None:
-        """Initial full sync when node has no sync state (last_synced_id == 0)."""
+        if response.status_code != 200:
+            logger.warning("SyncWorker: snapshot for %s/%s failed: HTTP %d", table_name, record_id, response.status_code)
+            return None
+
+        return response.json().get("data")
+
+    def _do_full_sync(self, master_url: str, node_id: str) -> bool:
+        """Initial full sync when node has no sync state (last_synced_id == 0).
+
+        Consumes the master's NDJSON snapshot stream line by line, so memory
+        use is bounded by one chunk plus the primary keys seen, and
+        bulk-upserts each chunk as it arrives. Once the stream is complete,
+        local rows of the streamed tables that the snapshot did not contain
+        are deleted: they were deleted on the master, possibly by entries
+        this node can no longer replay after a compaction (410) or a reset
+        of its sync state. The sync state only moves to the snapshot's pinned sync id
+        once the ``end`` line is seen; an interrupted stream leaves it at 0
+        and the next cycle starts the full sync again. Returns True once the
+        snapshot is imported, so incremental pulls can follow right away.
+        """
         logger.info("SyncWorker: starting full sync from %s", master_url)
 
         try:
-            response = requests.get(
-                f"{master_url.rstrip('/')}/api/cluster/sync/full/",
-                params={"page": 1, "page_size": 1000},
-                timeout=30,
+            response = cluster_http.get(
+                f"{master_url.rstrip('/')}/api/cluster/sync/full/stream/",
+                params={"chunk_size": sync_manager.DEFAULT_SNAPSHOT_CHUNK_SIZE},
+                stream=True,
+                endpoint="full",
             )
         except requests.RequestException as e:
             logger.error("SyncWorker: full sync request failed: %s", e)
-            return
+            return False
 
-        if response.status_code != 200:
-            logger.error("SyncWorker: full sync failed: HTTP %d", response.status_code)
-            return
+        with response:
+            if response.status_code != 200:
+                logger.error("SyncWorker: full sync failed: HTTP %d", response.status_code)
+                return False
 
-        data = response.json()
-        latest_sync_id = data.get("latest_sync_id", 0)
+            latest_sync_id = None
+            tables: List[str] = []
+            snapshot_ids: Dict[str, List[Any]] = {}
+            imported = 0
+            try:
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    message = json.loads(line)
+                    kind = message.get("type")
+
+                    if kind == "header":
+                        latest_sync_id = message.get("latest_sync_id", 0)
+                        tables = message.get("tables", [])
+                    elif kind == "chunk":
+                        table_name = message.get("table")
+                        if table_name not in sync_manager._model_registry:
+                            logger.warning("SyncWorker: skipping unknown table '%s' in full sync", table_name)
+                            continue
+                        records = message.get("records", [])
+                        imported += sync_manager.import_snapshot_chunk(table_name, records)
+                        snapshot_ids.setdefault(table_name, []).extend(record["id"] for record in records)
+                    elif kind == "end":
+                        latest_sync_id = message.get("latest_sync_id", latest_sync_id)
+                        break
+                else:
+                    logger.error("SyncWorker: full sync stream ended early after %d record(s); will retry", imported)
+                    return False
+            except (requests.RequestException, ValueError) as e:
+                logger.error("SyncWorker: full sync stream failed after %d record(s): %s", imported, e)
+                return False
+            except Exception as e:
+                logger.error("SyncWorker: failed to import full sync chunk: %s", e)
+                return False
 
-        for table_name, records in data.get("data", {}).items():
-            if table_name not in sync_manager._model_registry:
-                logger.warning("SyncWorker: skipping unknown table '%s' in full sync", table_name)
-                continue
+        if latest_sync_id is None:
+            logger.error("SyncWorker: full sync stream had no header")
+            return False
 
-            model_class = sync_manager._model_registry[table_name].model_class
-            for record in records:
-                try:
-                    defaults = sync_manager._clean_data(record, model_class)
-                    model_class.objects.update_or_create(id=record["id"], defaults=defaults)
-                except Exception as e:
-                    logger.error("SyncWorker: failed to import record %s/%s: %s", table_name, record.get("id"), e)
+        try:
+            # Children first, so no delete cascades into rows that are checked later
+            pruned = sum(
+                sync_manager.prune_snapshot_table(table_name, snapshot_ids.get(table_name, []))
+                for table_name in reversed(tables)
+                if table_name in sync_manager._model_registry
+            )
+        except Exception as e:
+            logger.error("SyncWorker: failed to remove rows missing from the full sync: %s", e)
+            return False
+        if pruned:
+            logger.info("SyncWorker: removed %d local row(s) missing from the full sync", pruned)
 
         sync_manager.update_sync_state(node_id, latest_sync_id, master_latest_sync_id=latest_sync_id)
 
-        logger.info("SyncWorker: full sync complete (last_sync_id=%d)", latest_sync_id)
+        logger.info("SyncWorker: full sync complete (last_sync_id=%d, records=%d)", latest_sync_id, imported)
 
         self._send_ack(master_url, node_id, latest_sync_id)
+        self._bootstrapped = True
+        return True
 
     def _send_ack(self, master_url: str, node_id: str, sync_id: int) -> None:
         """Send ACK to master after applying changes, including this node's URL."""
         own_url = _get_own_url()
         try:
-            requests.post(
+            cluster_http.post(
                 f"{master_url.rstrip('/')}/api/cluster/sync/ack/",
                 json={"node_id": node_id, "sync_id": sync_id, "url": own_url},
-                timeout=5,
+                endpoint="ack",
             )
         except requests.RequestException as e:
             logger.warning("SyncWorker: ACK to master failed: %s", e)
@@ -278,14 +506,14 @@ class SyncWorker:
             return
         own_url = _get_own_url()
         try:
-            requests.post(
+            cluster_http.post(
                 f"{config.master_url.rstrip('/')}/api/cluster/status/announce/",
                 json={
                     "node_id": config.node_id,
                     "url": own_url,
                     "is_master": False,
                 },
-                timeout=5,
+                endpoint="announce",
             )
             logger.info("SyncWorker: announced presence to master at %s (url=%s)", config.master_url, own_url)
         except requests.RequestException as e:
@@ -2,70 +2,180 @@ import asyncio
 import logging
 import socket
 import time
-from typing import Callable, Optional, Dict
+from collections import OrderedDict
+from typing import Callable, Hashable, List, Optional
 
+from django.conf import settings
+
+from backend.apps.cluster.schemas.frames import encode_frames, node_hash, parse_datagram
 from backend.apps.cluster.schemas.messages import (
     BaseMessage,
-    parse_message,
     MessageType,
 )
+from backend.apps.cluster.services.config_cache import get_cluster_config
+from backend.apps.cluster.services.udp_transport import UDPTransport, create_transport
 
 logger = logging.getLogger(__name__)
 
+WIRE_FORMATS = ("binary", "json")
+
+
+class DuplicateFilter:
+    """
+    Per-sender sliding window over sequence numbers.
+
+    Each sender keeps the highest seq_num seen and a bitmap of the ``window``
+    seq_nums below it, so a check is O(1) whatever the traffic. A seq_num
+    that falls behind the window means the sender restarted its counter; the
+    window starts over from it. Senders are kept in least-recently-seen
+    order: silent ones expire after ``ttl`` seconds, and past
+    ``max_senders`` the oldest is evicted, which bounds memory.
+    """
+
+    def __init__(self, window: int = 256, ttl: float = 60.0, max_senders: int = 1024):
+        self.window = window
+        self.ttl = ttl
+        self.max_senders = max_senders
+        self._mask = (1 << window) - 1
+        # sender -> [highest seq_num, bitmap (bit i = highest - i seen), last seen]
+        self._senders: "OrderedDict[Hashable, list]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._senders)
+
+    def seen(self, sender: Hashable, seq_num: int, now: Optional[float] = None) -> bool:
+        """Record ``seq_num`` from ``sender``; True if it was already seen."""
+        now = time.monotonic() if now is None else now
+        self._expire(now)
+
+        state = self._senders.get(sender)
+        if state is None:
+            if len(self._senders) >= self.max_senders:
+                self._senders.popitem(last=False)
+            self._senders[sender] = [seq_num, 1, now]
+            return False
+
+        self._senders.move_to_end(sender)
+        state[2] = now
+        highest, bitmap = state[0], state[1]
+        if seq_num > highest:
+            shift = seq_num - highest
+            state[0] = seq_num
+            state[1] = ((bitmap << shift) | 1) & self._mask if shift < self.window else 1
+            return False
+
+        offset = highest - seq_num
+        if offset >= self.window:
+            state[0], state[1] = seq_num, 1
+            return False
+        bit = 1 << offset
+        if bitmap & bit:
+            return True
+        state[1] = bitmap | bit
+        return False
+
+    def _expire(self, now: float) -> None:
+        while self._senders:
+            sender, state = next(iter(self._senders.items()))
+            if now - state[2] <= self.ttl:
+                break
+            del self._senders[sender]
+
 
 class UDPBroadcastService:
+    """
+    UDP broadcast transport for cluster messages.
+
+    Messages are sent as binary frames (see schemas/frames.py), several per
+    datagram when sent together with broadcast_many(); with
+    CLUSTER_CONFIG["udp_wire_format"] = "json" each message goes out as its
+    own JSON datagram instead. Both formats are always accepted.
+
+    Where datagrams go is up to the transport (see udp_transport.py),
+    read from DjangoClusterConfig when the service starts unless given.
+    """
+
     DEFAULT_PORT = 9000
     BUFFER_SIZE = 8192
     RETRY_COUNT = 2
     RETRY_DELAY_MS = 500
+    REPEATED_TYPES = (MessageType.MASTER_ANNOUNCE, MessageType.GOODBYE)
 
     def __init__(
         self,
         port: int = DEFAULT_PORT,
         node_id: str = "",
         on_message: Optional[Callable[[BaseMessage, str], None]] = None,
+        wire_format: Optional[str] = None,
+        transport: Optional[str] = None,
+        multicast_group: Optional[str] = None,
     ):
         self.port = port
         self.node_id = node_id
         self.on_message = on_message
+        self.wire_format = wire_format or getattr(settings, "CLUSTER_CONFIG", {}).get("udp_wire_format", "binary")
+        if self.wire_format not in WIRE_FORMATS:
+            raise ValueError(f"Unknown UDP wire format: {self.wire_format}")
+        self.transport_name = transport
+        self.multicast_group = multicast_group
+        # Unicast destinations; NodeDiscovery supplies its peers' addresses
+        self.peer_hosts: Callable[[], List[str]] = lambda: []
+        self._transport: Optional[UDPTransport] = None
         self.socket: Optional[socket.socket] = None
         self.running = False
         self.receive_task: Optional[asyncio.Task] = None
         self.seq_num = 0
-        self._seen_messages: Dict[str, float] = {}
-        self._seen_messages_ttl = 60.0
+        self._duplicates = DuplicateFilter()
+        self._own_hash: Optional[tuple] = None
 
     def _get_seq_num(self) -> int:
         self.seq_num += 1
         return self.seq_num
 
-    def _is_duplicate(self, msg: BaseMessage) -> bool:
-        key = f"{msg.node_id}:{msg.seq_num}:{msg.type.value}"
-        now = time.time()
-        self._cleanup_seen_messages(now)
-        if key in self._seen_messages:
+    @property
+    def node_hash(self) -> int:
+        # node_id is assigned after construction by NodeDiscovery, so the hash follows it
+        if self._own_hash is None or self._own_hash[0] != self.node_id:
+            self._own_hash = (self.node_id, node_hash(self.node_id))
+        return self._own_hash[1]
+
+    def _should_skip(self, message_type: MessageType, hashed: int, seq_num: int) -> bool:
+        """Header-level filter: our own broadcasts and messages already seen are never decoded."""
+        if hashed == self.node_hash:
             return True
-        self._seen_messages[key] = now
-        return False
+        # Windows are per message type: NodeDiscovery numbers its startup announces itself
+        return self._duplicates.seen((hashed, message_type), seq_num)
 
-    def _cleanup_seen_messages(self, now: float) -> None:
-        expired_keys = [k for k, v in self._seen_messages.items() if now - v > self._seen_messages_ttl]
-        for key in expired_keys:
-            del self._seen_messages[key]
+    def _is_duplicate(self, msg: BaseMessage) -> bool:
+        return self._duplicates.seen((node_hash(msg.node_id), msg.type), msg.seq_num)
+
+    @property
+    def transport(self) -> UDPTransport:
+        if self._transport is None:
+            name, group = self.transport_name, self.multicast_group
+            if name is None:
+                try:
+                    config = get_cluster_config()
+                    name, group = config.udp_transport, group or config.udp_multicast_group
+                except Exception as e:
+                    logger.warning(f"Could not read UDP transport from cluster config, using broadcast: {e}")
+                    name = "broadcast"
+            self._transport = create_transport(name, group, peer_hosts=lambda: self.peer_hosts())
+        return self._transport
 
     def start(self) -> None:
         if self.socket is not None:
             return
 
         self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
         self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
 
         try:
+            self.transport.configure(self.socket)
             self.socket.bind(("0.0.0.0", self.port))
             self.socket.setblocking(False)
             self.running = True
-            logger.info(f"UDP broadcast service started on port {self.port}")
+            logger.info(f"UDP broadcast service started on port {self.port} ({self.transport.name})")
         except OSError as e:
             logger.error(f"Failed to start UDP service: {e}")
             self.socket.close()
@@ -95,15 +205,9 @@ class UDPBroadcastService:
                     continue
 
                 try:
-                    msg = parse_message(data)
-                    if self._is_duplicate(msg):
-                        continue
-
-                    if msg.node_id == self.node_id:
-                        continue
-
-                    if self.on_message:
-                        self.on_message(msg, addr[0])
+                    for msg in parse_datagram(data, skip=self._should_skip):
+                        if self.on_message:
+                            self.on_message(msg, addr[0])
 
                 except Exception as e:
                     logger.warning(f"Failed to parse message from {addr}: {e}")
@@ -114,46 +218,53 @@ class UDPBroadcastService:
                 logger.error(f"Error in receive loop: {e}")
 
     def broadcast(self, message: BaseMessage) -> None:
+        self.broadcast_many([message])
+
+    def broadcast_many(self, messages: List[BaseMessage]) -> None:
+        """Broadcast messages together; in binary format they share as few datagrams as possible."""
         if not self.socket:
             raise RuntimeError("UDP service not started")
 
-        if not hasattr(message, "seq_num") or message.seq_num == 1:
-            message.seq_num = self._get_seq_num()
-
-        data = message.to_json().encode("utf-8")
-
-        broadcast_addr = "255.255.255.255"
+        datagrams = self._encode(messages)
+        hosts = self.transport.destinations()
+        # Role changes and departures are repeated once, spaced so a burst of loss does not take both copies;
+        # everything else goes out once (a failed send is retried)
+        spaced = any(m.type in self.REPEATED_TYPES for m in messages)
 
         for attempt in range(self.RETRY_COUNT):
             try:
-                self.socket.sendto(data, (broadcast_addr, self.port))
+                for host in hosts:
+                    for data in datagrams:
+                        self.socket.sendto(data, (host, self.port))
                 if attempt == 0:
-                    logger.debug(f"Broadcast {message.type.value} (seq={message.seq_num})")
+                    logger.debug(
+                        f"Broadcast {', '.join(f'{m.type.value} (seq={m.seq_num})' for m in messages)} "
+                        f"in {len(datagrams)} datagram(s) to {len(hosts)} host(s)"
+                    )
             except Exception as e:
                 logger.error(f"Failed to send broadcast (attempt {attempt + 1}): {e}")
-                if attempt < self.RETRY_COUNT - 1:
-                    time.sleep(self.RETRY_DELAY_MS / 1000.0)
-                else:
+                if attempt == self.RETRY_COUNT - 1:
                     raise
+            else:
+                if not spaced:
+                    return
 
-            if attempt < self.RETRY_COUNT - 1 and message.type in (
-                MessageType.MASTER_ANNOUNCE,
-                MessageType.GOODBYE,
-            ):
+            if attempt < self.RETRY_COUNT - 1:
                 time.sleep(self.RETRY_DELAY_MS / 1000.0)
 
     async def broadcast_async(self, message: BaseMessage) -> None:
         loop = asyncio.get_event_loop()
         await loop.run_in_executor(None, self.broadcast, message)
 
+    async def broadcast_many_async(self, messages: List[BaseMessage]) -> None:
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(None, self.broadcast_many, messages)
+
     def send_to(self, message: BaseMessage, host: str) -> None:
         if not self.socket:
             raise RuntimeError("UDP service not started")
 
-        if not hasattr(message, "seq_num") or message.seq_num == 1:
-            message.seq_num = self._get_seq_num()
-
-        data = message.to_json().encode("utf-8")
+        (data,) = self._encode([message])
 
         try:
             self.socket.sendto(data, (host, self.port))
@@ -162,6 +273,14 @@ class UDPBroadcastService:
             logger.error(f"Failed to send message to {host}: {e}")
             raise
 
+    def _encode(self, messages: List[BaseMessage]) -> List[bytes]:
+        for message in messages:
+            if not hasattr(message, "seq_num") or message.seq_num == 1:
+                message.seq_num = self._get_seq_num()
+        if self.wire_format == "json":
+            return [message.to_json().encode("utf-8") for message in messages]
+        return encode_frames(messages)
+
     async def send_to_async(self, message: BaseMessage, host: str) -> None:
         loop = asyncio.get_event_loop()
         await loop.run_in_executor(None, self.send_to, message, host)
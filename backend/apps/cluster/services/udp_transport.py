@@ -0,0 +1,86 @@
+"""
+Transports for UDP cluster messages.
+
+UDPBroadcastService hands every outgoing datagram to a transport, which
+decides where it goes. The transport is selected per node through
+DjangoClusterConfig.udp_transport:
+
+    broadcast  255.255.255.255; every host on the LAN receives the traffic (default)
+    multicast  an IP multicast group (udp_multicast_group); only hosts that
+               joined it wake up for cluster traffic
+    unicast    the known peers once discovery is complete; broadcast until then,
+               so new nodes are still found
+
+Broadcast and unicast nodes can share a cluster. Multicast nodes only hear
+each other, so a cluster must switch to multicast as a whole.
+"""
+
+import socket
+import struct
+from typing import Callable, List, Optional
+
+BROADCAST_ADDRESS = "255.255.255.255"
+DEFAULT_MULTICAST_GROUP = "239.255.42.99"
+# Cluster traffic never needs to leave the venue LAN
+MULTICAST_TTL = 1
+TRANSPORTS = ("broadcast", "multicast", "unicast")
+
+
+class UDPTransport:
+    name = ""
+
+    def configure(self, sock: socket.socket) -> None:
+        """Prepare the service socket before it is bound."""
+
+    def destinations(self) -> List[str]:
+        """Hosts an outgoing datagram is sent to."""
+        raise NotImplementedError
+
+
+class BroadcastTransport(UDPTransport):
+    name = "broadcast"
+
+    def configure(self, sock: socket.socket) -> None:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+
+    def destinations(self) -> List[str]:
+        return [BROADCAST_ADDRESS]
+
+
+class MulticastTransport(UDPTransport):
+    name = "multicast"
+
+    def __init__(self, group: str = DEFAULT_MULTICAST_GROUP):
+        self.group = group
+
+    def configure(self, sock: socket.socket) -> None:
+        sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, MULTICAST_TTL)
+        membership = struct.pack("4s4s", socket.inet_aton(self.group), socket.inet_aton("0.0.0.0"))
+        sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, membership)
+
+    def destinations(self) -> List[str]:
+        return [self.group]
+
+
+class UnicastTransport(BroadcastTransport):
+    name = "unicast"
+
+    def __init__(self, peer_hosts: Callable[[], List[str]]):
+        self.peer_hosts = peer_hosts
+
+    def destinations(self) -> List[str]:
+        return self.peer_hosts() or super().destinations()
+
+
+def create_transport(
+    name: str,
+    multicast_group: Optional[str] = None,
+    peer_hosts: Optional[Callable[[], List[str]]] = None,
+) -> UDPTransport:
+    if name == "broadcast":
+        return BroadcastTransport()
+    if name == "multicast":
+        return MulticastTransport(multicast_group or DEFAULT_MULTICAST_GROUP)
+    if name == "unicast":
+        return UnicastTransport(peer_hosts or (lambda: []))
+    raise ValueError(f"Unknown UDP transport: {name}")
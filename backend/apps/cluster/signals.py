@@ -0,0 +1,13 @@
+"""
+Cluster signals.
+
+``sync_changes_applied`` is sent by SyncManager.apply_changes_batch() after a
+page of replicated changes has been written locally, with ``changes`` set to
+the list of SyncChange objects that were applied. The bulk apply path uses
+bulk_create / bulk_update, which do not send post_save, so code that keeps
+in-memory state derived from synced tables should listen here as well.
+"""
+
+from django.dispatch import Signal
+
+sync_changes_applied = Signal()
@@ -1,3 +1,4 @@
+import ipaddress
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -12,8 +13,13 @@ from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
 from backend.apps.cluster.models import DjangoSyncLog, DjangoSyncState, DjangoClusterConfig
+from backend.apps.cluster.services.config_cache import get_cluster_config
+from backend.apps.cluster.services.http_client import cluster_http
+from backend.apps.cluster.services.notify_dispatcher import notification_dispatcher
+from backend.apps.cluster.services.sync_log_compactor import sync_log_compactor
 from backend.apps.cluster.services.sync_manager import sync_manager
 from backend.apps.cluster.services.sync_worker import sync_worker
+from backend.apps.cluster.services.udp_transport import TRANSPORTS
 from backend.apps.fencing_organizer.permissions import IsSchedulerOrAdmin
 
 logger = logging.getLogger(__name__)
@@ -62,7 +68,7 @@ class ClusterStatusViewSet(viewsets.GenericViewSet):
     def _get_config(self) -> Dict[str, Any]:
         """Get cluster configuration from database first, then fall back to settings."""
         try:
-            db_config = DjangoClusterConfig.get_config()
+            db_config = get_cluster_config()
             mode = db_config.mode
             is_master = db_config.is_master
 
@@ -70,6 +76,8 @@ class ClusterStatusViewSet(viewsets.GenericViewSet):
                 "mode": mode,
                 "node_id": db_config.node_id or "",
                 "udp_port": db_config.udp_port,
+                "udp_transport": db_config.udp_transport,
+                "udp_multicast_group": db_config.udp_multicast_group,
                 "api_port": db_config.api_port,
                 "heartbeat_interval": db_config.heartbeat_interval,
                 "heartbeat_timeout": db_config.heartbeat_timeout,
@@ -250,6 +258,9 @@ class ClusterStatusViewSet(viewsets.GenericViewSet):
         - isMaster: whether this node is master
         - followers: List of followers with their sync status
         - uncommittedChanges: Count of changes not yet ACKed by all followers
+        - notifications: Push notification counters and queue depth (master)
+        - http: Requests sent and connections opened/reused by the cluster HTTP client
+        - compaction: Highest compacted sync_log ID and the result of the last compaction run
         """
         config = self._get_config()
         node_id = self._get_node_id()
@@ -303,6 +314,9 @@ class ClusterStatusViewSet(viewsets.GenericViewSet):
                 "isMaster": is_master,
                 "followers": followers,
                 "uncommittedChanges": uncommitted_changes,
+                "notifications": notification_dispatcher.stats(),
+                "http": cluster_http.stats(),
+                "compaction": sync_log_compactor.stats(),
             }
         )
 
@@ -364,6 +378,7 @@ class ClusterStatusViewSet(viewsets.GenericViewSet):
 
         try:
             DjangoSyncState.objects.filter(node_id=node_id).delete()
+            notification_dispatcher.invalidate_urls()
 
             logger.info(f"Node departed: id={node_id}")
 
@@ -400,6 +415,7 @@ class ClusterStatusViewSet(viewsets.GenericViewSet):
                 "isMaster": config.get("is_master", False),
                 "nodeId": config.get("node_id", "unknown"),
                 "masterUrl": config.get("master_url"),
+                "udpTransport": config.get("udp_transport", "broadcast"),
                 "replicaAckRequired": config.get("replica_ack_required", 1),
                 "ackTimeoutMs": config.get("ack_timeout_ms", 5000),
             }
@@ -414,6 +430,8 @@ class ClusterStatusViewSet(viewsets.GenericViewSet):
         - mode: 'single' or 'cluster'
         - node_id: Node identifier (optional)
         - udp_port: UDP port (optional, read-only from UI)
+        - udp_transport: 'broadcast', 'multicast' or 'unicast' (optional, applied on restart)
+        - udp_multicast_group: Multicast group address (optional)
         - api_port: API port (optional, read-only from UI)
         - heartbeat_interval: Heartbeat interval in seconds (optional)
         - heartbeat_timeout: Heartbeat timeout in seconds (optional)
@@ -446,6 +464,28 @@ class ClusterStatusViewSet(viewsets.GenericViewSet):
             if "udp_port" in request.data:
                 db_config.udp_port = request.data["udp_port"]
 
+            if "udp_transport" in request.data:
+                udp_transport = request.data["udp_transport"]
+                if udp_transport not in TRANSPORTS:
+                    return Response(
+                        {"detail": f"Invalid udp_transport. Must be one of: {', '.join(TRANSPORTS)}."},
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+                db_config.udp_transport = udp_transport
+
+            if "udp_multicast_group" in request.data:
+                udp_multicast_group = request.data["udp_multicast_group"]
+                try:
+                    is_multicast = ipaddress.IPv4Address(udp_multicast_group).is_multicast
+                except ValueError:
+                    is_multicast = False
+                if not is_multicast:
+                    return Response(
+                        {"detail": "Invalid udp_multicast_group. Must be an IPv4 multicast address (224.0.0.0/4)."},
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+                db_config.udp_multicast_group = udp_multicast_group
+
             if "api_port" in request.data:
                 db_config.api_port = request.data["api_port"]
 
@@ -504,6 +544,8 @@ class ClusterStatusViewSet(viewsets.GenericViewSet):
                     "isMaster": db_config.is_master,
                     "nodeId": db_config.node_id,
                     "udpPort": db_config.udp_port,
+                    "udpTransport": db_config.udp_transport,
+                    "udpMulticastGroup": db_config.udp_multicast_group,
                     "apiPort": db_config.api_port,
                     "heartbeatInterval": db_config.heartbeat_interval,
                     "heartbeatTimeout": db_config.heartbeat_timeout,
@@ -1,11 +1,17 @@
+import datetime
+import json
 import logging
 
 from rest_framework import status, viewsets
 from rest_framework.decorators import action, api_view, permission_classes
 from rest_framework.permissions import AllowAny
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
 from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db.models import Max
+from django.http import StreamingHttpResponse
 from django.views.decorators.csrf import csrf_exempt
 
 from backend.apps.cluster.models import DjangoSyncLog, DjangoSyncState
@@ -14,13 +20,32 @@ from backend.apps.cluster.serializers import (
     SyncLogCreateSerializer,
     SyncStateSerializer,
 )
-from backend.apps.cluster.models.cluster_config import DjangoClusterConfig
+from backend.apps.cluster.services import change_codec
+from backend.apps.cluster.services.change_feed import change_feed
+from backend.apps.cluster.services.config_cache import get_cluster_config
+from backend.apps.cluster.services.sync_log_compactor import sync_log_compactor
 from backend.apps.cluster.services.sync_manager import sync_manager
 from backend.apps.cluster.services.sync_worker import sync_worker
 
 logger = logging.getLogger(__name__)
 
 
+class SnapshotJSONEncoder(DjangoJSONEncoder):
+    """DjangoJSONEncoder that keeps microseconds, so followers get the master's exact timestamps."""
+
+    def default(self, o):
+        if isinstance(o, datetime.datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+class CompactChangesRenderer(JSONRenderer):
+    """Lets DRF negotiate the compact /sync/changes/ format; error responses are still plain JSON."""
+
+    media_type = change_codec.CONTENT_TYPE
+    format = "ndjson"
+
+
 class SyncLogViewSet(viewsets.GenericViewSet):
     """Sync log API - Handles synchronization log records for cluster replication."""
 
@@ -159,7 +184,9 @@ class SyncViewSet(viewsets.GenericViewSet):
 
     permission_classes = [AllowAny]
 
-    @action(detail=False, methods=["get"], url_path="changes")
+    @action(
+        detail=False, methods=["get"], url_path="changes", renderer_classes=[*api_settings.DEFAULT_RENDERER_CLASSES, CompactChangesRenderer]
+    )
     def get_changes(self, request):
         """
         Get incremental changes since the given sync log ID.
@@ -169,6 +196,15 @@ class SyncViewSet(viewsets.GenericViewSet):
         - since: Last sync log ID the follower has applied (default: 0)
         - limit: Maximum number of changes to return (default: 100, max: 500)
         - tables: Comma-separated list of tables to filter (optional)
+        - wait: Long-poll; seconds to hold the request open when there are no
+          changes yet (default: 0, max: 30). The response is sent as soon as a
+          newer entry commits.
+
+        With ``Accept: application/x-ndjson`` the page is streamed in the
+        compact format of change_codec, gzipped if the client accepts it.
+
+        Returns 410 Gone if entries after ``since`` were removed by sync_log
+        compaction; the follower has to re-bootstrap from a full snapshot.
         """
         since_id = request.query_params.get("since", "0")
         try:
@@ -182,12 +218,31 @@ class SyncViewSet(viewsets.GenericViewSet):
         except ValueError:
             return Response({"detail": "Invalid 'limit' parameter"}, status=status.HTTP_400_BAD_REQUEST)
 
+        wait = request.query_params.get("wait", "0")
+        try:
+            wait = max(0.0, float(wait))
+        except ValueError:
+            return Response({"detail": "Invalid 'wait' parameter"}, status=status.HTTP_400_BAD_REQUEST)
+
         tables_param = request.query_params.get("tables")
         tables = None
         if tables_param:
             tables = [t.strip() for t in tables_param.split(",") if t.strip()]
 
         try:
+            compacted_id = sync_log_compactor.compacted_id
+            if since_id < compacted_id:
+                return Response(
+                    {"detail": "Changes since this ID were compacted; a full sync is required", "compacted_id": compacted_id},
+                    status=status.HTTP_410_GONE,
+                )
+
+            if wait:
+                change_feed.wait_for(since_id, wait)
+
+            if request.accepted_renderer.media_type == change_codec.CONTENT_TYPE:
+                return self._stream_changes(request, since_id, limit, tables)
+
             if tables:
                 result = sync_manager.get_changes_for_tables(since_id, tables, limit)
             else:
@@ -203,6 +258,18 @@ class SyncViewSet(viewsets.GenericViewSet):
             logger.error(f"Failed to get changes: {e}")
             return Response({"detail": "Failed to get changes"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+    def _stream_changes(self, request, since_id, limit, tables):
+        rows = sync_manager.iter_change_rows(since_id, limit, tables=tables)
+        lines = change_codec.encode_changes(rows, min(limit, sync_manager.MAX_BATCH_SIZE), since_id)
+
+        if "gzip" in request.META.get("HTTP_ACCEPT_ENCODING", ""):
+            response = StreamingHttpResponse(change_codec.gzip_lines(lines), content_type=change_codec.CONTENT_TYPE)
+            response["Content-Encoding"] = "gzip"
+        else:
+            response = StreamingHttpResponse(lines, content_type=change_codec.CONTENT_TYPE)
+        response["Vary"] = "Accept, Accept-Encoding"
+        return response
+
     @action(detail=False, methods=["get"], url_path="full")
     def get_full_sync(self, request):
         """
@@ -246,6 +313,66 @@ class SyncViewSet(viewsets.GenericViewSet):
             logger.error(f"Failed to export full data: {e}")
             return Response({"detail": "Failed to export data"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+    @action(detail=False, methods=["get"], url_path="full/stream")
+    def stream_full_sync(self, request):
+        """
+        Stream a consistent full snapshot as NDJSON for follower bootstrap.
+
+        The first line is a header with the ``latest_sync_id`` the snapshot is
+        pinned to, followed by one ``chunk`` line per batch of rows (tables in
+        foreign key order, rows in primary key order) and a final ``end``
+        line. A stream without the ``end`` line is incomplete.
+
+        Query params:
+        - chunk_size: Rows per chunk line (default: 500, max: 5000)
+        - tables: Comma-separated list of tables to export (optional)
+        """
+        chunk_size = request.query_params.get("chunk_size", str(sync_manager.DEFAULT_SNAPSHOT_CHUNK_SIZE))
+        try:
+            chunk_size = int(chunk_size)
+        except ValueError:
+            return Response({"detail": "Invalid 'chunk_size' parameter"}, status=status.HTTP_400_BAD_REQUEST)
+
+        tables_param = request.query_params.get("tables")
+        tables = None
+        if tables_param:
+            tables = [t.strip() for t in tables_param.split(",") if t.strip()]
+
+        def lines():
+            for message in sync_manager.iter_full_snapshot(tables=tables, chunk_size=chunk_size):
+                if message["type"] == "end":
+                    logger.info(f"Full sync stream: pinned at {message['latest_sync_id']}, records={message['total_records']}")
+                yield json.dumps(message, cls=SnapshotJSONEncoder) + "\n"
+
+        return StreamingHttpResponse(lines(), content_type="application/x-ndjson")
+
+    @action(detail=False, methods=["get"], url_path="snapshot")
+    def get_snapshot(self, request):
+        """
+        Get the current full-row snapshot of a single record.
+        Used by followers when a delta UPDATE does not match their local base.
+
+        Query params:
+        - table_name: Registered sync table name
+        - record_id: Primary key of the record
+        """
+        table_name = request.query_params.get("table_name")
+        record_id = request.query_params.get("record_id")
+
+        if not table_name or not record_id:
+            return Response({"detail": "table_name and record_id are required"}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            snapshot = sync_manager.get_record_snapshot(table_name, record_id)
+        except Exception as e:
+            logger.error(f"Failed to get snapshot for {table_name}/{record_id}: {e}")
+            return Response({"detail": "Failed to get snapshot"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+        if snapshot is None:
+            return Response({"detail": "Record not found"}, status=status.HTTP_404_NOT_FOUND)
+
+        return Response({"table_name": table_name, "record_id": record_id, "data": snapshot})
+
     @action(detail=False, methods=["post"], url_path="ack")
     def acknowledge(self, request):
         """
@@ -273,6 +400,8 @@ class SyncViewSet(viewsets.GenericViewSet):
         sync_manager.ack_queue.acknowledge(sync_id, node_id)
         url = request.data.get("url")
         sync_manager.update_sync_state(node_id, sync_id, url=url)
+        # ACKs are what move the compaction horizon forward
+        sync_log_compactor.maybe_compact()
 
         logger.debug(f"ACK received from node={node_id} for sync_id={sync_id}")
 
@@ -344,7 +473,7 @@ class SyncViewSet(viewsets.GenericViewSet):
         Triggers immediate sync on this follower's SyncWorker.
         Returns 200 immediately (non-blocking).
         """
-        config = DjangoClusterConfig.get_config()
+        config = get_cluster_config()
         if config.is_master:
             return Response({"status": "ignored", "reason": "master_node"})
 
@@ -6,3 +6,37 @@ class ApiConfig(AppConfig):
     name = "backend.apps.fencing_organizer"  # 完整的Python路径
     # 可选但推荐：定义一个更友好的名字
     verbose_name = "API"
+
+    def ready(self):
+        """Keep the in-memory live ranking in step with pool writes."""
+        from django.db import transaction  # noqa: E402
+        from django.db.models.signals import post_delete, post_save  # noqa: E402
+        from django.dispatch import receiver  # noqa: E402
+
+        from backend.apps.cluster.signals import sync_changes_applied  # noqa: E402
+        from backend.apps.fencing_organizer.modules.pool.models import DjangoPool  # noqa: E402
+        from backend.apps.fencing_organizer.services.live_ranking_service import live_ranking_service  # noqa: E402
+
+        @receiver(post_save, sender=DjangoPool, dispatch_uid="live_ranking_pool_saved")
+        def on_pool_saved(sender, instance, **kwargs):
+            """Apply the saved score sheet once the write is committed."""
+            transaction.on_commit(lambda: live_ranking_service.pool_changed(instance))
+
+        @receiver(post_delete, sender=DjangoPool, dispatch_uid="live_ranking_pool_deleted")
+        def on_pool_deleted(sender, instance, **kwargs):
+            """Drop the ranking of the stage a deleted pool belonged to."""
+            transaction.on_commit(lambda: live_ranking_service.pool_removed(instance.pk))
+
+        @receiver(sync_changes_applied, dispatch_uid="live_ranking_sync_applied")
+        def on_sync_changes_applied(sender, changes, **kwargs):
+            """Apply replicated pool changes, which the bulk apply path writes without post_save."""
+            pool_ids = {str(change.record_id) for change in changes if change.table_name == "pool"}
+            if not pool_ids:
+                return
+
+            pools = {str(pool.pk): pool for pool in DjangoPool.objects.filter(id__in=pool_ids)}
+            for pool_id in pool_ids:
+                if pool_id in pools:
+                    live_ranking_service.pool_changed(pools[pool_id])
+                else:
+                    live_ranking_service.pool_removed(pool_id)
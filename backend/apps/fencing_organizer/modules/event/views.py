@@ -1,4 +1,3 @@
-from datetime import datetime
 from uuid import UUID
 
 
@@ -10,6 +9,7 @@ from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 
 from backend.apps.cluster.decorators.transaction import SyncTransaction
+from backend.apps.cluster.services.delta import snapshot_instance
 
 from backend.apps.fencing_organizer.viewsets.base import SyncWriteModelViewSet
 from backend.apps.fencing_organizer.modules.event.models import DjangoEvent
@@ -18,7 +18,10 @@ from backend.apps.fencing_organizer.modules.fencer.models import DjangoFencer
 from backend.apps.fencing_organizer.modules.pool.models import DjangoPool
 from backend.apps.fencing_organizer.permissions import IsEventEditor
 from backend.apps.fencing_organizer.services.event_service import EventService
-from backend.apps.fencing_organizer.utils.pagination import get_paginated_response
+from backend.apps.fencing_organizer.services.live_ranking_service import live_ranking_service
+from backend.apps.fencing_organizer.services.pool_service import PoolService
+from backend.apps.fencing_organizer.utils.pagination import get_paginated_query_response, get_paginated_response
+from core.interfaces.query_spec import QuerySpec
 from .serializers import EventSerializer, EventCreateSerializer
 
 
@@ -35,6 +38,7 @@ class EventViewSet(SyncWriteModelViewSet):
     queryset = DjangoEvent.objects.all()
     serializer_class = EventSerializer
     service = EventService()
+    pool_service = PoolService()
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ["tournament", "event_type", "status", "is_team_event"]
     search_fields = ["event_name", "tournament__tournament_name"]
@@ -42,7 +46,7 @@ class EventViewSet(SyncWriteModelViewSet):
     ordering = ["start_time"]
 
     def get_permissions(self):
-        if self.action in ["list", "retrieve", "by_tournament", "get_participants"]:
+        if self.action in ["list", "retrieve", "by_tournament", "get_participants", "stage_pool_ranking", "stage_live_ranking"]:
             return [AllowAny()]
         elif self.action in [
             "create",
@@ -52,7 +56,10 @@ class EventViewSet(SyncWriteModelViewSet):
             "update_live_ranking",
             "sync_participants",
             "stage_pools",
+            "stage_draw",
             "stage_detree",
+            "stage_bracket",
+            "stage_bracket_bout",
         ]:
             return [IsEventEditor()]
         return [IsAuthenticated()]
@@ -63,38 +70,22 @@ class EventViewSet(SyncWriteModelViewSet):
         return EventSerializer
 
     def list(self, request):
-        events = self.service.get_all_events()
+        spec = QuerySpec(ordering=[request.query_params.get("ordering", "start_time")])
 
         tournament_id = request.query_params.get("tournament")
         if tournament_id:
             try:
-                tournament_uuid = UUID(tournament_id)
-                events = [e for e in events if e.tournament_id == tournament_uuid]
+                spec.filters["tournament_id"] = UUID(tournament_id)
             except (ValueError, TypeError):
                 pass
 
         status_filter = request.query_params.get("status")
         if status_filter:
-            events = [e for e in events if e.status == status_filter]
+            spec.filters["status"] = status_filter
 
-        search = request.query_params.get("search")
-        if search:
-            events = [e for e in events if search.lower() in e.event_name.lower()]
+        spec.search = request.query_params.get("search") or None
 
-        ordering = request.query_params.get("ordering", "start_time")
-        reverse = ordering.startswith("-")
-        order_field = ordering.lstrip("-")
-        if events and hasattr(events[0], order_field):
-
-            def sort_key(x):
-                val = getattr(x, order_field)
-                if val is None:
-                    return datetime.min
-                return val
-
-            events = sorted(events, key=sort_key, reverse=reverse)
-
-        return get_paginated_response(self.get_serializer_class(), events, request)
+        return get_paginated_query_response(self.get_serializer_class(), spec, self.service.find_events, request)
 
     def retrieve(self, request, pk=None):
         try:
@@ -188,16 +179,16 @@ class EventViewSet(SyncWriteModelViewSet):
 
         try:
             with SyncTransaction() as sync_tx:
+                previous_event = DjangoEvent.objects.filter(id=event_id).first()
+                previous = snapshot_instance(previous_event) if previous_event else None
                 event = self.service.update_event(event_id, {"live_ranking": live_ranking})
                 # Get DjangoEvent instance for sync logging
                 django_event = DjangoEvent.objects.get(id=event_id)
-                sync_data = model_to_dict(django_event)
-                if hasattr(django_event, "created_at") and django_event.created_at:
-                    sync_data["created_at"] = django_event.created_at
                 sync_tx.record_update(
                     table_name="event",
                     instance=django_event,
-                    data=sync_data,
+                    data=snapshot_instance(django_event),
+                    previous=previous,
                 )
 
             request._sync_log_id = sync_tx.last_sync_id
@@ -291,48 +282,181 @@ class EventViewSet(SyncWriteModelViewSet):
                 return Response({"detail": "Expected a list of pools"}, status=status.HTTP_400_BAD_REQUEST)
 
             try:
-                with SyncTransaction() as sync_tx:
-                    # Get existing pools before deletion to record DELETE operations
-                    existing_pools = DjangoPool.objects.filter(event_id=event_id, stage_id=stage_id)
-                    for pool in existing_pools:
-                        sync_tx.record_delete(
-                            table_name="pool",
-                            record_id=str(pool.id),
-                        )
-
-                    DjangoPool.objects.filter(event_id=event_id, stage_id=stage_id).delete()
-
-                    new_pools = []
-                    for p_data in pools_data:
-                        new_pools.append(
-                            DjangoPool(
-                                event_id=event_id,
-                                stage_id=stage_id,
-                                pool_number=p_data.get("pool_number"),
-                                fencer_ids=p_data.get("fencer_ids", []),
-                            )
-                        )
-
-                    DjangoPool.objects.bulk_create(new_pools)
-
-                    # Record INSERT operations for new pools
-                    for pool in new_pools:
-                        sync_data = model_to_dict(pool)
-                        if hasattr(pool, "created_at") and pool.created_at:
-                            sync_data["created_at"] = pool.created_at
-                        sync_tx.record_insert(
-                            table_name="pool",
-                            instance=pool,
-                            data=sync_data,
-                        )
-
-                request._sync_log_id = sync_tx.last_sync_id
+                new_pools = self._replace_stage_pools(request, event_id, stage_id, pools_data)
                 return Response(
                     {"message": f"Successfully saved {len(new_pools)} pools to stage {stage_id}"}, status=status.HTTP_201_CREATED
                 )
             except Exception as e:
                 return Response({"detail": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+    @action(detail=True, methods=["post", "get"], url_path="stages/(?P<stage_id>[^/.]+)/draw")
+    def stage_draw(self, request, pk=None, stage_id=None):
+        try:
+            event_id = UUID(pk)
+        except (ValueError, TypeError):
+            return Response({"detail": "Invalid event ID"}, status=status.HTTP_400_BAD_REQUEST)
+
+        params = request.query_params if request.method == "GET" else request.data
+        try:
+            seed = int(params.get("seed", 0))
+        except (TypeError, ValueError):
+            return Response({"detail": "seed must be an integer"}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            draw = self.pool_service.draw_stage_pools(event_id, seed=seed)
+        except self.pool_service.PoolServiceError as e:
+            return Response({"detail": e.message}, status=status.HTTP_400_BAD_REQUEST)
+
+        data = {
+            "seed": draw.seed,
+            "pools": draw.pools,
+            "collisions": draw.collisions,
+            "initial_collisions": draw.initial_collisions,
+            "swaps": draw.swaps,
+        }
+        # GET computes the draw without saving it, e.g. to verify a saved draw from its seed
+        if request.method == "GET":
+            return Response(data)
+
+        pools_data = [{"pool_number": number, "fencer_ids": fencer_ids} for number, fencer_ids in enumerate(draw.pools, start=1)]
+        try:
+            self._replace_stage_pools(request, event_id, stage_id, pools_data)
+        except Exception as e:
+            return Response({"detail": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        return Response(data, status=status.HTTP_201_CREATED)
+
+    def _replace_stage_pools(self, request, event_id, stage_id, pools_data):
+        """Replace all pools of a stage and record the sync log entries."""
+        with SyncTransaction() as sync_tx:
+            # Get existing pools before deletion to record DELETE operations
+            existing_pools = DjangoPool.objects.filter(event_id=event_id, stage_id=stage_id)
+            for pool in existing_pools:
+                sync_tx.record_delete(
+                    table_name="pool",
+                    record_id=str(pool.id),
+                )
+
+            DjangoPool.objects.filter(event_id=event_id, stage_id=stage_id).delete()
+
+            new_pools = []
+            for p_data in pools_data:
+                new_pools.append(
+                    DjangoPool(
+                        event_id=event_id,
+                        stage_id=stage_id,
+                        pool_number=p_data.get("pool_number"),
+                        fencer_ids=p_data.get("fencer_ids", []),
+                    )
+                )
+
+            DjangoPool.objects.bulk_create(new_pools)
+
+            # Record INSERT operations for new pools
+            for pool in new_pools:
+                sync_data = model_to_dict(pool)
+                if hasattr(pool, "created_at") and pool.created_at:
+                    sync_data["created_at"] = pool.created_at
+                sync_tx.record_insert(
+                    table_name="pool",
+                    instance=pool,
+                    data=sync_data,
+                )
+
+        # bulk_create does not send post_save, so the stage's live ranking is rebuilt on the next read
+        live_ranking_service.invalidate(event_id, stage_id)
+
+        request._sync_log_id = sync_tx.last_sync_id
+        return new_pools
+
+    @action(detail=True, methods=["get"], url_path="stages/(?P<stage_id>[^/.]+)/pool-ranking")
+    def stage_pool_ranking(self, request, pk=None, stage_id=None):
+        try:
+            event_id = UUID(pk)
+        except (ValueError, TypeError):
+            return Response({"detail": "Invalid event ID"}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            ranking = self.pool_service.get_stage_ranking(event_id, stage_id)
+        except self.pool_service.PoolServiceError as e:
+            return Response({"detail": e.message}, status=status.HTTP_404_NOT_FOUND)
+
+        return Response([result.to_dict() for result in ranking])
+
+    @action(detail=True, methods=["get"], url_path="stages/(?P<stage_id>[^/.]+)/live-ranking")
+    def stage_live_ranking(self, request, pk=None, stage_id=None):
+        try:
+            event_id = UUID(pk)
+        except (ValueError, TypeError):
+            return Response({"detail": "Invalid event ID"}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            ranking = live_ranking_service.get_stage_ranking(event_id, stage_id)
+        except self.pool_service.PoolServiceError as e:
+            return Response({"detail": e.message}, status=status.HTTP_404_NOT_FOUND)
+
+        return Response(ranking)
+
+    @action(detail=True, methods=["post", "get"], url_path="stages/(?P<stage_id>[^/.]+)/bracket")
+    def stage_bracket(self, request, pk=None, stage_id=None):
+        try:
+            event_id = UUID(pk)
+        except (ValueError, TypeError):
+            return Response({"detail": "Invalid event ID"}, status=status.HTTP_400_BAD_REQUEST)
+
+        if request.method == "GET":
+            try:
+                bracket = self.service.get_bracket(event_id, stage_id)
+            except self.service.EventServiceError as e:
+                return Response({"detail": e.message}, status=status.HTTP_404_NOT_FOUND)
+            if bracket is None:
+                return Response({"detail": "Stage has no bracket"}, status=status.HTTP_404_NOT_FOUND)
+            return Response({**bracket.to_dict(), "rounds": bracket.rounds()})
+
+        fencer_ids = request.data.get("fencer_ids")
+        if not isinstance(fencer_ids, list):
+            return Response({"detail": "fencer_ids must be a list in seed order"}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            with SyncTransaction() as sync_tx:
+                previous_event = DjangoEvent.objects.select_for_update().filter(id=event_id).first()
+                if previous_event is None:
+                    return Response({"detail": "Event not found"}, status=status.HTTP_404_NOT_FOUND)
+                previous = snapshot_instance(previous_event)
+                bracket = self.service.create_bracket(event_id, stage_id, fencer_ids)
+                django_event = DjangoEvent.objects.get(id=event_id)
+                sync_tx.record_update(table_name="event", instance=django_event, data=snapshot_instance(django_event), previous=previous)
+        except self.service.EventServiceError as e:
+            return Response({"detail": e.message}, status=status.HTTP_400_BAD_REQUEST)
+
+        request._sync_log_id = sync_tx.last_sync_id
+        return Response({**bracket.to_dict(), "rounds": bracket.rounds()}, status=status.HTTP_201_CREATED)
+
+    @action(detail=True, methods=["patch"], url_path=r"stages/(?P<stage_id>[^/.]+)/bracket/bouts/(?P<node>\d+)")
+    def stage_bracket_bout(self, request, pk=None, stage_id=None, node=None):
+        try:
+            event_id = UUID(pk)
+        except (ValueError, TypeError):
+            return Response({"detail": "Invalid event ID"}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            # The row lock serialises concurrent bouts of the same event (no-op on SQLite)
+            with SyncTransaction() as sync_tx:
+                previous_event = DjangoEvent.objects.select_for_update().filter(id=event_id).first()
+                if previous_event is None:
+                    return Response({"detail": "Event not found"}, status=status.HTTP_404_NOT_FOUND)
+                previous = snapshot_instance(previous_event)
+                bracket, changed = self.service.record_bracket_result(
+                    event_id, stage_id, int(node), request.data.get("score_a"), request.data.get("score_b")
+                )
+                django_event = DjangoEvent.objects.get(id=event_id)
+                # Only the written heap slots differ from the previous snapshot, so the sync delta stays small
+                sync_tx.record_update(table_name="event", instance=django_event, data=snapshot_instance(django_event), previous=previous)
+        except self.service.EventServiceError as e:
+            return Response({"detail": e.message}, status=status.HTTP_400_BAD_REQUEST)
+
+        request._sync_log_id = sync_tx.last_sync_id
+        return Response({"changed": [bracket.bout(n) for n in changed], "champion": bracket.champion})
+
     @action(detail=True, methods=["put", "get"], url_path="stages/(?P<stage_id>[^/.]+)/detree")
     def stage_detree(self, request, pk=None, stage_id=None):
         try:
@@ -361,16 +485,16 @@ class EventViewSet(SyncWriteModelViewSet):
 
             try:
                 with SyncTransaction() as sync_tx:
+                    previous_event = DjangoEvent.objects.filter(id=event_id).first()
+                    previous = snapshot_instance(previous_event) if previous_event else None
                     event = self.service.update_event(event_id, {"de_trees": current_trees})
                     # Get DjangoEvent instance for sync logging
                     django_event = DjangoEvent.objects.get(id=event_id)
-                    sync_data = model_to_dict(django_event)
-                    if hasattr(django_event, "created_at") and django_event.created_at:
-                        sync_data["created_at"] = django_event.created_at
                     sync_tx.record_update(
                         table_name="event",
                         instance=django_event,
-                        data=sync_data,
+                        data=snapshot_instance(django_event),
+                        previous=previous,
                     )
 
                 request._sync_log_id = sync_tx.last_sync_id
@@ -11,7 +11,8 @@ from backend.apps.cluster.decorators.transaction import SyncTransaction
 from backend.apps.fencing_organizer.viewsets.base import SyncWriteModelViewSet
 from backend.apps.fencing_organizer.modules.fencer.models import DjangoFencer
 from backend.apps.fencing_organizer.services.fencer_service import FencerService
-from backend.apps.fencing_organizer.utils.pagination import get_paginated_response
+from backend.apps.fencing_organizer.utils.pagination import get_paginated_query_response
+from core.interfaces.query_spec import QuerySpec
 from .serializers import FencerSerializer, FencerCreateSerializer, FencerUpdateSerializer, FencerSearchSerializer
 
 
@@ -49,39 +50,23 @@ class FencerViewSet(SyncWriteModelViewSet):
         return [IsAuthenticated()]
 
     def list(self, request):
-        fencers = self.service.get_all_fencers()
+        spec = QuerySpec(ordering=[request.query_params.get("ordering", "last_name")])
 
         country_code = request.query_params.get("country_code")
         if country_code:
-            fencers = [f for f in fencers if f.country_code == country_code.upper()]
+            spec.filters["country_code"] = country_code.upper()
 
         gender = request.query_params.get("gender")
         if gender:
-            fencers = [f for f in fencers if f.gender == gender.upper()]
+            spec.filters["gender"] = gender.upper()
 
         weapon = request.query_params.get("primary_weapon")
         if weapon:
-            fencers = [f for f in fencers if f.primary_weapon == weapon.upper()]
-
-        search = request.query_params.get("search")
-        if search:
-            search_lower = search.lower()
-            fencers = [
-                f
-                for f in fencers
-                if search_lower in f.first_name.lower()
-                or search_lower in f.last_name.lower()
-                or (f.display_name and search_lower in f.display_name.lower())
-                or (f.fencing_id and search_lower in f.fencing_id.lower())
-            ]
-
-        ordering = request.query_params.get("ordering", "last_name")
-        reverse = ordering.startswith("-")
-        order_field = ordering.lstrip("-")
-        if fencers and hasattr(fencers[0], order_field):
-            fencers = sorted(fencers, key=lambda x: getattr(x, order_field) or "", reverse=reverse)
-
-        return get_paginated_response(self.get_serializer_class(), fencers, request)
+            spec.filters["primary_weapon"] = weapon.upper()
+
+        spec.search = request.query_params.get("search") or None
+
+        return get_paginated_query_response(self.get_serializer_class(), spec, self.service.find_fencers, request)
 
     def retrieve(self, request, pk=None):
         try:
@@ -1,5 +1,6 @@
 from uuid import UUID
 
+from django.db import transaction
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, status
 from rest_framework.decorators import action
@@ -7,11 +8,13 @@ from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 
 from backend.apps.cluster.decorators.transaction import SyncTransaction
+from backend.apps.cluster.services.delta import snapshot_instance
 from backend.apps.fencing_organizer.viewsets.base import SyncWriteModelViewSet
 from backend.apps.fencing_organizer.modules.pool.models import DjangoPool
+from backend.apps.fencing_organizer.services.live_ranking_service import live_ranking_service
 from backend.apps.fencing_organizer.services.pool_service import PoolService
-from backend.apps.fencing_organizer.utils.pagination import get_paginated_response
-from django.forms.models import model_to_dict
+from backend.apps.fencing_organizer.utils.pagination import get_paginated_query_response
+from core.interfaces.query_spec import QuerySpec
 from .serializers import PoolSerializer, PoolCreateSerializer, PoolUpdateSerializer
 
 
@@ -47,31 +50,24 @@ class PoolViewSet(SyncWriteModelViewSet):
         return PoolSerializer
 
     def list(self, request):
-        pools = self.service.get_all_pools()
+        spec = QuerySpec(ordering=[request.query_params.get("ordering", "pool_number")])
 
         event_id = request.query_params.get("event")
         if event_id:
             try:
-                event_uuid = UUID(event_id)
-                pools = [p for p in pools if p.event_id == event_uuid]
+                spec.filters["event_id"] = UUID(event_id)
             except (ValueError, TypeError):
                 pass
 
         stage_id = request.query_params.get("stage_id")
         if stage_id:
-            pools = [p for p in pools if p.stage_id == stage_id]
+            spec.filters["stage_id"] = stage_id
 
         status_filter = request.query_params.get("status")
         if status_filter:
-            pools = [p for p in pools if p.status == status_filter]
-
-        ordering = request.query_params.get("ordering", "pool_number")
-        reverse = ordering.startswith("-")
-        order_field = ordering.lstrip("-")
-        if pools and hasattr(pools[0], order_field):
-            pools = sorted(pools, key=lambda x: getattr(x, order_field) or 0, reverse=reverse)
+            spec.filters["status"] = status_filter
 
-        return get_paginated_response(self.get_serializer_class(), pools, request)
+        return get_paginated_query_response(self.get_serializer_class(), spec, self.service.find_pools, request)
 
     def retrieve(self, request, pk=None):
         try:
@@ -151,17 +147,21 @@ class PoolViewSet(SyncWriteModelViewSet):
 
         try:
             with SyncTransaction() as sync_tx:
+                previous_pool = DjangoPool.objects.filter(id=pool_id).first()
+                previous = snapshot_instance(previous_pool) if previous_pool else None
                 pool = self.service.update_pool(pool_id, update_data)
                 django_pool = DjangoPool.objects.get(id=pool.id)
-                sync_data = model_to_dict(django_pool)
-                if hasattr(django_pool, "created_at") and django_pool.created_at:
-                    sync_data["created_at"] = django_pool.created_at
                 sync_tx.record_update(
                     table_name=self.sync_table_name,
                     instance=django_pool,
-                    data=sync_data,
+                    data=snapshot_instance(django_pool),
+                    previous=previous,
                 )
 
+            # Statistics of the changed fencers are persisted in batches, and always when a pool is locked.
+            # Queued after the pool's post_save callback, so the index already holds this write.
+            transaction.on_commit(lambda: live_ranking_service.maybe_flush(force=bool(is_locked)))
+
             request._sync_log_id = sync_tx.last_sync_id
             response_data = {"message": "Updated successfully"}
             if is_locked is not None:
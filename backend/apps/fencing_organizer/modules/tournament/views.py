@@ -18,7 +18,8 @@ from backend.apps.fencing_organizer.permissions import (
     IsTournamentCreatorOrAdmin,
 )
 from backend.apps.fencing_organizer.services.tournament_service import TournamentService
-from backend.apps.fencing_organizer.utils.pagination import get_paginated_response
+from backend.apps.fencing_organizer.utils.pagination import get_paginated_query_response, get_paginated_response
+from core.interfaces.query_spec import QuerySpec
 from backend.apps.users.models import User
 from .serializers import TournamentSerializer, TournamentCreateSerializer, TournamentSchedulerSerializer
 
@@ -72,29 +73,14 @@ class TournamentViewSet(SyncWriteModelViewSet):
         return TournamentSerializer
 
     def list(self, request):
-        tournaments = self.service.get_all_tournaments()
-
-        search = request.query_params.get("search")
-        if search:
-            tournaments = [
-                t
-                for t in tournaments
-                if search.lower() in t.tournament_name.lower()
-                or (t.organizer and search.lower() in t.organizer.lower())
-                or (t.location and search.lower() in t.location.lower())
-            ]
+        spec = QuerySpec(ordering=[request.query_params.get("ordering", "-start_date")])
+        spec.search = request.query_params.get("search") or None
 
         status_filter = request.query_params.get("status")
         if status_filter:
-            tournaments = [t for t in tournaments if t.status == status_filter]
+            spec.filters["status"] = status_filter
 
-        ordering = request.query_params.get("ordering", "-start_date")
-        reverse = ordering.startswith("-")
-        order_field = ordering.lstrip("-")
-        if hasattr(tournaments[0] if tournaments else None, order_field):
-            tournaments = sorted(tournaments, key=lambda x: getattr(x, order_field), reverse=reverse)
-
-        return get_paginated_response(self.get_serializer_class(), tournaments, request)
+        return get_paginated_query_response(self.get_serializer_class(), spec, self.service.find_tournaments, request)
 
     def retrieve(self, request, pk=None):
         try:
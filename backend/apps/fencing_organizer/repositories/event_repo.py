@@ -5,7 +5,9 @@ from django.db.models import Q
 
 from backend.apps.fencing_organizer.mappers.event_mapper import EventMapper
 from backend.apps.fencing_organizer.modules.event.models import DjangoEvent
+from backend.apps.fencing_organizer.repositories.query import apply_query_spec
 from core.interfaces.event_repository import EventRepositoryInterface
+from core.interfaces.query_spec import QueryResult, QuerySpec
 from core.models.event import Event
 
 
@@ -58,6 +60,16 @@ class DjangoEventRepository(EventRepositoryInterface):
 
         return [EventMapper.to_domain(e) for e in django_events]
 
+    def find_events(self, spec: QuerySpec) -> QueryResult[Event]:
+        """按查询规格分页获取项目"""
+        return apply_query_spec(
+            DjangoEvent.objects.select_related("tournament", "rule"),
+            spec,
+            EventMapper.to_domain,
+            search_fields=("event_name",),
+            default_ordering=["-start_time"],
+        )
+
     def save_event(self, event: Event) -> Event:
         """保存或更新项目"""
         orm_data = EventMapper.to_orm_data(event)
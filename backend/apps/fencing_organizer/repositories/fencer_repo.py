@@ -5,7 +5,9 @@ from django.core.exceptions import MultipleObjectsReturned
 
 from backend.apps.fencing_organizer.mappers.fencer_mapper import FencerMapper
 from backend.apps.fencing_organizer.modules.fencer.models import DjangoFencer
+from backend.apps.fencing_organizer.repositories.query import apply_query_spec
 from core.interfaces.fencer_repository import FencerRepositoryInterface
+from core.interfaces.query_spec import QueryResult, QuerySpec
 from core.models.fencer import Fencer
 
 
@@ -65,6 +67,16 @@ class DjangoFencerRepository(FencerRepositoryInterface):
 
         return [FencerMapper.to_domain(fencer) for fencer in django_fencers]
 
+    def find_fencers(self, spec: QuerySpec) -> QueryResult[Fencer]:
+        """按查询规格分页获取运动员"""
+        return apply_query_spec(
+            DjangoFencer.objects.all(),
+            spec,
+            FencerMapper.to_domain,
+            search_fields=("first_name", "last_name", "display_name", "fencing_id"),
+            default_ordering=["last_name", "first_name"],
+        )
+
     def save_fencer(self, fencer: Fencer) -> Fencer:
         """保存或更新运动员"""
         orm_data = FencerMapper.to_orm_data(fencer)
@@ -6,7 +6,9 @@ from django.db import transaction
 
 from backend.apps.fencing_organizer.mappers.pool_mapper import PoolMapper
 from backend.apps.fencing_organizer.modules.pool.models import DjangoPool
+from backend.apps.fencing_organizer.repositories.query import apply_query_spec
 from core.interfaces.pool_repository import PoolRepositoryInterface
+from core.interfaces.query_spec import QueryResult, QuerySpec
 from core.models.pool import Pool
 from core.constants.pool import PoolStatus
 
@@ -64,6 +66,15 @@ class DjangoPoolRepository(PoolRepositoryInterface):
 
         return [PoolMapper.to_domain(p) for p in django_pools]
 
+    def find_pools(self, spec: QuerySpec) -> QueryResult[Pool]:
+        """按查询规格分页获取小组"""
+        return apply_query_spec(
+            DjangoPool.objects.select_related("event", "piste", "event__tournament"),
+            spec,
+            PoolMapper.to_domain,
+            default_ordering=["-start_time"],
+        )
+
     def save_pool(self, pool: Pool) -> Pool:
         """保存或更新小组"""
         orm_data = PoolMapper.to_orm_data(pool)
@@ -0,0 +1,69 @@
+from typing import Callable, Iterable, List, Optional, Type, TypeVar
+
+from django.db.models import F, Model, Q, QuerySet
+
+from core.interfaces.query_spec import QueryResult, QuerySpec
+
+T = TypeVar("T")
+
+
+def _field_names(model_class: Type[Model]) -> set:
+    """模型上可用于过滤和排序的字段名（包括外键的 *_id 列）"""
+    names = set()
+    for f in model_class._meta.concrete_fields:
+        names.add(f.name)
+        names.add(f.attname)
+    return names
+
+
+def build_ordering(model_class: Type[Model], ordering: Iterable[str], default: List[str]) -> list:
+    """
+    将排序字段转换为 ORM 排序表达式
+
+    未知字段被忽略；空值排在升序最前、降序最后，与之前在 Python 中排序的行为一致。
+    末尾追加主键，保证分页稳定。
+    """
+    allowed = _field_names(model_class)
+    fields = [name for name in ordering if name and name.lstrip("-") in allowed] or list(default)
+
+    expressions = []
+    for name in fields:
+        if name.startswith("-"):
+            expressions.append(F(name[1:]).desc(nulls_last=True))
+        else:
+            expressions.append(F(name).asc(nulls_first=True))
+    expressions.append("pk")
+    return expressions
+
+
+def apply_query_spec(
+    queryset: QuerySet,
+    spec: QuerySpec,
+    to_domain: Callable[[Model], T],
+    search_fields: Iterable[str] = (),
+    default_ordering: Optional[List[str]] = None,
+) -> QueryResult[T]:
+    """在数据库中执行过滤、搜索、排序和分页，只映射当前页"""
+    model_class = queryset.model
+    allowed = _field_names(model_class)
+
+    for name, value in spec.filters.items():
+        if name not in allowed:
+            raise ValueError(f"Unknown filter field: {name}")
+        queryset = queryset.filter(**{name: value})
+
+    if spec.search:
+        query = Q()
+        for search_field in search_fields:
+            query |= Q(**{f"{search_field}__icontains": spec.search})
+        queryset = queryset.filter(query)
+
+    total = queryset.count()
+
+    queryset = queryset.order_by(*build_ordering(model_class, spec.ordering, default_ordering or []))
+    if spec.limit is not None:
+        queryset = queryset[spec.offset : spec.offset + spec.limit]
+    elif spec.offset:
+        queryset = queryset[spec.offset :]
+
+    return QueryResult(items=[to_domain(obj) for obj in queryset], total=total)
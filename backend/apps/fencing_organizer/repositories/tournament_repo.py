@@ -5,7 +5,9 @@ from django.db.models import Q
 
 from backend.apps.fencing_organizer.mappers.tournament_mapper import TournamentMapper
 from backend.apps.fencing_organizer.modules.tournament.models import DjangoTournament
+from backend.apps.fencing_organizer.repositories.query import apply_query_spec
 from core.interfaces.tournament_repository import TournamentRepositoryInterface
+from core.interfaces.query_spec import QueryResult, QuerySpec
 from core.models.tournament import Tournament
 
 
@@ -40,6 +42,16 @@ class DjangoTournamentRepository(TournamentRepositoryInterface):
         django_tournaments = DjangoTournament.objects.all().order_by("-start_date")
         return [TournamentMapper.to_domain(t) for t in django_tournaments]
 
+    def find_tournaments(self, spec: QuerySpec) -> QueryResult[Tournament]:
+        """按查询规格分页获取赛事"""
+        return apply_query_spec(
+            DjangoTournament.objects.all(),
+            spec,
+            TournamentMapper.to_domain,
+            search_fields=("tournament_name", "organizer", "location"),
+            default_ordering=["-start_date"],
+        )
+
     def save_tournament(self, tournament: Tournament) -> Tournament:
         """保存或更新赛事"""
         orm_data = TournamentMapper.to_orm_data(tournament)
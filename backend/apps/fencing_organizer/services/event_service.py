@@ -1,5 +1,5 @@
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Any, List, Optional, Sequence, Tuple
 from uuid import UUID
 
 from django.db import IntegrityError
@@ -7,7 +7,9 @@ from django.db import IntegrityError
 from backend.apps.fencing_organizer.repositories.event_repo import DjangoEventRepository
 from backend.apps.fencing_organizer.repositories.tournament_repo import DjangoTournamentRepository
 from backend.apps.fencing_organizer.repositories.rule_repo import DjangoRuleRepository
+from core.interfaces.query_spec import QueryResult, QuerySpec
 from core.models.event import Event
+from core.services.bracket_service import DEFAULT_DE_MAX_TOUCHES, Bracket, BracketError
 
 
 class EventService:
@@ -37,6 +39,10 @@ class EventService:
         """Get all events."""
         return self.event_repository.get_all_events()
 
+    def find_events(self, spec: QuerySpec) -> QueryResult[Event]:
+        """Get a page of events matching the query spec."""
+        return self.event_repository.find_events(spec)
+
     def get_events_by_tournament(self, tournament_id: UUID) -> List[Event]:
         """Get events by tournament."""
         return self.event_repository.get_events_by_tournament(tournament_id)
@@ -104,6 +110,65 @@ class EventService:
         except IntegrityError as e:
             raise self.EventServiceError(f"Update event failed: {str(e)}")
 
+    def get_bracket(self, event_id: UUID, stage_id: str) -> Optional[Bracket]:
+        """Get the server-side DE table of a stage, if one was created."""
+        return self._load_bracket(self._get_event_or_raise(event_id), stage_id)
+
+    def create_bracket(self, event_id: UUID, stage_id: str, fencer_ids: Sequence[Any]) -> Bracket:
+        """Build a seeded DE table for a stage; fencer_ids are in seed order."""
+        event = self._get_event_or_raise(event_id)
+
+        max_touches = DEFAULT_DE_MAX_TOUCHES
+        if event.rule_id:
+            rule = self.rule_repository.get_rule_by_id(event.rule_id)
+            if rule and rule.match_score_elimination:
+                max_touches = rule.match_score_elimination
+
+        try:
+            bracket = Bracket.build(fencer_ids, max_touches=max_touches)
+        except BracketError as e:
+            raise self.EventServiceError(str(e))
+
+        self._save_bracket(event, stage_id, bracket)
+        return bracket
+
+    def record_bracket_result(self, event_id: UUID, stage_id: str, node: int, score_a: Any, score_b: Any) -> Tuple[Bracket, List[int]]:
+        """Record one DE bout; returns the table and the nodes that changed."""
+        event = self._get_event_or_raise(event_id)
+        bracket = self._load_bracket(event, stage_id)
+        if bracket is None:
+            raise self.EventServiceError(f"Stage {stage_id} has no bracket")
+
+        try:
+            changed = bracket.record_result(node, score_a, score_b)
+        except BracketError as e:
+            raise self.EventServiceError(str(e))
+
+        self._save_bracket(event, stage_id, bracket)
+        return bracket, changed
+
+    def _get_event_or_raise(self, event_id: UUID) -> Event:
+        event = self.event_repository.get_event_by_id(event_id)
+        if not event:
+            raise self.EventServiceError(f"Event {event_id} not found")
+        return event
+
+    @staticmethod
+    def _load_bracket(event: Event, stage_id: str) -> Optional[Bracket]:
+        try:
+            return Bracket.from_dict((event.de_trees or {}).get(stage_id))
+        except BracketError:
+            return None
+
+    def _save_bracket(self, event: Event, stage_id: str, bracket: Bracket) -> Event:
+        trees = dict(event.de_trees or {})
+        trees[stage_id] = bracket.to_dict()
+        event.de_trees = trees
+        try:
+            return self.event_repository.save_event(event)
+        except IntegrityError as e:
+            raise self.EventServiceError(f"Update event failed: {str(e)}")
+
     def delete_event(self, event_id: UUID) -> bool:
         """Delete event."""
         event = self.event_repository.get_event_by_id(event_id)
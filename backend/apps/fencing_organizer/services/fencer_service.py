@@ -5,6 +5,7 @@ from uuid import UUID
 from django.db import IntegrityError
 
 from backend.apps.fencing_organizer.repositories.fencer_repo import DjangoFencerRepository
+from core.interfaces.query_spec import QueryResult, QuerySpec
 from core.models.fencer import Fencer
 
 
@@ -31,6 +32,10 @@ class FencerService:
         """Get all fencers."""
         return self.repository.get_all_fencers()
 
+    def find_fencers(self, spec: QuerySpec) -> QueryResult[Fencer]:
+        """Get a page of fencers matching the query spec."""
+        return self.repository.find_fencers(spec)
+
     def create_fencer(self, fencer_data: dict) -> Fencer:
         """
         Create fencer.
@@ -0,0 +1,236 @@
+"""
+Live ranking of pool stages.
+
+Keeps one StageRankingIndex per (event, stage) in memory. An index is built
+from the stage's score sheets the first time its ranking is read; after that
+every saved pool is diffed against it, so a score entered on one piste costs
+two O(log n) moves instead of a recompute of the whole stage.
+
+Each index remembers the ``updated_at`` of every pool it reflects. A read
+compares them with the database (one small query over the stage's pools), so
+pools saved by another worker process are re-applied and a stage whose pools
+were added or removed is rebuilt.
+
+Pool statistics of the fencers that changed are written to their
+PoolAssignment rows in batches (see flush()), not once per bout. A batch is
+written when it is full, when a pool is locked, or once the flush interval
+has passed at the next write or read of a ranking. Only a node that accepts
+writes (single mode, or the cluster master) persists; followers receive those
+rows through sync.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from django.utils import timezone
+
+from backend.apps.cluster.decorators.transaction import SyncTransaction
+from backend.apps.cluster.services.config_cache import get_cluster_config
+from backend.apps.cluster.services.delta import snapshot_instance
+from backend.apps.fencing_organizer.modules.pool.models import DjangoPool
+from backend.apps.fencing_organizer.modules.pool_assignment.models import DjangoPoolAssignment
+from backend.apps.fencing_organizer.services.pool_service import PoolService
+from core.services.live_ranking import StageRankingIndex
+from core.services.result_service import PoolFencerResult, PoolSheet
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FLUSH_BATCH_SIZE = 50
+DEFAULT_FLUSH_INTERVAL = 5.0
+
+STAT_FIELDS = ["victories", "matches_played", "touches_scored", "touches_received", "indicator"]
+
+StageKey = Tuple[str, str]
+
+
+class LiveRankingService:
+    """Process-wide incremental ranking of pool stages."""
+
+    def __init__(
+        self,
+        pool_service: Optional[PoolService] = None,
+        flush_batch_size: int = DEFAULT_FLUSH_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ):
+        self.pool_service = pool_service or PoolService()
+        self.flush_batch_size = flush_batch_size
+        self.flush_interval = flush_interval
+        self._lock = threading.RLock()
+        self._indexes: Dict[StageKey, StageRankingIndex] = {}
+        # updated_at of every pool as it is reflected in its stage index
+        self._versions: Dict[StageKey, Dict[str, Any]] = {}
+        self._pool_stages: Dict[str, StageKey] = {}
+        # Changed rows of indexes dropped before they were flushed
+        self._pending: List[PoolFencerResult] = []
+        self._last_flush = time.monotonic()
+
+    def get_stage_ranking(self, event_id: UUID, stage_id: str) -> List[Dict[str, Any]]:
+        """Get the live ranking of a pool stage, building its index on first use."""
+        key = (str(event_id), str(stage_id))
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is not None:
+                index = self._refresh(key, index)
+            if index is None:
+                index = self._build(key)
+            ranking = [result.to_dict() for result in index.ranking()]
+        self.maybe_flush()
+        return ranking
+
+    def pool_changed(self, pool: Any) -> None:
+        """Apply a saved pool to its stage index, if that index is loaded."""
+        pool_id = str(pool.id)
+        key = (str(pool.event_id), str(pool.stage_id))
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is None:
+                self._forget_pool(pool_id)
+                return
+            if not index.has_pool(pool_id):
+                # A new pool (or one moved between stages) changes the stage layout
+                self._forget_pool(pool_id)
+                self.invalidate(*key)
+                return
+
+            sheet = PoolSheet(fencer_ids=pool.fencer_ids or [], results=pool.results or [], pool_number=pool.pool_number, pool_id=pool_id)
+            changed = index.update_pool(sheet)
+            self._versions[key][pool_id] = pool.updated_at
+            if changed:
+                logger.debug(f"Live ranking {key}: {changed} bout(s) changed in pool {pool_id}")
+
+    def pool_removed(self, pool_id: Any) -> None:
+        """Drop the index of the stage a deleted pool belonged to."""
+        with self._lock:
+            key = self._pool_stages.get(str(pool_id))
+            if key is not None:
+                self.invalidate(*key)
+
+    def invalidate(self, event_id: Any, stage_id: Any) -> None:
+        """Forget a stage index; it is rebuilt on the next read."""
+        key = (str(event_id), str(stage_id))
+        with self._lock:
+            index = self._indexes.pop(key, None)
+            self._versions.pop(key, None)
+            if index is not None:
+                self._pending.extend(index.drain_dirty())
+                self._pool_stages = {pool_id: stage for pool_id, stage in self._pool_stages.items() if stage != key}
+
+    def clear(self) -> None:
+        """Forget all stage indexes."""
+        with self._lock:
+            self._indexes.clear()
+            self._versions.clear()
+            self._pool_stages.clear()
+            self._pending = []
+            self._last_flush = time.monotonic()
+
+    def maybe_flush(self, force: bool = False) -> int:
+        """Flush pending statistics once a batch is full or the flush interval has passed."""
+        with self._lock:
+            pending = len(self._pending) + sum(index.dirty_count for index in self._indexes.values())
+            if not pending:
+                return 0
+            due = time.monotonic() - self._last_flush >= self.flush_interval
+            if not (force or due or pending >= self.flush_batch_size):
+                return 0
+            return self.flush()
+
+    def flush(self) -> int:
+        """Write the statistics of every changed fencer to PoolAssignment; returns the rows updated."""
+        with self._lock:
+            rows = self._pending + [row for index in self._indexes.values() for row in index.drain_dirty()]
+            self._pending = []
+            self._last_flush = time.monotonic()
+
+        if not rows or not self._accepts_writes():
+            return 0
+
+        try:
+            return self._persist(rows)
+        except Exception as e:
+            logger.error(f"Failed to persist live ranking statistics: {e}")
+            return 0
+
+    def _build(self, key: StageKey) -> StageRankingIndex:
+        # Versions are read before the sheets: a pool saved in between is only re-applied on the next read
+        versions = self._stage_versions(key)
+        sheets, max_touches = self.pool_service.get_stage_sheets(UUID(key[0]), key[1])
+        index = StageRankingIndex(max_touches=max_touches)
+        for sheet in sheets:
+            index.add_pool(sheet)
+            self._pool_stages[str(sheet.pool_id)] = key
+        # Freshly loaded rows already match the sheets; PoolAssignment is only updated for later changes
+        index.drain_dirty()
+        self._indexes[key] = index
+        self._versions[key] = versions
+        logger.debug(f"Live ranking {key}: built from {len(sheets)} pool(s), {len(index)} fencer(s)")
+        return index
+
+    def _refresh(self, key: StageKey, index: StageRankingIndex) -> Optional[StageRankingIndex]:
+        """Re-apply pools saved since the index last saw them; None if the stage must be rebuilt."""
+        current = self._stage_versions(key)
+        known = self._versions.get(key, {})
+        if current.keys() != known.keys():
+            logger.debug(f"Live ranking {key}: pools were added or removed, rebuilding")
+            self.invalidate(*key)
+            return None
+
+        stale = [pool_id for pool_id, updated_at in current.items() if known[pool_id] != updated_at]
+        for pool in DjangoPool.objects.filter(id__in=stale):
+            self.pool_changed(pool)
+        return self._indexes.get(key)
+
+    @staticmethod
+    def _stage_versions(key: StageKey) -> Dict[str, Any]:
+        rows = DjangoPool.objects.filter(event_id=key[0], stage_id=key[1]).values_list("id", "updated_at")
+        return {str(pool_id): updated_at for pool_id, updated_at in rows}
+
+    def _forget_pool(self, pool_id: str) -> None:
+        key = self._pool_stages.pop(pool_id, None)
+        if key is not None:
+            self.invalidate(*key)
+
+    @staticmethod
+    def _accepts_writes() -> bool:
+        config = get_cluster_config()
+        return config.mode != "cluster" or config.is_master
+
+    @staticmethod
+    def _persist(rows: List[PoolFencerResult]) -> int:
+        stats = {(row.pool_id, row.fencer_id): row for row in rows}
+        # Sheet fencer ids are free-form JSON strings, so they are matched here rather than in the query
+        assignments = DjangoPoolAssignment.objects.filter(pool_id__in={row.pool_id for row in rows})
+
+        now = timezone.now()
+        changed = []
+        for assignment in assignments:
+            row = stats.get((str(assignment.pool_id), str(assignment.fencer_id)))
+            if row is None:
+                continue
+            values = {field: getattr(row, field) for field in STAT_FIELDS}
+            if all(getattr(assignment, field) == value for field, value in values.items()):
+                continue
+
+            previous = snapshot_instance(assignment)
+            for field, value in values.items():
+                setattr(assignment, field, value)
+            assignment.last_modified_at = now
+            assignment.updated_at = now
+            changed.append((assignment, previous))
+
+        if not changed:
+            return 0
+
+        with SyncTransaction() as sync_tx:
+            DjangoPoolAssignment.objects.bulk_update([a for a, _ in changed], STAT_FIELDS + ["last_modified_at", "updated_at"])
+            for assignment, previous in changed:
+                sync_tx.record_update("pool_assignment", assignment, data=snapshot_instance(assignment), previous=previous)
+
+        logger.debug(f"Persisted live ranking statistics for {len(changed)} pool assignment(s)")
+        return len(changed)
+
+
+live_ranking_service = LiveRankingService()
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 
 from django.db import IntegrityError
@@ -6,8 +6,13 @@ from django.db import IntegrityError
 from backend.apps.fencing_organizer.repositories.pool_repo import DjangoPoolRepository
 from backend.apps.fencing_organizer.repositories.event_repo import DjangoEventRepository
 from backend.apps.fencing_organizer.repositories.piste_repo import DjangoPisteRepository
+from backend.apps.fencing_organizer.repositories.rule_repo import DjangoRuleRepository
+from backend.apps.fencing_organizer.repositories.event_participant_repo import DjangoEventParticipantRepository
+from core.interfaces.query_spec import QueryResult, QuerySpec
 from core.models.pool import Pool
 from core.constants.pool import PoolStatus, STATUS_TRANSITIONS
+from core.services.draw_service import DEFAULT_POOL_SIZE, DrawEntry, PoolDraw, draw_pools
+from core.services.result_service import DEFAULT_MAX_TOUCHES, PoolFencerResult, PoolSheet, rank_stage
 
 
 class PoolService:
@@ -23,11 +28,15 @@ class PoolService:
         pool_repository: Optional[DjangoPoolRepository] = None,
         event_repository: Optional[DjangoEventRepository] = None,
         piste_repository: Optional[DjangoPisteRepository] = None,
+        rule_repository: Optional[DjangoRuleRepository] = None,
+        participant_repository: Optional[DjangoEventParticipantRepository] = None,
     ):
 
         self.pool_repository = pool_repository or DjangoPoolRepository()
         self.event_repository = event_repository or DjangoEventRepository()
         self.piste_repository = piste_repository or DjangoPisteRepository()
+        self.rule_repository = rule_repository or DjangoRuleRepository()
+        self.participant_repository = participant_repository or DjangoEventParticipantRepository()
 
     def get_pool_by_id(self, pool_id: UUID) -> Optional[Pool]:
         """Get pool by ID."""
@@ -37,6 +46,10 @@ class PoolService:
         """Get all pools."""
         return self.pool_repository.get_all_pools()
 
+    def find_pools(self, spec: QuerySpec) -> QueryResult[Pool]:
+        """Get a page of pools matching the query spec."""
+        return self.pool_repository.find_pools(spec)
+
     def get_pools_by_event(self, event_id: UUID) -> List[Pool]:
         """Get pools by event."""
         return self.pool_repository.get_pools_by_event(event_id)
@@ -49,6 +62,62 @@ class PoolService:
         """Get pools with stats."""
         return self.pool_repository.get_pools_with_stats(event_id)
 
+    def get_stage_ranking(self, event_id: UUID, stage_id: str) -> List[PoolFencerResult]:
+        """Rank all fencers of a pool stage from the pools' score sheets."""
+        sheets, max_touches = self.get_stage_sheets(event_id, stage_id)
+        return rank_stage(sheets, max_touches=max_touches)
+
+    def get_stage_sheets(self, event_id: UUID, stage_id: str) -> Tuple[List[PoolSheet], int]:
+        """Get the score sheets of a pool stage and the event's pool bout length."""
+        event = self.event_repository.get_event_by_id(event_id)
+        if not event:
+            raise self.PoolServiceError(f"Event {event_id} not found")
+
+        max_touches = DEFAULT_MAX_TOUCHES
+        if event.rule_id:
+            rule = self.rule_repository.get_rule_by_id(event.rule_id)
+            if rule and rule.match_score_pool:
+                max_touches = rule.match_score_pool
+
+        pools = self.pool_repository.find_pools(QuerySpec(filters={"event_id": event_id, "stage_id": stage_id}, ordering=["pool_number"]))
+        sheets = [
+            PoolSheet(fencer_ids=pool.fencer_ids or [], results=pool.results or [], pool_number=pool.pool_number, pool_id=str(pool.id))
+            for pool in pools.items
+        ]
+        return sheets, max_touches
+
+    def draw_stage_pools(self, event_id: UUID, seed: int = 0) -> PoolDraw:
+        """
+        Draw the event's confirmed participants into pools.
+
+        Participants are seeded by seed_rank (unranked fencers last) and
+        pools are sized by the rule's pool_size.
+        """
+        event = self.event_repository.get_event_by_id(event_id)
+        if not event:
+            raise self.PoolServiceError(f"Event {event_id} not found")
+
+        pool_size = DEFAULT_POOL_SIZE
+        if event.rule_id:
+            rule = self.rule_repository.get_rule_by_id(event.rule_id)
+            if rule and rule.pool_size:
+                pool_size = rule.pool_size
+
+        participants = self.participant_repository.get_participants_with_details(event_id)
+        if not participants:
+            raise self.PoolServiceError(f"Event {event_id} has no confirmed participants")
+
+        # Fencer id breaks ties so every node derives the same order from the same rows
+        participants.sort(key=lambda p: (p["participant"].seed_rank is None, p["participant"].seed_rank or 0, str(p["fencer"]["id"])))
+        entries = [
+            DrawEntry(fencer_id=str(p["fencer"]["id"]), seed=position, country_code=p["fencer"]["country_code"])
+            for position, p in enumerate(participants, start=1)
+        ]
+        try:
+            return draw_pools(entries, pool_size=pool_size, seed=seed)
+        except ValueError as e:
+            raise self.PoolServiceError(str(e))
+
     def create_pool(self, pool_data: dict) -> Pool:
         """
         Create pool.
@@ -5,6 +5,7 @@ from uuid import UUID
 from django.db import IntegrityError
 
 from backend.apps.fencing_organizer.repositories.tournament_repo import DjangoTournamentRepository
+from core.interfaces.query_spec import QueryResult, QuerySpec
 from core.models.tournament import Tournament
 
 
@@ -27,6 +28,10 @@ class TournamentService:
         """Get all tournaments."""
         return self.repository.get_all_tournaments()
 
+    def find_tournaments(self, spec: QuerySpec) -> QueryResult[Tournament]:
+        """Get a page of tournaments matching the query spec."""
+        return self.repository.find_tournaments(spec)
+
     def get_upcoming_tournaments(self, days: int = 30) -> List[Tournament]:
         """Get upcoming tournaments within N days."""
         today = date.today()
@@ -1,9 +1,14 @@
-from typing import Any, List, Type
+from typing import Any, Callable, List, Type
+
+from django.core.paginator import InvalidPage, Page, Paginator
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.serializers import BaseSerializer
 
+from core.interfaces.query_spec import QueryResult, QuerySpec
+
 
 class StandardPagination(PageNumberPagination):
     page_size = 20
@@ -16,3 +21,44 @@ def get_paginated_response(serializer_class: Type[BaseSerializer], queryset: Lis
     page = paginator.paginate_queryset(queryset, request)
     serializer = serializer_class(page, many=True, context={"request": request})
     return paginator.get_paginated_response(serializer.data)
+
+
+def get_paginated_query_response(
+    serializer_class: Type[BaseSerializer],
+    spec: QuerySpec,
+    fetch: Callable[[QuerySpec], QueryResult],
+    request: Request,
+) -> Response:
+    """
+    Paginate a repository query in the database.
+
+    Fills the spec's offset/limit from the page/page_size query params, so only
+    the requested page is loaded and mapped. The response has the same shape
+    as get_paginated_response.
+    """
+    paginator = StandardPagination()
+    paginator.request = request
+    page_size = paginator.get_page_size(request)
+
+    try:
+        page_number = int(request.query_params.get(paginator.page_query_param, 1))
+        if page_number < 1:
+            raise ValueError
+    except (TypeError, ValueError):
+        page_param = request.query_params.get(paginator.page_query_param)
+        raise NotFound(paginator.invalid_page_message.format(page_number=page_param, message="Invalid page."))
+
+    spec.offset = (page_number - 1) * page_size
+    spec.limit = page_size
+    result = fetch(spec)
+
+    # range() gives the Django paginator the total count without materialising rows
+    django_paginator = Paginator(range(result.total), page_size)
+    try:
+        django_paginator.validate_number(page_number)
+    except InvalidPage as exc:
+        raise NotFound(paginator.invalid_page_message.format(page_number=page_number, message=str(exc)))
+
+    paginator.page = Page(result.items, page_number, django_paginator)
+    serializer = serializer_class(result.items, many=True, context={"request": request})
+    return paginator.get_paginated_response(serializer.data)
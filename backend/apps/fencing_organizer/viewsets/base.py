@@ -4,11 +4,10 @@ Base viewsets with automatic sync logging support.
 
 import logging
 from typing import Optional
-from django.forms.models import model_to_dict
-
 from rest_framework.viewsets import ModelViewSet
 
 from backend.apps.cluster.decorators.transaction import SyncTransaction
+from backend.apps.cluster.services.delta import snapshot_instance
 
 logger = logging.getLogger(__name__)
 
@@ -76,6 +75,14 @@ class SyncWriteViewSetMeta(type):
 
             # For create/update, do operation first then record
             with SyncTransaction() as sync_tx:
+                # Snapshot the row before an update so only changed columns are logged
+                previous = None
+                if method_name == "update":
+                    try:
+                        previous = snapshot_instance(self.get_object())
+                    except Exception:
+                        previous = None
+
                 result = original_method(self, request, *args, **kwargs)
 
                 # Extract instance from result
@@ -86,16 +93,12 @@ class SyncWriteViewSetMeta(type):
                             instance_id = result.data.get("id")
                             if instance_id and hasattr(self, "queryset"):
                                 instance = self.queryset.get(id=instance_id)
-                                sync_data = model_to_dict(instance)
-                                if hasattr(instance, "created_at") and instance.created_at:
-                                    sync_data["created_at"] = instance.created_at
+                                sync_data = snapshot_instance(instance)
                                 sync_tx.record_insert(table_name=table_name, instance=instance, data=sync_data)
                         else:  # update
                             instance = self.get_object()
-                            sync_data = model_to_dict(instance)
-                            if hasattr(instance, "created_at") and instance.created_at:
-                                sync_data["created_at"] = instance.created_at
-                            sync_tx.record_update(table_name=table_name, instance=instance, data=sync_data)
+                            sync_data = snapshot_instance(instance)
+                            sync_tx.record_update(table_name=table_name, instance=instance, data=sync_data, previous=previous)
                     except Exception as e:
                         logger.warning(f"Failed to record sync log: {e}")
 
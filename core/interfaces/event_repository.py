@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from typing import Optional, List
 from uuid import UUID
 from datetime import datetime
+from core.interfaces.query_spec import QueryResult, QuerySpec
 from core.models.event import Event
 
 
@@ -32,6 +33,10 @@ class EventRepositoryInterface(ABC):
     def get_all_events(self) -> List[Event]:
         pass
 
+    @abstractmethod
+    def find_events(self, spec: QuerySpec) -> QueryResult[Event]:
+        pass
+
     @abstractmethod
     def save_event(self, event: Event) -> Event:
         pass
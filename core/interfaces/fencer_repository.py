@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import Optional, List
 from uuid import UUID
+from core.interfaces.query_spec import QueryResult, QuerySpec
 from core.models.fencer import Fencer
 
 
@@ -32,6 +33,11 @@ class FencerRepositoryInterface(ABC):
         """获取所有运动员"""
         pass
 
+    @abstractmethod
+    def find_fencers(self, spec: QuerySpec) -> QueryResult[Fencer]:
+        """按查询规格分页获取运动员（过滤、搜索、排序在数据库中完成）"""
+        pass
+
     @abstractmethod
     def save_fencer(self, fencer: Fencer) -> Fencer:
         """保存或更新运动员"""
@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from typing import Optional, List
 from uuid import UUID
 from datetime import datetime
+from core.interfaces.query_spec import QueryResult, QuerySpec
 from core.models.pool import Pool
 
 
@@ -32,6 +33,10 @@ class PoolRepositoryInterface(ABC):
     def get_all_pools(self) -> List[Pool]:
         pass
 
+    @abstractmethod
+    def find_pools(self, spec: QuerySpec) -> QueryResult[Pool]:
+        pass
+
     @abstractmethod
     def save_pool(self, pool: Pool) -> Pool:
         pass
@@ -0,0 +1,28 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class QuerySpec:
+    """
+    列表查询规格
+
+    由仓库在数据库层完成过滤、搜索、排序和分页，只有请求的那一页会被映射为领域对象。
+    字段名使用领域模型的字段名（如 tournament_id、country_code）。
+    """
+
+    filters: Dict[str, Any] = field(default_factory=dict)  # 字段名 -> 精确匹配值
+    search: Optional[str] = None  # 在仓库定义的搜索字段上做不区分大小写的包含匹配
+    ordering: List[str] = field(default_factory=list)  # 字段名，"-" 前缀表示降序
+    offset: int = 0
+    limit: Optional[int] = None
+
+
+@dataclass
+class QueryResult(Generic[T]):
+    """列表查询结果：当前页的领域对象及过滤后的总数"""
+
+    items: List[T]
+    total: int
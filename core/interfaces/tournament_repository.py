@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from typing import Optional, List
 from uuid import UUID
 from datetime import date
+from core.interfaces.query_spec import QueryResult, QuerySpec
 from core.models.tournament import Tournament
 
 
@@ -24,6 +25,10 @@ class TournamentRepositoryInterface(ABC):
     def get_all_tournaments(self) -> List[Tournament]:
         pass
 
+    @abstractmethod
+    def find_tournaments(self, spec: QuerySpec) -> QueryResult[Tournament]:
+        pass
+
     @abstractmethod
     def save_tournament(self, tournament: Tournament) -> Tournament:
         pass
@@ -0,0 +1,210 @@
+"""
+Direct-elimination bracket engine.
+
+A table of ``size`` places (8 to 256) is stored as an array-backed heap:
+node 1 is the final, node ``i`` is fed by nodes ``2i`` (side A) and ``2i + 1``
+(side B), and nodes ``size`` .. ``2 * size - 1`` are the seeded places of the
+first round. ``fencers[i]`` holds the fencer who occupies node ``i`` - the
+seeded fencer for a place, the winner for a bout - and ``scores[i]`` holds
+the two score cells of bout ``i``.
+
+Places are filled in FIE table order (1-8, 5-4, 3-6, 7-2 for a table of 8);
+empty places are byes, and a fencer facing a bye advances without a bout.
+Recording a result writes the bout's own node and, unless the winner
+changes, nothing else: advancing is a single write into the parent node.
+When a corrected result changes the winner, later bouts that had already
+been fenced with the previous winner are voided up the path to the final.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+from core.services.result_service import _bout_winner, parse_score
+
+MIN_TABLE_SIZE = 8
+MAX_TABLE_SIZE = 256
+DEFAULT_DE_MAX_TOUCHES = 15
+BRACKET_FORMAT = "heap"
+
+
+class BracketError(ValueError):
+    """Invalid bracket operation"""
+
+
+def fie_seed_order(size: int) -> List[int]:
+    """Seeds of the places of a table in FIE order, top to bottom."""
+    order = [1]
+    while len(order) < size:
+        total = len(order) * 2 + 1
+        next_order: List[int] = []
+        for position, seed in enumerate(order):
+            pair = [seed, total - seed]
+            next_order.extend(pair if position % 2 == 0 else reversed(pair))
+        order = next_order
+    return order
+
+
+def table_size(fencer_count: int) -> int:
+    """Smallest supported table that seats ``fencer_count`` fencers."""
+    if fencer_count < 2:
+        raise BracketError("A direct-elimination table needs at least 2 fencers")
+    if fencer_count > MAX_TABLE_SIZE:
+        raise BracketError(f"A direct-elimination table holds at most {MAX_TABLE_SIZE} fencers")
+    size = MIN_TABLE_SIZE
+    while size < fencer_count:
+        size *= 2
+    return size
+
+
+@dataclass
+class Bracket:
+    """A direct-elimination table stored as a heap"""
+
+    size: int
+    fencers: List[Optional[str]]
+    scores: List[Optional[List[Any]]]
+    max_touches: int = DEFAULT_DE_MAX_TOUCHES
+    _byes: List[bool] = field(default_factory=list, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.size < MIN_TABLE_SIZE or self.size > MAX_TABLE_SIZE or self.size & (self.size - 1):
+            raise BracketError(f"Unsupported table size {self.size}")
+        if len(self.fencers) != 2 * self.size or len(self.scores) != self.size:
+            raise BracketError("Bracket arrays do not match the table size")
+
+        # A node is a bye when no fencer can ever reach it; this depends only on the seeded places
+        self._byes = [False] * (2 * self.size)
+        for node in range(2 * self.size - 1, 0, -1):
+            if node >= self.size:
+                self._byes[node] = self.fencers[node] is None
+            else:
+                self._byes[node] = self._byes[2 * node] and self._byes[2 * node + 1]
+
+    @classmethod
+    def build(cls, seeded_fencer_ids: Sequence[Any], max_touches: int = DEFAULT_DE_MAX_TOUCHES) -> "Bracket":
+        """Seat fencers (given in seed order, best first) and advance everyone who has a bye."""
+        fencer_ids = [str(f) for f in seeded_fencer_ids]
+        if len(set(fencer_ids)) != len(fencer_ids):
+            raise BracketError("A fencer can only be seeded once")
+
+        size = table_size(len(fencer_ids))
+        fencers: List[Optional[str]] = [None] * (2 * size)
+        for position, seed in enumerate(fie_seed_order(size)):
+            if seed <= len(fencer_ids):
+                fencers[size + position] = fencer_ids[seed - 1]
+
+        bracket = cls(size=size, fencers=fencers, scores=[None] * size, max_touches=max_touches)
+        for node in range(size - 1, 0, -1):
+            bracket.fencers[node] = bracket._walkover(node)
+        return bracket
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Bracket":
+        if not isinstance(data, dict) or data.get("format") != BRACKET_FORMAT:
+            raise BracketError("Not a stored bracket")
+        return cls(
+            size=data["size"],
+            fencers=list(data["fencers"]),
+            scores=[list(s) if s is not None else None for s in data["scores"]],
+            max_touches=data.get("max_touches", DEFAULT_DE_MAX_TOUCHES),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "format": BRACKET_FORMAT,
+            "size": self.size,
+            "max_touches": self.max_touches,
+            "fencers": list(self.fencers),
+            "scores": [list(s) if s is not None else None for s in self.scores],
+        }
+
+    @property
+    def champion(self) -> Optional[str]:
+        return self.fencers[1]
+
+    def record_result(self, node: int, score_a: Any, score_b: Any) -> List[int]:
+        """
+        Record (or, with two empty cells, clear) the result of bout ``node``.
+
+        Returns the nodes that were written, the bout itself first.
+        """
+        self._check_bout(node)
+        fencer_a, fencer_b = self.fencers[2 * node], self.fencers[2 * node + 1]
+        if fencer_a is None or fencer_b is None:
+            raise BracketError(f"Bout {node} does not have two fencers yet")
+
+        a = parse_score(score_a, self.max_touches)
+        b = parse_score(score_b, self.max_touches)
+        if a is None and b is None:
+            self.scores[node] = None
+            return self._set_winner(node, None)
+        if a is None or b is None:
+            raise BracketError("Both scores are required")
+
+        won = _bout_winner(a, b)
+        if won is None:
+            raise BracketError("A direct-elimination bout needs a winner")
+
+        self.scores[node] = [score_a, score_b]
+        return self._set_winner(node, fencer_a if won else fencer_b)
+
+    def bout(self, node: int) -> Dict[str, Any]:
+        """One bout in API form."""
+        self._check_bout(node)
+        scores = self.scores[node] or [None, None]
+        return {
+            "node": node,
+            # Bouts at heap depth d make up the table of 2^(d + 1)
+            "table": 2 << (node.bit_length() - 1),
+            "fencer_a": self.fencers[2 * node],
+            "fencer_b": self.fencers[2 * node + 1],
+            "score_a": scores[0],
+            "score_b": scores[1],
+            "winner": self.fencers[node],
+            "is_bye": self._byes[2 * node] or self._byes[2 * node + 1],
+        }
+
+    def rounds(self) -> List[List[Dict[str, Any]]]:
+        """All bouts by round, first round first, each round top to bottom."""
+        result = []
+        first = self.size // 2
+        while first >= 1:
+            result.append([self.bout(node) for node in range(first, 2 * first)])
+            first //= 2
+        return result
+
+    def _check_bout(self, node: int) -> None:
+        if not isinstance(node, int) or not 1 <= node < self.size:
+            raise BracketError(f"Bout {node} is not in a table of {self.size}")
+
+    def _walkover(self, node: int) -> Optional[str]:
+        """The fencer who wins ``node`` without fencing, if the other side is a bye."""
+        if self._byes[2 * node + 1]:
+            return self.fencers[2 * node]
+        if self._byes[2 * node]:
+            return self.fencers[2 * node + 1]
+        return None
+
+    def _set_winner(self, node: int, winner: Optional[str]) -> List[int]:
+        changed = [node]
+        if self.fencers[node] == winner:
+            return changed
+        self.fencers[node] = winner
+
+        while node > 1:
+            parent = node // 2
+            if self._byes[node ^ 1]:
+                # The parent is a walkover: the new occupant goes straight through
+                if self.fencers[parent] == self.fencers[node]:
+                    break
+                self.fencers[parent] = self.fencers[node]
+            else:
+                # The parent bout has a different fencer now; any result it had is void
+                if self.scores[parent] is None and self.fencers[parent] is None:
+                    break
+                self.scores[parent] = None
+                self.fencers[parent] = None
+            changed.append(parent)
+            node = parent
+
+        return changed
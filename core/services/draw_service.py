@@ -0,0 +1,142 @@
+"""
+Pool draw.
+
+Fencers are dealt into pools in serpentine order of their seed (1-2-3-...-n,
+then n-...-3-2-1, and so on), so every pool receives one fencer from each
+seeding row. A bounded local search then separates fencers of the same
+country: a fencer sharing a pool with a compatriot is swapped with a fencer
+of the same seeding row in another pool whenever that strictly lowers the
+number of same-country pairs. Swapping within a row keeps the seeding
+balance of the serpentine.
+
+The draw is deterministic for a given entry list and ``seed``, so another
+node can recompute it from the replicated participants instead of
+receiving it.
+"""
+
+import random
+from collections import Counter
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+DEFAULT_POOL_SIZE = 7
+DEFAULT_MAX_PASSES = 4
+
+
+@dataclass
+class DrawEntry:
+    """One seeded fencer to draw"""
+
+    fencer_id: str
+    seed: int
+    country_code: Optional[str] = None
+
+
+@dataclass
+class PoolDraw:
+    """Result of a draw: fencer ids per pool, in seat order"""
+
+    pools: List[List[str]]
+    seed: int
+    collisions: int
+    swaps: int = 0
+    initial_collisions: int = 0
+
+
+def pool_count(fencer_count: int, pool_size: int) -> int:
+    """Number of pools needed so that no pool exceeds ``pool_size`` fencers."""
+    if pool_size < 2:
+        raise ValueError("pool_size must be at least 2")
+    return max(1, -(-fencer_count // pool_size))
+
+
+def serpentine(entries: Sequence[DrawEntry], pools: int) -> List[List[DrawEntry]]:
+    """Deal entries (already in seed order) into pools in serpentine order."""
+    result: List[List[DrawEntry]] = [[] for _ in range(pools)]
+    for position, entry in enumerate(entries):
+        row, column = divmod(position, pools)
+        result[column if row % 2 == 0 else pools - 1 - column].append(entry)
+    return result
+
+
+def collision_count(pools: Sequence[Sequence[DrawEntry]]) -> int:
+    """Number of same-country pairs over all pools."""
+    total = 0
+    for pool in pools:
+        for count in Counter(e.country_code for e in pool if e.country_code).values():
+            total += count * (count - 1) // 2
+    return total
+
+
+def draw_pools(
+    entries: Sequence[DrawEntry],
+    pool_size: int = DEFAULT_POOL_SIZE,
+    seed: int = 0,
+    max_passes: int = DEFAULT_MAX_PASSES,
+) -> PoolDraw:
+    """
+    Draw seeded entries into pools of at most ``pool_size``.
+
+    Each pass visits every fencer that has a compatriot in its pool and
+    takes the first improving swap within its seeding row, trying the other
+    pools in an order shuffled with ``seed``. The search stops after a pass
+    without swaps or after ``max_passes`` passes, so its cost is bounded by
+    ``max_passes * fencers * pools`` constant-time swap evaluations.
+    """
+    ordered = sorted(entries, key=lambda e: e.seed)
+    pools_total = pool_count(len(ordered), pool_size)
+    pools = serpentine(ordered, pools_total)
+    initial = collision_count(pools)
+
+    # pools[p][row] is the fencer dealt to pool p in seeding row ``row``
+    counts = [Counter(e.country_code for e in pool if e.country_code) for pool in pools]
+    rng = random.Random(seed)
+    swaps = 0
+
+    for _ in range(max_passes if initial else 0):
+        improved = False
+        for row in range(max(len(pool) for pool in pools)):
+            row_pools = [p for p in range(pools_total) if row < len(pools[p])]
+            for a in row_pools:
+                first = pools[a][row]
+                if not first.country_code or counts[a][first.country_code] < 2:
+                    continue
+
+                candidates = [b for b in row_pools if b != a]
+                rng.shuffle(candidates)
+                for b in candidates:
+                    second = pools[b][row]
+                    if second.country_code == first.country_code:
+                        continue
+                    if _swap_delta(counts[a], counts[b], first.country_code, second.country_code) < 0:
+                        _move(counts[a], first.country_code, second.country_code)
+                        _move(counts[b], second.country_code, first.country_code)
+                        pools[a][row], pools[b][row] = second, first
+                        swaps += 1
+                        improved = True
+                        break
+        if not improved:
+            break
+
+    return PoolDraw(
+        pools=[[e.fencer_id for e in pool] for pool in pools],
+        seed=seed,
+        collisions=collision_count(pools),
+        swaps=swaps,
+        initial_collisions=initial,
+    )
+
+
+def _swap_delta(counts_a: Counter, counts_b: Counter, country_a: str, country_b: Optional[str]) -> int:
+    """Change in same-country pairs when a fencer of country_a (pool a) swaps with one of country_b (pool b)."""
+    delta = -(counts_a[country_a] - 1) + counts_b[country_a]
+    if country_b:
+        delta += counts_a[country_b] - (counts_b[country_b] - 1)
+    return delta
+
+
+def _move(counts: Counter, leaving: Optional[str], arriving: Optional[str]) -> None:
+    if leaving:
+        counts[leaving] -= 1
+    if arriving:
+        counts[arriving] += 1
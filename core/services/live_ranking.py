@@ -0,0 +1,209 @@
+"""
+Incremental stage ranking.
+
+``StageRankingIndex`` keeps every fencer of a pool round in a list sorted by
+the FIE key (V/M, indicator, TS; see result_service), together with the
+parsed score of every bout. Changing one bout touches only the two fencers
+who fenced it: their old contribution is subtracted, the new one added, and
+each is moved to its new position with a binary search, instead of
+re-parsing every pool sheet and re-sorting the whole stage.
+
+Fencers whose statistics changed are tracked as dirty so the caller can
+persist them in batches (see ``drain_dirty``).
+"""
+
+from bisect import bisect_left, insort
+from copy import copy
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from core.services.result_service import (
+    DEFAULT_MAX_TOUCHES,
+    PoolFencerResult,
+    PoolSheet,
+    _assign_ranks,
+    _bout_winner,
+    parse_score,
+)
+
+Score = Optional[Tuple[int, bool]]
+
+
+class StageRankingIndex:
+    """Sorted ranking of one pool stage, updated bout by bout"""
+
+    def __init__(self, max_touches: int = DEFAULT_MAX_TOUCHES):
+        self.max_touches = max_touches
+        self._rows: Dict[str, PoolFencerResult] = {}
+        self._keys: List[Tuple[Tuple[float, int, int], str]] = []
+        # pool_id -> fencer ids in seat order
+        self._pools: Dict[str, Tuple[str, ...]] = {}
+        # (fencer, opponent) in seat order -> (fencer's score, opponent's score)
+        self._bouts: Dict[Tuple[str, str], Tuple[Score, Score]] = {}
+        self._winners: Dict[Tuple[str, str], str] = {}
+        self._dirty: Set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @property
+    def dirty_count(self) -> int:
+        return len(self._dirty)
+
+    def has_pool(self, pool_id: str) -> bool:
+        return str(pool_id) in self._pools
+
+    def add_pool(self, sheet: PoolSheet) -> None:
+        """Add (or reload) a pool with all of its bouts."""
+        pool_id = str(sheet.pool_id)
+        if pool_id in self._pools:
+            self.remove_pool(pool_id)
+
+        fencer_ids = tuple(str(f) for f in sheet.fencer_ids)
+        self._pools[pool_id] = fencer_ids
+        for fencer_id in fencer_ids:
+            row = PoolFencerResult(fencer_id=fencer_id, pool_number=sheet.pool_number, pool_id=pool_id)
+            self._rows[fencer_id] = row
+            self._index(row)
+            self._dirty.add(fencer_id)
+
+        self._apply_sheet(fencer_ids, sheet.results)
+        self._rank_pool(pool_id)
+
+    def remove_pool(self, pool_id: str) -> None:
+        """Drop a pool and its fencers from the index."""
+        fencer_ids = self._pools.pop(str(pool_id), ())
+        for i, fencer_id in enumerate(fencer_ids):
+            for opponent_id in fencer_ids[i + 1 :]:
+                self._bouts.pop((fencer_id, opponent_id), None)
+                self._winners.pop((fencer_id, opponent_id), None)
+                self._winners.pop((opponent_id, fencer_id), None)
+        for fencer_id in fencer_ids:
+            row = self._rows.pop(fencer_id, None)
+            if row is not None:
+                self._unindex(row)
+            self._dirty.discard(fencer_id)
+
+    def update_pool(self, sheet: PoolSheet) -> int:
+        """
+        Bring a pool in line with its current score sheet.
+
+        Only bouts whose cells changed are re-applied. A pool that is unknown
+        or whose fencers changed is reloaded. Returns the number of bouts
+        that changed.
+        """
+        pool_id = str(sheet.pool_id)
+        fencer_ids = tuple(str(f) for f in sheet.fencer_ids)
+        if self._pools.get(pool_id) != fencer_ids:
+            self.add_pool(sheet)
+            return len(fencer_ids) * (len(fencer_ids) - 1) // 2
+
+        for fencer_id in fencer_ids:
+            self._rows[fencer_id].pool_number = sheet.pool_number
+
+        changed = self._apply_sheet(fencer_ids, sheet.results)
+        if changed:
+            self._rank_pool(pool_id)
+        return changed
+
+    def set_bout(self, fencer_id: str, opponent_id: str, score: Any, opponent_score: Any) -> bool:
+        """Record one bout from its two score sheet cells; returns False if nothing changed."""
+        fencer_id, opponent_id = str(fencer_id), str(opponent_id)
+        row = self._rows.get(fencer_id)
+        if row is None or opponent_id not in self._rows or self._rows[opponent_id].pool_id != row.pool_id:
+            raise KeyError(f"{fencer_id} and {opponent_id} are not in the same pool")
+
+        seats = self._pools[row.pool_id]
+        if seats.index(fencer_id) > seats.index(opponent_id):
+            fencer_id, opponent_id, score, opponent_score = opponent_id, fencer_id, opponent_score, score
+
+        changed = self._set_bout(
+            fencer_id, opponent_id, parse_score(score, self.max_touches), parse_score(opponent_score, self.max_touches)
+        )
+        if changed:
+            self._rank_pool(row.pool_id)
+        return changed
+
+    def ranking(self) -> List[PoolFencerResult]:
+        """All fencers in stage rank order, with ``rank`` and ``is_tied`` filled in."""
+        # The rows are already in key order, so the sort in _assign_ranks is linear
+        return _assign_ranks([self._rows[fencer_id] for _, fencer_id in self._keys], self._winners, "rank")
+
+    def drain_dirty(self) -> List[PoolFencerResult]:
+        """Return copies of the rows changed since the last call and reset the dirty set."""
+        rows = [copy(self._rows[fencer_id]) for fencer_id in self._dirty if fencer_id in self._rows]
+        self._dirty.clear()
+        return rows
+
+    def _apply_sheet(self, fencer_ids: Tuple[str, ...], results: Any) -> int:
+        results = results or []
+        changed = 0
+        for i, fencer_id in enumerate(fencer_ids):
+            for j in range(i + 1, len(fencer_ids)):
+                score = self._cell(results, i, j)
+                opponent_score = self._cell(results, j, i)
+                if self._set_bout(fencer_id, fencer_ids[j], score, opponent_score):
+                    changed += 1
+        return changed
+
+    def _cell(self, results: Any, i: int, j: int) -> Score:
+        try:
+            return parse_score(results[i][j], self.max_touches)
+        except (IndexError, TypeError):
+            return None
+
+    def _set_bout(self, fencer_id: str, opponent_id: str, score: Score, opponent_score: Score) -> bool:
+        key = (fencer_id, opponent_id)
+        old = self._bouts.get(key, (None, None))
+        new = (score, opponent_score)
+        if old == new:
+            return False
+
+        first, second = self._rows[fencer_id], self._rows[opponent_id]
+        self._unindex(first)
+        self._unindex(second)
+        self._apply_bout(first, second, old, -1)
+        self._apply_bout(first, second, new, 1)
+        self._index(first)
+        self._index(second)
+
+        if new == (None, None):
+            self._bouts.pop(key, None)
+        else:
+            self._bouts[key] = new
+        self._dirty.update(key)
+        return True
+
+    def _apply_bout(self, first: PoolFencerResult, second: PoolFencerResult, bout: Tuple[Score, Score], sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) one bout's contribution, as compute_pool counts it."""
+        a, b = bout
+        if a is None or b is None:
+            return
+
+        first.matches_played += sign
+        second.matches_played += sign
+        first.touches_scored += sign * a[0]
+        first.touches_received += sign * b[0]
+        second.touches_scored += sign * b[0]
+        second.touches_received += sign * a[0]
+
+        won = _bout_winner(a, b)
+        if won is None:
+            return
+        winner = first if won else second
+        winner.victories += sign
+        if sign > 0:
+            self._winners[(first.fencer_id, second.fencer_id)] = winner.fencer_id
+            self._winners[(second.fencer_id, first.fencer_id)] = winner.fencer_id
+        else:
+            self._winners.pop((first.fencer_id, second.fencer_id), None)
+            self._winners.pop((second.fencer_id, first.fencer_id), None)
+
+    def _rank_pool(self, pool_id: str) -> None:
+        _assign_ranks([self._rows[fencer_id] for fencer_id in self._pools[pool_id]], self._winners, "pool_rank")
+
+    def _index(self, row: PoolFencerResult) -> None:
+        insort(self._keys, (row.sort_key, row.fencer_id))
+
+    def _unindex(self, row: PoolFencerResult) -> None:
+        position = bisect_left(self._keys, (row.sort_key, row.fencer_id))
+        del self._keys[position]
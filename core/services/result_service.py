@@ -0,0 +1,205 @@
+"""
+Pool result engine.
+
+Turns a pool's ``fencer_ids`` and ``results`` matrix into V, M, V/M, TS, TR and
+indicator per fencer, and ranks fencers within each pool and across all pools
+of a stage.
+
+``results[i][j]`` is the score of fencer ``i`` against fencer ``j`` as entered
+on the score sheet: ``"V"`` (victory with the maximum touches), ``"V3"``
+(victory with 3 touches), ``"3"`` / ``3`` (touches scored in a defeat), and
+``""`` / ``None`` for a bout not yet fenced. A bout counts once both cells are
+filled in.
+
+Ranking follows the FIE order: V/M, then indicator (TS - TR), then TS. A tie
+remaining between exactly two fencers who met in the same pool is broken by
+their bout; any other tie is kept, and the fencers share the rank.
+"""
+
+from dataclasses import dataclass
+from itertools import groupby
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+DEFAULT_MAX_TOUCHES = 5
+VICTORY_MARK = "V"
+
+
+@dataclass
+class PoolFencerResult:
+    """Pool statistics and ranking of one fencer"""
+
+    fencer_id: str
+    pool_number: int
+    pool_id: Optional[str] = None
+    victories: int = 0
+    matches_played: int = 0
+    touches_scored: int = 0
+    touches_received: int = 0
+    pool_rank: Optional[int] = None
+    rank: Optional[int] = None
+    is_tied: bool = False
+
+    @property
+    def indicator(self) -> int:
+        return self.touches_scored - self.touches_received
+
+    @property
+    def victory_ratio(self) -> float:
+        return self.victories / self.matches_played if self.matches_played else 0.0
+
+    @property
+    def sort_key(self) -> Tuple[float, int, int]:
+        return (-self.victory_ratio, -self.indicator, -self.touches_scored)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.fencer_id,
+            "pool_id": self.pool_id,
+            "pool_number": self.pool_number,
+            "v": self.victories,
+            "m": self.matches_played,
+            "v_m": round(self.victory_ratio, 4),
+            "ts": self.touches_scored,
+            "tr": self.touches_received,
+            "ind": self.indicator,
+            "pool_rank": self.pool_rank,
+            "rank": self.rank,
+            "is_tied": self.is_tied,
+        }
+
+
+@dataclass
+class PoolSheet:
+    """Input for one pool: the fencers in seat order and their score matrix"""
+
+    fencer_ids: Sequence[str]
+    results: Sequence[Sequence[Any]]
+    pool_number: int = 0
+    pool_id: Optional[str] = None
+
+
+def parse_score(cell: Any, max_touches: int = DEFAULT_MAX_TOUCHES) -> Optional[Tuple[int, bool]]:
+    """Parse a score sheet cell into (touches, marked_victory); None when the bout is not fenced."""
+    if cell is None or isinstance(cell, bool):
+        return None
+    if isinstance(cell, int):
+        return (cell, False)
+
+    text = str(cell).strip().upper()
+    if not text:
+        return None
+    if text.startswith(VICTORY_MARK):
+        digits = text[len(VICTORY_MARK) :]
+        if not digits:
+            return (max_touches, True)
+        return (int(digits), True) if digits.isdigit() else None
+    if text.startswith("D"):
+        text = text[1:]
+    return (int(text), False) if text.isdigit() else None
+
+
+def _bout_winner(mine: Tuple[int, bool], theirs: Tuple[int, bool]) -> Optional[bool]:
+    """True if "mine" won, False if lost, None if the sheet does not decide it."""
+    if mine[1] != theirs[1]:
+        return mine[1]
+    if mine[0] != theirs[0]:
+        return mine[0] > theirs[0]
+    return None
+
+
+def compute_pool(sheet: PoolSheet, max_touches: int = DEFAULT_MAX_TOUCHES) -> Tuple[List[PoolFencerResult], Dict[Tuple[str, str], str]]:
+    """
+    Compute the statistics of every fencer in a pool.
+
+    Returns the per-fencer results in seat order and the head-to-head table,
+    mapping each (fencer, opponent) pair that was decided to the winner's id.
+    """
+    fencer_ids = [str(f) for f in sheet.fencer_ids]
+    size = len(fencer_ids)
+    rows = [PoolFencerResult(fencer_id=fencer_id, pool_number=sheet.pool_number, pool_id=sheet.pool_id) for fencer_id in fencer_ids]
+    winners: Dict[Tuple[str, str], str] = {}
+
+    parsed = [[None] * size for _ in range(size)]
+    for i, row in enumerate(sheet.results[:size]):
+        for j, cell in enumerate(row[:size]):
+            if i != j:
+                parsed[i][j] = parse_score(cell, max_touches)
+
+    for i in range(size):
+        for j in range(i + 1, size):
+            a, b = parsed[i][j], parsed[j][i]
+            if a is None or b is None:
+                continue
+
+            first, second = rows[i], rows[j]
+            first.matches_played += 1
+            second.matches_played += 1
+            first.touches_scored += a[0]
+            first.touches_received += b[0]
+            second.touches_scored += b[0]
+            second.touches_received += a[0]
+
+            won = _bout_winner(a, b)
+            if won is None:
+                continue
+            winner = first if won else second
+            winner.victories += 1
+            winners[(first.fencer_id, second.fencer_id)] = winner.fencer_id
+            winners[(second.fencer_id, first.fencer_id)] = winner.fencer_id
+
+    return rows, winners
+
+
+def _assign_ranks(ordered: List[PoolFencerResult], winners: Dict[Tuple[str, str], str], attr: str) -> List[PoolFencerResult]:
+    """Sort by the FIE key and write 1-based ranks (shared on ties) into ``attr``."""
+    ordered = sorted(ordered, key=lambda r: r.sort_key)
+    ranked: List[PoolFencerResult] = []
+
+    for _, group in groupby(ordered, key=lambda r: r.sort_key):
+        group = list(group)
+        position = len(ranked) + 1
+
+        if len(group) == 2:
+            first, second = group
+            winner = winners.get((first.fencer_id, second.fencer_id))
+            if winner is not None:
+                if winner == second.fencer_id:
+                    first, second = second, first
+                setattr(first, attr, position)
+                setattr(second, attr, position + 1)
+                ranked.extend([first, second])
+                continue
+
+        for result in group:
+            setattr(result, attr, position)
+            if attr == "rank":
+                result.is_tied = len(group) > 1
+        ranked.extend(group)
+
+    return ranked
+
+
+def rank_pool(sheet: PoolSheet, max_touches: int = DEFAULT_MAX_TOUCHES) -> List[PoolFencerResult]:
+    """Compute and rank a single pool; results are returned in pool rank order."""
+    rows, winners = compute_pool(sheet, max_touches)
+    return _assign_ranks(rows, winners, "pool_rank")
+
+
+def rank_stage(sheets: Iterable[PoolSheet], max_touches: int = DEFAULT_MAX_TOUCHES) -> List[PoolFencerResult]:
+    """
+    Rank every fencer of a pool round across all of its pools.
+
+    Each pool is computed once; the in-pool ranks and the overall ranking then
+    share the same head-to-head table, so the whole stage is one pass over the
+    score sheets plus one sort.
+    """
+    all_rows: List[PoolFencerResult] = []
+    winners: Dict[Tuple[str, str], str] = {}
+
+    for sheet in sheets:
+        rows, pool_winners = compute_pool(sheet, max_touches)
+        _assign_ranks(rows, pool_winners, "pool_rank")
+        winners.update(pool_winners)
+        all_rows.extend(rows)
+
+    return _assign_ranks(all_rows, winners, "rank")
@@ -6,6 +6,8 @@ Configures Django settings and Python paths for testing.
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add project root and backend to Python path
 project_root = Path(__file__).parent.parent
 backend_path = project_root / "backend"
@@ -15,3 +17,39 @@ if str(project_root) not in sys.path:
 
 if str(backend_path) not in sys.path:
     sys.path.insert(0, str(backend_path))
+
+
+@pytest.fixture(autouse=True)
+def reset_cluster_config_cache():
+    """Drop the cached cluster config so rolled-back test data never leaks between tests."""
+    from backend.apps.cluster.services.config_cache import cluster_config_cache
+
+    cluster_config_cache.invalidate()
+    yield
+    cluster_config_cache.invalidate()
+
+
+@pytest.fixture(autouse=True)
+def reset_live_ranking():
+    """Drop in-memory stage rankings built from rolled-back test data."""
+    from backend.apps.fencing_organizer.services.live_ranking_service import live_ranking_service
+
+    live_ranking_service.clear()
+    yield
+    live_ranking_service.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_change_feed():
+    """Forget sync ids published by rolled-back test data."""
+    from backend.apps.cluster.services.change_feed import change_feed
+
+    change_feed.reset()
+    yield
+    change_feed.reset()
+
+
+@pytest.fixture(autouse=True)
+def disable_sync_log_compaction(settings):
+    """Keep ACK requests from starting background compaction threads; compaction tests run it directly."""
+    settings.CLUSTER_CONFIG = {**settings.CLUSTER_CONFIG, "sync_log_compaction": False}
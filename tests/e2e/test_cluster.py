@@ -60,6 +60,7 @@ class TestClusterFormation:
         mock_udp.local_ip = "192.168.1.100"
         mock_udp.broadcast = lambda msg: mock_udp.broadcast_calls.append(msg)
         mock_udp.broadcast_async = AsyncMock(side_effect=lambda msg: mock_udp.broadcast_calls.append(msg))
+        mock_udp.broadcast_many_async = AsyncMock(side_effect=lambda msgs: mock_udp.broadcast_calls.extend(msgs))
 
         mock_discovery = MagicMock()
         mock_discovery.get_node_id.return_value = node.node_id
@@ -83,8 +84,9 @@ class TestClusterFormation:
         await election._determine_initial_role()
 
         assert election.state == ElectionState.MASTER
-        assert len(mock_udp.broadcast_calls) == 1
+        assert len(mock_udp.broadcast_calls) == 2
         assert isinstance(mock_udp.broadcast_calls[0], MasterAnnounceMessage)
+        assert isinstance(mock_udp.broadcast_calls[1], HeartbeatMessage)
 
     async def test_two_nodes_higher_id_wins(self):
         node_a = MockClusterNode(node_id="node_a", port=8001)
@@ -94,6 +96,7 @@ class TestClusterFormation:
         mock_udp_b.local_ip = "192.168.1.102"
         mock_udp_b.broadcast_calls = []
         mock_udp_b.broadcast_async = AsyncMock(side_effect=lambda msg: mock_udp_b.broadcast_calls.append(msg))
+        mock_udp_b.broadcast_many_async = AsyncMock(side_effect=lambda msgs: mock_udp_b.broadcast_calls.extend(msgs))
 
         mock_discovery_b = MagicMock()
         mock_discovery_b.get_node_id.return_value = node_b.node_id
@@ -125,6 +128,7 @@ class TestClusterFormation:
         mock_udp_a = MagicMock()
         mock_udp_a.local_ip = "192.168.1.100"
         mock_udp_a.broadcast_async = AsyncMock()
+        mock_udp_a.broadcast_many_async = AsyncMock()
 
         master_node = NodeInfo(
             node_id=node_z.node_id,
@@ -164,6 +168,7 @@ class TestMasterFailover:
         mock_udp_a.local_ip = "192.168.1.100"
         mock_udp_a.broadcast_calls = []
         mock_udp_a.broadcast_async = AsyncMock(side_effect=lambda msg: mock_udp_a.broadcast_calls.append(msg))
+        mock_udp_a.broadcast_many_async = AsyncMock(side_effect=lambda msgs: mock_udp_a.broadcast_calls.extend(msgs))
         mock_udp_a.start = MagicMock()
         mock_udp_a.stop = MagicMock()
 
@@ -430,6 +435,7 @@ class TestElectionEdgeCases:
         mock_udp = MagicMock()
         mock_udp.local_ip = "192.168.1.100"
         mock_udp.broadcast_async = AsyncMock()
+        mock_udp.broadcast_many_async = AsyncMock()
 
         mock_discovery = MagicMock()
         mock_discovery.get_node_id.return_value = "node_001"
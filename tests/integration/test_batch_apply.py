@@ -0,0 +1,246 @@
+"""
+Integration tests for the batched follower apply engine.
+Verifies SyncManager.apply_changes_batch(bulk=True) produces the same final
+state and summary as the per-change path, with far fewer queries.
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from backend.apps.cluster.services.sync_manager import SyncManager, SyncChange, SyncOperation
+from backend.apps.fencing_organizer.modules.event.models import DjangoEvent
+from backend.apps.fencing_organizer.modules.event.serializers import EventSerializer
+from backend.apps.fencing_organizer.modules.event_participant.models import DjangoEventParticipant
+from backend.apps.fencing_organizer.modules.event_participant.serializers import EventParticipantSerializer
+from backend.apps.fencing_organizer.modules.fencer.models import DjangoFencer
+from backend.apps.fencing_organizer.modules.fencer.serializers import FencerSerializer
+from backend.apps.fencing_organizer.modules.tournament.models import DjangoTournament
+from backend.apps.fencing_organizer.modules.tournament.serializers import TournamentSerializer
+
+
+@pytest.fixture
+def manager():
+    manager = SyncManager()
+    manager.register_model("fencer", DjangoFencer, FencerSerializer, last_modified_field="last_modified_at")
+    return manager
+
+
+def _fencer_change(change_id, record_id, operation, version=1, **data):
+    payload = {"first_name": "First", "last_name": "Last", "gender": "MEN", "country_code": "FRA"}
+    payload.update(data)
+    return SyncChange(
+        id=change_id,
+        table_name="fencer",
+        record_id=str(record_id),
+        operation=operation,
+        data=payload if operation != SyncOperation.DELETE.value else {},
+        version=version,
+        created_at=datetime.now(timezone.utc).isoformat(),
+    )
+
+
+@pytest.mark.django_db
+class TestBulkApply:
+    def test_bulk_insert_many_records(self, manager):
+        ids = [uuid4() for _ in range(50)]
+        changes = [_fencer_change(i + 1, fid, SyncOperation.INSERT.value, first_name=f"F{i}") for i, fid in enumerate(ids)]
+
+        with CaptureQueriesContext(connection) as ctx:
+            result = manager.apply_changes_batch(changes)
+
+        assert result == {"success": 50, "failed": 0, "skipped": 0, "last_success_id": 50}
+        assert DjangoFencer.objects.filter(id__in=ids).count() == 50
+        assert len(ctx.captured_queries) < 10
+
+    def test_insert_restores_created_at(self, manager):
+        fencer_id = uuid4()
+        created_at = datetime(2024, 3, 1, 10, 0, tzinfo=timezone.utc)
+        change = _fencer_change(1, fencer_id, SyncOperation.INSERT.value, created_at=created_at.isoformat())
+
+        manager.apply_changes_batch([change])
+
+        assert DjangoFencer.objects.get(id=fencer_id).created_at == created_at
+
+    def test_insert_update_delete_in_one_page(self, manager):
+        kept, removed = uuid4(), uuid4()
+        changes = [
+            _fencer_change(1, kept, SyncOperation.INSERT.value),
+            _fencer_change(2, removed, SyncOperation.INSERT.value),
+            _fencer_change(3, kept, SyncOperation.UPDATE.value, version=2, first_name="Updated"),
+            _fencer_change(4, removed, SyncOperation.DELETE.value, version=0),
+        ]
+
+        result = manager.apply_changes_batch(changes)
+
+        assert result["success"] == 4
+        assert result["last_success_id"] == 4
+        fencer = DjangoFencer.objects.get(id=kept)
+        assert fencer.first_name == "Updated"
+        assert fencer.version == 2
+        assert not DjangoFencer.objects.filter(id=removed).exists()
+
+    def test_update_existing_and_delete_existing(self, manager):
+        existing = DjangoFencer.objects.create(first_name="Old", last_name="Name", version=1)
+        doomed = DjangoFencer.objects.create(first_name="Gone", last_name="Soon")
+        changes = [
+            _fencer_change(10, existing.id, SyncOperation.UPDATE.value, version=2, first_name="New"),
+            _fencer_change(11, doomed.id, SyncOperation.DELETE.value, version=0),
+        ]
+
+        result = manager.apply_changes_batch(changes)
+
+        assert result["success"] == 2
+        existing.refresh_from_db()
+        assert existing.first_name == "New"
+        assert existing.version == 2
+        assert not DjangoFencer.objects.filter(id=doomed.id).exists()
+
+    def test_higher_local_version_wins(self, manager):
+        existing = DjangoFencer.objects.create(first_name="Local", last_name="Name", version=5)
+        change = _fencer_change(1, existing.id, SyncOperation.UPDATE.value, version=3, first_name="Remote")
+
+        result = manager.apply_changes_batch([change])
+
+        assert result["success"] == 1
+        existing.refresh_from_db()
+        assert existing.first_name == "Local"
+        assert existing.version == 5
+
+    def test_equal_version_newer_local_wins(self, manager):
+        existing = DjangoFencer.objects.create(first_name="Local", last_name="Name", version=2)
+        change = _fencer_change(1, existing.id, SyncOperation.UPDATE.value, version=2, first_name="Remote")
+        change.created_at = (datetime.now(timezone.utc) - timedelta(hours=1)).isoformat()
+
+        manager.apply_changes_batch([change])
+
+        existing.refresh_from_db()
+        assert existing.first_name == "Local"
+
+    def test_unknown_table_counts_as_failed(self, manager):
+        good = _fencer_change(1, uuid4(), SyncOperation.INSERT.value)
+        bad = SyncChange(id=2, table_name="nope", record_id="x", operation="INSERT", data={}, version=1, created_at=None)
+
+        result = manager.apply_changes_batch([good, bad])
+
+        assert result["success"] == 1
+        assert result["failed"] == 1
+        assert result["last_success_id"] == 1
+
+    def test_bulk_matches_serial_result(self, manager):
+        ids = [uuid4() for _ in range(5)]
+        changes = [_fencer_change(i + 1, fid, SyncOperation.INSERT.value) for i, fid in enumerate(ids)]
+        changes.append(_fencer_change(6, ids[0], SyncOperation.UPDATE.value, version=2, last_name="Changed"))
+
+        bulk_result = manager.apply_changes_batch(changes, bulk=True)
+        bulk_state = sorted(DjangoFencer.objects.values_list("id", "last_name", "version"))
+
+        DjangoFencer.objects.all().delete()
+        serial_result = manager.apply_changes_batch(changes, bulk=False)
+        serial_state = sorted(DjangoFencer.objects.values_list("id", "last_name", "version"))
+
+        assert bulk_result == serial_result
+        assert bulk_state == serial_state
+
+
+@pytest.fixture
+def related_manager():
+    manager = SyncManager()
+    manager.register_model("tournament", DjangoTournament, TournamentSerializer)
+    manager.register_model("event", DjangoEvent, EventSerializer)
+    manager.register_model("fencer", DjangoFencer, FencerSerializer)
+    manager.register_model("event_participant", DjangoEventParticipant, EventParticipantSerializer)
+    return manager
+
+
+def _change(change_id, table_name):
+    return SyncChange(
+        id=change_id,
+        table_name=table_name,
+        record_id=str(uuid4()),
+        operation=SyncOperation.UPDATE.value,
+        data={},
+        version=1,
+        created_at=None,
+    )
+
+
+class TestParallelApply:
+    def test_dependencies_follow_foreign_keys(self, related_manager):
+        dependencies = related_manager.table_dependencies(["event_participant", "fencer", "event", "tournament"])
+
+        assert dependencies == {
+            "tournament": set(),
+            "fencer": set(),
+            "event": {"tournament"},
+            "event_participant": {"event", "fencer"},
+        }
+
+    def test_dependencies_only_name_tables_in_the_page(self, related_manager):
+        assert related_manager.table_dependencies(["event_participant", "fencer"]) == {"event_participant": {"fencer"}, "fencer": set()}
+
+    def test_single_writer_on_sqlite(self, related_manager):
+        assert connection.vendor == "sqlite"
+        assert related_manager.parallel_apply_enabled() is False
+
+    def test_groups_join_tables_linked_by_foreign_keys(self, related_manager):
+        assert related_manager.table_groups(["tournament", "fencer", "event"]) == [["tournament", "event"], ["fencer"]]
+        assert related_manager.table_groups(["event_participant", "fencer", "event", "tournament"]) == [
+            ["event_participant", "fencer", "event", "tournament"]
+        ]
+
+    def test_cyclic_dependencies_share_a_group(self, related_manager):
+        cycle = {"tournament": {"event"}, "event": {"tournament"}, "fencer": set()}
+
+        with patch.object(related_manager, "table_dependencies", return_value=cycle):
+            assert related_manager.table_groups(["tournament", "event", "fencer"]) == [["tournament", "event"], ["fencer"]]
+
+    def test_unrelated_groups_run_concurrently(self, related_manager):
+        changes = [
+            _change(1, "tournament"),
+            _change(2, "fencer"),
+            _change(3, "event"),
+            _change(4, "tournament"),
+            _change(5, "unknown"),
+        ]
+        lock = threading.Lock()
+        events = []
+        applied = []
+
+        def apply_group(group_changes, fetch_snapshot=None):
+            ids = [c.id for c in group_changes]
+            with lock:
+                applied.append(ids)
+                events.append(("start", ids[0]))
+            time.sleep(0.05)
+            with lock:
+                events.append(("end", ids[0]))
+            return ids, 0, 0
+
+        with patch.object(related_manager, "parallel_apply_enabled", return_value=True), patch.object(
+            related_manager, "_apply_group_changes", side_effect=apply_group
+        ):
+            result = related_manager.apply_changes_batch(changes)
+
+        assert result == {"success": 4, "failed": 1, "skipped": 0, "last_success_id": 4}
+        # tournament and event share a transaction and keep their id order
+        assert sorted(applied) == [[1, 3, 4], [2]]
+        assert max(events.index(("start", 1)), events.index(("start", 2))) < min(events.index(("end", 1)), events.index(("end", 2)))
+
+    def test_related_tables_apply_sequentially_in_id_order(self, related_manager):
+        changes = [_change(1, "tournament"), _change(2, "event"), _change(3, "fencer"), _change(4, "event_participant")]
+
+        with patch.object(related_manager, "parallel_apply_enabled", return_value=True), patch.object(
+            related_manager, "_apply_group_changes"
+        ) as apply_group, patch.object(related_manager, "_apply_changes_bulk", return_value=([1, 2, 3, 4], 0)) as apply_bulk:
+            result = related_manager.apply_changes_batch(changes)
+
+        apply_group.assert_not_called()
+        apply_bulk.assert_called_once_with(changes, None)
+        assert result["success"] == 4
@@ -0,0 +1,80 @@
+"""
+Integration tests for the server-side DE bracket endpoints.
+"""
+
+from datetime import date
+from uuid import uuid4
+
+import pytest
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+
+from backend.apps.cluster.models import DjangoSyncLog
+from backend.apps.cluster.services.delta import is_delta
+from backend.apps.fencing_organizer.modules.event.models import DjangoEvent
+from backend.apps.fencing_organizer.modules.tournament.models import DjangoTournament
+
+
+@pytest.fixture
+def api_client():
+    client = APIClient()
+    user = get_user_model().objects.create_user(username="referee", password="testpass123", email="referee@example.com")
+    client.force_authenticate(user=user)
+    return client
+
+
+@pytest.fixture
+def event():
+    tournament = DjangoTournament.objects.create(tournament_name="DE Open", start_date=date(2025, 1, 1), end_date=date(2025, 1, 2))
+    return DjangoEvent.objects.create(id=uuid4(), tournament=tournament, event_name="Foil")
+
+
+def _url(event, suffix=""):
+    return f"/api/events/{event.id}/stages/de1/bracket/{suffix}"
+
+
+@pytest.mark.django_db
+class TestBracketApi:
+    def test_create_and_get(self, api_client, event):
+        response = api_client.post(_url(event), {"fencer_ids": [f"f{i}" for i in range(1, 11)]}, format="json")
+
+        assert response.status_code == 201
+        assert response.data["size"] == 16
+        event.refresh_from_db()
+        assert event.de_trees["de1"]["format"] == "heap"
+
+        fetched = api_client.get(_url(event))
+        assert fetched.status_code == 200
+        assert [len(r) for r in fetched.data["rounds"]] == [8, 4, 2, 1]
+
+    def test_bout_patch_records_node_delta(self, api_client, event):
+        api_client.post(_url(event), {"fencer_ids": [f"f{i}" for i in range(1, 17)]}, format="json")
+
+        response = api_client.patch(_url(event, "bouts/8/"), {"score_a": "V", "score_b": "7"}, format="json")
+
+        assert response.status_code == 200
+        assert [b["node"] for b in response.data["changed"]] == [8]
+        assert response.data["changed"][0]["winner"] == "f1"
+        log = DjangoSyncLog.objects.filter(table_name="event", record_id=str(event.id)).latest("id")
+        assert is_delta(log.data)
+        paths = {patch["path"] for patch in log.data["patches"]["de_trees"]}
+        assert paths == {"/de1/fencers/8", "/de1/scores/8"}
+
+    def test_invalid_bout(self, api_client, event):
+        api_client.post(_url(event), {"fencer_ids": ["a", "b", "c"]}, format="json")
+
+        response = api_client.patch(_url(event, "bouts/2/"), {"score_a": "V", "score_b": "3"}, format="json")
+
+        assert response.status_code == 400
+
+    def test_missing_bracket(self, api_client, event):
+        assert api_client.get(_url(event)).status_code == 404
+        assert api_client.patch(_url(event, "bouts/1/"), {"score_a": "V", "score_b": "3"}, format="json").status_code == 400
+
+    def test_missing_event(self, api_client):
+        url = f"/api/events/{uuid4()}/stages/de1/bracket/"
+
+        assert api_client.get(url).status_code == 404
+        assert api_client.post(url, {"fencer_ids": ["a", "b"]}, format="json").status_code == 404
+        assert api_client.patch(f"{url}bouts/1/", {"score_a": "V", "score_b": "3"}, format="json").status_code == 404
+        assert not DjangoSyncLog.objects.filter(table_name="event").exists()
@@ -0,0 +1,170 @@
+"""
+Integration tests for delta sync_log payloads.
+Verifies UPDATE writes record only changed columns and that followers apply
+deltas, falling back to a master snapshot when their base has diverged.
+"""
+
+from datetime import date
+from uuid import uuid4
+
+import pytest
+from django.db import connection
+from rest_framework.test import APIClient
+
+from backend.apps.cluster.decorators.transaction import SyncTransaction
+from backend.apps.cluster.models import DjangoSyncLog
+from backend.apps.cluster.services.delta import is_delta, snapshot_instance
+from backend.apps.cluster.services.sync_manager import SyncManager
+from backend.apps.fencing_organizer.modules.event.models import DjangoEvent
+from backend.apps.fencing_organizer.modules.event.serializers import EventSerializer
+from backend.apps.fencing_organizer.modules.pool.models import DjangoPool
+from backend.apps.fencing_organizer.modules.tournament.models import DjangoTournament
+
+
+def _bracket():
+    return [[{"a": f"f{i}", "b": f"g{i}", "score_a": 0, "score_b": 0} for i in range(32 >> r)] for r in range(6)]
+
+
+@pytest.fixture
+def event():
+    tournament = DjangoTournament.objects.create(
+        tournament_name="Delta Open",
+        start_date=date(2025, 1, 1),
+        end_date=date(2025, 1, 2),
+    )
+    return DjangoEvent.objects.create(
+        id=uuid4(),
+        tournament=tournament,
+        event_name="Foil",
+        de_trees={"stage_de": _bracket()},
+    )
+
+
+@pytest.fixture
+def manager():
+    manager = SyncManager()
+    manager.register_model("event", DjangoEvent, EventSerializer, last_modified_field="last_modified_at")
+    return manager
+
+
+def _edit_cell(event, score):
+    previous = snapshot_instance(event)
+    trees = {"stage_de": _bracket()}
+    trees["stage_de"][1][2]["score_a"] = score
+    with SyncTransaction() as sync_tx:
+        event.de_trees = trees
+        event.version = 2
+        event.save()
+        sync_tx.record_update("event", event, data=snapshot_instance(event), previous=previous)
+    return DjangoSyncLog.objects.get(id=sync_tx.last_sync_id)
+
+
+@pytest.mark.django_db
+class TestDeltaRecording:
+    def test_bracket_edit_is_recorded_as_patch(self, event):
+        log = _edit_cell(event, 15)
+
+        assert is_delta(log.data)
+        assert log.data["patches"]["de_trees"] == [{"op": "replace", "path": "/stage_de/1/2/score_a", "value": 15}]
+        assert "event_name" not in log.data["fields"]
+
+    def test_without_previous_full_snapshot_is_recorded(self, event):
+        with SyncTransaction() as sync_tx:
+            sync_tx.record_update("event", event, data=snapshot_instance(event))
+
+        log = DjangoSyncLog.objects.get(id=sync_tx.last_sync_id)
+        assert not is_delta(log.data)
+        assert log.data["event_name"] == "Foil"
+
+    def test_pool_results_endpoint_records_delta(self, event):
+        pool = DjangoPool.objects.create(event=event, pool_number=1, fencer_ids=["a", "b", "c"], results=[[None] * 3 for _ in range(3)])
+        results = [[None] * 3 for _ in range(3)]
+        results[0][1] = "V5"
+
+        response = APIClient().patch(f"/api/pools/{pool.id}/results/", {"results": results}, format="json")
+
+        assert response.status_code == 200
+        log = DjangoSyncLog.objects.filter(table_name="pool", record_id=str(pool.id)).latest("id")
+        assert is_delta(log.data)
+        assert log.data["patches"]["results"] == [{"op": "replace", "path": "/0/1", "value": "V5"}]
+
+
+@pytest.mark.django_db
+class TestDeltaApply:
+    @pytest.mark.parametrize("bulk", [True, False])
+    def test_follower_applies_delta(self, event, manager, bulk):
+        log = _edit_cell(event, 15)
+        change = manager.get_changes_since(log.id - 1).changes[0]
+        # Follower still has the pre-edit bracket
+        DjangoEvent.objects.filter(id=event.id).update(de_trees={"stage_de": _bracket()}, version=1)
+
+        result = manager.apply_changes_batch([change], bulk=bulk)
+
+        assert result["success"] == 1
+        event.refresh_from_db()
+        assert event.de_trees["stage_de"][1][2]["score_a"] == 15
+        assert event.version == 2
+
+    @pytest.mark.parametrize("bulk", [True, False])
+    def test_base_mismatch_falls_back_to_snapshot(self, event, manager, bulk):
+        log = _edit_cell(event, 15)
+        change = manager.get_changes_since(log.id - 1).changes[0]
+        master_snapshot = manager.get_record_snapshot("event", str(event.id))
+        diverged = {"stage_de": _bracket()}
+        diverged["stage_de"][0][0]["score_b"] = 3
+        DjangoEvent.objects.filter(id=event.id).update(de_trees=diverged, version=1)
+
+        requested = []
+
+        def fetch(table_name, record_id):
+            requested.append((table_name, record_id))
+            return master_snapshot
+
+        result = manager.apply_changes_batch([change], bulk=bulk, fetch_snapshot=fetch)
+
+        assert result["success"] == 1
+        assert requested == [("event", str(event.id))]
+        event.refresh_from_db()
+        assert event.de_trees["stage_de"][1][2]["score_a"] == 15
+        assert event.de_trees["stage_de"][0][0]["score_b"] == 0
+
+    def test_bulk_apply_fetches_snapshots_outside_its_transaction(self, event, manager):
+        _edit_cell(event, 7)
+        log = _edit_cell(event, 15)
+        changes = manager.get_changes_since(log.id - 2).changes
+        master_snapshot = manager.get_record_snapshot("event", str(event.id))
+        DjangoEvent.objects.filter(id=event.id).update(de_trees={}, version=1)
+        depth = len(connection.atomic_blocks)
+
+        requested = []
+
+        def fetch(table_name, record_id):
+            requested.append(len(connection.atomic_blocks) - depth)
+            return master_snapshot
+
+        result = manager.apply_changes_batch(changes, bulk=True, fetch_snapshot=fetch)
+
+        assert result["success"] == 2
+        assert requested == [0]
+        event.refresh_from_db()
+        assert event.de_trees["stage_de"][1][2]["score_a"] == 15
+
+    def test_base_mismatch_without_snapshot_source_fails(self, event, manager):
+        log = _edit_cell(event, 15)
+        change = manager.get_changes_since(log.id - 1).changes[0]
+        DjangoEvent.objects.filter(id=event.id).update(de_trees={}, version=1)
+
+        result = manager.apply_changes_batch([change])
+
+        assert result["failed"] == 1
+        assert result["last_success_id"] == 0
+
+    def test_snapshot_endpoint(self, event):
+        client = APIClient()
+
+        response = client.get("/api/cluster/sync/snapshot/", {"table_name": "event", "record_id": str(event.id)})
+        missing = client.get("/api/cluster/sync/snapshot/", {"table_name": "event", "record_id": str(uuid4())})
+
+        assert response.status_code == 200
+        assert response.data["data"]["event_name"] == "Foil"
+        assert missing.status_code == 404
@@ -0,0 +1,136 @@
+"""
+Integration tests for the streaming full sync bootstrap.
+Verifies the NDJSON snapshot is pinned, keyset-paged and parent-first, and
+that a follower rebuilds the same rows from its chunks, including rows the
+master deleted behind the compaction horizon.
+"""
+
+import json
+from datetime import date, timedelta
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from backend.apps.cluster.decorators.transaction import SyncTransaction
+from backend.apps.cluster.models import DjangoSyncLog
+from backend.apps.cluster.services.sync_log_compactor import SyncLogCompactor
+from backend.apps.cluster.services.sync_manager import sync_manager
+from backend.apps.cluster.services.sync_worker import SyncWorker
+from backend.apps.fencing_organizer.modules.event.models import DjangoEvent
+from backend.apps.fencing_organizer.modules.tournament.models import DjangoTournament
+
+
+@pytest.fixture
+def tournaments():
+    created = []
+    with SyncTransaction() as sync_tx:
+        for i in range(3):
+            tournament = DjangoTournament.objects.create(
+                tournament_name=f"Stream Open {i}",
+                start_date=date(2025, 1, 1),
+                end_date=date(2025, 1, 2),
+            )
+            sync_tx.record_insert("tournament", tournament)
+            created.append(tournament)
+    DjangoEvent.objects.create(id=uuid4(), tournament=created[0], event_name="Epee")
+    return created
+
+
+def _read_stream(response):
+    return [json.loads(line) for line in b"".join(response.streaming_content).decode().splitlines() if line]
+
+
+@pytest.mark.django_db
+class TestFullSyncStream:
+    def test_stream_is_pinned_and_keyset_paged(self, tournaments):
+        response = APIClient().get("/api/cluster/sync/full/stream/", {"tables": "event,tournament", "chunk_size": 2})
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == "application/x-ndjson"
+
+        messages = _read_stream(response)
+        header, chunks, end = messages[0], messages[1:-1], messages[-1]
+        assert header["type"] == "header"
+        assert header["tables"] == ["tournament", "event"]
+        assert end == {"type": "end", "latest_sync_id": header["latest_sync_id"], "total_records": 4}
+        assert header["latest_sync_id"] == sync_manager.get_latest_sync_id()
+
+        assert [(c["table"], len(c["records"])) for c in chunks] == [("tournament", 2), ("tournament", 1), ("event", 1)]
+        tournament_ids = [r["id"] for c in chunks if c["table"] == "tournament" for r in c["records"]]
+        assert tournament_ids == sorted(str(t.pk) for t in tournaments)
+
+    def test_invalid_chunk_size(self):
+        response = APIClient().get("/api/cluster/sync/full/stream/", {"chunk_size": "many"})
+        assert response.status_code == 400
+
+    def test_import_rebuilds_rows_with_master_timestamps(self, tournaments):
+        messages = _read_stream(APIClient().get("/api/cluster/sync/full/stream/", {"tables": "tournament,event"}))
+        chunks = [m for m in messages if m["type"] == "chunk"]
+        original = {str(t.pk): t.last_modified_at for t in DjangoTournament.objects.all()}
+
+        # One row changed locally, the others missing entirely
+        DjangoEvent.objects.all().delete()
+        DjangoTournament.objects.exclude(pk=tournaments[0].pk).delete()
+        DjangoTournament.objects.filter(pk=tournaments[0].pk).update(
+            tournament_name="Local edit", last_modified_at=timezone.now() + timedelta(days=1)
+        )
+
+        imported = sum(sync_manager.import_snapshot_chunk(c["table"], c["records"]) for c in chunks)
+
+        assert imported == 4
+        assert DjangoEvent.objects.filter(tournament_id=tournaments[0].pk).count() == 1
+        assert DjangoTournament.objects.get(pk=tournaments[0].pk).tournament_name == "Stream Open 0"
+        assert {str(t.pk): t.last_modified_at for t in DjangoTournament.objects.all()} == original
+
+    def test_import_defers_rows_whose_parent_is_missing(self, tournaments):
+        messages = _read_stream(APIClient().get("/api/cluster/sync/full/stream/", {"tables": "event"}))
+        (chunk,) = [m for m in messages if m["type"] == "chunk"]
+        orphan = {**chunk["records"][0], "id": str(uuid4()), "tournament": str(uuid4())}
+        DjangoEvent.objects.all().delete()
+
+        imported = sync_manager.import_snapshot_chunk("event", chunk["records"] + [orphan])
+
+        assert imported == 1
+        assert list(DjangoEvent.objects.values_list("tournament_id", flat=True)) == [tournaments[0].pk]
+
+    def test_snapshot_is_read_without_a_transaction_on_sqlite(self, tournaments):
+        with patch("backend.apps.cluster.services.sync_manager.transaction.atomic") as atomic:
+            messages = list(sync_manager.iter_full_snapshot(["tournament"]))
+
+        atomic.assert_not_called()
+        assert messages[-1]["total_records"] == 3
+
+
+@pytest.mark.django_db
+class TestRebootstrap:
+    def test_rows_deleted_behind_compaction_are_removed(self, tournaments):
+        deleted = tournaments[1]
+        with SyncTransaction() as sync_tx:
+            DjangoTournament.objects.filter(pk=deleted.pk).delete()
+            sync_tx.record_delete("tournament", deleted.pk)
+        DjangoSyncLog.objects.update(created_at=timezone.now() - timedelta(hours=5))
+        assert SyncLogCompactor().compact(retention_hours=1)["compacted_id"] > 0
+
+        gone = MagicMock(status_code=410)
+        gone.json.return_value = {"detail": "compacted", "compacted_id": SyncLogCompactor().compacted_id}
+        stream = MagicMock(status_code=200)
+        stream.__enter__.return_value = stream
+        stream.iter_lines.return_value = [
+            line for line in b"".join(APIClient().get("/api/cluster/sync/full/stream/").streaming_content).splitlines() if line
+        ]
+
+        # The follower still has the row the master deleted while it was behind
+        DjangoTournament.objects.bulk_create([deleted])
+
+        worker = SyncWorker()
+        with patch("backend.apps.cluster.services.sync_worker.cluster_http") as http, patch.object(worker, "_send_ack"):
+            http.get.side_effect = [gone, stream]
+            worker._do_incremental_sync("http://master:8000", "follower_001", 1)
+
+        assert not DjangoTournament.objects.filter(pk=deleted.pk).exists()
+        assert DjangoTournament.objects.count() == 2
+        assert DjangoEvent.objects.count() == 1
+        assert sync_manager.get_sync_state("follower_001").last_synced_id == sync_manager.get_latest_sync_id()
@@ -0,0 +1,134 @@
+"""
+Integration tests for database-backed list endpoints.
+Verifies filtering, search, ordering and pagination run as queries and that
+only the requested page is loaded.
+"""
+
+from datetime import date
+from uuid import uuid4
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from backend.apps.fencing_organizer.modules.event.models import DjangoEvent
+from backend.apps.fencing_organizer.modules.fencer.models import DjangoFencer
+from backend.apps.fencing_organizer.modules.pool.models import DjangoPool
+from backend.apps.fencing_organizer.modules.tournament.models import DjangoTournament
+from backend.apps.fencing_organizer.repositories.fencer_repo import DjangoFencerRepository
+from core.interfaces.query_spec import QuerySpec
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+@pytest.fixture
+def fencers():
+    DjangoFencer.objects.bulk_create(
+        [
+            DjangoFencer(
+                first_name=f"First{i:03d}",
+                last_name=f"Last{i:03d}",
+                gender="MEN" if i % 2 else "WOMEN",
+                country_code="FRA" if i % 3 == 0 else "ITA",
+                primary_weapon="FOIL",
+                current_ranking=None if i % 10 == 0 else i,
+            )
+            for i in range(150)
+        ]
+    )
+
+
+@pytest.fixture
+def tournament():
+    return DjangoTournament.objects.create(
+        tournament_name="Paris Open", organizer="FFE", start_date=date(2025, 1, 1), end_date=date(2025, 1, 2)
+    )
+
+
+@pytest.mark.django_db
+class TestFencerList:
+    def test_count_covers_all_rows(self, api_client, fencers):
+        response = api_client.get("/api/fencers/")
+
+        assert response.status_code == 200
+        assert response.data["count"] == 150
+        assert len(response.data["results"]) == 20
+        assert response.data["results"][0]["last_name"] == "Last000"
+
+    def test_filters_and_page(self, api_client, fencers):
+        response = api_client.get("/api/fencers/", {"country_code": "fra", "gender": "women", "page": 2, "page_size": 5})
+
+        expected = sorted(f"Last{i:03d}" for i in range(150) if i % 3 == 0 and i % 2 == 0)
+        assert response.data["count"] == len(expected)
+        assert [f["last_name"] for f in response.data["results"]] == expected[5:10]
+        assert response.data["previous"] is not None
+
+    def test_search_and_descending_order(self, api_client, fencers):
+        response = api_client.get("/api/fencers/", {"search": "last01", "ordering": "-last_name"})
+
+        assert [f["last_name"] for f in response.data["results"]] == [f"Last{i:03d}" for i in range(19, 9, -1)]
+
+    def test_unknown_ordering_falls_back_to_default(self, api_client, fencers):
+        response = api_client.get("/api/fencers/", {"ordering": "password"})
+
+        assert response.status_code == 200
+        assert response.data["results"][0]["last_name"] == "Last000"
+
+    def test_out_of_range_page_is_404(self, api_client, fencers):
+        assert api_client.get("/api/fencers/", {"page": 99}).status_code == 404
+        assert api_client.get("/api/fencers/", {"page": "x"}).status_code == 404
+
+    def test_only_page_is_fetched(self, api_client, fencers):
+        with CaptureQueriesContext(connection) as ctx:
+            api_client.get("/api/fencers/", {"page_size": 10})
+
+        selects = [q["sql"] for q in ctx.captured_queries if "fencer" in q["sql"] and q["sql"].startswith("SELECT")]
+        assert len(selects) == 2
+        assert any("LIMIT 10" in sql for sql in selects)
+
+    def test_nulls_sort_first_ascending(self, fencers):
+        result = DjangoFencerRepository().find_fencers(QuerySpec(ordering=["current_ranking"], limit=3))
+
+        assert result.total == 150
+        assert [f.current_ranking for f in result.items] == [None, None, None]
+
+
+@pytest.mark.django_db
+class TestEventPoolTournamentLists:
+    def test_events_filtered_by_tournament_and_search(self, api_client, tournament):
+        other = DjangoTournament.objects.create(tournament_name="Other", start_date=date(2025, 2, 1), end_date=date(2025, 2, 2))
+        DjangoEvent.objects.create(id=uuid4(), tournament=tournament, event_name="Men Foil")
+        DjangoEvent.objects.create(id=uuid4(), tournament=tournament, event_name="Women Epee")
+        DjangoEvent.objects.create(id=uuid4(), tournament=other, event_name="Men Foil")
+
+        response = api_client.get("/api/events/", {"tournament": str(tournament.id), "search": "foil"})
+
+        assert response.data["count"] == 1
+        assert response.data["results"][0]["event_name"] == "Men Foil"
+
+    def test_pools_filtered_by_stage_and_ordered(self, api_client, tournament):
+        event = DjangoEvent.objects.create(id=uuid4(), tournament=tournament, event_name="Sabre")
+        for number in (3, 1, 2):
+            DjangoPool.objects.create(event=event, pool_number=number, stage_id="stage_1")
+        DjangoPool.objects.create(event=event, pool_number=4, stage_id="stage_2")
+
+        response = api_client.get("/api/pools/", {"event": str(event.id), "stage_id": "stage_1"})
+
+        assert [p["pool_number"] for p in response.data["results"]] == [1, 2, 3]
+
+    def test_tournaments_search_and_status(self, api_client, tournament):
+        DjangoTournament.objects.create(
+            tournament_name="Lyon Cup", status="ONGOING", start_date=date(2025, 3, 1), end_date=date(2025, 3, 2)
+        )
+
+        by_organizer = api_client.get("/api/tournaments/", {"search": "ffe"})
+        by_status = api_client.get("/api/tournaments/", {"status": "ONGOING"})
+        default = api_client.get("/api/tournaments/")
+
+        assert [t["tournament_name"] for t in by_organizer.data["results"]] == ["Paris Open"]
+        assert [t["tournament_name"] for t in by_status.data["results"]] == ["Lyon Cup"]
+        assert [t["tournament_name"] for t in default.data["results"]] == ["Lyon Cup", "Paris Open"]
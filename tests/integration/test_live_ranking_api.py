@@ -0,0 +1,159 @@
+"""
+Integration tests for the incremental live ranking of pool stages.
+Checks that saved score sheets update the in-memory index without rebuilding
+it, and that fencer statistics are persisted to PoolAssignment in batches.
+"""
+
+from datetime import date
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from backend.apps.cluster.models import DjangoSyncLog
+from backend.apps.cluster.services.sync_manager import SyncManager
+from backend.apps.fencing_organizer.modules.event.models import DjangoEvent
+from backend.apps.fencing_organizer.modules.fencer.models import DjangoFencer
+from backend.apps.fencing_organizer.modules.pool.models import DjangoPool
+from backend.apps.fencing_organizer.modules.pool.serializers import PoolSerializer
+from backend.apps.fencing_organizer.modules.pool_assignment.models import DjangoPoolAssignment
+from backend.apps.fencing_organizer.modules.tournament.models import DjangoTournament
+from backend.apps.fencing_organizer.repositories.pool_assignment_repo import DjangoPoolAssignmentRepository
+from backend.apps.fencing_organizer.services.live_ranking_service import live_ranking_service
+
+
+@pytest.fixture
+def event():
+    tournament = DjangoTournament.objects.create(tournament_name="Live Open", start_date=date(2025, 1, 1), end_date=date(2025, 1, 2))
+    return DjangoEvent.objects.create(id=uuid4(), tournament=tournament, event_name="Sabre")
+
+
+@pytest.fixture
+def pool(event):
+    fencers = [DjangoFencer.objects.create(first_name=name, last_name="Test") for name in ("A", "B", "C")]
+    pool = DjangoPool.objects.create(
+        event=event,
+        stage_id="s1",
+        pool_number=1,
+        fencer_ids=[str(f.id) for f in fencers],
+        results=[["" for _ in fencers] for _ in fencers],
+    )
+    for fencer in fencers:
+        DjangoPoolAssignment.objects.create(pool=pool, fencer=fencer)
+    return pool
+
+
+def _live_ranking(event):
+    response = APIClient().get(f"/api/events/{event.id}/stages/s1/live-ranking/")
+    assert response.status_code == 200
+    return response.data
+
+
+def _enter_bout(pool, i, j, score, opponent_score, **extra):
+    results = [list(row) for row in pool.results]
+    results[i][j], results[j][i] = score, opponent_score
+    pool.results = results
+    return APIClient().patch(f"/api/pools/{pool.id}/results/", {"results": results, **extra}, format="json")
+
+
+@pytest.mark.django_db
+class TestLiveRanking:
+    def test_matches_pool_ranking(self, event, pool):
+        _enter_bout(pool, 0, 1, "V", "2")
+
+        assert _live_ranking(event) == APIClient().get(f"/api/events/{event.id}/stages/s1/pool-ranking/").data
+
+    def test_bout_updates_index_without_rebuild(self, event, pool, django_capture_on_commit_callbacks):
+        _live_ranking(event)
+
+        with patch.object(live_ranking_service.pool_service, "get_stage_sheets") as get_stage_sheets:
+            with django_capture_on_commit_callbacks(execute=True):
+                response = _enter_bout(pool, 2, 0, "V", "4")
+            ranking = _live_ranking(event)
+
+        assert response.status_code == 200
+        get_stage_sheets.assert_not_called()
+        assert (ranking[0]["id"], ranking[0]["v"], ranking[0]["ts"]) == (pool.fencer_ids[2], 1, 5)
+
+    def test_statistics_are_flushed_in_batches(self, event, pool, django_capture_on_commit_callbacks):
+        _live_ranking(event)
+        winner = DjangoPoolAssignment.objects.get(pool=pool, fencer_id=pool.fencer_ids[0])
+
+        with django_capture_on_commit_callbacks(execute=True):
+            _enter_bout(pool, 0, 1, "V", "2")
+        winner.refresh_from_db()
+        assert winner.victories == 0
+
+        with django_capture_on_commit_callbacks(execute=True):
+            _enter_bout(pool, 0, 2, "V", "1", is_locked=True)
+        winner.refresh_from_db()
+        assert (winner.victories, winner.matches_played, winner.touches_scored, winner.indicator) == (2, 2, 10, 7)
+        assert DjangoSyncLog.objects.filter(table_name="pool_assignment", record_id=str(winner.id)).exists()
+
+    def test_statistics_are_flushed_on_read_once_interval_passed(self, event, pool, django_capture_on_commit_callbacks):
+        _live_ranking(event)
+        winner = DjangoPoolAssignment.objects.get(pool=pool, fencer_id=pool.fencer_ids[0])
+        with django_capture_on_commit_callbacks(execute=True):
+            _enter_bout(pool, 0, 1, "V", "2")
+
+        live_ranking_service._last_flush -= live_ranking_service.flush_interval
+        _live_ranking(event)
+
+        winner.refresh_from_db()
+        assert (winner.victories, winner.matches_played) == (1, 1)
+
+    def test_pool_saved_by_another_process_is_reapplied(self, event, pool):
+        _live_ranking(event)
+        results = [list(row) for row in pool.results]
+        results[1][2], results[2][1] = "V", "0"
+
+        # A queryset update sends no post_save, like a write served by another worker
+        DjangoPool.objects.filter(id=pool.id).update(results=results, updated_at=timezone.now())
+
+        assert _live_ranking(event)[0]["id"] == pool.fencer_ids[1]
+
+    def test_pool_added_by_another_process_rebuilds_stage(self, event, pool):
+        _live_ranking(event)
+
+        DjangoPool.objects.bulk_create(
+            [DjangoPool(event=event, stage_id="s1", pool_number=2, fencer_ids=["x", "y"], results=[["", "V"], ["3", ""]])]
+        )
+
+        assert _live_ranking(event)[0]["id"] == "x"
+
+    def test_new_pool_rebuilds_stage(self, event, pool, django_capture_on_commit_callbacks):
+        _live_ranking(event)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            DjangoPool.objects.create(event=event, stage_id="s1", pool_number=2, fencer_ids=["x", "y"], results=[["", "V"], ["3", ""]])
+
+        assert _live_ranking(event)[0]["id"] == "x"
+
+    def test_replicated_pool_changes_update_index(self, event, pool):
+        _live_ranking(event)
+        manager = SyncManager()
+        manager.register_model("pool", DjangoPool, PoolSerializer, last_modified_field="last_modified_at")
+        _enter_bout(pool, 1, 2, "V", "0")
+        change = manager.get_changes_since(DjangoSyncLog.objects.latest("id").id - 1).changes[0]
+        DjangoPool.objects.filter(id=pool.id).update(results=[["" for _ in range(3)] for _ in range(3)], version=0)
+        live_ranking_service.clear()
+        _live_ranking(event)
+
+        result = manager.apply_changes_batch([change], bulk=True)
+
+        assert result["success"] == 1
+        assert _live_ranking(event)[0]["id"] == pool.fencer_ids[1]
+
+    def test_match_result_updates_final_pool_rank(self, pool):
+        winner_id = pool.fencer_ids[1]
+
+        DjangoPoolAssignmentRepository().update_match_result(pool.id, winner_id, 5, 2, True)
+
+        assert DjangoPoolAssignment.objects.get(pool=pool, fencer_id=winner_id).final_pool_rank == 1
+
+    def test_unknown_event(self):
+        response = APIClient().get(f"/api/events/{uuid4()}/stages/s1/live-ranking/")
+
+        assert response.status_code == 404
@@ -0,0 +1,65 @@
+"""
+Integration tests for the server-side pool draw endpoint.
+"""
+
+from datetime import date
+from uuid import uuid4
+
+import pytest
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+
+from backend.apps.fencing_organizer.modules.event.models import DjangoEvent
+from backend.apps.fencing_organizer.modules.event_participant.models import DjangoEventParticipant
+from backend.apps.fencing_organizer.modules.fencer.models import DjangoFencer
+from backend.apps.fencing_organizer.modules.pool.models import DjangoPool
+from backend.apps.fencing_organizer.modules.tournament.models import DjangoTournament
+
+
+@pytest.fixture
+def api_client():
+    client = APIClient()
+    user = get_user_model().objects.create_user(username="organizer", password="testpass123", email="organizer@example.com")
+    client.force_authenticate(user=user)
+    return client
+
+
+@pytest.fixture
+def event():
+    tournament = DjangoTournament.objects.create(tournament_name="Draw Open", start_date=date(2025, 1, 1), end_date=date(2025, 1, 2))
+    event = DjangoEvent.objects.create(id=uuid4(), tournament=tournament, event_name="Epee")
+    countries = ["FRA", "FRA", "ITA", "FRA", "USA", "ITA", "HUN", "KOR", "FRA", "CHN", "GER", "ITA", "JPN", "USA"]
+    for rank, country in enumerate(countries, start=1):
+        fencer = DjangoFencer.objects.create(first_name=f"F{rank}", last_name="Draw", country_code=country)
+        DjangoEventParticipant.objects.create(event=event, fencer=fencer, seed_rank=rank)
+    return event
+
+
+@pytest.mark.django_db
+class TestPoolDrawApi:
+    def test_preview_is_deterministic(self, api_client, event):
+        url = f"/api/events/{event.id}/stages/s1/draw/"
+
+        first = api_client.get(url, {"seed": 9})
+        second = api_client.get(url, {"seed": 9})
+
+        assert first.status_code == 200
+        assert first.data == second.data
+        assert [len(pool) for pool in first.data["pools"]] == [7, 7]
+        assert first.data["collisions"] <= first.data["initial_collisions"]
+        assert not DjangoPool.objects.filter(event=event).exists()
+
+    def test_post_saves_pools_verifiable_from_seed(self, api_client, event):
+        url = f"/api/events/{event.id}/stages/s1/draw/"
+
+        response = api_client.post(url, {"seed": 4}, format="json")
+
+        assert response.status_code == 201
+        saved = [pool.fencer_ids for pool in DjangoPool.objects.filter(event=event, stage_id="s1").order_by("pool_number")]
+        assert saved == response.data["pools"]
+        assert api_client.get(url, {"seed": 4}).data["pools"] == saved
+
+    def test_invalid_seed(self, api_client, event):
+        response = api_client.get(f"/api/events/{event.id}/stages/s1/draw/", {"seed": "x"})
+
+        assert response.status_code == 400
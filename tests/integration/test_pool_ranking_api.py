@@ -0,0 +1,51 @@
+"""
+Integration tests for the stage pool ranking endpoint.
+"""
+
+from datetime import date
+from uuid import uuid4
+
+import pytest
+from rest_framework.test import APIClient
+
+from backend.apps.fencing_organizer.modules.event.models import DjangoEvent
+from backend.apps.fencing_organizer.modules.pool.models import DjangoPool
+from backend.apps.fencing_organizer.modules.tournament.models import DjangoTournament
+
+
+@pytest.fixture
+def event():
+    tournament = DjangoTournament.objects.create(tournament_name="Ranking Open", start_date=date(2025, 1, 1), end_date=date(2025, 1, 2))
+    return DjangoEvent.objects.create(id=uuid4(), tournament=tournament, event_name="Epee")
+
+
+@pytest.mark.django_db
+class TestStagePoolRanking:
+    def test_cross_pool_ranking(self, event):
+        DjangoPool.objects.create(event=event, stage_id="s1", pool_number=1, fencer_ids=["a", "b"], results=[["", "V"], ["3", ""]])
+        DjangoPool.objects.create(event=event, stage_id="s1", pool_number=2, fencer_ids=["c", "d"], results=[["", "1"], ["V", ""]])
+        DjangoPool.objects.create(event=event, stage_id="s2", pool_number=1, fencer_ids=["x", "y"], results=[["", "V"], ["0", ""]])
+
+        response = APIClient().get(f"/api/events/{event.id}/stages/s1/pool-ranking/")
+
+        assert response.status_code == 200
+        assert [(r["id"], r["rank"]) for r in response.data] == [("d", 1), ("a", 2), ("b", 3), ("c", 4)]
+        assert response.data[0] == {
+            "id": "d",
+            "pool_id": response.data[0]["pool_id"],
+            "pool_number": 2,
+            "v": 1,
+            "m": 1,
+            "v_m": 1.0,
+            "ts": 5,
+            "tr": 1,
+            "ind": 4,
+            "pool_rank": 1,
+            "rank": 1,
+            "is_tied": False,
+        }
+
+    def test_unknown_event(self):
+        response = APIClient().get(f"/api/events/{uuid4()}/stages/s1/pool-ranking/")
+
+        assert response.status_code == 404
@@ -0,0 +1,109 @@
+"""
+Integration tests for UPDATE coalescing in SyncTransaction.
+Verifies opted-in tables record one entry per hot record with its final
+state, within a transaction and across the configured window.
+"""
+
+from datetime import timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from django.utils import timezone
+
+from backend.apps.cluster.decorators.transaction import SyncTransaction
+from backend.apps.cluster.models import DjangoSyncLog
+from backend.apps.cluster.services.delta import is_delta
+
+NOTES = "unchanged " * 20
+
+
+def _row(record_id, version, status, score):
+    return {"id": record_id, "version": version, "status": status, "score": score, "notes": NOTES}
+
+
+def _update(sync_tx, record_id, version, status, score, previous):
+    data = _row(record_id, version, status, score)
+    sync_tx.record_update("event", SimpleNamespace(id=record_id, version=version), data=data, previous=previous)
+    return data
+
+
+def _coalesce(settings, window_ms):
+    settings.CLUSTER_CONFIG = {**settings.CLUSTER_CONFIG, "sync_coalesce_tables": {"event": window_ms}}
+
+
+def _entries(record_id):
+    return list(DjangoSyncLog.objects.filter(record_id=record_id).order_by("id"))
+
+
+@pytest.mark.django_db
+class TestSyncTransactionCoalescing:
+    def test_tables_not_opted_in_record_every_update(self):
+        record_id = str(uuid4())
+        with SyncTransaction() as sync_tx:
+            first = _update(sync_tx, record_id, 2, "B", 1, _row(record_id, 1, "A", 0))
+            _update(sync_tx, record_id, 3, "C", 2, first)
+
+        assert len(_entries(record_id)) == 2
+
+    def test_updates_in_one_transaction_collapse_to_final_state(self, settings):
+        _coalesce(settings, 0)
+        record_id, other_id = str(uuid4()), str(uuid4())
+        with SyncTransaction() as sync_tx:
+            first = _update(sync_tx, record_id, 2, "B", 1, _row(record_id, 1, "A", 0))
+            sync_tx.record("event", other_id, "INSERT", {"id": other_id})
+            second = _update(sync_tx, record_id, 3, "C", 1, first)
+            _update(sync_tx, record_id, 4, "A", 7, second)
+
+        (entry,) = _entries(record_id)
+        assert entry.version == 4
+        assert is_delta(entry.data)
+        assert entry.data["base_version"] == 1
+        assert entry.data["fields"] == {"version": 4, "score": 7}
+        assert sync_tx.sync_log_ids == [_entries(other_id)[0].id, entry.id]
+
+    def test_partial_updates_are_merged(self, settings):
+        _coalesce(settings, 0)
+        record_id = str(uuid4())
+        with SyncTransaction() as sync_tx:
+            sync_tx.record_update("event", SimpleNamespace(id=record_id, version=2), data={"status": "B"})
+            sync_tx.record_update("event", SimpleNamespace(id=record_id, version=3), data={"score": 4})
+
+        (entry,) = _entries(record_id)
+        assert entry.data == {"status": "B", "score": 4}
+
+    def test_delete_ends_coalescing(self, settings):
+        _coalesce(settings, 0)
+        record_id = str(uuid4())
+        with SyncTransaction() as sync_tx:
+            sync_tx.record_update("event", SimpleNamespace(id=record_id, version=2), data={"status": "B"})
+            sync_tx.record_delete("event", record_id)
+            sync_tx.record_update("event", SimpleNamespace(id=record_id, version=3), data={"score": 4})
+
+        assert [e.operation for e in _entries(record_id)] == ["UPDATE", "DELETE", "UPDATE"]
+
+    def test_window_replaces_recent_updates_with_full_row(self, settings):
+        _coalesce(settings, 500)
+        record_id = str(uuid4())
+        with SyncTransaction() as sync_tx:
+            sync_tx.record("event", record_id, "INSERT", _row(record_id, 1, "A", 0))
+        previous = _row(record_id, 1, "A", 0)
+        for version in range(2, 5):
+            with SyncTransaction() as sync_tx:
+                previous = _update(sync_tx, record_id, version, "B", version, previous)
+
+        insert, update = _entries(record_id)
+        assert insert.operation == "INSERT"
+        assert update.id == sync_tx.last_sync_id
+        assert update.data == _row(record_id, 4, "B", 4)
+
+    def test_updates_older_than_window_are_kept(self, settings):
+        _coalesce(settings, 500)
+        record_id = str(uuid4())
+        with SyncTransaction() as sync_tx:
+            _update(sync_tx, record_id, 2, "B", 1, _row(record_id, 1, "A", 0))
+        DjangoSyncLog.objects.filter(record_id=record_id).update(created_at=timezone.now() - timedelta(seconds=5))
+        with SyncTransaction() as sync_tx:
+            _update(sync_tx, record_id, 3, "C", 1, _row(record_id, 2, "B", 1))
+
+        assert len(_entries(record_id)) == 2
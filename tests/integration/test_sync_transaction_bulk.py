@@ -0,0 +1,107 @@
+"""
+Integration tests for SyncTransaction commit.
+Verifies queued records are flushed to sync_log with one bulk INSERT and that
+the assigned ids are exposed in order.
+"""
+
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from backend.apps.cluster.decorators.transaction import SyncTransaction
+from backend.apps.cluster.models import DjangoSyncLog
+from backend.apps.cluster.services.sync_manager import sync_manager
+
+
+def _record_many(sync_tx, count):
+    record_ids = [str(uuid4()) for _ in range(count)]
+    for record_id in record_ids:
+        sync_tx.record("fencer", record_id, "INSERT", {"first_name": record_id})
+    return record_ids
+
+
+@pytest.mark.django_db
+class TestSyncTransactionBulk:
+    def test_records_flushed_in_single_insert(self):
+        with CaptureQueriesContext(connection) as ctx:
+            with SyncTransaction() as sync_tx:
+                record_ids = _record_many(sync_tx, 20)
+
+        inserts = [q for q in ctx.captured_queries if q["sql"].startswith("INSERT") and "sync_log" in q["sql"]]
+        assert len(inserts) == 1
+        logs = list(DjangoSyncLog.objects.filter(id__in=sync_tx.sync_log_ids).order_by("id"))
+        assert [log.record_id for log in logs] == record_ids
+
+    def test_ids_are_exposed_in_order(self):
+        DjangoSyncLog.objects.create(table_name="fencer", record_id="old", operation="INSERT", data={})
+
+        with SyncTransaction() as sync_tx:
+            record_ids = _record_many(sync_tx, 3)
+
+        assert len(sync_tx.sync_log_ids) == 3
+        assert sync_tx.sync_log_ids == sorted(sync_tx.sync_log_ids)
+        assert sync_tx.last_sync_id == sync_tx.sync_log_ids[-1]
+        for sync_log_id, record_id in zip(sync_tx.sync_log_ids, record_ids):
+            assert DjangoSyncLog.objects.get(id=sync_log_id).record_id == record_id
+
+    def test_ids_recovered_without_returning_support(self):
+        with patch.object(type(connection.features), "can_return_rows_from_bulk_insert", False):
+            with CaptureQueriesContext(connection) as ctx:
+                with SyncTransaction() as sync_tx:
+                    record_ids = _record_many(sync_tx, 4)
+
+        # One INSERT per row, so no id has to be read back from the table
+        assert len([q for q in ctx.captured_queries if q["sql"].startswith("INSERT") and "sync_log" in q["sql"]]) == 4
+        assert sync_tx.last_sync_id == DjangoSyncLog.objects.latest("id").id
+        assert [DjangoSyncLog.objects.get(id=i).record_id for i in sync_tx.sync_log_ids] == record_ids
+
+    def test_nothing_recorded_leaves_ids_empty(self):
+        with SyncTransaction() as sync_tx:
+            pass
+
+        assert sync_tx.last_sync_id is None
+        assert sync_tx.sync_log_ids == []
+
+    def test_exception_discards_queued_records(self):
+        with pytest.raises(RuntimeError):
+            with SyncTransaction() as sync_tx:
+                _record_many(sync_tx, 2)
+                raise RuntimeError("boom")
+
+        assert sync_tx.last_sync_id is None
+        assert not DjangoSyncLog.objects.exists()
+
+    def test_invalid_operation_is_logged_not_raised(self):
+        with SyncTransaction() as sync_tx:
+            sync_tx.record("fencer", "x", "UPSERT", {})
+
+        assert sync_tx.last_sync_id is None
+        assert not DjangoSyncLog.objects.exists()
+
+    def test_invalid_record_does_not_discard_the_batch(self):
+        with SyncTransaction() as sync_tx:
+            sync_tx.record("fencer", "a", "INSERT", {})
+            sync_tx.record("fencer", "x", "UPSERT", {})
+            sync_tx.record("fencer", "b", "UPDATE", {})
+
+        assert [DjangoSyncLog.objects.get(id=i).record_id for i in sync_tx.sync_log_ids] == ["a", "b"]
+
+    def test_failed_bulk_insert_records_changes_one_by_one(self):
+        with patch.object(DjangoSyncLog.objects, "bulk_create", side_effect=RuntimeError("boom")):
+            with SyncTransaction() as sync_tx:
+                record_ids = _record_many(sync_tx, 3)
+
+        assert [DjangoSyncLog.objects.get(id=i).record_id for i in sync_tx.sync_log_ids] == record_ids
+
+    def test_record_changes_validates_every_record_first(self):
+        records = [
+            {"table_name": "fencer", "record_id": "a", "operation": "INSERT", "data": {}},
+            {"table_name": "fencer", "record_id": "b", "operation": "INSERT", "data": {"when": object()}},
+        ]
+
+        with pytest.raises(ValueError, match="not JSON serializable"):
+            sync_manager.record_changes(records)
+        assert not DjangoSyncLog.objects.exists()
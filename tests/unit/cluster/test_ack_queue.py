@@ -1,5 +1,6 @@
-"""Unit tests for AckQueue and PendingAck — threading.Event based."""
+"""Unit tests for AckQueue and PendingAck — threading.Event and asyncio future waiters."""
 
+import asyncio
 import threading
 import time
 import pytest
@@ -204,3 +205,117 @@ class TestAckQueue:
 
         confirmed = event.wait(timeout=1.0)
         assert confirmed
+
+
+class TestAckQueueAsync:
+    async def test_ack_from_another_thread_resolves_future(self):
+        queue = AckQueue()
+        queue.set_nodes_required(1)
+
+        threading.Timer(0.05, queue.acknowledge, args=(1, "node_a")).start()
+
+        assert await queue.wait_async(1, timeout=2) is True
+        assert queue.get_pending_count() == 0
+
+    async def test_wait_times_out_without_acks(self):
+        queue = AckQueue()
+        queue.set_nodes_required(1)
+
+        assert await queue.wait_async(1, timeout=0.05) is False
+        assert queue._pending[1].futures == []
+
+    async def test_waits_do_not_block_each_other(self):
+        queue = AckQueue()
+        queue.set_nodes_required(1)
+
+        def ack_all():
+            for sync_log_id in range(1, 51):
+                queue.acknowledge(sync_log_id, "node_a")
+
+        threading.Timer(0.1, ack_all).start()
+        started = time.monotonic()
+        results = await asyncio.gather(*(queue.wait_async(i, timeout=2) for i in range(1, 51)))
+
+        assert all(results)
+        assert time.monotonic() - started < 1
+
+    async def test_sync_and_async_waiters_share_one_entry(self):
+        queue = AckQueue()
+        queue.set_nodes_required(1)
+        event = queue.register(1, 1)
+
+        threading.Timer(0.05, queue.acknowledge, args=(1, "node_a")).start()
+
+        assert await queue.wait_async(1, timeout=2) is True
+        assert event.is_set()
+
+
+class TestAckQueueWatermark:
+    def test_batch_ack_releases_every_earlier_write(self):
+        queue = AckQueue()
+        queue.set_nodes_required(1)
+        events = {i: queue.register(i) for i in (3, 5, 8, 12)}
+
+        assert queue.acknowledge(8, "node_a") is True
+
+        assert [i for i, event in events.items() if event.is_set()] == [3, 5, 8]
+        assert queue.get_pending_ids() == [12]
+        assert queue.is_confirmed(5)
+        assert not queue.is_confirmed(12)
+
+    def test_group_watermark_needs_required_nodes(self):
+        queue = AckQueue()
+        queue.set_nodes_required(2)
+        first, second = queue.register(4), queue.register(9)
+
+        queue.acknowledge(9, "node_a")
+        assert not first.is_set()
+        assert queue.get_confirmed_nodes(4) == ["node_a"]
+
+        queue.acknowledge(5, "node_b")
+        assert first.is_set()
+        assert not second.is_set()
+
+        queue.acknowledge(10, "node_b")
+        assert second.is_set()
+
+    def test_watermark_never_moves_back(self):
+        queue = AckQueue()
+        queue.set_nodes_required(1)
+        queue.acknowledge(20, "node_a")
+        queue.acknowledge(7, "node_a")
+
+        assert queue.get_watermarks() == {"node_a": 20}
+
+    def test_register_after_ack_is_confirmed_immediately(self):
+        queue = AckQueue()
+        queue.set_nodes_required(1)
+        queue.acknowledge(6, "node_a")
+
+        event = queue.register(6)
+
+        assert event.is_set()
+        assert queue.get_pending_count() == 0
+
+    def test_lowering_required_nodes_releases_writes(self):
+        queue = AckQueue()
+        queue.set_nodes_required(2)
+        event = queue.register(3)
+        queue.acknowledge(3, "node_a")
+        assert not event.is_set()
+
+        queue.set_nodes_required(1)
+
+        assert event.is_set()
+
+    async def test_concurrent_writers_released_together(self):
+        queue = AckQueue()
+        queue.set_nodes_required(1)
+
+        threading.Timer(0.05, queue.acknowledge, args=(30, "node_a")).start()
+        started = time.monotonic()
+        results = await asyncio.gather(*(queue.wait_async(i, timeout=2) for i in range(1, 31)))
+
+        assert all(results)
+        assert time.monotonic() - started < 1
+        assert queue.get_pending_count() == 0
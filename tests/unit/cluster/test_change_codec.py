@@ -0,0 +1,60 @@
+"""Tests for the compact /sync/changes/ wire format."""
+
+import gzip
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from backend.apps.cluster.services import change_codec
+
+
+def _rows(*ids):
+    created = datetime(2025, 1, 1, 10, 0, 0, 123456, tzinfo=timezone.utc)
+    return [(i, "tournament", f"t{i}", "UPDATE", json.dumps({"n": i, "name": "Épée"}), 2, created) for i in ids]
+
+
+def _encode(rows, limit=10, since_id=0):
+    return [line.encode() for line in change_codec.encode_changes(rows, limit, since_id)]
+
+
+class TestCompactChanges:
+    def test_round_trip(self):
+        page = change_codec.decode_changes(_encode(_rows(3, 4)))
+
+        assert page["last_id"] == 4
+        assert page["has_more"] is False
+        first = page["changes"][0]
+        assert (first.id, first.table_name, first.record_id, first.operation, first.version) == (3, "tournament", "t3", "UPDATE", 2)
+        assert first.data == {"n": 3, "name": "Épée"}
+        assert first.created_at == "2025-01-01T10:00:00.123456+00:00"
+
+    def test_extra_row_sets_has_more_and_is_not_sent(self):
+        page = change_codec.decode_changes(_encode(_rows(3, 4, 5), limit=2))
+
+        assert [c.id for c in page["changes"]] == [3, 4]
+        assert page["last_id"] == 4
+        assert page["has_more"] is True
+
+    def test_empty_page_keeps_since_id(self):
+        page = change_codec.decode_changes(_encode([], since_id=7))
+        assert page == {"changes": [], "last_id": 7, "has_more": False}
+
+    def test_truncated_stream_is_rejected(self):
+        with pytest.raises(ValueError):
+            change_codec.decode_changes(_encode(_rows(3, 4))[:-1])
+
+    def test_unknown_format_is_rejected(self):
+        with pytest.raises(ValueError):
+            change_codec.decode_changes([b'{"format": "changes/99", "fields": []}'])
+
+    def test_gzip_stream_decodes_to_the_same_lines(self):
+        lines = list(change_codec.encode_changes(_rows(*range(1, 251)), 500, 0))
+        body = b"".join(change_codec.gzip_lines(iter(lines), flush_rows=100))
+
+        assert gzip.decompress(body).decode() == "".join(lines)
+        assert len(body) < len("".join(lines).encode())
+
+    def test_content_type_negotiation(self):
+        assert change_codec.is_compact("application/x-ndjson; charset=utf-8")
+        assert not change_codec.is_compact("application/json")
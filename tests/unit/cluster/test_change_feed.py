@@ -0,0 +1,50 @@
+"""Tests for ChangeFeed — long-poll wake-ups on committed sync_log entries."""
+
+import threading
+import time
+
+from backend.apps.cluster.services.change_feed import ChangeFeed
+
+
+class TestChangeFeed:
+    def test_returns_immediately_when_newer_entry_exists(self):
+        feed = ChangeFeed(latest_id_loader=lambda: 0)
+        feed.publish(5)
+
+        started = time.monotonic()
+        assert feed.wait_for(4, timeout=5) is True
+        assert time.monotonic() - started < 0.5
+
+    def test_times_out_without_new_entries(self):
+        feed = ChangeFeed(recheck_interval=0.02, latest_id_loader=lambda: 3)
+
+        assert feed.wait_for(3, timeout=0.1) is False
+
+    def test_publish_wakes_waiter(self):
+        feed = ChangeFeed(recheck_interval=10, latest_id_loader=lambda: 0)
+        threading.Timer(0.05, feed.publish, args=(1,)).start()
+
+        started = time.monotonic()
+        assert feed.wait_for(0, timeout=5) is True
+        assert time.monotonic() - started < 1
+
+    def test_recheck_sees_entries_from_other_processes(self):
+        latest = {"id": 0}
+        feed = ChangeFeed(recheck_interval=0.02, latest_id_loader=lambda: latest["id"])
+        threading.Timer(0.05, latest.update, kwargs={"id": 2}).start()
+
+        assert feed.wait_for(0, timeout=5) is True
+        assert feed.latest_id == 2
+
+    def test_publish_never_moves_backwards(self):
+        feed = ChangeFeed(latest_id_loader=lambda: 0)
+        feed.publish(9)
+        feed.publish(4)
+
+        assert feed.latest_id == 9
+
+    def test_recheck_interval_comes_from_settings(self, settings):
+        settings.CLUSTER_CONFIG = {**settings.CLUSTER_CONFIG, "sync_long_poll_recheck_interval": 0.25}
+
+        assert ChangeFeed(latest_id_loader=lambda: 0).recheck_interval == 0.25
+        assert ChangeFeed(recheck_interval=2, latest_id_loader=lambda: 0).recheck_interval == 2
@@ -0,0 +1,64 @@
+"""Tests for the process-wide DjangoClusterConfig cache."""
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from backend.apps.cluster.models import DjangoClusterConfig
+from backend.apps.cluster.services.config_cache import ClusterConfigCache, cluster_config_cache, get_cluster_config
+
+
+@pytest.mark.django_db
+class TestClusterConfigCache:
+    def test_repeated_reads_hit_database_once(self):
+        DjangoClusterConfig.get_config()
+        cache = ClusterConfigCache(ttl=60)
+
+        with CaptureQueriesContext(connection) as ctx:
+            first = cache.get()
+            for _ in range(10):
+                assert cache.get() is first
+
+        assert len(ctx.captured_queries) == 1
+
+    def test_post_save_refreshes_shared_cache(self):
+        assert get_cluster_config().mode == "single"
+
+        config = DjangoClusterConfig.get_config()
+        config.mode = "cluster"
+        config.is_master = True
+        config.save()
+
+        with CaptureQueriesContext(connection) as ctx:
+            cached = get_cluster_config()
+
+        assert cached.mode == "cluster"
+        assert cached.is_master is True
+        assert cached is not config
+        assert len(ctx.captured_queries) == 0
+
+    def test_ttl_expiry_reloads_after_signal_bypass(self):
+        cache = ClusterConfigCache(ttl=5)
+        assert cache.get().mode == "single"
+
+        DjangoClusterConfig.objects.filter(singleton_id=1).update(mode="cluster")
+
+        assert cache.get().mode == "single"
+        cache._loaded_at -= 6
+        assert cache.get().mode == "cluster"
+
+    def test_invalidate_forces_reload(self):
+        get_cluster_config()
+        DjangoClusterConfig.objects.filter(singleton_id=1).update(node_id="node_x")
+
+        cluster_config_cache.invalidate()
+
+        assert get_cluster_config().node_id == "node_x"
+
+    def test_middleware_requests_do_not_query_config(self, client):
+        get_cluster_config()
+
+        with CaptureQueriesContext(connection) as ctx:
+            client.get("/api/cluster/health/")
+
+        assert not [q for q in ctx.captured_queries if "cluster_config" in q["sql"]]
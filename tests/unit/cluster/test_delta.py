@@ -0,0 +1,106 @@
+"""Tests for field-level delta payloads recorded in sync_log."""
+
+from types import SimpleNamespace
+
+from backend.apps.cluster.services.delta import (
+    compute_delta,
+    fingerprint,
+    is_delta,
+    json_diff,
+    json_patch,
+    resolve_delta,
+)
+
+
+def _bracket(rounds=6, size=64):
+    return {"stage_1": [[{"a": f"f{i}", "b": f"g{i}", "score_a": 0, "score_b": 0} for i in range(size >> r)] for r in range(rounds)]}
+
+
+class TestJsonDiff:
+    def test_identical_documents_produce_no_ops(self):
+        assert json_diff({"a": [1, 2]}, {"a": [1, 2]}) == []
+
+    def test_single_cell_edit_is_single_replace(self):
+        old = _bracket()
+        new = _bracket()
+        new["stage_1"][0][3]["score_a"] = 15
+
+        ops = json_diff(old, new)
+
+        assert ops == [{"op": "replace", "path": "/stage_1/0/3/score_a", "value": 15}]
+
+    def test_roundtrip_with_adds_and_removes(self):
+        old = {"a": [1, 2, 3], "b": {"x": 1}, "gone": True, "we/ird~key": 1}
+        new = {"a": [1, 5], "b": {"x": 1, "y": [2]}, "new": None, "we/ird~key": 2}
+
+        assert json_patch(old, json_diff(old, new)) == new
+
+    def test_type_change_replaces_value(self):
+        assert json_diff({"a": 1}, {"a": True}) == [{"op": "replace", "path": "/a", "value": True}]
+
+    def test_patch_does_not_mutate_input(self):
+        old = {"a": [1]}
+        json_patch(old, [{"op": "add", "path": "/a/1", "value": 2}])
+        assert old == {"a": [1]}
+
+
+class TestComputeDelta:
+    def test_only_changed_columns_are_recorded(self):
+        previous = {"event_name": "Foil", "status": "REGISTRATION", "de_trees": _bracket(), "version": 1}
+        current = dict(previous, status="ONGOING")
+
+        delta = compute_delta(previous, current, json_fields={"de_trees"}, base_version=1)
+
+        assert is_delta(delta)
+        assert delta["fields"] == {"status": "ONGOING"}
+        assert delta["patches"] == {}
+
+    def test_json_column_stored_as_patch(self):
+        previous = {"event_name": "Foil", "de_trees": _bracket()}
+        current = {"event_name": "Foil", "de_trees": _bracket()}
+        current["de_trees"]["stage_1"][2][1]["score_b"] = 10
+
+        delta = compute_delta(previous, current, json_fields={"de_trees"})
+
+        assert delta["fields"] == {}
+        assert len(delta["patches"]["de_trees"]) == 1
+        assert delta["base"] == fingerprint({"de_trees": previous["de_trees"]})
+
+    def test_delta_is_much_smaller_than_snapshot(self):
+        import json
+
+        previous = {"de_trees": _bracket(), "live_ranking": list(range(200))}
+        current = {"de_trees": _bracket(), "live_ranking": list(range(200))}
+        current["de_trees"]["stage_1"][0][0]["score_a"] = 5
+
+        delta = compute_delta(previous, current, json_fields={"de_trees", "live_ranking"})
+
+        assert len(json.dumps(delta)) * 10 < len(json.dumps(current))
+
+    def test_returns_none_when_not_smaller(self):
+        assert compute_delta({"a": 1}, {"a": 2}) is None
+
+
+class TestResolveDelta:
+    def test_resolves_against_matching_base(self):
+        previous = {"status": "REGISTRATION", "de_trees": _bracket()}
+        current = {"status": "ONGOING", "de_trees": _bracket()}
+        current["de_trees"]["stage_1"][1][0]["score_a"] = 15
+        delta = compute_delta(previous, current, json_fields={"de_trees"})
+
+        record = SimpleNamespace(pk="e1", status="REGISTRATION", de_trees=_bracket())
+        resolved = resolve_delta(delta, record)
+
+        assert resolved == {"status": "ONGOING", "de_trees": current["de_trees"]}
+
+    def test_base_mismatch_returns_none(self):
+        previous = {"de_trees": _bracket()}
+        current = {"de_trees": _bracket()}
+        current["de_trees"]["stage_1"][0][0]["score_a"] = 3
+        delta = compute_delta(previous, current, json_fields={"de_trees"})
+
+        diverged = _bracket()
+        diverged["stage_1"][0][5]["score_b"] = 9
+        record = SimpleNamespace(pk="e1", de_trees=diverged)
+
+        assert resolve_delta(delta, record) is None
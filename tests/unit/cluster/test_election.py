@@ -4,13 +4,16 @@ Tests cover election states, master/follower transitions, and edge cases.
 """
 
 import asyncio
+import time
 import pytest
 from unittest.mock import MagicMock
 from typing import Optional
 
+from backend.apps.cluster.models import DjangoClusterConfig, DjangoSyncLog
 from backend.apps.cluster.services.election import BullyElection, ElectionState
-from backend.apps.cluster.services.node_discovery import NodeInfo
-from backend.apps.cluster.schemas.messages import MasterAnnounceMessage
+from backend.apps.cluster.services.node_discovery import NodeDiscovery, NodeInfo
+from backend.apps.cluster.services.sync_manager import sync_manager
+from backend.apps.cluster.schemas.messages import ElectionMessage, HeartbeatMessage, MasterAnnounceMessage
 
 
 class MockUDPService:
@@ -29,6 +32,9 @@ class MockUDPService:
     async def broadcast_async(self, msg):
         self.broadcast_calls.append(msg)
 
+    async def broadcast_many_async(self, msgs):
+        self.broadcast_calls.extend(msgs)
+
     def start(self):
         pass
 
@@ -140,8 +146,9 @@ class TestBullyElection:
 
         assert election.state == ElectionState.MASTER
         assert election.is_master()
-        assert len(mock_udp_service.broadcast_calls) == 1
+        assert len(mock_udp_service.broadcast_calls) == 2
         assert isinstance(mock_udp_service.broadcast_calls[0], MasterAnnounceMessage)
+        assert isinstance(mock_udp_service.broadcast_calls[1], HeartbeatMessage)
 
     async def test_existing_master_becomes_follower(self, mock_udp_service):
         node_discovery = MockNodeDiscovery(node_id="node_b")
@@ -320,12 +327,14 @@ class TestBullyElection:
 
         await election._become_master()
 
-        assert len(mock_udp_service.broadcast_calls) == 1
-        msg = mock_udp_service.broadcast_calls[0]
+        assert len(mock_udp_service.broadcast_calls) == 2
+        msg, heartbeat = mock_udp_service.broadcast_calls
         assert isinstance(msg, MasterAnnounceMessage)
         assert msg.node_id == "node_001"
         assert msg.ip == mock_udp_service.local_ip
         assert msg.port == 8000
+        assert isinstance(heartbeat, HeartbeatMessage)
+        assert heartbeat.node_id == "node_001"
 
     def test_become_follower_updates_state(self, mock_udp_service):
         node_discovery = MockNodeDiscovery(node_id="node_b")
@@ -400,3 +409,172 @@ class TestBullyElection:
         await asyncio.sleep(0.4)
 
         assert election.state == ElectionState.MASTER
+
+
+class TestFastFailover:
+    def _election(self, node_id, peers, udp_service):
+        node_discovery = MockNodeDiscovery(node_id=node_id)
+        node_discovery.state.peers = peers
+        heartbeat_monitor = MockHeartbeatMonitor()
+        return BullyElection(node_discovery=node_discovery, heartbeat_monitor=heartbeat_monitor, udp_service=udp_service)
+
+    async def test_failed_master_is_not_waited_for(self, mock_udp_service):
+        dead_master = NodeInfo("node_z", "192.168.1.103", 8000, 1000.0, True)
+        election = self._election(
+            "node_b", {"node_a": NodeInfo("node_a", "192.168.1.101", 8000, 1000.0, False), "node_z": dead_master}, mock_udp_service
+        )
+        election.node_discovery.state.master_id = "node_z"
+        election.heartbeat_monitor.master_id = "node_z"
+
+        await election._on_master_failure()
+        await asyncio.wait_for(election._election_task, timeout=1.0)
+
+        assert election.state == ElectionState.MASTER
+        assert election.last_failover_seconds is not None
+        assert election.last_failover_seconds < 1.0
+
+    async def test_waits_for_live_higher_peer_and_follows_it(self, mock_udp_service):
+        dead_master = NodeInfo("node_z", "192.168.1.103", 8000, 1000.0, True)
+        election = self._election(
+            "node_a", {"node_b": NodeInfo("node_b", "192.168.1.102", 8000, 1000.0, False), "node_z": dead_master}, mock_udp_service
+        )
+        election.node_discovery.state.master_id = "node_z"
+        election.heartbeat_monitor.master_id = "node_z"
+        election.ELECTION_TIMEOUT = 5.0
+
+        await election._on_master_failure()
+        await asyncio.sleep(0.05)
+        # The dead master is still listed as master, but is not followed
+        assert election.state == ElectionState.ELECTING
+
+        election.node_discovery.state.peers["node_b"].is_master = True
+        election.node_discovery.state.master_id = "node_b"
+        await asyncio.wait_for(election._election_task, timeout=1.0)
+
+        assert election.state == ElectionState.FOLLOWER
+        assert election.heartbeat_monitor.master_id == "node_b"
+
+
+class TestDataAwareElection:
+    def _election(self, node_id, peers, udp_service, last_sync_id=0):
+        node_discovery = MockNodeDiscovery(node_id=node_id)
+        node_discovery.state.peers = peers
+        return BullyElection(
+            node_discovery=node_discovery,
+            heartbeat_monitor=MockHeartbeatMonitor(),
+            udp_service=udp_service,
+            get_last_sync_id=lambda: last_sync_id,
+        )
+
+    async def test_up_to_date_node_beats_higher_node_id(self, mock_udp_service):
+        laptop = NodeInfo("node_z", "192.168.1.103", 8000, 1000.0, False, last_sync_id=0)
+        election = self._election("node_a", {"node_z": laptop}, mock_udp_service, last_sync_id=500)
+
+        await election.trigger_election()
+        await asyncio.wait_for(election._election_task, timeout=1.0)
+
+        assert election.state == ElectionState.MASTER
+        candidacy = mock_udp_service.broadcast_calls[0]
+        assert isinstance(candidacy, ElectionMessage)
+        assert (candidacy.node_id, candidacy.last_sync_id) == ("node_a", 500)
+
+    async def test_node_behind_waits_for_up_to_date_peer(self, mock_udp_service):
+        peer = NodeInfo("node_a", "192.168.1.101", 8000, 1000.0, False, last_sync_id=500)
+        election = self._election("node_z", {"node_a": peer}, mock_udp_service, last_sync_id=0)
+        election.ELECTION_TIMEOUT = 5.0
+
+        await election.trigger_election()
+        await asyncio.sleep(election.CANDIDACY_WAIT + 0.1)
+        assert election.state == ElectionState.ELECTING
+
+        peer.is_master = True
+        election.node_discovery.state.master_id = "node_a"
+        await asyncio.wait_for(election._election_task, timeout=1.0)
+
+        assert election.state == ElectionState.FOLLOWER
+
+    async def test_node_id_breaks_ties(self, mock_udp_service):
+        peer = NodeInfo("node_a", "192.168.1.101", 8000, 1000.0, False, last_sync_id=500)
+        election = self._election("node_b", {"node_a": peer}, mock_udp_service, last_sync_id=500)
+
+        await election.trigger_election()
+        await asyncio.wait_for(election._election_task, timeout=1.0)
+
+        assert election.state == ElectionState.MASTER
+
+    async def test_outranking_follower_joins_election(self, mock_udp_service):
+        election = self._election("node_a", {}, mock_udp_service, last_sync_id=500)
+
+        election._on_candidacy(ElectionMessage(node_id="node_z", last_sync_id=10))
+        await asyncio.sleep(0.05)
+
+        assert election.state == ElectionState.MASTER
+
+    async def test_outranked_follower_stays_out(self, mock_udp_service):
+        election = self._election("node_a", {}, mock_udp_service, last_sync_id=5)
+
+        election._on_candidacy(ElectionMessage(node_id="node_z", last_sync_id=10))
+        await asyncio.sleep(0.05)
+
+        assert election.state == ElectionState.FOLLOWER
+        assert mock_udp_service.broadcast_calls == []
+
+    async def test_master_reannounces_on_candidacy(self, mock_udp_service):
+        election = self._election("node_a", {}, mock_udp_service, last_sync_id=5)
+        election.state = ElectionState.MASTER
+
+        election._on_candidacy(ElectionMessage(node_id="node_z", last_sync_id=10))
+        await asyncio.sleep(0.05)
+
+        announce, heartbeat = mock_udp_service.broadcast_calls[-2:]
+        assert isinstance(announce, MasterAnnounceMessage)
+        assert isinstance(heartbeat, HeartbeatMessage)
+        assert heartbeat.last_sync_id == 5
+
+    def test_discovery_records_candidacy_rank(self):
+        udp_service = MagicMock()
+        discovery = NodeDiscovery(udp_service=udp_service)
+        received = []
+        discovery.on_election = received.append
+
+        discovery._handle_message(ElectionMessage(node_id="node_q", last_sync_id=42, port=8001), "192.168.1.50")
+
+        peer = discovery.state.peers["node_q"]
+        assert (peer.ip, peer.port, peer.last_sync_id) == ("192.168.1.50", 8001, 42)
+        assert received[0].node_id == "node_q"
+
+    async def test_suspected_master_that_reannounces_is_followed(self, mock_udp_service):
+        master = NodeInfo("node_z", "192.168.1.103", 8000, 1000.0, True, last_sync_id=900)
+        other = NodeInfo("node_0", "192.168.1.100", 8000, 1000.0, False)
+        election = self._election("node_a", {"node_z": master, "node_0": other}, mock_udp_service, last_sync_id=500)
+        election.node_discovery.state.master_id = "node_z"
+        election.heartbeat_monitor.master_id = "node_z"
+
+        await election._on_master_failure()
+        master.last_seen = time.time() + 1
+        await asyncio.wait_for(election._election_task, timeout=1.0)
+
+        assert election.state == ElectionState.FOLLOWER
+        assert election.heartbeat_monitor.master_id == "node_z"
+
+
+@pytest.mark.django_db
+class TestAppliedSyncId:
+    def _configure(self, **fields):
+        config = DjangoClusterConfig.get_config()
+        for name, value in fields.items():
+            setattr(config, name, value)
+        config.save()
+
+    def test_master_reports_latest_log_entry(self):
+        self._configure(mode="cluster", is_master=True, node_id="node_a")
+        latest = DjangoSyncLog.objects.create(table_name="tournament", record_id="t1", operation="INSERT", data={})
+
+        assert sync_manager.get_applied_sync_id() == latest.id
+
+    def test_follower_reports_last_applied_change(self):
+        self._configure(mode="cluster", is_master=False, node_id="node_b")
+        DjangoSyncLog.objects.create(table_name="tournament", record_id="t1", operation="INSERT", data={})
+        sync_manager.update_sync_state("node_b", 7)
+
+        assert sync_manager.get_applied_sync_id() == 7
@@ -0,0 +1,147 @@
+"""Tests for the phi-accrual failure detector and its use in HeartbeatMonitor."""
+
+import asyncio
+import time
+
+from backend.apps.cluster.services.failure_detector import PhiAccrualFailureDetector
+from backend.apps.cluster.services.heartbeat import HeartbeatMonitor
+
+
+def _detector_with_history(intervals, expected_interval=1.0, **kwargs):
+    detector = PhiAccrualFailureDetector(expected_interval=expected_interval, **kwargs)
+    now = 0.0
+    detector.heartbeat(now)
+    for interval in intervals:
+        now += interval
+        detector.heartbeat(now)
+    return detector, now
+
+
+def _suspected_after(detector, last):
+    """Seconds of silence after ``last`` until the detector suspects the sender."""
+    silence = 0.0
+    while detector.is_available(last + silence):
+        silence += 0.01
+    return silence
+
+
+class TestPhiAccrualFailureDetector:
+    def test_no_heartbeat_no_suspicion(self):
+        assert PhiAccrualFailureDetector(expected_interval=1.0).phi(now=100.0) == 0.0
+
+    def test_phi_grows_with_silence(self):
+        detector, last = _detector_with_history([1.0] * 20)
+
+        values = [detector.phi(last + t) for t in (0.5, 1.0, 1.5, 2.5)]
+
+        assert values == sorted(values)
+        assert values[0] < 1.0
+        assert values[-1] > detector.threshold
+
+    def test_steady_lan_heartbeats_are_suspected_within_seconds(self):
+        detector, last = _detector_with_history([1.0, 1.01, 0.99] * 10)
+
+        assert 1.0 < _suspected_after(detector, last) < 2.5
+
+    def test_jitter_delays_suspicion(self):
+        steady, steady_last = _detector_with_history([1.0] * 30)
+        lossy, lossy_last = _detector_with_history([1.0, 1.0, 2.0, 0.6, 1.4] * 6)
+
+        assert _suspected_after(lossy, lossy_last) > _suspected_after(steady, steady_last) + 1.0
+
+    def test_bootstrap_uses_expected_interval(self):
+        detector, last = _detector_with_history([], expected_interval=1.0)
+
+        assert detector.stats()["mean_interval"] == 1.0
+        assert detector.is_available(last + 2.0)
+        assert not detector.is_available(last + 10.0)
+
+    def test_reset_forgets_history(self):
+        detector, _ = _detector_with_history([1.0] * 5)
+
+        detector.reset()
+
+        assert detector.last_arrival is None
+        assert detector.stats()["samples"] == 0
+
+
+class TestHeartbeatMonitorDetection:
+    def _follower(self, **kwargs):
+        monitor = HeartbeatMonitor(node_id="node_a", udp_service=None, **kwargs)
+        monitor.set_master(False, "node_z")
+        return monitor
+
+    def test_new_master_gets_grace_period(self):
+        monitor = self._follower()
+
+        assert monitor.check_timeout() is False
+
+    def test_silent_master_is_suspected_by_phi_before_hard_timeout(self):
+        monitor = self._follower()
+        start = monitor.detector.last_arrival
+        for i in range(1, 11):
+            monitor.detector.heartbeat(start + i * 1.2)
+        # Silence of 3 intervals: far below HEARTBEAT_TIMEOUT, well above phi threshold
+        monitor.detector._last_arrival = time.monotonic() - 3.6
+        monitor.last_heartbeat_time = time.time() - 3.6
+
+        assert monitor.check_timeout() is True
+        assert monitor.detections == 1
+        assert 3.5 < monitor.last_detection_latency < 4.0
+        assert monitor.stats()["detector"]["phi"] >= monitor.detector.threshold
+
+    def test_heartbeat_clears_suspicion(self):
+        monitor = self._follower()
+        monitor.last_heartbeat_time = 0
+        assert monitor.check_timeout() is True
+
+        monitor.record_heartbeat("node_z")
+
+        assert monitor.check_timeout() is False
+
+    def test_master_change_resets_detector(self):
+        monitor = self._follower()
+        monitor.record_heartbeat("node_z")
+        monitor.record_heartbeat("node_z")
+
+        monitor.record_heartbeat("node_y")
+
+        assert monitor.master_id == "node_y"
+        assert monitor.detector.stats()["samples"] == 0
+
+    async def test_monitor_loop_awaits_election_once(self):
+        calls = []
+
+        async def on_timeout():
+            calls.append(time.monotonic())
+
+        monitor = self._follower(on_timeout=on_timeout)
+        monitor.MONITOR_INTERVAL = 0.01
+        monitor.last_heartbeat_time = 0
+
+        await monitor.start()
+        await asyncio.sleep(0.1)
+        monitor.stop()
+
+        assert len(calls) == 1
+
+
+class TestHeartbeatSending:
+    async def test_master_sends_one_heartbeat_per_interval(self, settings):
+        settings.CLUSTER_CONFIG = {**settings.CLUSTER_CONFIG, "heartbeat_interval": 0.05}
+        sent = []
+
+        class CountingUDPService:
+            async def broadcast_async(self, message):
+                sent.append(time.monotonic())
+
+        monitor = HeartbeatMonitor(node_id="node_a", udp_service=CountingUDPService())
+        monitor.set_master(True)
+
+        await monitor.start()
+        await asyncio.sleep(0.22)
+        monitor.stop()
+
+        assert 4 <= len(sent) <= 6
+        assert all(later - earlier > 0.03 for earlier, later in zip(sent, sent[1:]))
+        assert monitor.detector.expected_interval == 0.05
@@ -0,0 +1,101 @@
+"""Tests for ClusterHttpClient — shared pooled session for node-to-node calls."""
+
+import gzip
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.test import RequestFactory, override_settings
+
+from backend.apps.cluster.middleware.gzip import ClusterGzipMiddleware
+from backend.apps.cluster.services.http_client import ClusterHttpClient
+from backend.apps.cluster.services.proxy import FollowerProxy, MasterProxy
+
+
+class TestClusterHttpClient:
+    def test_session_is_shared_and_pooled(self):
+        client = ClusterHttpClient(pool_connections=2, pool_maxsize=7)
+
+        assert client.session is client.session
+        adapter = client.session.get_adapter("http://master:8000/")
+        assert adapter._pool_maxsize == 7
+        assert client.session.headers["Connection"] == "keep-alive"
+
+    def test_endpoint_timeouts(self):
+        client = ClusterHttpClient(timeouts={"ack": 2})
+
+        with patch("requests.Session.request") as request:
+            client.post("http://master:8000/api/cluster/sync/ack/", json={}, endpoint="ack")
+            client.get("http://master:8000/api/cluster/sync/changes/", endpoint="changes", timeout=40)
+
+        assert request.call_args_list[0].kwargs["timeout"] == 2
+        assert request.call_args_list[1].kwargs["timeout"] == 40
+
+    def test_large_json_bodies_are_gzipped(self):
+        client = ClusterHttpClient(gzip_requests=True, gzip_min_bytes=100)
+        payload = {"changes": ["x" * 50] * 10}
+
+        with patch("requests.Session.request") as request:
+            client.post("http://master:8000/api/cluster/sync/apply/", json=payload)
+            client.post("http://master:8000/api/cluster/sync/ack/", json={"sync_id": 1})
+
+        large, small = request.call_args_list
+        assert large.kwargs["headers"]["Content-Encoding"] == "gzip"
+        assert json.loads(gzip.decompress(large.kwargs["data"])) == payload
+        assert small.kwargs["json"] == {"sync_id": 1}
+
+    def test_stats_report_connection_reuse(self):
+        client = ClusterHttpClient()
+        client.session
+        pool = MagicMock(scheme="http", host="master", port=8000, num_requests=5, num_connections=1)
+        pool.pool.qsize.return_value = 1
+        client._adapter.poolmanager.pools = {"key": pool}
+
+        stats = client.stats()
+
+        assert stats["requests"] == 5
+        assert stats["connections_opened"] == 1
+        assert stats["connections_reused"] == 4
+        assert stats["hosts"][0]["host"] == "http://master:8000"
+
+    def test_proxies_use_the_shared_session(self):
+        from backend.apps.cluster.services.http_client import cluster_http
+
+        assert MasterProxy("http://master:8000").session is cluster_http.session
+        assert FollowerProxy().session is cluster_http.session
+
+
+class TestClusterGzipMiddleware:
+    def test_gzip_request_body_is_inflated(self):
+        body = json.dumps({"sync_id": 3}).encode()
+        request = RequestFactory().post(
+            "/api/cluster/sync/ack/", data=gzip.compress(body), content_type="application/json", HTTP_CONTENT_ENCODING="gzip"
+        )
+
+        assert ClusterGzipMiddleware(lambda r: None).process_request(request) is None
+        assert request.body == body
+        assert "HTTP_CONTENT_ENCODING" not in request.META
+
+    def test_malformed_gzip_is_rejected(self):
+        request = RequestFactory().post(
+            "/api/cluster/sync/ack/", data=b"not gzip", content_type="application/json", HTTP_CONTENT_ENCODING="gzip"
+        )
+
+        response = ClusterGzipMiddleware(lambda r: None).process_request(request)
+
+        assert response.status_code == 400
+
+    @pytest.mark.parametrize(
+        "path, enabled, compressed",
+        [("/api/cluster/sync/changes/", True, True), ("/api/cluster/sync/changes/", False, False), ("/api/events/", True, False)],
+    )
+    def test_response_compression(self, path, enabled, compressed):
+        from django.http import HttpResponse
+
+        request = RequestFactory().get(path, HTTP_ACCEPT_ENCODING="gzip")
+        response = HttpResponse(b"x" * 1000, content_type="application/json")
+
+        with override_settings(CLUSTER_CONFIG={"http_gzip": enabled}):
+            result = ClusterGzipMiddleware(lambda r: None).process_response(request, response)
+
+        assert (result.get("Content-Encoding") == "gzip") is compressed
@@ -0,0 +1,79 @@
+"""Tests for NotificationDispatcher — debounced, bounded follower notifications."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+from backend.apps.cluster.services.notify_dispatcher import NotificationDispatcher
+
+
+def _dispatcher(**kwargs):
+    proxy = MagicMock()
+    proxy.broadcast_sync.side_effect = lambda urls, sync_log_id, table_name, record_id: {
+        "sync_log_id": sync_log_id,
+        "total_followers": len(urls),
+        "successful": list(urls),
+        "failed": [],
+    }
+    kwargs.setdefault("url_loader", lambda: ["http://f1:8000", "http://f2:8000"])
+    return NotificationDispatcher(proxy_factory=lambda: proxy, **kwargs), proxy
+
+
+class TestNotificationDispatcher:
+    def test_disabled_by_default(self):
+        dispatcher, _ = _dispatcher()
+
+        assert dispatcher.submit(1) is False
+        assert dispatcher.stats()["submitted"] == 0
+
+    def test_batch_collapses_to_latest_id(self):
+        dispatcher, proxy = _dispatcher(debounce_ms=50)
+        with patch.object(NotificationDispatcher, "_ensure_thread"), patch.object(NotificationDispatcher, "enabled", True):
+            for sync_log_id in (3, 5, 4):
+                dispatcher.submit(sync_log_id)
+
+        latest = dispatcher.drain()
+        dispatcher.dispatch(latest)
+
+        assert latest == 5
+        proxy.broadcast_sync.assert_called_once_with(["http://f1:8000", "http://f2:8000"], 5, None, None)
+        stats = dispatcher.stats()
+        assert stats["submitted"] == 3
+        assert stats["batches"] == 1
+        assert stats["sent"] == 2
+        assert stats["queue_depth"] == 0
+
+    def test_debounce_collects_ids_arriving_within_window(self):
+        dispatcher, _ = _dispatcher(debounce_ms=200)
+        with patch.object(NotificationDispatcher, "_ensure_thread"), patch.object(NotificationDispatcher, "enabled", True):
+            dispatcher.submit(1)
+            threading.Timer(0.05, dispatcher.submit, args=(2,)).start()
+
+            assert dispatcher.drain() == 2
+
+    def test_full_queue_drops_and_counts(self):
+        dispatcher, _ = _dispatcher(max_queue=2)
+        with patch.object(NotificationDispatcher, "_ensure_thread"), patch.object(NotificationDispatcher, "enabled", True):
+            results = [dispatcher.submit(i) for i in range(4)]
+
+        assert results == [True, True, False, False]
+        assert dispatcher.stats()["dropped"] == 2
+        assert dispatcher.queue_depth == 2
+
+    def test_follower_urls_are_cached_until_invalidated(self):
+        loader = MagicMock(return_value=["http://f1:8000"])
+        dispatcher, _ = _dispatcher(url_loader=loader)
+
+        dispatcher.dispatch(1)
+        dispatcher.dispatch(2)
+        assert loader.call_count == 1
+
+        dispatcher.invalidate_urls()
+        dispatcher.dispatch(3)
+        assert loader.call_count == 2
+
+    def test_no_followers_skips_broadcast(self):
+        dispatcher, proxy = _dispatcher(url_loader=lambda: [])
+
+        dispatcher.dispatch(1)
+
+        proxy.broadcast_sync.assert_not_called()
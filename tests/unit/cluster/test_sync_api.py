@@ -1,6 +1,11 @@
 """Tests for cluster sync API endpoints."""
 
+import gzip
+import json
+import time
+
 import pytest
+from django.contrib.auth import get_user_model
 from rest_framework.test import APIClient
 
 from backend.apps.cluster.models import DjangoSyncLog, DjangoSyncState, DjangoClusterConfig
@@ -194,3 +199,106 @@ class TestAnnounceEndpoint:
 
         state = DjangoSyncState.objects.get(node_id="follower_002")
         assert state.url == "http://192.168.1.20:9000"
+
+
+@pytest.mark.django_db
+class TestSyncChangesLongPoll:
+    def _log(self, record_id="lp-1"):
+        return DjangoSyncLog.objects.create(table_name="tournament", record_id=record_id, operation="INSERT", data={})
+
+    def test_wait_returns_pending_changes_at_once(self, api_client):
+        sync_log = self._log()
+
+        started = time.monotonic()
+        response = api_client.get("/api/cluster/sync/changes/", {"since": 0, "wait": 5})
+
+        assert response.status_code == 200
+        assert [c["id"] for c in response.data["changes"]] == [sync_log.id]
+        assert time.monotonic() - started < 1
+
+    def test_wait_times_out_with_empty_page(self, api_client):
+        sync_log = self._log()
+
+        started = time.monotonic()
+        response = api_client.get("/api/cluster/sync/changes/", {"since": sync_log.id, "wait": 0.2})
+
+        assert response.status_code == 200
+        assert response.data["changes"] == []
+        assert time.monotonic() - started >= 0.2
+
+    def test_invalid_wait(self, api_client):
+        response = api_client.get("/api/cluster/sync/changes/", {"wait": "soon"})
+        assert response.status_code == 400
+
+    def test_committed_changes_are_published(self, django_capture_on_commit_callbacks):
+        from backend.apps.cluster.services.change_feed import change_feed
+        from backend.apps.cluster.services.sync_manager import sync_manager
+
+        with django_capture_on_commit_callbacks(execute=True):
+            sync_logs = sync_manager.record_changes([{"table_name": "tournament", "record_id": "lp-2", "operation": "INSERT", "data": {}}])
+
+        assert change_feed.latest_id >= sync_logs[-1].id
+
+
+@pytest.mark.django_db
+class TestSyncChangesCompactFormat:
+    def _logs(self, count):
+        return [
+            DjangoSyncLog.objects.create(table_name="tournament", record_id=f"c-{i}", operation="UPDATE", data={"round": i, "name": "Épée"})
+            for i in range(count)
+        ]
+
+    def _lines(self, body):
+        return [json.loads(line) for line in body.decode().splitlines() if line]
+
+    def test_compact_page_matches_json_page(self, api_client):
+        self._logs(3)
+
+        document = api_client.get("/api/cluster/sync/changes/", {"since": 0, "limit": 2}).data
+        response = api_client.get("/api/cluster/sync/changes/", {"since": 0, "limit": 2}, HTTP_ACCEPT="application/x-ndjson")
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == "application/x-ndjson"
+        header, *rows, trailer = self._lines(b"".join(response.streaming_content))
+        fields = header["fields"]
+        assert [dict(zip(fields, row)) for row in rows] == document["changes"]
+        assert trailer == {"last_id": document["last_id"], "has_more": True}
+
+    def test_compact_page_is_gzipped_when_accepted(self, api_client):
+        logs = self._logs(2)
+
+        response = api_client.get(
+            "/api/cluster/sync/changes/",
+            {"since": 0, "tables": "tournament"},
+            HTTP_ACCEPT="application/x-ndjson",
+            HTTP_ACCEPT_ENCODING="gzip",
+        )
+
+        assert response["Content-Encoding"] == "gzip"
+        lines = self._lines(gzip.decompress(b"".join(response.streaming_content)))
+        assert [row[0] for row in lines[1:-1]] == [log.id for log in logs]
+        assert lines[-1] == {"last_id": logs[-1].id, "has_more": False}
+
+
+@pytest.mark.django_db
+class TestUpdateConfigEndpoint:
+    @pytest.fixture
+    def admin_client(self, api_client):
+        user = get_user_model().objects.create_user(
+            username="cluster_admin", password="testpass123", email="cluster_admin@example.com", role="ADMIN"
+        )
+        api_client.force_authenticate(user=user)
+        return api_client
+
+    def test_multicast_group_is_saved(self, admin_client):
+        response = admin_client.put("/api/cluster/status/update_config/", {"udp_multicast_group": "239.1.2.3"}, format="json")
+
+        assert response.status_code == 200
+        assert DjangoClusterConfig.get_config().udp_multicast_group == "239.1.2.3"
+
+    @pytest.mark.parametrize("group", ["192.168.1.10", "not-an-ip", "ff02::1", None])
+    def test_invalid_multicast_group_is_rejected(self, admin_client, group):
+        response = admin_client.put("/api/cluster/status/update_config/", {"udp_multicast_group": group}, format="json")
+
+        assert response.status_code == 400
+        assert DjangoClusterConfig.get_config().udp_multicast_group == "239.255.42.99"
@@ -0,0 +1,105 @@
+"""Tests for sync_log compaction and the forced re-bootstrap of lagging followers."""
+
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from backend.apps.cluster.models import DjangoClusterConfig, DjangoSyncLog, DjangoSyncState
+from backend.apps.cluster.services.sync_log_compactor import SyncLogCompactor
+
+
+def _log(record_id, hours_ago=5, table_name="tournament"):
+    entry = DjangoSyncLog.objects.create(table_name=table_name, record_id=record_id, operation="UPDATE", data={"r": record_id})
+    DjangoSyncLog.objects.filter(id=entry.id).update(created_at=timezone.now() - timedelta(hours=hours_ago))
+    return entry.id
+
+
+def _follower(node_id, last_synced_id, hours_ago=0):
+    DjangoSyncState.objects.create(node_id=node_id, last_synced_id=last_synced_id)
+    DjangoSyncState.objects.filter(node_id=node_id).update(last_sync_time=timezone.now() - timedelta(hours=hours_ago))
+
+
+@pytest.fixture
+def master(db):
+    config = DjangoClusterConfig.get_config()
+    config.mode = "cluster"
+    config.is_master = True
+    config.node_id = "master_001"
+    config.save()
+    return config
+
+
+@pytest.mark.django_db
+class TestSyncLogCompactor:
+    def test_keeps_latest_entry_per_record_below_horizon(self, master):
+        a1, b1, a2, a3 = _log("a"), _log("b"), _log("a"), _log("a")
+        _follower("follower_001", a2)
+
+        result = SyncLogCompactor().compact(retention_hours=1)
+
+        assert result == {"horizon": a2, "deleted": 1, "compacted_id": a1}
+        assert list(DjangoSyncLog.objects.order_by("id").values_list("id", flat=True)) == [b1, a2, a3]
+        assert DjangoClusterConfig.get_config().sync_log_compacted_id == a1
+
+    def test_entries_inside_retention_window_are_kept(self, master):
+        _log("a", hours_ago=0.5)
+        _log("a", hours_ago=0.1)
+
+        result = SyncLogCompactor().compact(retention_hours=1)
+
+        assert result["deleted"] == 0
+        assert DjangoSyncLog.objects.count() == 2
+
+    def test_stale_followers_and_own_state_do_not_hold_compaction_back(self, master, settings):
+        settings.CLUSTER_CONFIG = {**settings.CLUSTER_CONFIG, "sync_log_follower_timeout": 600}
+        ids = [_log("a") for _ in range(3)]
+        _follower("master_001", 0)
+        _follower("gone_follower", 0, hours_ago=2)
+        _follower("follower_001", ids[1])
+
+        assert SyncLogCompactor().horizon() == ids[1]
+
+    def test_horizon_is_latest_entry_without_followers(self, master):
+        ids = [_log("a") for _ in range(3)]
+
+        assert SyncLogCompactor().horizon() == ids[-1]
+        assert SyncLogCompactor().compact(retention_hours=1)["deleted"] == 2
+
+    def test_maybe_compact_respects_setting(self, master):
+        compactor = SyncLogCompactor()
+        assert compactor.maybe_compact() is False
+
+    def test_command_runs_compaction(self, master):
+        _log("a")
+        _log("a")
+
+        out = StringIO()
+        call_command("compact_sync_log", "--retention-hours", "1", stdout=out)
+
+        assert "Deleted 1 sync_log entries" in out.getvalue()
+        assert DjangoSyncLog.objects.count() == 1
+
+
+@pytest.mark.django_db
+class TestCompactedChangesEndpoint:
+    def test_follower_behind_compaction_gets_gone(self, master):
+        a1, _ = _log("a"), _log("a")
+        SyncLogCompactor().compact(retention_hours=1)
+
+        response = APIClient().get("/api/cluster/sync/changes/", {"since": a1 - 1})
+
+        assert response.status_code == 410
+        assert response.data["compacted_id"] == a1
+
+    def test_follower_at_compaction_horizon_still_pulls(self, master):
+        a1, a2 = _log("a"), _log("a")
+        SyncLogCompactor().compact(retention_hours=1)
+
+        response = APIClient().get("/api/cluster/sync/changes/", {"since": a1})
+
+        assert response.status_code == 200
+        assert [c["id"] for c in response.data["changes"]] == [a2]
@@ -1,5 +1,6 @@
 """Tests for SyncWorker — background sync thread for follower nodes."""
 
+import json
 import threading
 from unittest.mock import patch, MagicMock
 
@@ -78,42 +79,95 @@ class TestSyncWorkerTriggerImmediateSync:
 
 
 class TestSyncWorkerDoSyncCycle:
-    @patch("backend.apps.cluster.services.sync_worker.DjangoClusterConfig")
-    def test_skips_if_master_node(self, mock_config_cls):
+    @patch("backend.apps.cluster.services.sync_worker.get_cluster_config")
+    def test_skips_if_master_node(self, mock_get_config):
         config = MagicMock()
         config.mode = "cluster"
         config.is_master = True
         config.node_id = "node_001"
-        mock_config_cls.get_config.return_value = config
+        mock_get_config.return_value = config
 
         worker = SyncWorker()
         worker._running = True
 
-        with patch("backend.apps.cluster.services.sync_worker.requests") as mock_requests:
+        with patch("backend.apps.cluster.services.sync_worker.requests") as mock_http:
             worker._do_sync_cycle()
-            mock_requests.get.assert_not_called()
+            mock_http.get.assert_not_called()
 
-    @patch("backend.apps.cluster.services.sync_worker.DjangoClusterConfig")
-    def test_skips_if_no_master_url(self, mock_config_cls):
+    @patch("backend.apps.cluster.services.sync_worker.get_cluster_config")
+    def test_skips_if_no_master_url(self, mock_get_config):
         config = MagicMock()
         config.mode = "cluster"
         config.is_master = False
         config.node_id = "node_001"
         config.master_url = None
-        mock_config_cls.get_config.return_value = config
+        mock_get_config.return_value = config
+
+        worker = SyncWorker()
+
+        with patch("backend.apps.cluster.services.sync_worker.requests") as mock_http:
+            worker._do_sync_cycle()
+            mock_http.get.assert_not_called()
+
+    @patch("backend.apps.cluster.services.sync_worker.get_cluster_config", side_effect=RuntimeError("no config"))
+    def test_returns_false_if_config_unavailable(self, mock_get_config):
+        worker = SyncWorker()
+
+        assert worker._do_sync_cycle() is False
+
+    @patch("backend.apps.cluster.services.sync_worker.sync_manager")
+    @patch("backend.apps.cluster.services.sync_worker.get_cluster_config")
+    def test_fresh_follower_bootstraps_from_full_sync(self, mock_get_config, mock_sync_manager):
+        config = MagicMock()
+        config.mode = "cluster"
+        config.is_master = False
+        config.node_id = "follower_001"
+        config.master_url = "http://master:8000"
+        config.sync_interval = 3.0
+        mock_get_config.return_value = config
+        mock_sync_manager.get_sync_state.return_value = None
 
         worker = SyncWorker()
+        with patch.object(worker, "_do_full_sync", return_value=True) as full_sync, patch.object(
+            worker, "_do_incremental_sync"
+        ) as incremental:
+            assert worker._do_sync_cycle() is True
+
+        full_sync.assert_called_once_with("http://master:8000", "follower_001")
+        incremental.assert_not_called()
+
+    @patch("backend.apps.cluster.services.sync_worker.sync_manager")
+    @patch("backend.apps.cluster.services.sync_worker.cluster_http")
+    @patch("backend.apps.cluster.services.sync_worker.get_cluster_config")
+    def test_empty_master_is_snapshotted_once(self, mock_get_config, mock_http, mock_sync_manager):
+        config = MagicMock()
+        config.mode = "cluster"
+        config.is_master = False
+        config.node_id = "follower_001"
+        config.master_url = "http://master:8000"
+        config.sync_interval = 3.0
+        mock_get_config.return_value = config
+        mock_sync_manager.get_sync_state.return_value = None
+        mock_sync_manager._model_registry = {}
+        mock_http.get.return_value = _stream_response(
+            {"type": "header", "latest_sync_id": 0, "tables": []},
+            {"type": "end", "latest_sync_id": 0, "total_records": 0},
+        )
 
-        with patch("backend.apps.cluster.services.sync_worker.requests") as mock_requests:
+        worker = SyncWorker()
+        with patch.object(worker, "_send_ack"), patch.object(worker, "_do_incremental_sync", return_value=False) as incremental:
             worker._do_sync_cycle()
-            mock_requests.get.assert_not_called()
+            worker._do_sync_cycle()
+
+        assert mock_http.get.call_count == 1
+        incremental.assert_called_once_with("http://master:8000", "follower_001", 0)
 
 
 class TestSyncWorkerDoIncrementalSync:
     @patch("backend.apps.cluster.services.sync_worker.sync_manager")
-    @patch("backend.apps.cluster.services.sync_worker.requests")
+    @patch("backend.apps.cluster.services.sync_worker.cluster_http")
     @patch("backend.apps.cluster.services.sync_worker.DjangoClusterConfig")
-    def test_incremental_sync_applies_changes(self, mock_config_cls, mock_requests, mock_sync_manager):
+    def test_incremental_sync_applies_changes(self, mock_config_cls, mock_http, mock_sync_manager):
         config = MagicMock()
         config.mode = "cluster"
         config.is_master = False
@@ -143,37 +197,274 @@ class TestSyncWorkerDoIncrementalSync:
             "last_id": 11,
             "has_more": False,
         }
-        mock_requests.get.return_value = mock_response
+        mock_http.get.return_value = mock_response
 
         mock_sync_manager.apply_changes_batch.return_value = {"success": 1, "failed": 0, "skipped": 0, "last_success_id": 11}
 
         worker = SyncWorker()
-        with patch.object(worker, "_send_ack"):
+        with patch.object(worker, "_queue_ack"):
             worker._do_incremental_sync("http://master:8000", "follower_001", 10)
 
         mock_sync_manager.apply_changes_batch.assert_called_once()
         mock_sync_manager.update_sync_state.assert_called_once_with("follower_001", 11, master_latest_sync_id=11)
 
 
+class TestSyncWorkerLongPoll:
+    @patch("backend.apps.cluster.services.sync_worker.sync_manager")
+    @patch("backend.apps.cluster.services.sync_worker.cluster_http")
+    def test_incremental_sync_long_polls_master(self, mock_http, mock_sync_manager):
+        mock_http.timeout.return_value = 10
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "changes": [{"id": 11, "table_name": "tournament", "record_id": "t1", "operation": "INSERT", "data": {}}],
+            "last_id": 11,
+            "has_more": False,
+        }
+        mock_http.get.return_value = mock_response
+        mock_sync_manager.apply_changes_batch.return_value = {"success": 1, "failed": 0, "skipped": 0, "last_success_id": 11}
+
+        worker = SyncWorker()
+        with patch.object(worker, "_queue_ack"):
+            poll_again = worker._do_incremental_sync("http://master:8000", "follower_001", 10)
+
+        params = mock_http.get.call_args.kwargs["params"]
+        assert params["wait"] == worker._long_poll_timeout > 0
+        assert mock_http.get.call_args.kwargs["timeout"] > params["wait"]
+        assert poll_again is True
+
+    @patch("backend.apps.cluster.services.sync_worker.sync_manager")
+    @patch("backend.apps.cluster.services.sync_worker.cluster_http")
+    def test_early_empty_page_falls_back_to_polling(self, mock_http, mock_sync_manager):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"changes": [], "last_id": 10, "has_more": False}
+        mock_http.get.return_value = mock_response
+
+        worker = SyncWorker()
+        assert worker._do_incremental_sync("http://master:8000", "follower_001", 10) is False
+
+    def test_loop_skips_interval_wait_after_long_poll(self):
+        worker = SyncWorker()
+        worker._sync_interval = 60
+        cycles = []
+
+        def cycle():
+            cycles.append(1)
+            if len(cycles) == 3:
+                worker._stop_event.set()
+            return True
+
+        worker._do_sync_cycle = cycle
+        thread = threading.Thread(target=worker._sync_loop, daemon=True)
+        thread.start()
+        thread.join(timeout=2)
+
+        assert not thread.is_alive()
+        assert len(cycles) == 3
+
+
+def _changes_page(ids, has_more, last_id=None):
+    response = MagicMock()
+    response.status_code = 200
+    response.json.return_value = {
+        "changes": [{"id": i, "table_name": "tournament", "record_id": f"t{i}", "operation": "UPDATE", "data": {}} for i in ids],
+        "last_id": last_id or ids[-1],
+        "has_more": has_more,
+    }
+    return response
+
+
+def _apply_all(changes, fetch_snapshot=None):
+    return {"success": len(changes), "failed": 0, "skipped": 0, "last_success_id": max(c.id for c in changes)}
+
+
+class TestSyncWorkerPipeline:
+    @patch("backend.apps.cluster.services.sync_worker.sync_manager")
+    @patch("backend.apps.cluster.services.sync_worker.cluster_http")
+    def test_prefetches_next_page_from_end_of_current_one(self, mock_http, mock_sync_manager):
+        mock_http.timeout.return_value = 10
+        mock_http.get.side_effect = [_changes_page([11, 12], True, 14), _changes_page([13, 14], False)]
+        mock_sync_manager.apply_changes_batch.side_effect = _apply_all
+
+        worker = SyncWorker()
+        with patch.object(worker, "_queue_ack") as queue_ack:
+            worker._do_incremental_sync("http://master:8000", "follower_001", 10)
+
+        sinces = [c.kwargs["params"]["since"] for c in mock_http.get.call_args_list]
+        waits = [c.kwargs["params"]["wait"] for c in mock_http.get.call_args_list]
+        assert sinces == [10, 12]
+        assert waits[1] == 0
+        assert mock_sync_manager.apply_changes_batch.call_count == 2
+        assert [c.args[1] for c in mock_sync_manager.update_sync_state.call_args_list] == [12, 14]
+        assert queue_ack.call_args.args == ("http://master:8000", "follower_001", 14)
+
+    @patch("backend.apps.cluster.services.sync_worker.sync_manager")
+    @patch("backend.apps.cluster.services.sync_worker.cluster_http")
+    def test_prefetched_page_is_discarded_after_failed_changes(self, mock_http, mock_sync_manager):
+        mock_http.timeout.return_value = 10
+        mock_http.get.side_effect = [_changes_page([11, 12], True, 14), _changes_page([13, 14], False)]
+        mock_sync_manager.apply_changes_batch.return_value = {"success": 1, "failed": 1, "skipped": 0, "last_success_id": 11}
+
+        worker = SyncWorker()
+        with patch.object(worker, "_queue_ack"):
+            worker._do_incremental_sync("http://master:8000", "follower_001", 10)
+
+        assert mock_sync_manager.apply_changes_batch.call_count == 1
+        mock_sync_manager.update_sync_state.assert_called_once_with("follower_001", 11, master_latest_sync_id=14)
+        assert worker._sync_event.is_set()
+
+    @patch("backend.apps.cluster.services.sync_worker.sync_manager")
+    @patch("backend.apps.cluster.services.sync_worker.cluster_http")
+    def test_compact_page_is_decoded_from_the_stream(self, mock_http, mock_sync_manager):
+        mock_http.timeout.return_value = 10
+        response = MagicMock()
+        response.status_code = 200
+        response.headers = {"Content-Type": "application/x-ndjson"}
+        response.iter_lines.return_value = iter(
+            [
+                json.dumps(
+                    {"format": "changes/1", "fields": ["id", "table_name", "record_id", "operation", "data", "version", "created_at"]}
+                ).encode(),
+                json.dumps([11, "tournament", "t1", "UPDATE", {"status": "open"}, 2, None]).encode(),
+                json.dumps({"last_id": 11, "has_more": False}).encode(),
+            ]
+        )
+        mock_http.get.return_value = response
+        mock_sync_manager.apply_changes_batch.side_effect = _apply_all
+
+        worker = SyncWorker()
+        with patch.object(worker, "_queue_ack"):
+            worker._do_incremental_sync("http://master:8000", "follower_001", 10)
+
+        assert "application/x-ndjson" in mock_http.get.call_args.kwargs["headers"]["Accept"]
+        (applied,) = mock_sync_manager.apply_changes_batch.call_args.args[0]
+        assert (applied.id, applied.data, applied.version) == (11, {"status": "open"}, 2)
+        response.json.assert_not_called()
+        response.close.assert_called()
+
+    def test_acks_are_coalesced_to_the_newest_id(self):
+        worker = SyncWorker()
+        sent = []
+        release = threading.Event()
+
+        def send_ack(master_url, node_id, sync_id):
+            release.wait(timeout=2)
+            sent.append(sync_id)
+
+        with patch.object(worker, "_send_ack", side_effect=send_ack):
+            worker._queue_ack("http://master:8000", "follower_001", 5)
+            for sync_id in (6, 7, 8):
+                worker._queue_ack("http://master:8000", "follower_001", sync_id)
+            release.set()
+            worker._ack_executor.shutdown(wait=True)
+
+        assert sent[-1] == 8
+        assert sorted(sent) == sent
+        assert len(sent) < 4
+
+    def test_page_size_follows_apply_throughput_within_bounds(self):
+        worker = SyncWorker()
+        start = worker._page_size
+
+        for _ in range(20):
+            worker._adapt_page_size(worker._page_size, 0.001)
+        assert start < worker._page_size == SyncWorker.MAX_PAGE_SIZE
+
+        for _ in range(20):
+            worker._adapt_page_size(worker._page_size, 60)
+        assert worker._page_size == SyncWorker.MIN_PAGE_SIZE
+
+        worker._adapt_page_size(1, 60)
+        assert worker._page_size == SyncWorker.MIN_PAGE_SIZE
+
+
+def _stream_response(*messages):
+    response = MagicMock()
+    response.status_code = 200
+    response.__enter__.return_value = response
+    response.iter_lines.return_value = iter([json.dumps(m).encode() for m in messages])
+    return response
+
+
+class TestSyncWorkerDoFullSync:
+    @patch("backend.apps.cluster.services.sync_worker.sync_manager")
+    @patch("backend.apps.cluster.services.sync_worker.cluster_http")
+    def test_full_sync_imports_chunks_and_pins_state(self, mock_http, mock_sync_manager):
+        mock_sync_manager._model_registry = {"tournament": MagicMock(), "event": MagicMock()}
+        mock_sync_manager.import_snapshot_chunk.side_effect = lambda table, records: len(records)
+        mock_http.get.return_value = _stream_response(
+            {"type": "header", "latest_sync_id": 40, "tables": ["tournament", "event"]},
+            {"type": "chunk", "table": "tournament", "records": [{"id": "t1"}, {"id": "t2"}]},
+            {"type": "chunk", "table": "event", "records": [{"id": "e1"}]},
+            {"type": "end", "latest_sync_id": 40, "total_records": 3},
+        )
+
+        worker = SyncWorker()
+        with patch.object(worker, "_send_ack") as send_ack:
+            assert worker._do_full_sync("http://master:8000", "follower_001") is True
+
+        assert mock_http.get.call_args.args[0] == "http://master:8000/api/cluster/sync/full/stream/"
+        assert mock_http.get.call_args.kwargs["stream"] is True
+        assert [c.args[0] for c in mock_sync_manager.import_snapshot_chunk.call_args_list] == ["tournament", "event"]
+        mock_sync_manager.update_sync_state.assert_called_once_with("follower_001", 40, master_latest_sync_id=40)
+        send_ack.assert_called_once_with("http://master:8000", "follower_001", 40)
+
+    @patch("backend.apps.cluster.services.sync_worker.sync_manager")
+    @patch("backend.apps.cluster.services.sync_worker.cluster_http")
+    def test_truncated_stream_keeps_sync_state(self, mock_http, mock_sync_manager):
+        mock_sync_manager._model_registry = {"tournament": MagicMock()}
+        mock_sync_manager.import_snapshot_chunk.return_value = 1
+        mock_http.get.return_value = _stream_response(
+            {"type": "header", "latest_sync_id": 40, "tables": ["tournament"]},
+            {"type": "chunk", "table": "tournament", "records": [{"id": "t1"}]},
+        )
+
+        worker = SyncWorker()
+        with patch.object(worker, "_send_ack") as send_ack:
+            assert worker._do_full_sync("http://master:8000", "follower_001") is False
+
+        mock_sync_manager.update_sync_state.assert_not_called()
+        send_ack.assert_not_called()
+
+
 class TestSyncWorkerSendAck:
     @patch("backend.apps.cluster.services.sync_worker._get_own_url", return_value="http://192.168.1.5:8001")
-    @patch("backend.apps.cluster.services.sync_worker.requests")
-    def test_send_ack_posts_to_master(self, mock_requests, mock_own_url):
+    @patch("backend.apps.cluster.services.sync_worker.cluster_http")
+    def test_send_ack_posts_to_master(self, mock_http, mock_own_url):
         worker = SyncWorker()
         worker._send_ack("http://master:8000", "follower_001", 42)
 
-        mock_requests.post.assert_called_once_with(
+        mock_http.post.assert_called_once_with(
             "http://master:8000/api/cluster/sync/ack/",
             json={"node_id": "follower_001", "sync_id": 42, "url": "http://192.168.1.5:8001"},
-            timeout=5,
+            endpoint="ack",
         )
 
-    @patch("backend.apps.cluster.services.sync_worker.requests")
-    def test_send_ack_handles_failure(self, mock_requests):
+    @patch("backend.apps.cluster.services.sync_worker.cluster_http")
+    def test_send_ack_handles_failure(self, mock_http):
         from requests.exceptions import RequestException
 
-        mock_requests.post.side_effect = RequestException("Connection refused")
-        mock_requests.RequestException = RequestException
+        mock_http.post.side_effect = RequestException("Connection refused")
 
         worker = SyncWorker()
         worker._send_ack("http://master:8000", "follower_001", 42)
+
+
+class TestSyncWorkerCompactedLog:
+    @patch("backend.apps.cluster.services.sync_worker.sync_manager")
+    @patch("backend.apps.cluster.services.sync_worker.cluster_http")
+    def test_gone_response_triggers_full_sync(self, mock_http, mock_sync_manager):
+        mock_http.timeout.return_value = 10
+        response = MagicMock()
+        response.status_code = 410
+        response.json.return_value = {"detail": "compacted", "compacted_id": 40}
+        mock_http.get.return_value = response
+
+        worker = SyncWorker()
+        with patch.object(worker, "_do_full_sync") as full_sync:
+            poll_again = worker._do_incremental_sync("http://master:8000", "follower_001", 10)
+
+        full_sync.assert_called_once_with("http://master:8000", "follower_001")
+        mock_sync_manager.apply_changes_batch.assert_not_called()
+        assert poll_again is False
@@ -0,0 +1,234 @@
+"""Tests for the binary UDP frame format and its use in UDPBroadcastService."""
+
+import json
+import struct
+
+import pytest
+
+from backend.apps.cluster.schemas import frames
+from backend.apps.cluster.schemas.messages import (
+    AckMessage,
+    AnnounceMessage,
+    ElectionMessage,
+    GoodbyeMessage,
+    HeartbeatMessage,
+    MasterAnnounceMessage,
+    MessageType,
+    SyncRequestMessage,
+    parse_message,
+)
+from backend.apps.cluster.services.udp_broadcast import DuplicateFilter, UDPBroadcastService
+
+
+def _messages(node_id="node-a"):
+    common = {"node_id": node_id, "timestamp": 1700000000, "seq_num": 7}
+    return [
+        AnnounceMessage(ip="192.168.1.10", port=8000, is_master=True, **common),
+        HeartbeatMessage(last_sync_id=12345678901, **common),
+        MasterAnnounceMessage(ip="192.168.1.10", port=8001, **common),
+        GoodbyeMessage(reason="shutdown", **common),
+        SyncRequestMessage(last_sync_id=42, limit=500, **common),
+        AckMessage(sync_id=43, **common),
+        ElectionMessage(last_sync_id=44, port=8002, **common),
+    ]
+
+
+class FakeSocket:
+    def __init__(self):
+        self.sent = []
+
+    def sendto(self, data, addr):
+        self.sent.append((data, addr))
+
+
+class TestFrames:
+    def test_round_trip_every_type(self):
+        messages = _messages()
+        (frame,) = frames.encode_frames(messages)
+
+        assert frames.decode_frame(frame) == messages
+
+    def test_binary_frame_is_smaller_than_json(self):
+        messages = _messages()
+
+        assert len(frames.encode_frames(messages)[0]) < sum(len(m.to_json()) for m in messages) / 2
+
+    def test_frames_are_split_at_max_bytes(self):
+        messages = [HeartbeatMessage(node_id="node-a", timestamp=1, seq_num=i, last_sync_id=i) for i in range(100)]
+
+        encoded = frames.encode_frames(messages, max_bytes=200)
+
+        assert len(encoded) > 1
+        assert all(len(frame) <= 200 for frame in encoded)
+        assert [m for frame in encoded for m in frames.decode_frame(frame)] == messages
+
+    def test_unknown_type_is_stepped_over(self):
+        (frame,) = frames.encode_frames([AckMessage(node_id="a", timestamp=1, sync_id=1)])
+        unknown = frames.MESSAGE_HEADER.pack(99, 1, 0, 1, 1, 3) + b"xyz"
+        magic, version, count = frames.FRAME_HEADER.unpack_from(frame, 0)
+        data = frames.FRAME_HEADER.pack(magic, version, count + 1) + unknown + frame[frames.FRAME_HEADER.size :]
+
+        (message,) = frames.decode_frame(data)
+        assert message.type == MessageType.ACK
+
+    def test_truncated_frame_is_rejected(self):
+        (frame,) = frames.encode_frames(_messages())
+
+        with pytest.raises((ValueError, struct.error)):
+            frames.decode_frame(frame[:-3])
+
+    def test_unsupported_frame_version_is_rejected(self):
+        (frame,) = frames.encode_frames(_messages())
+
+        with pytest.raises(ValueError):
+            frames.decode_frame(frame[:2] + bytes([frames.FRAME_VERSION + 1]) + frame[3:])
+
+    def test_skip_filter_sees_header_fields(self):
+        seen = []
+
+        def skip(message_type, hashed, seq_num):
+            seen.append((message_type, hashed, seq_num))
+            return message_type == MessageType.HEARTBEAT
+
+        (frame,) = frames.encode_frames(_messages())
+        decoded = frames.decode_frame(frame, skip)
+
+        assert MessageType.HEARTBEAT not in [m.type for m in decoded]
+        assert len(decoded) == 6
+        assert seen[0] == (MessageType.ANNOUNCE, frames.node_hash("node-a"), 7)
+
+    def test_json_datagram_fallback(self):
+        message = HeartbeatMessage(node_id="node-a", timestamp=1, seq_num=3, last_sync_id=9)
+
+        assert frames.parse_datagram(message.to_json().encode()) == [message]
+        assert frames.parse_datagram(message.to_json().encode(), skip=lambda *args: True) == []
+
+    def test_parse_message_rejects_unknown_type(self):
+        with pytest.raises(ValueError):
+            parse_message(json.dumps({"type": "gossip", "node_id": "a", "timestamp": 1}).encode())
+
+
+class TestUDPBroadcastServiceWireFormat:
+    def _service(self, wire_format="binary"):
+        service = UDPBroadcastService(node_id="node-a", wire_format=wire_format, transport="broadcast")
+        service.socket = FakeSocket()
+        return service
+
+    def test_broadcast_many_packs_one_datagram(self):
+        service = self._service()
+
+        service.broadcast_many(_messages())
+
+        datagrams = {data for data, _ in service.socket.sent}
+        assert len(datagrams) == 1
+        assert len(frames.parse_datagram(datagrams.pop())) == 7
+
+    def test_unrepeated_types_are_sent_once(self):
+        service = self._service()
+
+        service.broadcast(HeartbeatMessage(node_id="node-a", timestamp=1, last_sync_id=9))
+
+        assert len(service.socket.sent) == 1
+
+    def test_master_announce_is_repeated_once(self):
+        service = self._service()
+        service.RETRY_DELAY_MS = 0
+
+        service.broadcast_many(
+            [
+                MasterAnnounceMessage(node_id="node-a", timestamp=1, ip="10.0.0.1", port=8000),
+                HeartbeatMessage(node_id="node-a", timestamp=1, last_sync_id=9),
+            ]
+        )
+
+        assert len(service.socket.sent) == 2
+        assert service.socket.sent[0] == service.socket.sent[1]
+
+    def test_json_format_sends_one_datagram_per_message(self):
+        service = self._service("json")
+
+        service.broadcast_many([AckMessage(node_id="node-a", timestamp=1, sync_id=1), AckMessage(node_id="node-a", timestamp=1, sync_id=2)])
+
+        datagrams = [data for data, _ in service.socket.sent[:2]]
+        assert [parse_message(data).sync_id for data in datagrams] == [1, 2]
+
+    def test_send_to_assigns_sequence_numbers(self):
+        service = self._service()
+
+        service.send_to(AckMessage(node_id="node-a", timestamp=1, sync_id=1), "10.0.0.2")
+        service.send_to(AckMessage(node_id="node-a", timestamp=1, sync_id=2), "10.0.0.2")
+
+        seqs = [frames.decode_frame(data)[0].seq_num for data, _ in service.socket.sent]
+        assert seqs == [1, 2]
+        assert service.socket.sent[0][1] == ("10.0.0.2", service.port)
+
+    def test_unknown_wire_format_is_rejected(self):
+        with pytest.raises(ValueError):
+            UDPBroadcastService(wire_format="xml")
+
+    def test_own_and_duplicate_messages_are_skipped(self):
+        service = self._service()
+        own = HeartbeatMessage(node_id="node-a", timestamp=1, seq_num=5)
+        peer = HeartbeatMessage(node_id="node-b", timestamp=1, seq_num=5)
+        (frame,) = frames.encode_frames([own, peer])
+
+        assert frames.parse_datagram(frame, skip=service._should_skip) == [peer]
+        assert frames.parse_datagram(frame, skip=service._should_skip) == []
+        assert frames.parse_datagram(peer.to_json().encode(), skip=service._should_skip) == []
+
+    def test_own_hash_follows_node_id(self):
+        service = self._service()
+        service.node_id = "node-b"
+
+        assert service.node_hash == frames.node_hash("node-b")
+
+
+class TestDuplicateFilter:
+    def test_repeated_seq_is_duplicate(self):
+        dedup = DuplicateFilter(window=8)
+
+        assert dedup.seen("a", 1, now=0) is False
+        assert dedup.seen("a", 1, now=0) is True
+        assert dedup.seen("b", 1, now=0) is False
+
+    def test_out_of_order_within_window(self):
+        dedup = DuplicateFilter(window=8)
+        for seq in (5, 3, 7):
+            assert dedup.seen("a", seq, now=0) is False
+
+        assert dedup.seen("a", 3, now=0) is True
+        assert dedup.seen("a", 4, now=0) is False
+        assert dedup.seen("a", 5, now=0) is True
+
+    def test_seq_behind_window_restarts_sender(self):
+        dedup = DuplicateFilter(window=8)
+        dedup.seen("a", 100, now=0)
+
+        assert dedup.seen("a", 1, now=0) is False
+        assert dedup.seen("a", 1, now=0) is True
+        assert dedup.seen("a", 2, now=0) is False
+
+    def test_large_jump_clears_window(self):
+        dedup = DuplicateFilter(window=8)
+        dedup.seen("a", 1, now=0)
+
+        assert dedup.seen("a", 50, now=0) is False
+        assert dedup.seen("a", 49, now=0) is False
+
+    def test_silent_senders_expire(self):
+        dedup = DuplicateFilter(window=8, ttl=60)
+        dedup.seen("a", 1, now=0)
+        dedup.seen("b", 1, now=30)
+
+        assert dedup.seen("c", 1, now=61) is False
+        assert len(dedup) == 2
+        assert dedup.seen("a", 1, now=61) is False
+
+    def test_sender_count_is_bounded(self):
+        dedup = DuplicateFilter(max_senders=3)
+        for sender in "abcde":
+            dedup.seen(sender, 1, now=0)
+
+        assert len(dedup) == 3
+        assert dedup.seen("a", 1, now=0) is False
+        assert dedup.seen("e", 1, now=0) is True
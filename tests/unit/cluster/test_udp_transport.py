@@ -0,0 +1,102 @@
+"""Tests for the pluggable UDP transports (broadcast, multicast, unicast)."""
+
+import socket
+from unittest.mock import MagicMock
+
+import pytest
+
+from backend.apps.cluster.models import DjangoClusterConfig
+from backend.apps.cluster.schemas.messages import HeartbeatMessage
+from backend.apps.cluster.services.config_cache import cluster_config_cache
+from backend.apps.cluster.services.node_discovery import NodeDiscovery, NodeInfo
+from backend.apps.cluster.services.udp_broadcast import UDPBroadcastService
+from backend.apps.cluster.services.udp_transport import (
+    BROADCAST_ADDRESS,
+    BroadcastTransport,
+    MulticastTransport,
+    UnicastTransport,
+    create_transport,
+)
+
+
+class FakeSocket:
+    def __init__(self):
+        self.sent = []
+
+    def sendto(self, data, addr):
+        self.sent.append((data, addr))
+
+
+def _heartbeat():
+    return HeartbeatMessage(node_id="node-a", timestamp=1, last_sync_id=5)
+
+
+class TestTransports:
+    def test_create_transport(self):
+        assert isinstance(create_transport("broadcast"), BroadcastTransport)
+        assert create_transport("multicast", "239.1.2.3").destinations() == ["239.1.2.3"]
+        assert isinstance(create_transport("unicast"), UnicastTransport)
+        with pytest.raises(ValueError):
+            create_transport("carrier-pigeon")
+
+    def test_unicast_broadcasts_until_peers_are_known(self):
+        hosts = []
+        transport = UnicastTransport(lambda: hosts)
+
+        assert transport.destinations() == [BROADCAST_ADDRESS]
+        hosts.extend(["10.0.0.2", "10.0.0.3"])
+        assert transport.destinations() == ["10.0.0.2", "10.0.0.3"]
+
+    def test_multicast_joins_group_with_lan_ttl(self):
+        sock = MagicMock()
+
+        MulticastTransport("239.1.2.3").configure(sock)
+
+        options = {call.args[1]: call.args[2] for call in sock.setsockopt.call_args_list}
+        assert options[socket.IP_MULTICAST_TTL] == 1
+        assert options[socket.IP_ADD_MEMBERSHIP][:4] == socket.inet_aton("239.1.2.3")
+
+
+class TestUDPBroadcastServiceTransport:
+    def test_unicast_sends_to_each_peer(self):
+        service = UDPBroadcastService(node_id="node-a", transport="unicast")
+        service.peer_hosts = lambda: ["10.0.0.2", "10.0.0.3"]
+        service.socket = FakeSocket()
+        service.RETRY_COUNT = 1
+
+        service.broadcast(_heartbeat())
+
+        assert [addr for _, addr in service.socket.sent] == [("10.0.0.2", service.port), ("10.0.0.3", service.port)]
+
+    def test_multicast_sends_to_group(self):
+        service = UDPBroadcastService(node_id="node-a", transport="multicast", multicast_group="239.1.2.3")
+        service.socket = FakeSocket()
+        service.RETRY_COUNT = 1
+
+        service.broadcast(_heartbeat())
+
+        assert [addr for _, addr in service.socket.sent] == [("239.1.2.3", service.port)]
+
+    @pytest.mark.django_db
+    def test_transport_comes_from_cluster_config(self):
+        config = DjangoClusterConfig.get_config()
+        config.udp_transport = "multicast"
+        config.udp_multicast_group = "239.9.9.9"
+        config.save()
+        cluster_config_cache.invalidate()
+
+        service = UDPBroadcastService(node_id="node-a")
+
+        assert isinstance(service.transport, MulticastTransport)
+        assert service.transport.destinations() == ["239.9.9.9"]
+
+
+class TestDiscoveryPeerHosts:
+    def test_peer_hosts_follow_discovery(self):
+        udp_service = UDPBroadcastService(transport="unicast")
+        discovery = NodeDiscovery(udp_service=udp_service)
+        discovery.state.peers["node-b"] = NodeInfo(node_id="node-b", ip="10.0.0.2", port=8000, last_seen=0)
+
+        assert udp_service.transport.destinations() == [BROADCAST_ADDRESS]
+        discovery.state.discovery_complete = True
+        assert udp_service.transport.destinations() == ["10.0.0.2"]
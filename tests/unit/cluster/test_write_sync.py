@@ -1,8 +1,9 @@
-"""Tests for SyncWriteMiddleware — _wait_for_acks and _notify_followers."""
+"""Tests for SyncWriteMiddleware — _wait_for_acks and request routing."""
 
 import threading
-import time
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
+
+import pytest
 
 from backend.apps.cluster.services.ack_queue import AckQueue
 
@@ -48,75 +49,110 @@ class TestWaitForAcks:
         assert queue.is_confirmed(999)
 
 
-class TestNotifyFollowers:
-    @patch("backend.apps.cluster.models.sync_log.DjangoSyncLog.objects")
-    @patch("backend.apps.cluster.models.sync_state.DjangoSyncState.objects")
-    @patch("backend.apps.cluster.services.proxy.get_follower_proxy")
-    def test_notify_followers_with_urls(self, mock_get_proxy, mock_state_manager, mock_log_manager):
+class TestSyncWriteMiddleware:
+    def test_exempt_path(self):
         from backend.apps.cluster.middleware.write_sync import SyncWriteMiddleware
 
-        mock_log = MagicMock()
-        mock_log.id = 1
-        mock_log.table_name = "tournament"
-        mock_log.record_id = "abc"
-        mock_log_manager.get.return_value = mock_log
-
-        mock_state_1 = MagicMock()
-        mock_state_1.url = "http://192.168.1.10:8000"
-        mock_state_2 = MagicMock()
-        mock_state_2.url = "http://192.168.1.11:8000"
-        mock_state_manager.exclude.return_value.exclude.return_value = [mock_state_1, mock_state_2]
+        middleware = SyncWriteMiddleware(lambda r: None)
+        assert middleware._is_exempt_path("/api/cluster/status/") is True
+        assert middleware._is_exempt_path("/api/tournaments/") is False
 
-        mock_proxy = MagicMock()
-        mock_get_proxy.return_value = mock_proxy
+    def test_follower_write_returns_503(self):
+        from backend.apps.cluster.middleware.write_sync import SyncWriteMiddleware
+        from django.test import RequestFactory
 
         middleware = SyncWriteMiddleware(lambda r: None)
         middleware.mode = "cluster"
-        middleware.is_master = True
-
-        middleware._notify_followers(1)
+        middleware.is_master = False
 
-        time.sleep(0.2)
+        factory = RequestFactory()
+        request = factory.post("/api/tournaments/")
+        result = middleware._handle_follower_write(request)
 
-        mock_proxy.broadcast_sync.assert_called_once()
+        assert result.status_code == 503
 
-    @patch("backend.apps.cluster.models.sync_log.DjangoSyncLog.objects")
-    @patch("backend.apps.cluster.models.sync_state.DjangoSyncState.objects")
-    def test_notify_followers_skips_if_no_urls(self, mock_state_manager, mock_log_manager):
+    @patch("threading.Thread")
+    def test_master_write_waits_for_acks_without_notify_threads(self, mock_thread):
         from backend.apps.cluster.middleware.write_sync import SyncWriteMiddleware
+        from django.http import HttpResponse
+        from django.test import RequestFactory
 
-        mock_log = MagicMock()
-        mock_log.id = 1
-        mock_log.table_name = "tournament"
-        mock_log.record_id = "abc"
-        mock_log_manager.get.return_value = mock_log
+        middleware = SyncWriteMiddleware(lambda r: None)
+        request = RequestFactory().post("/api/tournaments/")
+        request._sync_log_id = 7
+        response = HttpResponse(status=201)
 
-        mock_state_manager.exclude.return_value.exclude.return_value = []
+        with patch.object(middleware, "_load_config"), patch.object(middleware, "_wait_for_acks", return_value=True) as wait:
+            middleware.mode = "cluster"
+            middleware.is_master = True
+            result = middleware.process_response(request, response)
 
-        middleware = SyncWriteMiddleware(lambda r: None)
-        middleware.mode = "cluster"
-        middleware.is_master = True
+        assert result is response
+        wait.assert_called_once_with(7)
+        mock_thread.assert_not_called()
 
-        middleware._notify_followers(1)
-        time.sleep(0.1)
 
-    def test_exempt_path(self):
+class TestSyncWriteMiddlewareAsync:
+    def _middleware(self, response):
         from backend.apps.cluster.middleware.write_sync import SyncWriteMiddleware
 
-        middleware = SyncWriteMiddleware(lambda r: None)
-        assert middleware._is_exempt_path("/api/cluster/status/") is True
-        assert middleware._is_exempt_path("/api/tournaments/") is False
+        async def get_response(request):
+            request._sync_log_id = 11
+            return response
 
-    def test_follower_write_returns_503(self):
-        from backend.apps.cluster.middleware.write_sync import SyncWriteMiddleware
+        middleware = SyncWriteMiddleware(get_response)
+        middleware.ack_timeout_ms = 2000
+        middleware.replica_ack_required = 1
+        return middleware
+
+    @pytest.fixture(autouse=True)
+    def ack_queue(self):
+        from backend.apps.cluster.services.sync_manager import sync_manager
+
+        queue = AckQueue()
+        with patch.object(sync_manager, "_ack_queue", queue):
+            yield queue
+
+    def _configure_master(self, middleware):
+        def load():
+            middleware.mode = "cluster"
+            middleware.is_master = True
+
+        return patch.object(middleware, "_load_config", side_effect=load)
+
+    async def test_write_returns_once_follower_acks(self, ack_queue):
+        from django.http import HttpResponse
         from django.test import RequestFactory
 
-        middleware = SyncWriteMiddleware(lambda r: None)
-        middleware.mode = "cluster"
-        middleware.is_master = False
+        response = HttpResponse(status=201)
+        middleware = self._middleware(response)
+        threading.Timer(0.05, ack_queue.acknowledge, args=(11, "node_a")).start()
 
-        factory = RequestFactory()
-        request = factory.post("/api/tournaments/")
-        result = middleware._handle_follower_write(request)
+        with self._configure_master(middleware):
+            result = await middleware(RequestFactory().post("/api/tournaments/"))
 
-        assert result.status_code == 503
+        assert result is response
+
+    async def test_write_without_acks_returns_202(self):
+        from django.http import HttpResponse
+        from django.test import RequestFactory
+
+        middleware = self._middleware(HttpResponse(status=201))
+        middleware.ack_timeout_ms = 50
+
+        with self._configure_master(middleware):
+            result = await middleware(RequestFactory().post("/api/tournaments/"))
+
+        assert result.status_code == 202
+
+    async def test_reads_skip_the_ack_wait(self):
+        from django.http import HttpResponse
+        from django.test import RequestFactory
+
+        response = HttpResponse(status=200)
+        middleware = self._middleware(response)
+
+        with self._configure_master(middleware):
+            result = await middleware(RequestFactory().get("/api/tournaments/"))
+
+        assert result is response
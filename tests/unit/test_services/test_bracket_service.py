@@ -0,0 +1,87 @@
+"""
+Unit tests for the direct-elimination bracket engine.
+"""
+
+import pytest
+
+from core.services.bracket_service import Bracket, BracketError, fie_seed_order, table_size
+
+
+def _fencers(count):
+    return [f"s{seed}" for seed in range(1, count + 1)]
+
+
+class TestSeeding:
+    def test_fie_table_order(self):
+        assert fie_seed_order(8) == [1, 8, 5, 4, 3, 6, 7, 2]
+        assert fie_seed_order(16) == [1, 16, 9, 8, 5, 12, 13, 4, 3, 14, 11, 6, 7, 10, 15, 2]
+
+    @pytest.mark.parametrize("size", [8, 16, 32, 64, 128, 256])
+    def test_first_round_pairs_add_up(self, size):
+        order = fie_seed_order(size)
+        assert sorted(order) == list(range(1, size + 1))
+        assert all(order[i] + order[i + 1] == size + 1 for i in range(0, size, 2))
+
+    def test_table_size(self):
+        assert table_size(2) == 8
+        assert table_size(9) == 16
+        assert table_size(256) == 256
+        with pytest.raises(BracketError):
+            table_size(257)
+
+
+class TestBracket:
+    def test_byes_advance_top_seeds(self):
+        bracket = Bracket.build(_fencers(13))
+
+        assert bracket.size == 16
+        first_round = bracket.rounds()[0]
+        assert [(b["fencer_a"], b["fencer_b"], b["winner"]) for b in first_round[:2]] == [("s1", None, "s1"), ("s9", "s8", None)]
+        assert bracket.bout(4)["fencer_a"] == "s1"
+
+    def test_result_advances_into_parent_only(self):
+        bracket = Bracket.build(_fencers(16))
+
+        assert bracket.record_result(8, "V", "9") == [8]
+        assert bracket.bout(4)["fencer_a"] == "s1"
+        assert bracket.bout(4)["fencer_b"] is None
+
+    def test_full_table_produces_champion(self):
+        bracket = Bracket.build(_fencers(8))
+        for node in range(7, 0, -1):
+            bout = bracket.bout(node)
+            # Lower seed number wins
+            a_wins = int(bout["fencer_a"][1:]) < int(bout["fencer_b"][1:])
+            bracket.record_result(node, "V" if a_wins else "10", "10" if a_wins else "V")
+
+        assert bracket.champion == "s1"
+
+    def test_corrected_result_voids_later_bouts(self):
+        bracket = Bracket.build(_fencers(8))
+        bracket.record_result(4, "V", "3")
+        bracket.record_result(5, "V", "14")
+        bracket.record_result(2, "V", "12")
+
+        changed = bracket.record_result(5, "14", "V")
+
+        assert changed == [5, 2]
+        assert bracket.bout(2) == {**bracket.bout(2), "fencer_b": "s4", "score_a": None, "winner": None}
+
+    def test_invalid_results(self):
+        bracket = Bracket.build(_fencers(8))
+
+        with pytest.raises(BracketError):
+            bracket.record_result(2, "V", "3")  # fencers not known yet
+        with pytest.raises(BracketError):
+            bracket.record_result(4, "10", "10")
+        with pytest.raises(BracketError):
+            bracket.record_result(8, "V", "3")
+
+    def test_round_trip(self):
+        bracket = Bracket.build(_fencers(11), max_touches=10)
+        bracket.record_result(bracket.size // 2 + 1, "V", "4")
+
+        restored = Bracket.from_dict(bracket.to_dict())
+
+        assert restored == bracket
+        assert restored.rounds() == bracket.rounds()
@@ -0,0 +1,58 @@
+"""
+Unit tests for the serpentine pool draw.
+"""
+
+import random
+import time
+
+from core.services.draw_service import DrawEntry, collision_count, draw_pools, pool_count, serpentine
+
+
+def _entries(count, countries=("FRA", "ITA", "USA", "HUN", "KOR", "CHN", "GER", "JPN"), rng_seed=1):
+    rng = random.Random(rng_seed)
+    return [DrawEntry(fencer_id=f"f{seed}", seed=seed, country_code=rng.choice(countries)) for seed in range(1, count + 1)]
+
+
+class TestSerpentine:
+    def test_pool_count(self):
+        assert pool_count(14, 7) == 2
+        assert pool_count(15, 7) == 3
+        assert pool_count(3, 7) == 1
+
+    def test_serpentine_order(self):
+        pools = serpentine([DrawEntry(fencer_id=str(s), seed=s) for s in range(1, 8)], 3)
+
+        assert [[int(e.fencer_id) for e in pool] for pool in pools] == [[1, 6, 7], [2, 5], [3, 4]]
+
+
+class TestDrawPools:
+    def test_separates_countries_within_seeding_rows(self):
+        entries = [DrawEntry(fencer_id=f"f{s}", seed=s, country_code="FRA" if s in (1, 4) else f"C{s}") for s in range(1, 9)]
+
+        draw = draw_pools(entries, pool_size=4)
+
+        assert draw.initial_collisions == 1
+        assert draw.collisions == 0
+        # Seeds 1 and 2 still head separate pools
+        assert {draw.pools[0][0], draw.pools[1][0]} == {"f1", "f2"}
+
+    def test_deterministic_for_seed(self):
+        entries = _entries(120)
+
+        first = draw_pools(entries, pool_size=7, seed=5)
+
+        assert draw_pools(list(reversed(entries)), pool_size=7, seed=5) == first
+        assert sorted(f for pool in first.pools for f in pool) == sorted(e.fencer_id for e in entries)
+
+    def test_large_draw_is_fast_and_balanced(self):
+        entries = _entries(560)
+
+        started = time.perf_counter()
+        draw = draw_pools(entries, pool_size=7, seed=3)
+        elapsed = time.perf_counter() - started
+
+        assert elapsed < 1.0
+        assert {len(pool) for pool in draw.pools} == {7}
+        assert draw.collisions < draw.initial_collisions
+        by_id = {e.fencer_id: e for e in entries}
+        assert draw.collisions == collision_count([[by_id[f] for f in pool] for pool in draw.pools])
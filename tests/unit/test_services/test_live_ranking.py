@@ -0,0 +1,74 @@
+"""
+Unit tests for the incremental stage ranking index.
+Every update must leave the index equal to a full recompute with rank_stage.
+"""
+
+import random
+
+from core.services.live_ranking import StageRankingIndex
+from core.services.result_service import PoolSheet, rank_stage
+
+
+def _empty_sheet(fencer_ids, pool_number):
+    results = [["" for _ in fencer_ids] for _ in fencer_ids]
+    return PoolSheet(fencer_ids=fencer_ids, results=results, pool_number=pool_number, pool_id=f"p{pool_number}")
+
+
+def _snapshot(rows):
+    return [
+        (r.fencer_id, r.victories, r.matches_played, r.touches_scored, r.touches_received, r.rank, r.pool_rank, r.is_tied) for r in rows
+    ]
+
+
+def _random_bout(rng):
+    loser = rng.randint(0, 4)
+    return ("V" if rng.random() < 0.7 else f"V{rng.randint(loser + 1, 5)}"), str(loser)
+
+
+class TestStageRankingIndex:
+    def test_matches_full_recompute_after_each_bout(self):
+        rng = random.Random(7)
+        sheets = [_empty_sheet([f"f{p}_{i}" for i in range(6)], p) for p in range(1, 5)]
+        index = StageRankingIndex()
+        for sheet in sheets:
+            index.add_pool(sheet)
+
+        for _ in range(150):
+            sheet = rng.choice(sheets)
+            i, j = rng.sample(range(6), 2)
+            if rng.random() < 0.1:
+                sheet.results[i][j], sheet.results[j][i] = "", ""
+            else:
+                sheet.results[i][j], sheet.results[j][i] = _random_bout(rng)
+            index.set_bout(sheet.fencer_ids[i], sheet.fencer_ids[j], sheet.results[i][j], sheet.results[j][i])
+
+            assert _snapshot(index.ranking()) == _snapshot(rank_stage(sheets))
+
+    def test_update_pool_applies_only_changed_bouts(self):
+        sheet = _empty_sheet(["a", "b", "c"], 1)
+        index = StageRankingIndex()
+        index.add_pool(sheet)
+        index.drain_dirty()
+
+        sheet.results[0][1], sheet.results[1][0] = "V", "2"
+        assert index.update_pool(sheet) == 1
+        assert index.update_pool(sheet) == 0
+        assert sorted(r.fencer_id for r in index.drain_dirty()) == ["a", "b"]
+        assert [r.fencer_id for r in index.ranking()][0] == "a"
+
+    def test_changed_fencers_reload_pool(self):
+        index = StageRankingIndex()
+        index.add_pool(_empty_sheet(["a", "b"], 1))
+
+        index.update_pool(PoolSheet(fencer_ids=["a", "c"], results=[["", "V"], ["1", ""]], pool_number=1, pool_id="p1"))
+
+        assert [(r.fencer_id, r.victories) for r in index.ranking()] == [("a", 1), ("c", 0)]
+        assert len(index) == 2
+
+    def test_bout_undone(self):
+        index = StageRankingIndex()
+        index.add_pool(PoolSheet(fencer_ids=["a", "b"], results=[["", "V"], ["3", ""]], pool_number=1, pool_id="p1"))
+
+        index.set_bout("b", "a", "", "")
+
+        assert [(r.fencer_id, r.matches_played, r.rank, r.is_tied) for r in index.ranking()] == [("a", 0, 1, True), ("b", 0, 1, True)]
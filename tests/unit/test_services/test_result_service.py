@@ -0,0 +1,122 @@
+"""
+Unit tests for the pool result engine.
+"""
+
+import random
+import time
+
+from core.services.result_service import PoolSheet, compute_pool, parse_score, rank_pool, rank_stage
+
+
+def _sheet(fencer_ids, scores, pool_number=1):
+    """Build a score sheet from {(winner, loser): (winner_touches, loser_touches)}."""
+    index = {f: i for i, f in enumerate(fencer_ids)}
+    results = [["" for _ in fencer_ids] for _ in fencer_ids]
+    for (winner, loser), (ws, ls) in scores.items():
+        results[index[winner]][index[loser]] = "V" if ws == 5 else f"V{ws}"
+        results[index[loser]][index[winner]] = str(ls)
+    return PoolSheet(fencer_ids=fencer_ids, results=results, pool_number=pool_number, pool_id=f"p{pool_number}")
+
+
+class TestParseScore:
+    def test_cells(self):
+        assert parse_score("V") == (5, True)
+        assert parse_score("v", max_touches=4) == (4, True)
+        assert parse_score("V3") == (3, True)
+        assert parse_score("2") == (2, False)
+        assert parse_score("D2") == (2, False)
+        assert parse_score(3) == (3, False)
+        assert parse_score("") is None
+        assert parse_score(None) is None
+        assert parse_score("abc") is None
+
+
+class TestComputePool:
+    def test_statistics(self):
+        sheet = _sheet(["a", "b", "c"], {("a", "b"): (5, 3), ("a", "c"): (5, 0), ("b", "c"): (4, 2)})
+
+        rows, winners = compute_pool(sheet)
+        by_id = {r.fencer_id: r for r in rows}
+
+        assert (by_id["a"].victories, by_id["a"].touches_scored, by_id["a"].touches_received) == (2, 10, 3)
+        assert (by_id["b"].victories, by_id["b"].indicator) == (1, 0)
+        assert by_id["c"].matches_played == 2
+        assert winners[("b", "a")] == "a"
+
+    def test_unfinished_bout_is_ignored(self):
+        sheet = PoolSheet(fencer_ids=["a", "b"], results=[["", "V"], ["", ""]])
+
+        rows, _ = compute_pool(sheet)
+
+        assert all(r.matches_played == 0 for r in rows)
+
+
+class TestRanking:
+    def test_pool_order_by_victories_indicator_touches(self):
+        sheet = _sheet(
+            ["a", "b", "c", "d"],
+            {
+                ("a", "b"): (5, 4),
+                ("c", "a"): (5, 0),
+                ("a", "d"): (5, 1),
+                ("b", "c"): (5, 2),
+                ("b", "d"): (5, 3),
+                ("d", "c"): (5, 4),
+            },
+        )
+
+        ranked = rank_pool(sheet)
+
+        # a and b both have 2 V; b ranks first on indicator (+4 against 0)
+        assert [r.fencer_id for r in ranked] == ["b", "a", "c", "d"]
+        assert [r.pool_rank for r in ranked] == [1, 2, 3, 4]
+
+    def test_two_way_tie_broken_by_head_to_head(self):
+        # a and b finish identical on V/M, indicator and TS; b won their bout
+        sheet = _sheet(
+            ["a", "b", "c", "d"],
+            {("b", "a"): (5, 4), ("a", "c"): (5, 4), ("a", "d"): (5, 0), ("b", "c"): (5, 0), ("d", "b"): (5, 4), ("c", "d"): (5, 1)},
+        )
+
+        ranked = rank_pool(sheet)
+
+        assert [r.fencer_id for r in ranked[:2]] == ["b", "a"]
+        assert [r.pool_rank for r in ranked[:2]] == [1, 2]
+
+    def test_cross_pool_tie_is_shared(self):
+        pool_1 = _sheet(["a", "b"], {("a", "b"): (5, 2)}, pool_number=1)
+        pool_2 = _sheet(["c", "d"], {("c", "d"): (5, 2)}, pool_number=2)
+
+        ranked = rank_stage([pool_1, pool_2])
+
+        assert [(r.fencer_id, r.rank, r.is_tied) for r in ranked] == [("a", 1, True), ("c", 1, True), ("b", 3, True), ("d", 3, True)]
+        assert {r.fencer_id: r.pool_rank for r in ranked} == {"a": 1, "b": 2, "c": 1, "d": 2}
+
+    def test_victory_ratio_across_pool_sizes(self):
+        pool_1 = _sheet(["a", "b", "c"], {("a", "b"): (5, 0), ("a", "c"): (5, 0), ("b", "c"): (5, 0)}, pool_number=1)
+        pool_2 = _sheet(["d", "e"], {("d", "e"): (5, 4)}, pool_number=2)
+
+        ranked = rank_stage([pool_1, pool_2])
+
+        # a: 2/2 ind +10, d: 1/1 ind +1, b: 1/2, ...
+        assert [r.fencer_id for r in ranked][:3] == ["a", "d", "b"]
+
+    def test_large_stage_is_fast(self):
+        rng = random.Random(42)
+        sheets = []
+        for number in range(43):
+            ids = [f"f{number}_{i}" for i in range(7)]
+            scores = {}
+            for i in range(7):
+                for j in range(i + 1, 7):
+                    winner, loser = (ids[i], ids[j]) if rng.random() < 0.5 else (ids[j], ids[i])
+                    scores[(winner, loser)] = (5, rng.randint(0, 4))
+            sheets.append(_sheet(ids, scores, pool_number=number + 1))
+
+        start = time.perf_counter()
+        ranked = rank_stage(sheets)
+        elapsed = time.perf_counter() - start
+
+        assert len(ranked) == 301
+        assert sorted(r.rank for r in ranked)[0] == 1
+        assert elapsed < 0.5